@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+BUDGET_CONTINUE = "continue"
+BUDGET_DOWNGRADE = "downgrade"
+BUDGET_STOP = "stop"
+
+# Downgrades stop at "low", which every GPT-5 family model accepts.
+_REASONING_EFFORT_DOWNGRADE: dict[str, str] = {
+    "xhigh": "high",
+    "high": "medium",
+    "medium": "low",
+}
+
+# Weight of the latest round in the projected next-round cost.
+_PROJECTION_SMOOTHING = 0.5
+
+
+@dataclass(frozen=True)
+class BudgetLimits:
+    """Per-run limits; zero disables a limit."""
+
+    max_run_seconds: float = 0.0
+    max_total_tokens: int = 0
+    max_total_price: float = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return (
+            self.max_run_seconds > 0
+            or self.max_total_tokens > 0
+            or self.max_total_price > 0
+        )
+
+
+@dataclass(frozen=True)
+class BudgetDecision:
+    action: str = BUDGET_CONTINUE
+    reason: str = ""
+
+
+@dataclass(frozen=True)
+class _RoundCost:
+    seconds: float
+    tokens: float
+    price: float
+
+    def smoothed(self, latest: _RoundCost) -> _RoundCost:
+        weight = _PROJECTION_SMOOTHING
+        return _RoundCost(
+            seconds=self.seconds + weight * (latest.seconds - self.seconds),
+            tokens=self.tokens + weight * (latest.tokens - self.tokens),
+            price=self.price + weight * (latest.price - self.price),
+        )
+
+
+def downgrade_reasoning_effort(current: Any) -> str | None:
+    return _REASONING_EFFORT_DOWNGRADE.get(str(current or "").lower())
+
+
+class BudgetController:
+    """Project the next round's cost and detect repeated tool-call rounds."""
+
+    def __init__(self, limits: BudgetLimits) -> None:
+        self.limits = limits
+        self.cycle_count = 0
+        # Exponential moving average of the round costs so far.
+        self._projection: _RoundCost | None = None
+        self._total_tokens = 0
+        self._total_price = 0.0
+        # Tool-call sets of the latest rounds, oldest first.
+        self._recent_tool_call_sets: list[tuple[tuple[str, str], ...]] = []
+
+    @property
+    def total_tokens(self) -> int:
+        return self._total_tokens
+
+    @property
+    def total_price(self) -> float:
+        return self._total_price
+
+    def record_round(self, *, seconds: float, usage: Any) -> None:
+        """Record a finished round from the run's accumulated usage."""
+        tokens = int(getattr(usage, "total_tokens", 0) or 0)
+        price = float(getattr(usage, "total_price", 0) or 0)
+        latest = _RoundCost(
+            seconds=max(0.0, seconds),
+            tokens=max(0, tokens - self._total_tokens),
+            price=max(0.0, price - self._total_price),
+        )
+        self._projection = (
+            latest
+            if self._projection is None
+            else self._projection.smoothed(latest)
+        )
+        self._total_tokens = max(self._total_tokens, tokens)
+        self._total_price = max(self._total_price, price)
+
+    def check(
+        self, *, elapsed_seconds: float, can_downgrade: bool
+    ) -> BudgetDecision:
+        if not self.limits.enabled:
+            return BudgetDecision()
+
+        reason = self._exceeded_limit(
+            elapsed_seconds, self._total_tokens, self._total_price
+        )
+        if reason:
+            return BudgetDecision(action=BUDGET_STOP, reason=reason)
+        projection = self._projection
+        if projection is None:
+            return BudgetDecision()
+
+        # Project with recent rounds so one expensive early round does not
+        # keep forcing downgrades after the run has become cheap.
+        reason = self._exceeded_limit(
+            elapsed_seconds + projection.seconds,
+            self._total_tokens + projection.tokens,
+            self._total_price + projection.price,
+        )
+        if not reason:
+            return BudgetDecision()
+        if can_downgrade:
+            return BudgetDecision(action=BUDGET_DOWNGRADE, reason=reason)
+        return BudgetDecision(action=BUDGET_STOP, reason=reason)
+
+    def is_tool_call_cycle(
+        self, signatures: Iterable[tuple[str, str]]
+    ) -> bool:
+        """
+        Return True when the round repeats the previous round exactly, or
+        completes an A/B/A/B alternation. Calls that come back after other
+        work (read -> write -> read, polling between other steps) are not
+        cycles: their results may have changed.
+        """
+        key = tuple(sorted(signatures))
+        if not key:
+            return False
+        recent = self._recent_tool_call_sets
+        cycle = bool(recent) and key == recent[-1]
+        if not cycle and len(recent) >= 3:
+            cycle = key == recent[-2] and recent[-1] == recent[-3]
+        recent.append(key)
+        del recent[:-3]
+        if cycle:
+            self.cycle_count += 1
+        return cycle
+
+    def _exceeded_limit(
+        self, elapsed_seconds: float, tokens: float, price: float
+    ) -> str:
+        limits = self.limits
+        if limits.max_run_seconds > 0 and (
+            elapsed_seconds >= limits.max_run_seconds
+        ):
+            return "max_run_seconds"
+        if limits.max_total_tokens > 0 and tokens >= limits.max_total_tokens:
+            return "max_total_tokens"
+        if limits.max_total_price > 0 and price >= limits.max_total_price:
+            return "max_total_price"
+        return ""
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 from collections.abc import Mapping
+from functools import lru_cache
 from typing import Any
 
 try:
@@ -20,6 +21,8 @@ except ModuleNotFoundError:
     )
 
 
+_SYSTEM_INSTRUCTION_CACHE_SIZE = 256
+
 _POLICY_TAG_BY_KEY: dict[str, str] = {
     "persistence_policy": "persistence",
     "context_gathering_policy": "context_gathering",
@@ -32,7 +35,22 @@ def build_system_instruction(
     base_instruction: str,
     prompt_policy_overrides: str | None = None,
 ) -> str:
-    instruction = (base_instruction or "").strip()
+    # Normalize before the cache lookup so equivalent inputs share one
+    # entry and always render the same bytes (stable prompt prefix).
+    return _render_system_instruction(
+        (base_instruction or "").strip(),
+        (prompt_policy_overrides or "").strip(),
+    )
+
+
+def clear_system_instruction_cache() -> None:
+    _render_system_instruction.cache_clear()
+
+
+@lru_cache(maxsize=_SYSTEM_INSTRUCTION_CACHE_SIZE)
+def _render_system_instruction(
+    instruction: str, prompt_policy_overrides: str
+) -> str:
     if not instruction:
         instruction = "You are a helpful GPT-5 agent."
 
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+PHASE_PROMPT_ORGANIZATION = "prompt_organization"
+PHASE_RECALC_MAX_TOKENS = "recalc_llm_max_tokens"
+PHASE_MODEL_CONFIG = "model_config"
+PHASE_MODEL_FIRST_CHUNK = "model_first_chunk"
+PHASE_MODEL_STREAM_DRAIN = "model_stream_drain"
+PHASE_ARGUMENT_NORMALIZATION = "argument_normalization"
+
+
+@dataclass
+class ToolTiming:
+    tool_call_id: str
+    name: str
+    started_at: float = field(default_factory=time.perf_counter)
+    first_response_seconds: float | None = None
+    total_seconds: float = 0.0
+
+    def mark_response(self) -> None:
+        if self.first_response_seconds is None:
+            self.first_response_seconds = time.perf_counter() - self.started_at
+
+    def finish(self) -> None:
+        self.total_seconds = time.perf_counter() - self.started_at
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "tool_call_id": self.tool_call_id,
+            "name": self.name,
+            "first_response_seconds": (
+                None
+                if self.first_response_seconds is None
+                else round(self.first_response_seconds, 6)
+            ),
+            "total_seconds": round(self.total_seconds, 6),
+        }
+
+
+@dataclass
+class RoundTiming:
+    round: int
+    started_at: float
+    total_seconds: float = 0.0
+    phases: dict[str, float] = field(default_factory=dict)
+    tools: list[ToolTiming] = field(default_factory=list)
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "round": self.round,
+            "total_seconds": round(self.total_seconds, 6),
+            "phases": {
+                name: round(seconds, 6)
+                for name, seconds in self.phases.items()
+            },
+            "tools": [tool.to_dict() for tool in self.tools],
+        }
+
+
+class StackSampler:
+    """Sample the call stack of one thread at a fixed interval.
+
+    Samples are aggregated as collapsed stacks (``outer;inner count``),
+    which flame graph tooling consumes directly.
+    """
+
+    def __init__(
+        self,
+        *,
+        thread_id: int | None = None,
+        interval_seconds: float = 0.005,
+        max_depth: int = 64,
+        max_samples: int = 20_000,
+    ) -> None:
+        self._thread_id = (
+            thread_id if thread_id is not None else threading.get_ident()
+        )
+        self._interval_seconds = max(0.001, float(interval_seconds))
+        self._max_depth = max_depth
+        self._max_samples = max_samples
+        self._sample_count = 0
+        self._samples: Counter[str] = Counter()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="gpt5-agent-stack-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+
+    def sample_once(self) -> None:
+        frame = sys._current_frames().get(self._thread_id)
+        if frame is None:
+            return
+        names: list[str] = []
+        while frame is not None and len(names) < self._max_depth:
+            code = frame.f_code
+            names.append(
+                f"{code.co_name} ({code.co_filename}:{frame.f_lineno})"
+            )
+            frame = frame.f_back
+        self._samples[";".join(reversed(names))] += 1
+        self._sample_count += 1
+
+    def collapsed_stacks(self, limit: int = 50) -> list[str]:
+        return [
+            f"{stack} {count}"
+            for stack, count in self._samples.most_common(limit)
+        ]
+
+    def _run(self) -> None:
+        # The sample cap also bounds a sampler whose run was abandoned
+        # before ``stop`` could be called (e.g. a closed generator).
+        while not self._stop_event.wait(self._interval_seconds):
+            if self._sample_count >= self._max_samples:
+                return
+            self.sample_once()
+
+
+class RunProfiler:
+    """Collect per-round phase timings for a single agent run."""
+
+    def __init__(
+        self,
+        *,
+        sampler: StackSampler | None = None,
+        slow_run_threshold_seconds: float | None = None,
+    ) -> None:
+        self.started_at = time.perf_counter()
+        self.finished_at: float | None = None
+        self.rounds: list[RoundTiming] = []
+        self._sampler = sampler
+        self._slow_run_threshold_seconds = slow_run_threshold_seconds
+        if self._sampler is not None:
+            self._sampler.start()
+
+    @property
+    def current_round(self) -> RoundTiming | None:
+        return self.rounds[-1] if self.rounds else None
+
+    def start_round(self, round_number: int) -> RoundTiming:
+        round_timing = RoundTiming(
+            round=round_number, started_at=time.perf_counter()
+        )
+        self.rounds.append(round_timing)
+        return round_timing
+
+    def finish_round(self) -> float:
+        round_timing = self.current_round
+        if round_timing is None:
+            return 0.0
+        round_timing.total_seconds = (
+            time.perf_counter() - round_timing.started_at
+        )
+        return round_timing.total_seconds
+
+    def record_phase(self, name: str, seconds: float) -> None:
+        round_timing = self.current_round
+        if round_timing is None:
+            return
+        round_timing.add_phase(name, seconds)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_phase(name, time.perf_counter() - started_at)
+
+    def start_tool(self, tool_call_id: str, name: str) -> ToolTiming:
+        tool_timing = ToolTiming(tool_call_id=tool_call_id, name=name)
+        round_timing = self.current_round
+        if round_timing is not None:
+            round_timing.tools.append(tool_timing)
+        return tool_timing
+
+    def finish(self) -> None:
+        if self.finished_at is not None:
+            return
+        self.finished_at = time.perf_counter()
+        if self._sampler is not None:
+            self._sampler.stop()
+
+    @property
+    def elapsed_seconds(self) -> float:
+        finished_at = (
+            self.finished_at
+            if self.finished_at is not None
+            else time.perf_counter()
+        )
+        return finished_at - self.started_at
+
+    def is_slow_run(self) -> bool:
+        if self._slow_run_threshold_seconds is None:
+            return False
+        return self.elapsed_seconds >= self._slow_run_threshold_seconds
+
+    def phase_totals(self) -> dict[str, float]:
+        totals: dict[str, float] = {}
+        for round_timing in self.rounds:
+            for name, seconds in round_timing.phases.items():
+                totals[name] = totals.get(name, 0.0) + seconds
+            for tool in round_timing.tools:
+                key = f"tool:{tool.name}"
+                totals[key] = totals.get(key, 0.0) + tool.total_seconds
+        return {name: round(seconds, 6) for name, seconds in totals.items()}
+
+    def flame_lines(self) -> list[str]:
+        """Render timings as collapsed stacks weighted in microseconds."""
+        lines: list[str] = []
+        for round_timing in self.rounds:
+            prefix = f"run;round_{round_timing.round}"
+            for name, seconds in round_timing.phases.items():
+                lines.append(f"{prefix};{name} {_to_micros(seconds)}")
+            for tool in round_timing.tools:
+                tool_prefix = f"{prefix};tool:{tool.name}"
+                first = tool.first_response_seconds
+                if first is None:
+                    lines.append(
+                        f"{tool_prefix} {_to_micros(tool.total_seconds)}"
+                    )
+                    continue
+                lines.append(
+                    f"{tool_prefix};first_response {_to_micros(first)}"
+                )
+                lines.append(
+                    f"{tool_prefix};drain "
+                    f"{_to_micros(max(0.0, tool.total_seconds - first))}"
+                )
+        return lines
+
+    def to_dict(self) -> dict[str, Any]:
+        report: dict[str, Any] = {
+            "total_seconds": round(self.elapsed_seconds, 6),
+            "rounds": [round_timing.to_dict() for round_timing in self.rounds],
+            "phase_totals": self.phase_totals(),
+            "flame": self.flame_lines(),
+        }
+        if self._sampler is not None and self.is_slow_run():
+            report["sampled_stacks"] = self._sampler.collapsed_stacks()
+        return report
+
+
+def _to_micros(seconds: float) -> int:
+    return max(0, int(seconds * 1_000_000))
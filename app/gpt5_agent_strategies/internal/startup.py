@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import importlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+WARM_START_ENV = "PLUGIN_WARM_START"
+WARM_START_OFF = "off"
+WARM_START_BACKGROUND = "background"
+WARM_START_BLOCKING = "blocking"
+_WARM_START_MODES = {
+    WARM_START_OFF,
+    WARM_START_BACKGROUND,
+    WARM_START_BLOCKING,
+}
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_warm_start_mode() -> str:
+    raw = os.getenv(WARM_START_ENV, "").strip().lower()
+    return raw if raw in _WARM_START_MODES else WARM_START_OFF
+
+
+def timed_import(name: str) -> float:
+    """Import ``name`` and return the seconds spent (0 if already loaded)."""
+    if name in sys.modules:
+        return 0.0
+    started_at = time.perf_counter()
+    importlib.import_module(name)
+    return time.perf_counter() - started_at
+
+
+class WarmStartManager:
+    """Pre-import heavy SDK modules and run warm-up hooks at startup.
+
+    In ``background`` mode the work runs on a daemon thread so plugin
+    registration is not delayed; ``blocking`` runs it inline. Failures are
+    recorded in the report and never raised.
+    """
+
+    def __init__(
+        self,
+        modules: Iterable[str],
+        warmers: Iterable[tuple[str, Callable[[], Any]]] = (),
+    ) -> None:
+        self.modules = tuple(modules)
+        self.warmers = tuple(warmers)
+        self.mode = WARM_START_OFF
+        self.timings: dict[str, float] = {}
+        self.errors: dict[str, str] = {}
+        self.total_seconds = 0.0
+        self._done = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self, mode: str | None = None) -> None:
+        self.mode = mode if mode is not None else resolve_warm_start_mode()
+        if self.mode == WARM_START_BLOCKING:
+            self.run()
+            return
+        if self.mode != WARM_START_BACKGROUND:
+            # Still report the registration timing recorded by main.py.
+            self._done.set()
+            self._log_report()
+            return
+        self._thread = threading.Thread(
+            target=self.run, name="plugin-warm-start", daemon=True
+        )
+        self._thread.start()
+
+    def run(self) -> None:
+        started_at = time.perf_counter()
+        try:
+            for name in self.modules:
+                self._record(f"import:{name}", lambda n=name: timed_import(n))
+            for label, warmer in self.warmers:
+                self._record(f"warm:{label}", lambda w=warmer: _timed_call(w))
+        finally:
+            self.total_seconds = time.perf_counter() - started_at
+            self._done.set()
+            self._log_report()
+
+    def record_timing(self, key: str, seconds: float) -> None:
+        self.timings[key] = seconds
+
+    def wait(self, timeout: float | None = None) -> bool:
+        return self._done.wait(timeout)
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "total_seconds": round(self.total_seconds, 6),
+            "timings": {
+                key: round(seconds, 6) for key, seconds in self.timings.items()
+            },
+            "errors": dict(self.errors),
+        }
+
+    def _log_report(self) -> None:
+        logger.info(
+            "plugin_warm_start %s", json.dumps(self.report(), sort_keys=True)
+        )
+
+    def _record(self, key: str, step: Callable[[], float]) -> None:
+        try:
+            self.timings[key] = step()
+        except Exception as exc:
+            self.errors[key] = f"{exc.__class__.__name__}: {exc}"
+
+
+def _timed_call(warmer: Callable[[], Any]) -> float:
+    started_at = time.perf_counter()
+    warmer()
+    return time.perf_counter() - started_at
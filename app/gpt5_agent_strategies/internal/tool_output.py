@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+
+class ToolResultBuffer:
+    """Accumulate the model-facing view of a tool result within a budget.
+
+    Text beyond ``max_chars`` is counted but not kept, and JSON payloads
+    are encoded incrementally so an oversized object is never rendered
+    into a single string.
+    """
+
+    def __init__(self, max_chars: int) -> None:
+        self._max_chars = max(0, int(max_chars))
+        self._parts: list[str] = []
+        self._size = 0
+        self._dropped_chars = 0
+        self._dropped_unknown = False
+
+    @property
+    def remaining(self) -> int:
+        return self._max_chars - self._size
+
+    @property
+    def truncated(self) -> bool:
+        return self._dropped_chars > 0 or self._dropped_unknown
+
+    def append(self, text: str) -> None:
+        if not text:
+            return
+        remaining = self.remaining
+        if remaining <= 0:
+            self._dropped_chars += len(text)
+            return
+        if len(text) > remaining:
+            self._parts.append(text[:remaining])
+            self._size += remaining
+            self._dropped_chars += len(text) - remaining
+            return
+        self._parts.append(text)
+        self._size += len(text)
+
+    def append_json(self, value: Any) -> None:
+        if self.remaining <= 0:
+            self._dropped_unknown = True
+            return
+        encoder = json.JSONEncoder(ensure_ascii=False)
+        for piece in encoder.iterencode(value):
+            if self.remaining <= 0:
+                # Stop encoding; the rest of the payload is never built.
+                self._dropped_unknown = True
+                return
+            self.append(piece)
+
+    def render(self) -> str:
+        text = "".join(self._parts)
+        if self._dropped_unknown:
+            return f"{text}\n[tool output truncated]"
+        if self._dropped_chars:
+            return (
+                f"{text}\n[tool output truncated: "
+                f"{self._dropped_chars} more chars]"
+            )
+        return text
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import json
 from collections.abc import Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any
 
 
@@ -47,3 +48,62 @@ def resolve_tool_instance(
     tool_instances: Mapping[str, Any], tool_name: str
 ) -> Any | None:
     return tool_instances.get(tool_name)
+
+
+@dataclass(frozen=True)
+class CompiledToolParameter:
+    name: str
+    type: str
+    required: bool
+    options: frozenset[str]
+    option_values: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class CompiledToolValidator:
+    """Argument lookup table built once per tool schema."""
+
+    parameters: Mapping[str, CompiledToolParameter]
+    source_parameters: Any = field(default=None, compare=False, repr=False)
+    source_count: int = 0
+
+    def matches(self, tool_instance: Any) -> bool:
+        parameters = getattr(tool_instance, "parameters", None)
+        return parameters is self.source_parameters and (
+            len(parameters or []) == self.source_count
+        )
+
+
+def parameter_option_values(parameter: Any) -> list[str]:
+    values: list[str] = []
+    for option in getattr(parameter, "options", []) or []:
+        if isinstance(option, Mapping):
+            option_value = option.get("value")
+        else:
+            option_value = getattr(option, "value", None)
+        if option_value is None:
+            continue
+        values.append(str(option_value))
+    return values
+
+
+def compile_tool_validator(tool_instance: Any) -> CompiledToolValidator:
+    source_parameters = getattr(tool_instance, "parameters", None)
+    compiled: dict[str, CompiledToolParameter] = {}
+    for parameter in source_parameters or []:
+        name = str(getattr(parameter, "name", "") or "")
+        if not name:
+            continue
+        option_values = tuple(parameter_option_values(parameter))
+        compiled[name] = CompiledToolParameter(
+            name=name,
+            type=str(getattr(parameter, "type", "") or "").lower(),
+            required=bool(getattr(parameter, "required", False)),
+            options=frozenset(option_values),
+            option_values=option_values,
+        )
+    return CompiledToolValidator(
+        parameters=MappingProxyType(compiled),
+        source_parameters=source_parameters,
+        source_count=len(source_parameters or []),
+    )
@@ -1,7 +1,17 @@
 import os
+import time
 
 from dify_plugin import DifyPluginEnv, Plugin
 
+try:
+    from app.gpt5_agent_strategies.internal.policy import (
+        build_system_instruction,
+    )
+    from app.gpt5_agent_strategies.internal.startup import WarmStartManager
+except ModuleNotFoundError:
+    from internal.policy import build_system_instruction
+    from internal.startup import WarmStartManager
+
 _TIMEOUT_MIN_SECONDS = 60
 _TIMEOUT_MAX_SECONDS = 3600
 _DEFAULT_MAX_REQUEST_TIMEOUT = 1800
@@ -21,6 +31,7 @@ def _read_timeout(name: str, default: int) -> int:
     return max(_TIMEOUT_MIN_SECONDS, min(_TIMEOUT_MAX_SECONDS, timeout_value))
 
 
+_registration_started_at = time.perf_counter()
 plugin = Plugin(
     DifyPluginEnv(
         MAX_REQUEST_TIMEOUT=_read_timeout(
@@ -31,6 +42,15 @@ plugin = Plugin(
         ),
     )
 )
+# Renders the default policy prompt into the instruction cache.
+warm_start = WarmStartManager(
+    (),
+    warmers=(("system_instruction", lambda: build_system_instruction("")),),
+)
+warm_start.record_timing(
+    "register:plugin", time.perf_counter() - _registration_started_at
+)
 
 if __name__ == "__main__":
+    warm_start.start()
     plugin.run()
@@ -33,24 +33,70 @@ from dify_plugin.interfaces.agent import (
 from pydantic import BaseModel
 
 try:
+    from app.gpt5_agent_strategies.internal.budget import (
+        BUDGET_DOWNGRADE,
+        BUDGET_STOP,
+        BudgetController,
+        BudgetLimits,
+        downgrade_reasoning_effort,
+    )
     from app.gpt5_agent_strategies.internal.flow import (
         build_round_prompt_messages,
         extract_blocking_tool_calls,
         extract_stream_tool_calls,
         should_emit_response_text,
     )
+    from app.gpt5_agent_strategies.internal.policy import (
+        build_system_instruction,
+    )
+    from app.gpt5_agent_strategies.internal.profiling import (
+        PHASE_ARGUMENT_NORMALIZATION,
+        PHASE_MODEL_CONFIG,
+        PHASE_MODEL_FIRST_CHUNK,
+        PHASE_MODEL_STREAM_DRAIN,
+        PHASE_PROMPT_ORGANIZATION,
+        PHASE_RECALC_MAX_TOKENS,
+        RunProfiler,
+        StackSampler,
+    )
+    from app.gpt5_agent_strategies.internal.tool_output import ToolResultBuffer
     from app.gpt5_agent_strategies.internal.tooling import (
+        CompiledToolValidator,
+        compile_tool_validator,
+        parameter_option_values,
         parse_tool_arguments,
         resolve_tool_instance,
     )
 except ModuleNotFoundError:
+    from internal.budget import (
+        BUDGET_DOWNGRADE,
+        BUDGET_STOP,
+        BudgetController,
+        BudgetLimits,
+        downgrade_reasoning_effort,
+    )
     from internal.flow import (
         build_round_prompt_messages,
         extract_blocking_tool_calls,
         extract_stream_tool_calls,
         should_emit_response_text,
     )
+    from internal.policy import build_system_instruction
+    from internal.profiling import (
+        PHASE_ARGUMENT_NORMALIZATION,
+        PHASE_MODEL_CONFIG,
+        PHASE_MODEL_FIRST_CHUNK,
+        PHASE_MODEL_STREAM_DRAIN,
+        PHASE_PROMPT_ORGANIZATION,
+        PHASE_RECALC_MAX_TOKENS,
+        RunProfiler,
+        StackSampler,
+    )
+    from internal.tool_output import ToolResultBuffer
     from internal.tooling import (
+        CompiledToolValidator,
+        compile_tool_validator,
+        parameter_option_values,
         parse_tool_arguments,
         resolve_tool_instance,
     )
@@ -124,6 +170,9 @@ class GPT5FunctionCallingParams(BaseModel):
     invocation_timeout_seconds: int = 1200
     emit_intermediate_thoughts: bool = False
     allow_schemaless_tool_args: bool = False
+    max_run_seconds: float = 0.0
+    max_total_tokens: int = 0
+    max_total_price: float = 0.0
     context: list[ContextItem] | None = None
 
 
@@ -134,9 +183,19 @@ class GPT5FunctionCallingStrategy(AgentStrategy):
     _REPEATED_TOOL_INVOKE_ERROR_MESSAGE = (
         "tool invoke error: repeated failure detected; skipped duplicate call"
     )
+    _TOOL_CALL_CYCLE_MESSAGE = (
+        "Repeated tool call detected: the same calls already ran in the "
+        "previous rounds. Use the earlier results to answer."
+    )
+    _MAX_TOOL_CALL_CYCLES = 2
     _VERBOSE_LOG_ENV = "GPT5_AGENT_VERBOSE_LOGGING"
     _VERBOSE_LOG_PREVIEW_ENV = "GPT5_AGENT_VERBOSE_LOG_PREVIEW"
     _SCHEMELESS_OVERRIDE_ENV = "GPT5_AGENT_ALLOW_SCHEMELESS_OVERRIDE"
+    _PROFILE_SAMPLING_ENV = "GPT5_AGENT_PROFILE_SAMPLING"
+    _PROFILE_SLOW_RUN_SECONDS_ENV = "GPT5_AGENT_PROFILE_SLOW_RUN_SECONDS"
+    _DEFAULT_PROFILE_SLOW_RUN_SECONDS = 30.0
+    _MAX_TOOL_RESULT_CHARS_ENV = "GPT5_AGENT_MAX_TOOL_RESULT_CHARS"
+    _DEFAULT_MAX_TOOL_RESULT_CHARS = 100_000
     _MAX_SCHEMELESS_ARG_KEYS = 16
     _MAX_SCHEMELESS_ARG_KEY_CHARS = 64
     _MAX_SCHEMELESS_ARG_VALUE_CHARS = 2048
@@ -155,6 +214,7 @@ class GPT5FunctionCallingStrategy(AgentStrategy):
     query: str = ""
     instruction: str | None = ""
     prompt_policy_overrides: str | None = None
+    _tool_validators: dict[str, CompiledToolValidator] | None = None
 
     @property
     def _user_prompt_message(self) -> UserPromptMessage:
@@ -162,15 +222,6 @@ class GPT5FunctionCallingStrategy(AgentStrategy):
 
     @property
     def _system_prompt_message(self) -> SystemPromptMessage:
-        try:
-            from app.gpt5_agent_strategies.internal.policy import (
-                build_system_instruction,
-            )
-        except ModuleNotFoundError:
-            from internal.policy import (
-                build_system_instruction,
-            )
-
         return SystemPromptMessage(
             content=build_system_instruction(
                 self.instruction or "",
@@ -185,6 +236,18 @@ class GPT5FunctionCallingStrategy(AgentStrategy):
         Run FunctionCall agent application
         """
         fc_params = GPT5FunctionCallingParams(**parameters)
+        profiler = self._create_run_profiler()
+        try:
+            yield from self._run_rounds(fc_params, profiler)
+        finally:
+            # Stops the stack sampler on errors and abandoned runs too.
+            profiler.finish()
+
+    def _run_rounds(
+        self,
+        fc_params: GPT5FunctionCallingParams,
+        profiler: RunProfiler,
+    ) -> Generator[AgentInvokeMessage, None, None]:
 
         # init prompt messages
         query = fc_params.query
@@ -249,11 +312,49 @@ class GPT5FunctionCallingStrategy(AgentStrategy):
         llm_usage: dict[str, LLMUsage | None] = {"usage": None}
         final_answer = ""
         failed_tool_invocations: dict[tuple[str, str], str] = {}
+        max_tool_result_chars = self._max_tool_result_chars()
+        budget = BudgetController(
+            BudgetLimits(
+                max_run_seconds=max(0.0, float(fc_params.max_run_seconds)),
+                max_total_tokens=max(0, int(fc_params.max_total_tokens)),
+                max_total_price=max(0.0, float(fc_params.max_total_price)),
+            )
+        )
 
         while function_call_state and iteration_step <= max_iteration_steps:
+            reasoning_effort = (model.completion_params or {}).get(
+                "reasoning_effort"
+            )
+            downgraded_effort = downgrade_reasoning_effort(reasoning_effort)
+            budget_decision = budget.check(
+                elapsed_seconds=profiler.elapsed_seconds,
+                can_downgrade=downgraded_effort is not None,
+            )
+            if budget_decision.action == BUDGET_STOP:
+                self._emit_budget_event(
+                    "budget_stop",
+                    reason=budget_decision.reason,
+                    iteration_step=iteration_step,
+                )
+                yield self.create_text_message(
+                    "Run stopped before completion: budget limit "
+                    f"'{budget_decision.reason}' would be exceeded."
+                )
+                break
+            if budget_decision.action == BUDGET_DOWNGRADE:
+                self._emit_budget_event(
+                    "reasoning_effort_downgraded",
+                    reason=budget_decision.reason,
+                    iteration_step=iteration_step,
+                    from_effort=reasoning_effort,
+                    to_effort=downgraded_effort,
+                )
+                model.completion_params["reasoning_effort"] = downgraded_effort
+
             # start a new round
             function_call_state = False
             round_started_at = time.perf_counter()
+            profiler.start_round(iteration_step)
             round_log = self.create_log_message(
                 label=f"ROUND {iteration_step}",
                 data={},
@@ -265,15 +366,17 @@ class GPT5FunctionCallingStrategy(AgentStrategy):
             yield round_log
 
             # recalc llm max tokens
-            prompt_messages = self._organize_prompt_messages(
-                history_prompt_messages=history_prompt_messages,
-                current_thoughts=current_thoughts,
-                model=model,
-            )
-            if model.entity and model.completion_params:
-                self.recalc_llm_max_tokens(
-                    model.entity, prompt_messages, model.completion_params
+            with profiler.phase(PHASE_PROMPT_ORGANIZATION):
+                prompt_messages = self._organize_prompt_messages(
+                    history_prompt_messages=history_prompt_messages,
+                    current_thoughts=current_thoughts,
+                    model=model,
                 )
+            if model.entity and model.completion_params:
+                with profiler.phase(PHASE_RECALC_MAX_TOKENS):
+                    self.recalc_llm_max_tokens(
+                        model.entity, prompt_messages, model.completion_params
+                    )
             # invoke model
             model_started_at = time.perf_counter()
             model_log = self.create_log_message(
@@ -287,7 +390,9 @@ class GPT5FunctionCallingStrategy(AgentStrategy):
                 status=ToolInvokeMessage.LogMessage.LogStatus.START,
             )
             yield model_log
-            model_config = LLMModelConfig(**model.model_dump(mode="json"))
+            with profiler.phase(PHASE_MODEL_CONFIG):
+                model_config = LLMModelConfig(**model.model_dump(mode="json"))
+            model_invoked_at = time.perf_counter()
             chunks: Generator[LLMResultChunk, None, None] | LLMResult = (
                 self.session.model.llm.invoke(
                     model_config=model_config,
@@ -312,7 +417,14 @@ class GPT5FunctionCallingStrategy(AgentStrategy):
                 stream_text_fragments: list[str] = []
                 deferred_stream_text_fragments: list[str] = []
                 stream_text_emitted = False
+                first_chunk_at: float | None = None
                 for chunk in chunks:
+                    if first_chunk_at is None:
+                        first_chunk_at = time.perf_counter()
+                        profiler.record_phase(
+                            PHASE_MODEL_FIRST_CHUNK,
+                            first_chunk_at - model_invoked_at,
+                        )
                     chunk_text_fragments: list[str] = []
                     # check if there is any tool call
                     if self.check_tool_calls(chunk):
@@ -357,6 +469,11 @@ class GPT5FunctionCallingStrategy(AgentStrategy):
                         deferred_stream_text_fragments.extend(
                             chunk_text_fragments
                         )
+                if first_chunk_at is not None:
+                    profiler.record_phase(
+                        PHASE_MODEL_STREAM_DRAIN,
+                        time.perf_counter() - first_chunk_at,
+                    )
 
                 if should_emit_response_text(
                     has_tool_calls=bool(tool_calls),
@@ -419,6 +536,10 @@ class GPT5FunctionCallingStrategy(AgentStrategy):
                                 yield self.create_text_message(visible_text)
 
             else:
+                profiler.record_phase(
+                    PHASE_MODEL_FIRST_CHUNK,
+                    time.perf_counter() - model_invoked_at,
+                )
                 result = chunks
                 result = cast(LLMResult, result)
                 # check if there is any tool call
@@ -592,14 +713,33 @@ class GPT5FunctionCallingStrategy(AgentStrategy):
 
             # call tools
             tool_responses = []
+            tool_call_cycle = budget.is_tool_call_cycle(
+                self._tool_invocation_signature(tool_call_name, tool_call_args)
+                for (
+                    _tool_call_id,
+                    tool_call_name,
+                    tool_call_args,
+                    _parse_error,
+                ) in tool_calls
+            )
+            if tool_call_cycle:
+                self._emit_budget_event(
+                    "tool_call_cycle_detected",
+                    iteration_step=iteration_step,
+                    cycle_count=budget.cycle_count,
+                    tool_names=sorted(
+                        {tool_call[1] for tool_call in tool_calls}
+                    ),
+                )
             # Check if max iterations reached.
             # Allow tool calls when max_iteration_steps == 1.
-            if (
+            if tool_call_cycle or (
                 tool_calls
                 and iteration_step == max_iteration_steps
                 and max_iteration_steps > 1
             ):
-                # Max iterations reached, return message instead of calling tools
+                # Max iterations reached or the calls repeat an earlier
+                # round, return message instead of calling tools
                 for (
                     tool_call_id,
                     tool_call_name,
@@ -627,14 +767,17 @@ class GPT5FunctionCallingStrategy(AgentStrategy):
                     yield tool_call_log
 
                     # Return error message instead of calling tool
+                    skipped_message = (
+                        f"Maximum iteration limit ({max_iteration_steps}) reached. "
+                        f"Cannot call tool '{tool_call_name}'. "
+                        f"Please consider increasing the iteration limit."
+                    )
+                    if tool_call_cycle:
+                        skipped_message = self._TOOL_CALL_CYCLE_MESSAGE
                     tool_response = {
                         "tool_call_id": tool_call_id,
                         "tool_call_name": tool_call_name,
-                        "tool_response": (
-                            f"Maximum iteration limit ({max_iteration_steps}) reached. "
-                            f"Cannot call tool '{tool_call_name}'. "
-                            f"Please consider increasing the iteration limit."
-                        ),
+                        "tool_response": skipped_message,
                     }
                     tool_responses.append(tool_response)
 
@@ -734,23 +877,24 @@ class GPT5FunctionCallingStrategy(AgentStrategy):
                         }
                     else:
                         # invoke tool
-                        normalized_tool_input, validation_error = (
-                            self._normalize_tool_invoke_parameters(
-                                tool_instance=tool_instance,
-                                runtime_parameters=dict(
-                                    getattr(
-                                        tool_instance,
-                                        "runtime_parameters",
-                                        {},
-                                    )
-                                    or {}
-                                ),
-                                tool_call_args=dict(tool_call_args),
-                                allow_schemaless_tool_args=(
-                                    allow_schemaless_tool_args
-                                ),
+                        with profiler.phase(PHASE_ARGUMENT_NORMALIZATION):
+                            normalized_tool_input, validation_error = (
+                                self._normalize_tool_invoke_parameters(
+                                    tool_instance=tool_instance,
+                                    runtime_parameters=dict(
+                                        getattr(
+                                            tool_instance,
+                                            "runtime_parameters",
+                                            {},
+                                        )
+                                        or {}
+                                    ),
+                                    tool_call_args=dict(tool_call_args),
+                                    allow_schemaless_tool_args=(
+                                        allow_schemaless_tool_args
+                                    ),
+                                )
                             )
-                        )
                         tool_signature = self._tool_invocation_signature(
                             tool_call_name, normalized_tool_input
                         )
@@ -782,119 +926,136 @@ class GPT5FunctionCallingStrategy(AgentStrategy):
                                     ).to_dict(),
                                 }
                             else:
-                                tool_invoke_responses = self.session.tool.invoke(
-                                    provider_type=ToolProviderType(
-                                        tool_instance.provider_type
-                                    ),
-                                    provider=tool_instance.identity.provider,
-                                    tool_name=tool_instance.identity.name,
-                                    parameters=normalized_tool_input,
+                                tool_timing = profiler.start_tool(
+                                    tool_call_id, tool_call_name
                                 )
-                                tool_result = ""
-                                for (
-                                    tool_invoke_response
-                                ) in tool_invoke_responses:
-                                    if (
-                                        tool_invoke_response.type
-                                        == ToolInvokeMessage.MessageType.TEXT
-                                    ):
-                                        tool_result += cast(
-                                            ToolInvokeMessage.TextMessage,
-                                            tool_invoke_response.message,
-                                        ).text
-                                    elif (
-                                        tool_invoke_response.type
-                                        == ToolInvokeMessage.MessageType.LINK
-                                    ):
-                                        tool_result += (
-                                            "result link: "
-                                            + cast(
-                                                ToolInvokeMessage.TextMessage,
-                                                tool_invoke_response.message,
-                                            ).text
-                                            + "."
-                                            + " please tell user to check it."
-                                        )
-                                    elif tool_invoke_response.type in {
-                                        ToolInvokeMessage.MessageType.IMAGE_LINK,
-                                        ToolInvokeMessage.MessageType.IMAGE,
-                                    }:
-                                        # Extract file path or URL from the message.
-                                        if hasattr(
-                                            tool_invoke_response.message,
-                                            "text",
+                                try:
+                                    tool_invoke_responses = self.session.tool.invoke(
+                                        provider_type=ToolProviderType(
+                                            tool_instance.provider_type
+                                        ),
+                                        provider=tool_instance.identity.provider,
+                                        tool_name=tool_instance.identity.name,
+                                        parameters=normalized_tool_input,
+                                    )
+                                    tool_output = ToolResultBuffer(
+                                        max_tool_result_chars
+                                    )
+                                    for (
+                                        tool_invoke_response
+                                    ) in tool_invoke_responses:
+                                        tool_timing.mark_response()
+                                        if (
+                                            tool_invoke_response.type
+                                            == ToolInvokeMessage.MessageType.TEXT
                                         ):
-                                            file_info = cast(
-                                                ToolInvokeMessage.TextMessage,
+                                            tool_output.append(
+                                                cast(
+                                                    ToolInvokeMessage.TextMessage,
+                                                    tool_invoke_response.message,
+                                                ).text
+                                            )
+                                        elif (
+                                            tool_invoke_response.type
+                                            == ToolInvokeMessage.MessageType.LINK
+                                        ):
+                                            tool_output.append(
+                                                "result link: "
+                                                + cast(
+                                                    ToolInvokeMessage.TextMessage,
+                                                    tool_invoke_response.message,
+                                                ).text
+                                                + "."
+                                                + " please tell user to check it."
+                                            )
+                                        elif tool_invoke_response.type in {
+                                            ToolInvokeMessage.MessageType.IMAGE_LINK,
+                                            ToolInvokeMessage.MessageType.IMAGE,
+                                        }:
+                                            # Extract file path or URL from the message.
+                                            if hasattr(
                                                 tool_invoke_response.message,
-                                            ).text
-                                            # Try to create a blob response from file.
-                                            try:
-                                                read_local_file = (
-                                                    self._read_local_file_for_blob
-                                                )
-                                                local_file = read_local_file(
-                                                    file_info
-                                                )
-                                                if local_file is not None:
-                                                    file_content, filename = (
-                                                        local_file
+                                                "text",
+                                            ):
+                                                file_info = cast(
+                                                    ToolInvokeMessage.TextMessage,
+                                                    tool_invoke_response.message,
+                                                ).text
+                                                # Blob response from the local file.
+                                                try:
+                                                    read_local_file = (
+                                                        self._read_local_file_for_blob
                                                     )
-                                                    blob = self.create_blob_message(
-                                                        blob=file_content,
-                                                        meta={
-                                                            "mime_type": (
-                                                                "image/png"
-                                                            ),
-                                                            "filename": filename,
-                                                        },
+                                                    local_file = (
+                                                        read_local_file(
+                                                            file_info
+                                                        )
                                                     )
-                                                    yield blob
-                                            except Exception:
-                                                logger.exception(
-                                                    "Failed to create blob message "
-                                                    "from local image output"
-                                                )
-                                                yield self.create_text_message(
-                                                    "Failed to process generated "
-                                                    "image file."
-                                                )
-                                        tool_result += (
-                                            "image generated and sent to user. "
-                                            "Tell user to review it now."
-                                        )
-                                        yield self._to_agent_invoke_message(
-                                            tool_invoke_response
-                                        )
-                                    elif (
-                                        tool_invoke_response.type
-                                        == ToolInvokeMessage.MessageType.JSON
-                                    ):
-                                        text = json.dumps(
-                                            cast(
-                                                ToolInvokeMessage.JsonMessage,
-                                                tool_invoke_response.message,
-                                            ).json_object,
-                                            ensure_ascii=False,
-                                        )
-                                        tool_result += (
-                                            f"tool response: {text}."
-                                        )
-                                    elif (
-                                        tool_invoke_response.type
-                                        == ToolInvokeMessage.MessageType.BLOB
-                                    ):
-                                        tool_result += "Generated file ... "
-                                        yield self._to_agent_invoke_message(
-                                            tool_invoke_response
-                                        )
-                                    else:
-                                        response_repr = repr(
-                                            tool_invoke_response.message
-                                        )
-                                        tool_result += (
-                                            f"tool response: {response_repr}."
-                                        )
+                                                    if local_file is not None:
+                                                        (
+                                                            file_content,
+                                                            filename,
+                                                        ) = local_file
+                                                        blob = self.create_blob_message(
+                                                            blob=file_content,
+                                                            meta={
+                                                                "mime_type": (
+                                                                    "image/png"
+                                                                ),
+                                                                "filename": filename,
+                                                            },
+                                                        )
+                                                        yield blob
+                                                except Exception:
+                                                    logger.exception(
+                                                        "Failed to create blob message "
+                                                        "from local image output"
+                                                    )
+                                                    yield self.create_text_message(
+                                                        "Failed to process generated "
+                                                        "image file."
+                                                    )
+                                            tool_output.append(
+                                                "image generated and sent to user. "
+                                                "Tell user to review it now."
+                                            )
+                                            yield self._to_agent_invoke_message(
+                                                tool_invoke_response
+                                            )
+                                        elif (
+                                            tool_invoke_response.type
+                                            == ToolInvokeMessage.MessageType.JSON
+                                        ):
+                                            tool_output.append(
+                                                "tool response: "
+                                            )
+                                            tool_output.append_json(
+                                                cast(
+                                                    ToolInvokeMessage.JsonMessage,
+                                                    tool_invoke_response.message,
+                                                ).json_object
+                                            )
+                                            tool_output.append(".")
+                                        elif (
+                                            tool_invoke_response.type
+                                            == ToolInvokeMessage.MessageType.BLOB
+                                        ):
+                                            tool_output.append(
+                                                "Generated file ... "
+                                            )
+                                            yield self._to_agent_invoke_message(
+                                                tool_invoke_response
+                                            )
+                                        else:
+                                            response_repr = repr(
+                                                tool_invoke_response.message
+                                            )
+                                            tool_output.append(
+                                                f"tool response: {response_repr}."
+                                            )
+                                finally:
+                                    tool_timing.finish()
+                                tool_result = tool_output.render()
                                 tool_response = {
                                     "tool_call_id": tool_call_id,
                                     "tool_call_name": tool_call_name,
@@ -946,6 +1107,9 @@ class GPT5FunctionCallingStrategy(AgentStrategy):
                 self.update_prompt_message_tool(
                     tool_instances[prompt_tool.name], prompt_tool
                 )
+            budget.record_round(
+                seconds=profiler.finish_round(), usage=llm_usage["usage"]
+            )
             yield self.finish_log_message(
                 log=round_log,
                 data=self._build_round_log_data(
@@ -976,6 +1140,11 @@ class GPT5FunctionCallingStrategy(AgentStrategy):
             if tool_responses and max_iteration_steps == 1:
                 for resp in tool_responses:
                     yield self.create_text_message(str(resp["tool_response"]))
+            if (
+                tool_call_cycle
+                and budget.cycle_count >= self._MAX_TOOL_CALL_CYCLES
+            ):
+                function_call_state = False
             iteration_step += 1
 
         # If context is a list of dict, create retriever resource message
@@ -1010,8 +1179,12 @@ class GPT5FunctionCallingStrategy(AgentStrategy):
             )
 
         metadata = ExecutionMetadata.from_llm_usage(llm_usage["usage"])
+        profiler.finish()
         yield self.create_json_message(
-            {"execution_metadata": metadata.model_dump()}
+            {
+                "execution_metadata": metadata.model_dump(),
+                "execution_profile": profiler.to_dict(),
+            }
         )
 
     def check_tool_calls(self, llm_result_chunk: LLMResultChunk) -> bool:
@@ -1132,6 +1305,39 @@ class GPT5FunctionCallingStrategy(AgentStrategy):
 
         return normalized or "まず、必要な情報を確認して進めます。"
 
+    def _create_run_profiler(self) -> RunProfiler:
+        sampler = (
+            StackSampler() if self._is_profile_sampling_enabled() else None
+        )
+        return RunProfiler(
+            sampler=sampler,
+            slow_run_threshold_seconds=self._profile_slow_run_seconds(),
+        )
+
+    def _is_profile_sampling_enabled(self) -> bool:
+        raw = str(os.getenv(self._PROFILE_SAMPLING_ENV, "") or "").strip()
+        return raw.lower() in {"1", "true", "yes", "on"}
+
+    def _profile_slow_run_seconds(self) -> float:
+        raw = str(
+            os.getenv(self._PROFILE_SLOW_RUN_SECONDS_ENV, "") or ""
+        ).strip()
+        if not raw:
+            return self._DEFAULT_PROFILE_SLOW_RUN_SECONDS
+        try:
+            return max(0.0, float(raw))
+        except ValueError:
+            return self._DEFAULT_PROFILE_SLOW_RUN_SECONDS
+
+    def _max_tool_result_chars(self) -> int:
+        raw = str(os.getenv(self._MAX_TOOL_RESULT_CHARS_ENV, "") or "").strip()
+        if not raw:
+            return self._DEFAULT_MAX_TOOL_RESULT_CHARS
+        try:
+            return max(1024, int(raw))
+        except ValueError:
+            return self._DEFAULT_MAX_TOOL_RESULT_CHARS
+
     def _is_verbose_logging_enabled(self) -> bool:
         raw = str(os.getenv(self._VERBOSE_LOG_ENV, "") or "").strip().lower()
         return raw in {"1", "true", "yes", "on"}
@@ -1147,6 +1353,13 @@ class GPT5FunctionCallingStrategy(AgentStrategy):
             json.dumps(event_payload, ensure_ascii=False, sort_keys=True),
         )
 
+    def _emit_budget_event(self, event_type: str, **payload: Any) -> None:
+        event_payload = {"event": event_type, **payload}
+        logger.warning(
+            "budget_event %s",
+            json.dumps(event_payload, ensure_ascii=False, sort_keys=True),
+        )
+
     def _is_verbose_preview_enabled(self) -> bool:
         raw = str(os.getenv(self._VERBOSE_LOG_PREVIEW_ENV, "") or "").strip()
         return raw.lower() in {"1", "true", "yes", "on"}
@@ -1309,11 +1522,7 @@ class GPT5FunctionCallingStrategy(AgentStrategy):
             **runtime_parameters,
             **tool_call_args,
         }
-        parameter_defs = {
-            str(getattr(parameter, "name", "") or ""): parameter
-            for parameter in getattr(tool_instance, "parameters", []) or []
-            if str(getattr(parameter, "name", "") or "")
-        }
+        parameter_defs = self._tool_validator(tool_instance).parameters
 
         if (
             not parameter_defs
@@ -1364,9 +1573,8 @@ class GPT5FunctionCallingStrategy(AgentStrategy):
                 )
 
         for parameter_name, parameter in parameter_defs.items():
-            required = bool(getattr(parameter, "required", False))
             if parameter_name not in normalized:
-                if required:
+                if parameter.required:
                     return (
                         normalized,
                         (
@@ -1387,8 +1595,7 @@ class GPT5FunctionCallingStrategy(AgentStrategy):
 
             normalized[parameter_name] = normalized_value
 
-            options = self._parameter_option_values(parameter)
-            if not options:
+            if not parameter.options:
                 continue
 
             raw_value = normalized[parameter_name]
@@ -1398,13 +1605,13 @@ class GPT5FunctionCallingStrategy(AgentStrategy):
                 else "false" if isinstance(raw_value, bool) else str(raw_value)
             )
 
-            if normalized_value not in options:
+            if normalized_value not in parameter.options:
                 return (
                     normalized,
                     (
                         f"tool arguments validation error: parameter "
                         f"'{parameter_name}' value {raw_value!r} "
-                        f"not in options {options}"
+                        f"not in options {list(parameter.option_values)}"
                     ),
                 )
 
@@ -1451,8 +1658,8 @@ class GPT5FunctionCallingStrategy(AgentStrategy):
                     "tool arguments validation error: argument key is too long "
                     f"without schema for tool '{tool_name}'"
                 )
-            value_chars = len(
-                json.dumps(raw_value, ensure_ascii=False, default=str)
+            value_chars = self._bounded_json_chars(
+                raw_value, self._MAX_SCHEMELESS_ARG_VALUE_CHARS
             )
             if value_chars > self._MAX_SCHEMELESS_ARG_VALUE_CHARS:
                 self._emit_security_event(
@@ -1533,17 +1740,57 @@ class GPT5FunctionCallingStrategy(AgentStrategy):
 
         return raw_value, None
 
+    @staticmethod
+    def _bounded_json_chars(value: Any, limit: int) -> int:
+        """Measure JSON length, stopping once ``limit`` is exceeded.
+
+        Past the limit the result is a lower bound, which is all the
+        callers need to reject the value.
+        """
+        if isinstance(value, str) and len(value) + 2 > limit:
+            # An encoded string is at least its length plus two quotes.
+            return len(value) + 2
+        if value is None or isinstance(value, (bool, int, float)):
+            return len(json.dumps(value, default=str))
+
+        chars = 0
+        encoder = json.JSONEncoder(ensure_ascii=False, default=str)
+        for piece in encoder.iterencode(value):
+            chars += len(piece)
+            if chars > limit:
+                break
+        return chars
+
     def _parameter_option_values(self, parameter: Any) -> list[str]:
-        values: list[str] = []
-        for option in getattr(parameter, "options", []) or []:
-            if isinstance(option, Mapping):
-                option_value = option.get("value")
-            else:
-                option_value = getattr(option, "value", None)
-            if option_value is None:
-                continue
-            values.append(str(option_value))
-        return values
+        return parameter_option_values(parameter)
+
+    def _tool_validator(
+        self, tool_instance: ToolEntity
+    ) -> CompiledToolValidator:
+        if self._tool_validators is None:
+            self._tool_validators = {}
+        validators = self._tool_validators
+        tool_name = self._tool_instance_name(tool_instance)
+        validator = validators.get(tool_name)
+        if validator is None or not validator.matches(tool_instance):
+            validator = compile_tool_validator(tool_instance)
+            validators[tool_name] = validator
+        return validator
+
+    def _init_prompt_tools(self, tools: list[ToolEntity] | None) -> list[Any]:
+        self._tool_validators = {
+            self._tool_instance_name(tool): compile_tool_validator(tool)
+            for tool in tools or []
+        }
+        return super()._init_prompt_tools(tools)
+
+    def update_prompt_message_tool(
+        self, tool: ToolEntity, prompt_tool: Any
+    ) -> Any:
+        updated = super().update_prompt_message_tool(tool, prompt_tool)
+        # Recompiles only when the tool's parameter schema was replaced.
+        self._tool_validator(tool)
+        return updated
 
     def _tool_invocation_signature(
         self, tool_call_name: str, parameters: dict[str, Any]
@@ -1,6 +1,10 @@
 import base64
 import binascii
+import hashlib
 import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any, Literal
 
@@ -12,11 +16,25 @@ SENSITIVE_CREDENTIAL_KEYS = (
     "gemini_api_key",
     "vertex_service_account_key",
 )
+CREDENTIAL_FINGERPRINT_KEYS = (
+    "api_key",
+    "gemini_api_key",
+    "vertex_project_id",
+    "vertex_location",
+    "vertex_service_account_key",
+)
 REQUIRED_SERVICE_ACCOUNT_FIELDS = (
     "client_email",
     "private_key",
     "token_uri",
 )
+# Errors after which a cached client's token or connection pool is suspect.
+# Matched by class name (including base classes) so google-auth, httpx and
+# requests do not have to be imported to classify an error.
+CLIENT_FAILURE_STATUS_CODES = frozenset({401, 403})
+CLIENT_FAILURE_ERROR_NAMES = frozenset(
+    {"RefreshError", "TransportError", "ConnectionError", "Timeout"}
+)
 
 
 @dataclass(frozen=True)
@@ -125,6 +143,83 @@ def make_genai_client(config: AuthConfig) -> Any:
     )
 
 
+def credential_fingerprint(credentials: dict[str, Any]) -> str:
+    payload = {
+        key: _clean_string(credentials.get(key))
+        for key in CREDENTIAL_FINGERPRINT_KEYS
+    }
+    encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def is_client_failure(error: BaseException) -> bool:
+    """Whether ``error`` points at the client (auth, transport), not the
+    request (invalid input, safety blocks, quota)."""
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    if getattr(error, "code", None) in CLIENT_FAILURE_STATUS_CODES:
+        return True
+    return any(
+        cls.__name__ in CLIENT_FAILURE_ERROR_NAMES
+        for cls in type(error).__mro__
+    )
+
+
+class GenaiClientCache:
+    """Reuse genai clients keyed by a fingerprint of the credentials.
+
+    A cached client keeps its google-auth credentials, so the access token
+    is reused until it expires, and keeps its HTTP connection pool. A
+    credential change produces a new fingerprint; the least recently used
+    clients beyond ``max_entries`` are dropped. Dropped clients are never
+    closed here: other invocations or batch workers may still hold them,
+    and they are released once the last of those finishes.
+    """
+
+    def __init__(self, max_entries: int = 4) -> None:
+        self._max_entries = max(1, max_entries)
+        self._clients: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+    def get(
+        self,
+        credentials: dict[str, Any],
+        factory: Callable[[AuthConfig], Any] = make_genai_client,
+    ) -> Any:
+        fingerprint = credential_fingerprint(credentials)
+        with self._lock:
+            client = self._clients.get(fingerprint)
+            if client is not None:
+                self._clients.move_to_end(fingerprint)
+                return client
+        # Only a cache miss pays for decoding the service account key, and
+        # building the client does not block lookups for other credentials.
+        client = factory(resolve_auth_config(credentials))
+        with self._lock:
+            existing = self._clients.get(fingerprint)
+            if existing is not None:
+                # Another call built one concurrently; share theirs.
+                self._clients.move_to_end(fingerprint)
+                return existing
+            self._clients[fingerprint] = client
+            while len(self._clients) > self._max_entries:
+                self._clients.popitem(last=False)
+        return client
+
+    def evict(self, credentials: dict[str, Any]) -> None:
+        """Stop handing out the client; callers holding it keep it."""
+        with self._lock:
+            self._clients.pop(credential_fingerprint(credentials), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clients.clear()
+
+
 def sanitize_error_message(
     error: Exception, credentials: dict[str, Any] | None = None
 ) -> str:
@@ -0,0 +1,96 @@
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any
+
+MAX_BATCH_SIZE = 8
+MAX_BATCH_WORKERS = 4
+RATE_LIMIT_RETRIES = 2
+RATE_LIMIT_BACKOFF_SECONDS = 2.0
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    index: int
+    prompt: str
+    aspect_ratio: str
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    job: BatchJob
+    response: Any = None
+    error: Exception | None = None
+
+
+def is_rate_limited_error(error: Exception) -> bool:
+    for name in ("code", "status_code"):
+        if getattr(error, name, None) == 429:
+            return True
+    status = getattr(error, "status", None)
+    return isinstance(status, str) and status.upper() == "RESOURCE_EXHAUSTED"
+
+
+class RateLimitGate:
+    """Hold back every worker of a batch after one of them is rate limited."""
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._clock = clock
+        self._sleep = sleep
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._resume_at = max(self._resume_at, self._clock() + seconds)
+
+    def wait(self) -> None:
+        with self._lock:
+            delay = self._resume_at - self._clock()
+        if delay > 0:
+            self._sleep(delay)
+
+
+def run_batch(
+    jobs: Sequence[BatchJob],
+    generate: Callable[[BatchJob], Any],
+    *,
+    max_workers: int = MAX_BATCH_WORKERS,
+    retries: int = RATE_LIMIT_RETRIES,
+    backoff_seconds: float = RATE_LIMIT_BACKOFF_SECONDS,
+    gate: RateLimitGate | None = None,
+) -> Iterator[BatchResult]:
+    """Run ``generate`` for each job and yield results as they complete."""
+    if not jobs:
+        return
+    gate = gate or RateLimitGate()
+
+    def run(job: BatchJob) -> BatchResult:
+        attempt = 0
+        while True:
+            gate.wait()
+            try:
+                return BatchResult(job=job, response=generate(job))
+            except Exception as exc:
+                if attempt >= retries or not is_rate_limited_error(exc):
+                    return BatchResult(job=job, error=exc)
+                attempt += 1
+                gate.pause(backoff_seconds * 2 ** (attempt - 1))
+
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(jobs))),
+        thread_name_prefix="nanobana-batch",
+    )
+    try:
+        futures = [executor.submit(run, job) for job in jobs]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        # A consumer that stops early must not wait for queued jobs.
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,230 @@
+import hashlib
+import io
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Any
+
+MAX_PREPROCESS_WORKERS = 4
+TARGET_EDGE_BY_IMAGE_SIZE = {"1K": 1024, "2K": 2048, "4K": 4096}
+DEFAULT_TARGET_EDGE = 1024
+JPEG_QUALITY = 90
+# Inline parts are cheaper than an upload round trip for small images.
+FILES_API_MIN_BYTES = 256 * 1024
+# The Files API keeps uploads for 48 hours; stop reusing them a bit early.
+FILES_API_TTL_SECONDS = 47 * 60 * 60
+_REENCODE_MIME_TYPES = {
+    "JPEG": "image/jpeg",
+    "PNG": "image/png",
+    "WEBP": "image/webp",
+}
+_METADATA_INFO_KEYS = ("exif", "xmp", "XML:com.adobe.xmp", "comment")
+
+
+@dataclass(frozen=True)
+class PreparedImage:
+    blob: bytes
+    mime_type: str
+    # sha256 of the source image (before downscaling).
+    digest: str
+    file_uri: str = ""
+    # sha256 of ``blob``; differs from ``digest`` once the image was
+    # re-encoded for a resolution.
+    blob_digest: str = ""
+
+    def content_digest(self) -> str:
+        return self.blob_digest or hashlib.sha256(self.blob).hexdigest()
+
+
+def _value(source: Any, *names: str) -> Any:
+    for name in names:
+        if isinstance(source, dict) and name in source:
+            return source[name]
+        if hasattr(source, name):
+            return getattr(source, name)
+    return None
+
+
+def target_edge(image_size: str) -> int:
+    return TARGET_EDGE_BY_IMAGE_SIZE.get(image_size, DEFAULT_TARGET_EDGE)
+
+
+def _has_alpha(image: Any) -> bool:
+    return image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+
+
+def _has_metadata(image: Any) -> bool:
+    return bool(image.getexif()) or any(
+        key in image.info for key in _METADATA_INFO_KEYS
+    )
+
+
+def prepare_image(
+    blob: bytes, mime_type: str, digest: str, max_edge: int
+) -> PreparedImage:
+    """Downscale ``blob`` to ``max_edge`` and drop EXIF/XMP metadata.
+
+    Images that are already small and carry no metadata, and images
+    Pillow cannot decode, are passed through unchanged.
+    """
+    from PIL import Image, ImageOps
+
+    original = PreparedImage(
+        blob=blob, mime_type=mime_type, digest=digest, blob_digest=digest
+    )
+    try:
+        with Image.open(io.BytesIO(blob)) as source:
+            source_format = source.format or ""
+            needs_resize = max(source.size) > max_edge
+            if not needs_resize and not _has_metadata(source):
+                return original
+
+            icc_profile = source.info.get("icc_profile")
+            alpha = _has_alpha(source)
+            # Apply the EXIF orientation before the EXIF block is dropped.
+            image = ImageOps.exif_transpose(source)
+            if image.mode not in ("RGB", "RGBA", "L", "LA"):
+                image = image.convert("RGBA" if alpha else "RGB")
+            if needs_resize:
+                image.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+
+            output_format = (
+                source_format
+                if source_format in _REENCODE_MIME_TYPES
+                else ("PNG" if alpha else "JPEG")
+            )
+            if output_format == "JPEG" and image.mode not in ("RGB", "L"):
+                image = image.convert("RGB")
+            options: dict[str, Any] = {"optimize": True}
+            if output_format in ("JPEG", "WEBP"):
+                options["quality"] = JPEG_QUALITY
+            if icc_profile:
+                options["icc_profile"] = icc_profile
+            buffer = io.BytesIO()
+            image.save(buffer, format=output_format, **options)
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return original
+
+    prepared_blob = buffer.getvalue()
+    return PreparedImage(
+        blob=prepared_blob,
+        mime_type=_REENCODE_MIME_TYPES[output_format],
+        digest=digest,
+        blob_digest=hashlib.sha256(prepared_blob).hexdigest(),
+    )
+
+
+def preprocess_images(
+    images: list[Any],
+    image_size: str,
+    *,
+    max_workers: int = MAX_PREPROCESS_WORKERS,
+) -> list[PreparedImage]:
+    """Validate, de-duplicate and downscale input images in parallel."""
+    sources: list[tuple[bytes, str, str]] = []
+    seen: set[str] = set()
+    for image in images:
+        blob = _value(image, "blob")
+        mime_type = _value(image, "mime_type", "mimeType")
+        if not isinstance(blob, bytes) or not mime_type:
+            raise ValueError(
+                "Each image file must include blob bytes and mime_type."
+            )
+        digest = hashlib.sha256(blob).hexdigest()
+        if digest in seen:
+            continue
+        seen.add(digest)
+        sources.append((blob, str(mime_type), digest))
+
+    max_edge = target_edge(image_size)
+    if len(sources) <= 1:
+        return [prepare_image(*source, max_edge) for source in sources]
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(sources))),
+        thread_name_prefix="nanobana-image",
+    ) as executor:
+        return list(
+            executor.map(
+                lambda source: prepare_image(*source, max_edge), sources
+            )
+        )
+
+
+@dataclass(frozen=True)
+class _UploadedFile:
+    file_uri: str
+    expires_at: float
+
+
+class UploadedFileCache:
+    """Reuse Gemini Files API uploads keyed by the uploaded bytes' digest.
+
+    Only the Developer API supports the Files API, so Vertex clients and
+    small images always stay inline. Upload failures fall back to inline
+    data rather than failing the generation.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_bytes: int = FILES_API_MIN_BYTES,
+        ttl_seconds: float = FILES_API_TTL_SECONDS,
+        max_entries: int = 256,
+        clock: Any = time.time,
+    ) -> None:
+        self._min_bytes = min_bytes
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max(1, max_entries)
+        self._clock = clock
+        self._files: OrderedDict[tuple[str, str], _UploadedFile] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def attach(
+        self, client: Any, namespace: str, images: list[PreparedImage]
+    ) -> list[PreparedImage]:
+        """Return ``images`` with ``file_uri`` set where an upload exists."""
+        if getattr(client, "vertexai", False):
+            return images
+        attached = [self._attach_one(client, namespace, i) for i in images]
+        if all(new is old for new, old in zip(attached, images, strict=True)):
+            return images
+        return attached
+
+    def _attach_one(
+        self, client: Any, namespace: str, image: PreparedImage
+    ) -> PreparedImage:
+        if len(image.blob) < self._min_bytes:
+            return image
+        # The uploaded bytes depend on the requested resolution, so the
+        # source digest alone would hand a 1K copy to a 4K request.
+        key = (namespace, image.content_digest())
+        now = self._clock()
+        with self._lock:
+            uploaded = self._files.get(key)
+            if uploaded is not None and uploaded.expires_at > now:
+                self._files.move_to_end(key)
+                return replace(image, file_uri=uploaded.file_uri)
+
+        try:
+            result = client.files.upload(
+                file=io.BytesIO(image.blob),
+                config={"mime_type": image.mime_type},
+            )
+        except Exception:
+            return image
+        file_uri = str(_value(result, "uri") or "")
+        if not file_uri:
+            return image
+
+        with self._lock:
+            self._files[key] = _UploadedFile(
+                file_uri=file_uri, expires_at=now + self._ttl_seconds
+            )
+            self._files.move_to_end(key)
+            while len(self._files) > self._max_entries:
+                self._files.popitem(last=False)
+        return replace(image, file_uri=file_uri)
@@ -0,0 +1,139 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any
+
+CACHE_DIR_ENV = "NANOBANA_RESULT_CACHE_DIR"
+CACHE_MAX_MB_ENV = "NANOBANA_RESULT_CACHE_MAX_MB"
+DEFAULT_CACHE_MAX_MB = 1024
+CACHE_KEY_VERSION = 2
+_META_FILE = "meta.json"
+
+CachedResult = tuple[list[str], list[tuple[str, bytes]]]
+
+
+def image_digest(blob: bytes, mime_type: str) -> str:
+    digest = hashlib.sha256(blob).hexdigest()
+    return f"{mime_type}:{digest}"
+
+
+def make_cache_key(
+    *,
+    namespace: str,
+    model: str,
+    prompt: str,
+    aspect_ratio: str,
+    image_size: str,
+    image_digests: list[str],
+    sample: int = 0,
+) -> str:
+    payload = {
+        "version": CACHE_KEY_VERSION,
+        # Results are private to the credentials that paid for them.
+        "namespace": namespace,
+        "model": model,
+        "prompt": prompt,
+        "aspect_ratio": aspect_ratio,
+        "image_size": image_size,
+        "images": image_digests,
+        "sample": sample,
+    }
+    encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ResultCache:
+    """Content-addressed disk cache of generated text and images.
+
+    Each entry is a directory named after its key. Reads refresh the
+    entry's mtime, and writes evict the least recently used entries until
+    the cache fits in ``max_bytes``. Filesystem errors are treated as
+    cache misses so the cache never fails a generation.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max(0, max_bytes)
+
+    def get(self, key: str) -> CachedResult | None:
+        entry = self.directory / key
+        meta_path = entry / _META_FILE
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            images = [
+                (str(item["mime_type"]), (entry / item["file"]).read_bytes())
+                for item in meta["images"]
+            ]
+            texts = [str(text) for text in meta["texts"]]
+            os.utime(meta_path)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return texts, images
+
+    def put(
+        self, key: str, texts: list[str], images: list[tuple[str, bytes]]
+    ) -> None:
+        if not images:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            staging = Path(
+                tempfile.mkdtemp(prefix=".tmp-", dir=self.directory)
+            )
+        except OSError:
+            return
+        try:
+            files: list[dict[str, Any]] = []
+            for index, (mime_type, blob) in enumerate(images):
+                name = f"{index}.bin"
+                (staging / name).write_bytes(blob)
+                files.append({"file": name, "mime_type": mime_type})
+            (staging / _META_FILE).write_text(
+                json.dumps({"texts": texts, "images": files}),
+                encoding="utf-8",
+            )
+            # Publishing with a rename keeps readers from seeing partial
+            # entries; losing a race with an identical writer is fine.
+            os.replace(staging, self.directory / key)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        entries: list[tuple[float, int, Path]] = []
+        total = 0
+        try:
+            children = list(self.directory.iterdir())
+        except OSError:
+            return
+        for child in children:
+            if child.name.startswith(".") or not child.is_dir():
+                continue
+            try:
+                size = sum(path.stat().st_size for path in child.iterdir())
+                mtime = (child / _META_FILE).stat().st_mtime
+            except OSError:
+                continue
+            entries.append((mtime, size, child))
+            total += size
+
+        for _mtime, size, child in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(child, ignore_errors=True)
+            total -= size
+
+
+def resolve_result_cache() -> ResultCache | None:
+    directory = os.getenv(CACHE_DIR_ENV, "").strip()
+    if not directory:
+        return None
+    try:
+        max_mb = int(os.getenv(CACHE_MAX_MB_ENV, "").strip())
+    except ValueError:
+        max_mb = DEFAULT_CACHE_MAX_MB
+    return ResultCache(directory, max(1, max_mb) * 1024 * 1024)
@@ -1,7 +1,9 @@
 import base64
+import json
 import mimetypes
+import threading
 import uuid
-from collections.abc import Generator, Iterable
+from collections.abc import Generator, Iterable, Iterator
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
@@ -9,10 +11,24 @@ from typing import Any
 from dify_plugin import Tool
 from dify_plugin.entities.tool import ToolInvokeMessage
 from internal.auth import (
+    GenaiClientCache,
+    credential_fingerprint,
+    is_client_failure,
     make_genai_client,
-    resolve_auth_config,
     sanitize_error_message,
 )
+from internal.batch import MAX_BATCH_SIZE, BatchJob, run_batch
+from internal.images import (
+    PreparedImage,
+    UploadedFileCache,
+    preprocess_images,
+)
+from internal.result_cache import (
+    ResultCache,
+    image_digest,
+    make_cache_key,
+    resolve_result_cache,
+)
 
 DEFAULT_MODEL = "gemini-3-pro-image"
 SUPPORTED_MODELS = ("gemini-3-pro-image", "gemini-3.1-flash-image")
@@ -31,6 +47,10 @@ SUPPORTED_ASPECT_RATIOS = (
 SUPPORTED_IMAGE_SIZES = ("1K", "2K", "4K")
 MAX_INPUT_IMAGES = 14
 MAX_OUTPUT_IMAGES = 1
+STREAM_PROGRESS_MESSAGE = "Generating image..."
+
+_CLIENT_CACHE = GenaiClientCache()
+_UPLOADED_FILES = UploadedFileCache()
 
 
 @dataclass(frozen=True)
@@ -66,6 +86,72 @@ def normalize_resolution(value: Any) -> str:
     return image_size
 
 
+def normalize_flag(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    return _clean_string(value).lower() in {"1", "true", "yes", "on"}
+
+
+def normalize_count(value: Any) -> int:
+    try:
+        count = int(value)
+    except (TypeError, ValueError):
+        return 1
+    return min(max(count, 1), MAX_BATCH_SIZE)
+
+
+def parse_variants(value: Any) -> list[dict[str, str]]:
+    if _is_empty_image_placeholder(value):
+        return []
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError as exc:
+            raise ValueError("Variants must be a JSON array.") from exc
+    if not isinstance(value, list):
+        raise ValueError("Variants must be a JSON array.")
+
+    variants: list[dict[str, str]] = []
+    for item in value:
+        if isinstance(item, str):
+            item = {"prompt": item}
+        if not isinstance(item, dict):
+            raise ValueError(
+                "Each variant must be a prompt string or an object."
+            )
+        variants.append(
+            {
+                "prompt": _clean_string(item.get("prompt")),
+                "aspect_ratio": _clean_string(item.get("aspect_ratio")),
+            }
+        )
+    return variants
+
+
+def plan_batch_jobs(
+    prompt: str,
+    aspect_ratio: str,
+    count: int,
+    variants: list[dict[str, str]],
+) -> list[BatchJob]:
+    bases = [
+        (
+            variant["prompt"] or prompt,
+            normalize_aspect_ratio(variant["aspect_ratio"] or aspect_ratio),
+        )
+        for variant in variants
+    ] or [(prompt, aspect_ratio)]
+    planned = [base for base in bases for _ in range(count)]
+    if len(planned) > MAX_BATCH_SIZE:
+        raise ValueError(
+            f"At most {MAX_BATCH_SIZE} images can be generated per call."
+        )
+    return [
+        BatchJob(index=index, prompt=job_prompt, aspect_ratio=job_ratio)
+        for index, (job_prompt, job_ratio) in enumerate(planned)
+    ]
+
+
 def normalize_images(value: Any) -> list[Any]:
     if _is_empty_image_placeholder(value):
         return []
@@ -114,6 +200,38 @@ def _decode_inline_data(data: Any) -> bytes | None:
     return None
 
 
+def _part_content(part: Any) -> Iterator[str | GeneratedImage]:
+    if _value(part, "thought") is True:
+        return
+
+    text = _value(part, "text")
+    if text:
+        yield str(text)
+
+    inline_data = _value(part, "inline_data", "inlineData")
+    if not inline_data:
+        return
+    blob = _decode_inline_data(_value(inline_data, "data"))
+    if not blob:
+        return
+    mime_type = _value(inline_data, "mime_type", "mimeType") or "image/png"
+    yield GeneratedImage(blob=blob, mime_type=str(mime_type))
+
+
+def iter_stream_content(
+    chunks: Iterable[Any],
+) -> Iterator[str | GeneratedImage]:
+    """Yield text deltas and images from streamed response chunks.
+
+    Each part is handled as soon as its chunk arrives, and chunks are not
+    retained, so at most one decoded image is held at a time.
+    """
+    for chunk in chunks:
+        for candidate in _iter_candidates(chunk):
+            for part in _iter_parts(candidate):
+                yield from _part_content(part)
+
+
 def extract_generated_content(
     response: Any,
 ) -> tuple[list[str], list[GeneratedImage]]:
@@ -122,26 +240,11 @@ def extract_generated_content(
 
     for candidate in _iter_candidates(response):
         for part in _iter_parts(candidate):
-            if _value(part, "thought") is True:
-                continue
-
-            text = _value(part, "text")
-            if text:
-                texts.append(str(text))
-
-            inline_data = _value(part, "inline_data", "inlineData")
-            if not inline_data:
-                continue
-
-            data = _value(inline_data, "data")
-            blob = _decode_inline_data(data)
-            if not blob:
-                continue
-
-            mime_type = (
-                _value(inline_data, "mime_type", "mimeType") or "image/png"
-            )
-            images.append(GeneratedImage(blob=blob, mime_type=str(mime_type)))
+            for content in _part_content(part):
+                if isinstance(content, GeneratedImage):
+                    images.append(content)
+                else:
+                    texts.append(content)
 
     return texts, images[-MAX_OUTPUT_IMAGES:]
 
@@ -158,6 +261,82 @@ def _build_generate_config(aspect_ratio: str, image_size: str) -> Any:
     )
 
 
+def generate_images(
+    client: Any,
+    *,
+    model: str,
+    contents: list[Any],
+    aspect_ratio: str,
+    image_size: str,
+    cache: ResultCache | None = None,
+    cache_key: str = "",
+) -> tuple[list[str], list[GeneratedImage]]:
+    """Call Gemini and store an image result under ``cache_key``; callers
+    look the key up first, before building clients or uploading inputs."""
+    response = client.models.generate_content(
+        model=model,
+        contents=contents,
+        config=_build_generate_config(aspect_ratio, image_size),
+    )
+    texts, images = extract_generated_content(response)
+    if cache is not None and images:
+        cache.put(
+            cache_key,
+            texts,
+            [(image.mime_type, image.blob) for image in images],
+        )
+    return texts, images
+
+
+def _cached_result(
+    cache: ResultCache | None, cache_key: str
+) -> tuple[list[str], list[GeneratedImage]] | None:
+    if cache is None:
+        return None
+    cached = cache.get(cache_key)
+    if cached is None:
+        return None
+    texts, images = cached
+    return texts, [
+        GeneratedImage(blob=blob, mime_type=mime_type)
+        for mime_type, blob in images
+    ]
+
+
+def build_cache_keys(
+    namespace: str,
+    model: str,
+    image_size: str,
+    jobs: list[BatchJob],
+    images: list[Any],
+) -> list[str]:
+    image_digests = [
+        image_digest(
+            _value(image, "blob"), str(_value(image, "mime_type", "mimeType"))
+        )
+        for image in images
+    ]
+    # Repeated jobs (count > 1) get distinct keys so a cached batch keeps
+    # its variety instead of returning one image several times.
+    samples: dict[tuple[str, str], int] = {}
+    keys: list[str] = []
+    for job in jobs:
+        sample = samples.get((job.prompt, job.aspect_ratio), 0)
+        samples[(job.prompt, job.aspect_ratio)] = sample + 1
+        keys.append(
+            make_cache_key(
+                namespace=namespace,
+                model=model,
+                prompt=job.prompt,
+                aspect_ratio=job.aspect_ratio,
+                image_size=image_size,
+                image_digests=image_digests,
+                sample=sample,
+            )
+        )
+    return keys
+
+
 def build_contents(prompt: str, images: list[Any]) -> list[Any]:
     if len(images) > MAX_INPUT_IMAGES:
         raise ValueError(
@@ -177,12 +356,34 @@ def build_contents(prompt: str, images: list[Any]) -> list[Any]:
             raise ValueError(
                 "Each image file must include blob bytes and mime_type."
             )
+        file_uri = _value(image, "file_uri")
+        if file_uri:
+            contents.append(
+                types.Part.from_uri(
+                    file_uri=str(file_uri), mime_type=str(mime_type)
+                )
+            )
+            continue
         contents.append(
             types.Part.from_bytes(data=blob, mime_type=str(mime_type))
         )
     return contents
 
 
+def _with_uploaded_files(
+    client: Any,
+    credentials: dict[str, Any],
+    prepared: list[PreparedImage],
+    contents: list[Any],
+) -> list[Any]:
+    attached = _UPLOADED_FILES.attach(
+        client, credential_fingerprint(credentials), prepared
+    )
+    if attached is prepared:
+        return contents
+    return build_contents(contents[0], attached)
+
+
 def _image_filename(mime_type: str) -> str:
     extension_map = {
         "image/png": ".png",
@@ -221,7 +422,20 @@ class NanobanaTool(Tool):
         image_size = normalize_resolution(tool_parameters.get("resolution"))
         images = normalize_images(tool_parameters.get("images"))
         try:
-            contents = build_contents(prompt, images)
+            jobs = plan_batch_jobs(
+                prompt,
+                aspect_ratio,
+                normalize_count(tool_parameters.get("count")),
+                parse_variants(tool_parameters.get("variants")),
+            )
+        except ValueError as exc:
+            yield self.create_text_message(
+                f"Invalid nanobana batch request: {exc}"
+            )
+            return
+        try:
+            prepared = preprocess_images(images, image_size)
+            contents = build_contents(prompt, prepared)
         except Exception as exc:
             message = sanitize_error_message(exc, credentials)
             yield self.create_text_message(
@@ -229,21 +443,69 @@ class NanobanaTool(Tool):
             )
             return
 
+        cache = resolve_result_cache()
+        cache_keys = (
+            build_cache_keys(
+                credential_fingerprint(credentials),
+                model,
+                image_size,
+                jobs,
+                images,
+            )
+            if cache is not None
+            else [""] * len(jobs)
+        )
+        if len(jobs) > 1:
+            yield from self._invoke_batch(
+                credentials,
+                model,
+                image_size,
+                jobs,
+                contents,
+                prepared,
+                cache,
+                cache_keys,
+            )
+            return
+        contents[0] = jobs[0].prompt
+        if normalize_flag(tool_parameters.get("stream")):
+            yield from self._invoke_stream(
+                credentials,
+                model,
+                image_size,
+                jobs[0],
+                contents,
+                prepared,
+                cache,
+                cache_keys[0],
+            )
+            return
+
+        cached = _cached_result(cache, cache_keys[0])
+        if cached is not None:
+            yield from self._result_messages(*cached)
+            return
+
         try:
-            auth_config = resolve_auth_config(credentials)
-            client = make_genai_client(auth_config)
+            client = _CLIENT_CACHE.get(credentials, make_genai_client)
+            contents = _with_uploaded_files(
+                client, credentials, prepared, contents
+            )
             try:
-                response = client.models.generate_content(
+                texts, images = generate_images(
+                    client,
                     model=model,
                     contents=contents,
-                    config=_build_generate_config(aspect_ratio, image_size),
+                    aspect_ratio=jobs[0].aspect_ratio,
+                    image_size=image_size,
+                    cache=cache,
+                    cache_key=cache_keys[0],
                 )
-            finally:
-                try:
-                    client.close()
-                except Exception:
-                    pass
-            texts, images = extract_generated_content(response)
+            except Exception as exc:
+                # Do not reuse a client whose token or pool may be broken.
+                if is_client_failure(exc):
+                    _CLIENT_CACHE.evict(credentials)
+                raise
         except Exception as exc:
             message = sanitize_error_message(exc, credentials)
             yield self.create_text_message(
@@ -251,19 +513,176 @@ class NanobanaTool(Tool):
             )
             return
 
+        yield from self._result_messages(texts, images)
+
+    def _result_messages(
+        self, texts: list[str], images: list[GeneratedImage]
+    ) -> Generator[ToolInvokeMessage, None, None]:
         for text in texts:
             yield self.create_text_message(text)
 
         for image in images:
-            yield self.create_blob_message(
-                blob=image.blob,
-                meta={
-                    "mime_type": image.mime_type,
-                    "filename": _image_filename(image.mime_type),
-                },
+            yield self._image_message(image)
+
+        if not texts and not images:
+            yield self.create_text_message(
+                "Gemini returned no text or image candidates."
+            )
+
+    def _invoke_batch(
+        self,
+        credentials: dict[str, Any],
+        model: str,
+        image_size: str,
+        jobs: list[BatchJob],
+        contents: list[Any],
+        prepared: list[PreparedImage],
+        cache: ResultCache | None,
+        cache_keys: list[str],
+    ) -> Generator[ToolInvokeMessage, None, None]:
+        try:
+            client = _CLIENT_CACHE.get(credentials, make_genai_client)
+        except Exception as exc:
+            message = sanitize_error_message(exc, credentials)
+            yield self.create_text_message(
+                f"Gemini image generation failed: {message}"
+            )
+            return
+        # Inputs are uploaded by the first job that misses the result cache.
+        uploaded_parts: list[list[Any]] = []
+        upload_lock = threading.Lock()
+
+        def image_parts() -> list[Any]:
+            with upload_lock:
+                if not uploaded_parts:
+                    uploaded_parts.append(
+                        _with_uploaded_files(
+                            client, credentials, prepared, contents
+                        )[1:]
+                    )
+                return uploaded_parts[0]
+
+        def generate(job: BatchJob) -> tuple[list[str], list[Any]]:
+            cached = _cached_result(cache, cache_keys[job.index])
+            if cached is not None:
+                return cached
+            return generate_images(
+                client,
+                model=model,
+                contents=[job.prompt, *image_parts()],
+                aspect_ratio=job.aspect_ratio,
+                image_size=image_size,
+                cache=cache,
+                cache_key=cache_keys[job.index],
             )
 
+        produced = False
+        failed = False
+        client_failed = False
+        # Images are streamed in completion order, not in job order.
+        for result in run_batch(jobs, generate):
+            label = f"Variant {result.job.index + 1}"
+            try:
+                if result.error is not None:
+                    raise result.error
+                texts, images = result.response
+            except Exception as exc:
+                failed = True
+                client_failed = client_failed or is_client_failure(exc)
+                message = sanitize_error_message(exc, credentials)
+                yield self.create_text_message(
+                    f"{label}: Gemini image generation failed: {message}"
+                )
+                continue
+
+            for text in texts:
+                yield self.create_text_message(f"{label}: {text}")
+            for image in images:
+                yield self._image_message(image, result.job.index)
+            produced = produced or bool(texts or images)
+
+        if client_failed:
+            _CLIENT_CACHE.evict(credentials)
+        if not produced and not failed:
+            yield self.create_text_message(
+                "Gemini returned no text or image candidates."
+            )
+
+    def _invoke_stream(
+        self,
+        credentials: dict[str, Any],
+        model: str,
+        image_size: str,
+        job: BatchJob,
+        contents: list[Any],
+        prepared: list[PreparedImage],
+        cache: ResultCache | None,
+        cache_key: str,
+    ) -> Generator[ToolInvokeMessage, None, None]:
+        cached = _cached_result(cache, cache_key)
+        if cached is not None:
+            yield from self._result_messages(*cached)
+            return
+
+        try:
+            client = _CLIENT_CACHE.get(credentials, make_genai_client)
+            contents = _with_uploaded_files(
+                client, credentials, prepared, contents
+            )
+        except Exception as exc:
+            message = sanitize_error_message(exc, credentials)
+            yield self.create_text_message(
+                f"Gemini image generation failed: {message}"
+            )
+            return
+
+        yield self.create_text_message(STREAM_PROGRESS_MESSAGE)
+        texts: list[str] = []
+        images: list[GeneratedImage] = []
+        try:
+            chunks = client.models.generate_content_stream(
+                model=model,
+                contents=contents,
+                config=_build_generate_config(job.aspect_ratio, image_size),
+            )
+            for content in iter_stream_content(chunks):
+                if isinstance(content, GeneratedImage):
+                    # Same limit as the non-stream path: keep the last
+                    # images and send them once the stream has ended.
+                    images.append(content)
+                    del images[:-MAX_OUTPUT_IMAGES]
+                else:
+                    texts.append(content)
+                    yield self.create_text_message(content)
+        except Exception as exc:
+            if is_client_failure(exc):
+                _CLIENT_CACHE.evict(credentials)
+            message = sanitize_error_message(exc, credentials)
+            yield self.create_text_message(
+                f"Gemini image generation failed: {message}"
+            )
+            return
+
+        for image in images:
+            yield self._image_message(image)
+        if cache is not None and images:
+            cache.put(
+                cache_key,
+                ["".join(texts)] if texts else [],
+                [(image.mime_type, image.blob) for image in images],
+            )
         if not texts and not images:
             yield self.create_text_message(
                 "Gemini returned no text or image candidates."
             )
+
+    def _image_message(
+        self, image: GeneratedImage, variant_index: int | None = None
+    ) -> ToolInvokeMessage:
+        meta: dict[str, Any] = {
+            "mime_type": image.mime_type,
+            "filename": _image_filename(image.mime_type),
+        }
+        if variant_index is not None:
+            meta["variant_index"] = variant_index
+        return self.create_blob_message(blob=image.blob, meta=meta)
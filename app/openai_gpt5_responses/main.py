@@ -1,7 +1,16 @@
 import os
+import time
 
 from dify_plugin import DifyPluginEnv, Plugin
 
+try:
+    from app.openai_gpt5_responses.internal.startup import WarmStartManager
+except ModuleNotFoundError:
+    from internal.startup import WarmStartManager
+
+# The OpenAI client imports its resource modules on first attribute access.
+WARM_START_MODULES = ("openai.resources.responses",)
+
 _TIMEOUT_MIN_SECONDS = 60
 _TIMEOUT_MAX_SECONDS = 3600
 _DEFAULT_MAX_REQUEST_TIMEOUT = 1200
@@ -21,6 +30,7 @@ def _read_timeout(name: str, default: int) -> int:
     return max(_TIMEOUT_MIN_SECONDS, min(_TIMEOUT_MAX_SECONDS, timeout_value))
 
 
+_registration_started_at = time.perf_counter()
 plugin = Plugin(
     DifyPluginEnv(
         MAX_REQUEST_TIMEOUT=_read_timeout(
@@ -31,6 +41,11 @@ plugin = Plugin(
         ),
     )
 )
+warm_start = WarmStartManager(WARM_START_MODULES)
+warm_start.record_timing(
+    "register:plugin", time.perf_counter() - _registration_started_at
+)
 
 if __name__ == "__main__":
+    warm_start.start()
     plugin.run()
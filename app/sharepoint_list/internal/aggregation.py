@@ -0,0 +1,187 @@
+"""Group-by aggregation over streamed list item pages.
+
+Items are folded into per-group accumulators page by page, so memory grows
+with the number of groups (and distinct values), not with the number of
+scanned items.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any
+
+AGGREGATE_OPS = ("count", "sum", "min", "max", "distinct")
+# Upper bound on result groups; beyond this the result is no longer "small".
+MAX_GROUPS = 1000
+
+
+@dataclass(frozen=True)
+class AggregateSpec:
+    op: str
+    field: str | None = None
+
+    @property
+    def label(self) -> str:
+        return f"{self.op}({self.field})" if self.field else self.op
+
+
+def parse_aggregates(raw: str | None) -> list[AggregateSpec]:
+    """
+    Parse aggregates given as comma separated ``op`` / ``op:field`` entries,
+    e.g. ``count, sum:Amount, distinct:AssignedTo``.
+    - empty: [count]
+    - ``count`` without a field counts items; ``count:field`` counts non-null
+      values. Other ops require a field.
+    """
+    text = (raw or "").strip()
+    if not text:
+        return [AggregateSpec("count")]
+
+    specs: list[AggregateSpec] = []
+    for part in text.split(","):
+        entry = part.strip().strip('"').strip("'")
+        if not entry:
+            continue
+        op, _, field = entry.partition(":")
+        op = op.strip().lower()
+        field = field.strip()
+        if op not in AGGREGATE_OPS:
+            allowed = ", ".join(AGGREGATE_OPS)
+            raise ValueError(
+                f"Unsupported aggregate: {op} (allowed: {allowed})"
+            )
+        if op != "count" and not field:
+            raise ValueError(f"aggregate '{op}' requires a field (op:field)")
+        spec = AggregateSpec(op, field or None)
+        if spec not in specs:
+            specs.append(spec)
+    if not specs:
+        raise ValueError("aggregates must contain at least one entry")
+    return specs
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _hashable(value: Any) -> Any:
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False, sort_keys=True)
+    return value
+
+
+def _group_value(value: Any) -> Any:
+    # Lookup/person columns come back as objects; group on their JSON text.
+    return _hashable(value)
+
+
+def _sort_key(key: tuple[Any, ...]) -> list[tuple[int, float, str]]:
+    # Numbers first (numerically), then text, then empty groups last.
+    parts: list[tuple[int, float, str]] = []
+    for value in key:
+        if value is None:
+            parts.append((2, 0.0, ""))
+        elif _is_number(value):
+            parts.append((0, float(value), ""))
+        else:
+            parts.append((1, 0.0, str(value)))
+    return parts
+
+
+def _comparable(current: Any, value: Any) -> bool:
+    if _is_number(current) and _is_number(value):
+        return True
+    return type(current) is type(value)
+
+
+class Aggregator:
+    """Dict-based accumulators keyed by the group-by values."""
+
+    def __init__(
+        self,
+        group_by: list[str],
+        aggregates: list[AggregateSpec],
+        max_groups: int = MAX_GROUPS,
+    ) -> None:
+        self.group_by = group_by
+        self.aggregates = aggregates
+        self.max_groups = max_groups
+        self.scanned = 0
+        self._groups: dict[tuple[Any, ...], list[Any]] = {}
+
+    def _initial_state(self) -> list[Any]:
+        return [
+            (
+                set()
+                if spec.op == "distinct"
+                else (0 if spec.op == "count" else None)
+            )
+            for spec in self.aggregates
+        ]
+
+    def add(self, fields_obj: dict[str, Any]) -> None:
+        self.scanned += 1
+        key = tuple(
+            _group_value(fields_obj.get(name)) for name in self.group_by
+        )
+        state = self._groups.get(key)
+        if state is None:
+            if len(self._groups) >= self.max_groups:
+                raise ValueError(
+                    f"aggregation produced more than {self.max_groups} groups; "
+                    "narrow the filters or group_by fields"
+                )
+            state = self._initial_state()
+            self._groups[key] = state
+
+        for index, spec in enumerate(self.aggregates):
+            if spec.op == "count":
+                if (
+                    spec.field is None
+                    or fields_obj.get(spec.field) is not None
+                ):
+                    state[index] += 1
+                continue
+            value = fields_obj.get(spec.field) if spec.field else None
+            if value is None:
+                continue
+            if spec.op == "distinct":
+                state[index].add(_hashable(value))
+            elif spec.op == "sum":
+                if _is_number(value):
+                    state[index] = (state[index] or 0) + value
+            else:
+                current = state[index]
+                if isinstance(value, (dict, list)):
+                    continue
+                if current is not None and not _comparable(current, value):
+                    continue
+                if current is None:
+                    state[index] = value
+                elif spec.op == "min" and value < current:
+                    state[index] = value
+                elif spec.op == "max" and value > current:
+                    state[index] = value
+
+    def result(self) -> dict[str, Any]:
+        columns = list(self.group_by) + [
+            spec.label for spec in self.aggregates
+        ]
+        if not self.group_by and not self._groups:
+            # Ungrouped aggregates still yield one row (count 0, ...).
+            self._groups[()] = self._initial_state()
+        rows: list[list[Any]] = []
+        for key in sorted(self._groups, key=_sort_key):
+            state = self._groups[key]
+            values = [
+                len(value) if spec.op == "distinct" else value
+                for spec, value in zip(self.aggregates, state, strict=True)
+            ]
+            rows.append(list(key) + values)
+        return {
+            "columns": columns,
+            "rows": rows,
+            "group_count": len(rows),
+            "scanned_items": self.scanned,
+        }
@@ -5,15 +5,29 @@
 
 from __future__ import annotations
 
+import copy
+import hashlib
 import logging
+import os
 import random
+import threading
 import time
-from dataclasses import dataclass
+import urllib.parse
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    TimeoutError as FutureTimeoutError,
+    wait,
+)
+from dataclasses import dataclass, field
 from typing import Any
 
 import requests
 
-from . import request_builders
+from . import json_stream, request_builders, tracing
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +83,18 @@ class TransientError(GraphAPIError):
     pass
 
 
+class CircuitOpenError(GraphAPIError):
+    """The endpoint's circuit is open; the request was not sent."""
+
+    def __init__(self, endpoint: str, retry_in: float):
+        super().__init__(
+            f"Graph endpoint {endpoint} is failing; requests are paused for "
+            f"{retry_in:.0f} more seconds (circuit breaker open)."
+        )
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+
+
 # ============================================================
 # リトライ設定
 # ============================================================
@@ -83,6 +109,8 @@ class RetryConfig:
     max_wait_seconds: float = 10.0
     exponential_base: float = 2.0
     jitter: bool = True  # ランダムなジッターを追加して thundering herd を防ぐ
+    # 待機関数の差し替え用（計測・テスト）。None なら time.sleep
+    sleep: Callable[[float], None] | None = None
 
 
 DEFAULT_RETRY_CONFIG = RetryConfig()
@@ -148,17 +176,539 @@ def calculate_backoff_wait(
 
 def parse_retry_after(response: requests.Response) -> int | None:
     """Parse Retry-After header value."""
-    retry_after = response.headers.get("Retry-After")
+    return parse_retry_after_value(response.headers.get("Retry-After"))
+
+
+def parse_retry_after_value(retry_after: object) -> int | None:
+    """Parse a raw Retry-After value (e.g. from a $batch sub-response)."""
     if retry_after is None:
         return None
     try:
         # Retry-After can be seconds or HTTP-date
-        return int(retry_after)
+        return int(str(retry_after))
     except ValueError:
         # HTTP-date format - use default
         return None
 
 
+# ============================================================
+# 同一 GET の合流（single-flight）と短期キャッシュ
+# ============================================================
+
+SINGLE_FLIGHT_ENV = "SHAREPOINT_LIST_SINGLE_FLIGHT"
+GET_CACHE_TTL_ENV = "SHAREPOINT_LIST_GET_CACHE_TTL_SECONDS"
+GET_CACHE_MAX_ENTRIES = 256
+
+CoalesceKey = tuple[Any, ...]
+
+
+class _InFlight:
+    __slots__ = ("done", "result", "error", "waiters", "generation")
+
+    def __init__(self, generation: int = 0) -> None:
+        self.done = threading.Event()
+        self.generation = generation
+        self.result: dict[str, Any] | None = None
+        self.error: BaseException | None = None
+        self.waiters = 0
+
+
+class GetCoalescer:
+    """
+    Share one in-flight response between concurrent identical GETs.
+
+    Callers with the same key (method, URL, params, extra headers, token
+    identity) that arrive while a request is in flight wait for it instead of
+    sending their own. With ``cache_ttl`` > 0 the response is also kept for
+    that many seconds (micro-cache). Every sharer gets its own deep copy, so
+    callers may mutate the result freely.
+
+    ``invalidate`` (called around every write) bumps a generation counter: a
+    fetch that started under an older generation is neither joined by new
+    callers nor cached, since it may predate the write.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        cache_ttl: float = 0.0,
+        max_cache_entries: int = GET_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.enabled = enabled
+        self.cache_ttl = cache_ttl
+        self.max_cache_entries = max_cache_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._inflight: dict[CoalesceKey, _InFlight] = {}
+        self._cache: dict[CoalesceKey, tuple[float, dict[str, Any]]] = {}
+        self._generation = 0
+        self.stats = {"requests": 0, "coalesced": 0, "cache_hits": 0}
+
+    def key_for(
+        self,
+        spec: request_builders.RequestSpec,
+        access_token: str,
+        extra_headers: dict[str, str] | None = None,
+    ) -> CoalesceKey | None:
+        """Return the coalescing key, or None if the request must not share."""
+        if not self.enabled or spec.method.upper() != "GET":
+            return None
+        if spec.json is not None:
+            return None
+        # トークン自体はキーに保持しない（ハッシュのみ）
+        token_id = hashlib.sha256(
+            str(access_token).encode("utf-8")
+        ).hexdigest()
+        params = tuple(
+            sorted((str(k), str(v)) for k, v in (spec.params or {}).items())
+        )
+        headers = tuple(
+            sorted((k.lower(), v) for k, v in (extra_headers or {}).items())
+        )
+        return ("GET", spec.url, params, headers, token_id)
+
+    def call(
+        self, key: CoalesceKey, fetch: Callable[[], dict[str, Any]]
+    ) -> dict[str, Any]:
+        with self._lock:
+            cached = self._cache_lookup(key)
+            if cached is None:
+                flight = self._inflight.get(key)
+                if (
+                    flight is not None
+                    and flight.generation != self._generation
+                ):
+                    flight = None
+                leader = flight is None
+                if flight is None:
+                    flight = _InFlight(self._generation)
+                    self._inflight[key] = flight
+                    self.stats["requests"] += 1
+                else:
+                    flight.waiters += 1
+                    self.stats["coalesced"] += 1
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.result or {})
+
+        try:
+            result = fetch()
+        except BaseException as exc:
+            with self._lock:
+                self._release(key, flight)
+            flight.error = exc
+            flight.done.set()
+            raise
+
+        with self._lock:
+            self._release(key, flight)
+            current = flight.generation == self._generation
+            shared = flight.waiters > 0 or (current and self.cache_ttl > 0)
+            # 共有する場合は読み取り専用のマスターコピーを保持
+            master = copy.deepcopy(result) if shared else None
+            if master is not None and current and self.cache_ttl > 0:
+                self._cache_store(key, master)
+        flight.result = master
+        flight.done.set()
+        return result
+
+    def invalidate(self) -> None:
+        """Drop the micro-cache and retire in-flight fetches (writes)."""
+        with self._lock:
+            self._generation += 1
+            self._cache.clear()
+
+    def _release(self, key: CoalesceKey, flight: _InFlight) -> None:
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+
+    def _cache_lookup(self, key: CoalesceKey) -> dict[str, Any] | None:
+        if self.cache_ttl <= 0:
+            return None
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._cache[key]
+            return None
+        self.stats["cache_hits"] += 1
+        return value
+
+    def _cache_store(self, key: CoalesceKey, value: dict[str, Any]) -> None:
+        self._cache.pop(key, None)
+        while len(self._cache) >= self.max_cache_entries:
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[key] = (self._clock() + self.cache_ttl, value)
+
+
+def _env_cache_ttl() -> float:
+    try:
+        return max(0.0, float(os.getenv(GET_CACHE_TTL_ENV, "0") or 0))
+    except ValueError:
+        return 0.0
+
+
+def _env_single_flight() -> bool:
+    raw = os.getenv(SINGLE_FLIGHT_ENV, "1")
+    return raw.lower() in {"1", "true", "yes", "on"}
+
+
+GET_COALESCER = GetCoalescer(
+    enabled=_env_single_flight(), cache_ttl=_env_cache_ttl()
+)
+
+
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() in {"1", "true", "yes", "on"}
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return max(0.0, float(os.getenv(name, "") or default))
+    except ValueError:
+        return default
+
+
+# $batch bundles sub-requests for any site (and tenant), so its failures
+# say nothing about one endpoint: it bypasses the circuit breaker and the
+# failed sub-requests are re-sent on their own site's endpoint.
+BATCH_SEGMENT = "$batch"
+
+
+def endpoint_key(url: str) -> str:
+    """
+    Group URLs by host and SharePoint tenant/site, the unit that degrades
+    together: ``/sites/contoso.sharepoint.com,<site>,<web>/...`` and
+    ``/sites/contoso.sharepoint.com:/sites/x`` both map to
+    ``<host>/sites/contoso.sharepoint.com``.
+    """
+    parsed = urllib.parse.urlparse(url)
+    segments = [s for s in parsed.path.split("/") if s]
+    if "sites" in segments:
+        index = segments.index("sites")
+        if index + 1 < len(segments):
+            site = segments[index + 1].split(",")[0].split(":")[0]
+            return f"{parsed.netloc}/sites/{site}"
+    tail = segments[1] if len(segments) > 1 else ""
+    return f"{parsed.netloc}/{tail}"
+
+
+# ============================================================
+# サーキットブレーカー（エンドポイント単位）
+# ============================================================
+
+CIRCUIT_BREAKER_ENV = "SHAREPOINT_LIST_CIRCUIT_BREAKER"
+CIRCUIT_THRESHOLD_ENV = "SHAREPOINT_LIST_CIRCUIT_FAILURE_THRESHOLD"
+CIRCUIT_OPEN_SECONDS_ENV = "SHAREPOINT_LIST_CIRCUIT_OPEN_SECONDS"
+
+
+class _Circuit:
+    __slots__ = ("failures", "opened_at", "probing", "probe_started_at")
+
+    def __init__(self) -> None:
+        self.failures: deque[float] = deque()
+        self.opened_at: float | None = None
+        self.probing = False
+        self.probe_started_at = 0.0
+
+
+class CircuitBreaker:
+    """
+    Fail fast on endpoints with repeated transient failures.
+
+    ``failure_threshold`` transient failures (5xx, timeouts, connection
+    errors) within ``window_seconds`` with no response in between open the
+    endpoint's circuit: requests fail with CircuitOpenError without being
+    sent. After ``open_seconds`` one probe request is let through
+    (half-open); a response closes the circuit, a failure re-opens it.
+    Any HTTP response other than 5xx (including 4xx and 429) counts as the
+    endpoint being reachable. A probe that ends without a verdict (another
+    exception) is released with ``release_probe``; a probe outstanding for
+    ``open_seconds`` is considered lost and another one is let through.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        failure_threshold: int = 5,
+        window_seconds: float = 30.0,
+        open_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.enabled = enabled and failure_threshold > 0
+        self.failure_threshold = failure_threshold
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._circuits: dict[str, _Circuit] = {}
+        self.stats = {"opened": 0, "rejected": 0, "probes": 0, "closed": 0}
+
+    def state(self, endpoint: str) -> str:
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None or circuit.opened_at is None:
+                return "closed"
+            if self._clock() - circuit.opened_at >= self.open_seconds:
+                return "half_open"
+            return "open"
+
+    def before_request(self, endpoint: str) -> bool:
+        """
+        Raise CircuitOpenError unless a request may be sent now.
+
+        Returns True when the request is the half-open probe.
+        """
+        if not self.enabled:
+            return False
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None or circuit.opened_at is None:
+                return False
+            now = self._clock()
+            elapsed = now - circuit.opened_at
+            probe_lost = (
+                circuit.probing
+                and now - circuit.probe_started_at >= self.open_seconds
+            )
+            if elapsed >= self.open_seconds and (
+                not circuit.probing or probe_lost
+            ):
+                circuit.probing = True
+                circuit.probe_started_at = now
+                self.stats["probes"] += 1
+                return True
+            self.stats["rejected"] += 1
+            retry_in = max(0.0, self.open_seconds - elapsed)
+        tracing.metric("circuit_rejected")
+        raise CircuitOpenError(endpoint, retry_in)
+
+    def release_probe(self, endpoint: str) -> None:
+        """Let another probe through; the current one ended undecided."""
+        if not self.enabled:
+            return
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is not None:
+                circuit.probing = False
+
+    def record_success(self, endpoint: str) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None:
+                return
+            was_open = circuit.opened_at is not None
+            del self._circuits[endpoint]
+            if was_open:
+                self.stats["closed"] += 1
+        if was_open:
+            self._notify("circuit_closed", endpoint)
+
+    def record_failure(self, endpoint: str) -> None:
+        if not self.enabled:
+            return
+        now = self._clock()
+        with self._lock:
+            circuit = self._circuits.setdefault(endpoint, _Circuit())
+            if circuit.opened_at is not None:
+                if not circuit.probing:
+                    return  # a request sent before the circuit opened
+                # failed probe: stay open for another period
+                circuit.opened_at = now
+                circuit.probing = False
+                opened = False
+            else:
+                circuit.failures.append(now)
+                while (
+                    circuit.failures
+                    and now - circuit.failures[0] > self.window_seconds
+                ):
+                    circuit.failures.popleft()
+                opened = len(circuit.failures) >= self.failure_threshold
+                if opened:
+                    circuit.opened_at = now
+                    circuit.failures.clear()
+                    self.stats["opened"] += 1
+        if opened:
+            logger.warning(
+                "Circuit opened for %s after %d transient failures; "
+                "failing fast for %.0f seconds",
+                endpoint,
+                self.failure_threshold,
+                self.open_seconds,
+            )
+            self._notify("circuit_opened", endpoint)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._circuits.clear()
+
+    def _notify(self, message: str, endpoint: str) -> None:
+        tracing.metric(message)
+        if tracing.is_enabled():
+            tracing.emit(
+                "http_client.py:CircuitBreaker",
+                message,
+                {"endpoint": endpoint, "stats": dict(self.stats)},
+            )
+
+
+CIRCUIT_BREAKER = CircuitBreaker(
+    enabled=_env_flag(CIRCUIT_BREAKER_ENV, "1"),
+    failure_threshold=int(_env_float(CIRCUIT_THRESHOLD_ENV, 5)),
+    open_seconds=_env_float(CIRCUIT_OPEN_SECONDS_ENV, 30.0),
+)
+# Used for requests that are not attributable to one endpoint ($batch).
+_UNTRACKED = CircuitBreaker(enabled=False)
+
+
+# ============================================================
+# ヘッジリクエスト（冪等な GET の裾野レイテンシ対策）
+# ============================================================
+
+HEDGED_GETS_ENV = "SHAREPOINT_LIST_HEDGED_GETS"
+# Latency samples kept per endpoint, and needed before p95 is trusted.
+HEDGE_SAMPLE_SIZE = 200
+HEDGE_MIN_SAMPLES = 20
+
+
+class HedgePolicy:
+    """
+    Send a second copy of a slow GET and use whichever answers first.
+
+    The hedge is sent once the first request has been outstanding for the
+    endpoint's p95 latency (``default_delay`` until ``HEDGE_MIN_SAMPLES``
+    successful requests were seen, never below ``min_delay``), so about 5%
+    of requests are duplicated. The slower request is left to finish in the
+    background and its result is discarded.
+
+    A hedged request runs both copies on the policy's pool (``max_workers``
+    threads, so at most ``max_workers // 2`` hedged requests at a time).
+    When the pool is full the request is sent on the caller's thread
+    without a hedge, so hedging never limits how many requests run
+    concurrently.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        min_delay: float = 0.05,
+        default_delay: float = 1.0,
+        max_workers: int = 16,
+    ) -> None:
+        self.enabled = enabled
+        self.min_delay = min_delay
+        self.default_delay = default_delay
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._latencies: dict[str, deque[float]] = {}
+        self._executor: ThreadPoolExecutor | None = None
+        self._active = 0
+        self.stats = {
+            "requests": 0,
+            "hedged": 0,
+            "hedge_wins": 0,
+            "unhedged": 0,
+        }
+
+    def record_latency(self, endpoint: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._latencies.get(endpoint)
+            if samples is None:
+                samples = deque(maxlen=HEDGE_SAMPLE_SIZE)
+                self._latencies[endpoint] = samples
+            samples.append(seconds)
+
+    def delay_for(self, endpoint: str) -> float:
+        with self._lock:
+            samples = sorted(self._latencies.get(endpoint, ()))
+        if len(samples) < HEDGE_MIN_SAMPLES:
+            return max(self.min_delay, self.default_delay)
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+        return max(self.min_delay, p95)
+
+    def call(self, endpoint: str, send: Callable[[], Any]) -> Any:
+        def timed_send() -> Any:
+            started_at = time.perf_counter()
+            result = send()
+            self.record_latency(endpoint, time.perf_counter() - started_at)
+            return result
+
+        with self._lock:
+            self.stats["requests"] += 1
+            slot_free = self._active < max(1, self.max_workers // 2)
+            if slot_free:
+                self._active += 1
+            else:
+                self.stats["unhedged"] += 1
+        if not slot_free:
+            return timed_send()
+
+        # The slot is freed once every copy sent for this request is done.
+        running = [1]
+
+        def copy_done(_: Future[Any]) -> None:
+            with self._lock:
+                running[0] -= 1
+                if running[0] == 0:
+                    self._active -= 1
+
+        executor = self._get_executor()
+        primary = executor.submit(timed_send)
+        primary.add_done_callback(copy_done)
+        try:
+            return primary.result(timeout=self.delay_for(endpoint))
+        except FutureTimeoutError:
+            pass
+
+        with self._lock:
+            primary_finished = primary.done()
+            if not primary_finished:
+                running[0] += 1
+                self.stats["hedged"] += 1
+        if primary_finished:
+            return primary.result()
+        hedge = executor.submit(timed_send)
+        hedge.add_done_callback(copy_done)
+        tracing.metric("hedged_requests")
+        pending: set[Future[Any]] = {primary, hedge}
+        errors: dict[Future[Any], BaseException] = {}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    if future is hedge:
+                        with self._lock:
+                            self.stats["hedge_wins"] += 1
+                        tracing.metric("hedge_wins")
+                    return future.result()
+                errors[future] = error
+        # Both failed: report the original request's error.
+        raise errors[primary]
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="sharepoint-hedge",
+                )
+            return self._executor
+
+
+HEDGE_POLICY = HedgePolicy(enabled=_env_flag(HEDGED_GETS_ENV, "0"))
+
+
 # ============================================================
 # HTTP リクエスト実行（リトライ付き）
 # ============================================================
@@ -200,15 +750,162 @@ def send_request_with_retry(
         RateLimitError: On 429 response after max retries
         TransientError: On 5xx response after max retries
         GraphAPIError: On other 4xx responses
+
+    Identical concurrent GETs are coalesced through GET_COALESCER; any other
+    request invalidates it before it is sent and again once it completes.
     """
+    coalescer = GET_COALESCER
+    key = coalescer.key_for(spec, access_token, extra_headers)
+    if key is None:
+        is_write = spec.method.upper() != "GET"
+        if is_write:
+            # GETs already in flight may read the pre-write state.
+            coalescer.invalidate()
+        try:
+            return _send_with_retry(
+                spec, access_token, extra_headers, config, timeout
+            )
+        finally:
+            if is_write:
+                coalescer.invalidate()
+    return coalescer.call(
+        key,
+        lambda: _send_with_retry(
+            spec, access_token, extra_headers, config, timeout
+        ),
+    )
+
+
+@dataclass
+class ConditionalResponse:
+    """Result of a conditional GET; ``data`` is None on 304 Not Modified."""
+
+    data: dict[str, Any] | None
+    etag: str | None = None
+
+    @property
+    def not_modified(self) -> bool:
+        return self.data is None
+
+
+def send_conditional_request_with_retry(
+    spec: request_builders.RequestSpec,
+    access_token: str,
+    etag: str | None = None,
+    extra_headers: dict[str, str] | None = None,
+    config: RetryConfig | None = None,
+    timeout: int = 30,
+) -> ConditionalResponse:
+    """
+    Send a GET revalidating ``etag`` with If-None-Match.
+
+    Retries and error mapping match send_request_with_retry. The returned
+    etag comes from the ETag response header, if any. Conditional requests
+    are not coalesced (their result depends on the caller's copy).
+    """
+    headers = dict(extra_headers or {})
+    if etag:
+        headers["If-None-Match"] = etag
+    return _send_with_retry(
+        spec,
+        access_token,
+        headers or None,
+        config,
+        timeout,
+        send_once=_send_conditional_request,
+    )
+
+
+@dataclass
+class CollectionPage:
+    """Items kept from one collection response (see read_collection)."""
+
+    items: list[Any] = field(default_factory=list)
+    # Index of each kept item within the response's collection.
+    positions: list[int] = field(default_factory=list)
+    meta: dict[str, Any] = field(default_factory=dict)
+    # Number of collection items read (kept or not).
+    count: int = 0
+    # False when reading stopped at ``limit`` with more items left.
+    complete: bool = True
+
+
+def read_collection_with_retry(
+    spec: request_builders.RequestSpec,
+    access_token: str,
+    extra_headers: dict[str, str] | None = None,
+    config: RetryConfig | None = None,
+    timeout: int = 30,
+    item_key: str = "value",
+    keep: Callable[[Any], bool] | None = None,
+    limit: int | None = None,
+) -> CollectionPage:
+    """
+    Send a request whose response is a collection and decode it while
+    reading, keeping only the items accepted by ``keep``. With ``limit``,
+    the connection is closed once that many items were read.
+
+    The whole exchange runs inside the retry policy of
+    send_request_with_retry: a connection reset or read timeout while the
+    body is downloaded re-sends the request, so ``keep`` must not have side
+    effects. Collection requests are not coalesced.
+    """
+    return _send_with_retry(
+        spec,
+        access_token,
+        extra_headers,
+        config,
+        timeout,
+        send_once=lambda *args: _read_collection(*args, item_key, keep, limit),
+    )
+
+
+def _send_with_retry(
+    spec: request_builders.RequestSpec,
+    access_token: str,
+    extra_headers: dict[str, str] | None,
+    config: RetryConfig | None,
+    timeout: int,
+    send_once: Callable[..., Any] | None = None,
+) -> Any:
     config = config or DEFAULT_RETRY_CONFIG
+    endpoint = endpoint_key(spec.url)
+    if send_once is None:
+        send_once = _send_single_request
+        if (
+            HEDGE_POLICY.enabled
+            and spec.method.upper() == "GET"
+            and spec.json is None
+        ):
+            send_once = _hedged(endpoint)
+    breaker = CIRCUIT_BREAKER
+    if urllib.parse.urlparse(spec.url).path.endswith(f"/{BATCH_SEGMENT}"):
+        breaker = _UNTRACKED
     last_exception: Exception | None = None
 
     for attempt in range(config.max_attempts):
         try:
-            return _send_single_request(
-                spec, access_token, extra_headers, timeout
-            )
+            probe = breaker.before_request(endpoint)
+            try:
+                result = send_once(spec, access_token, extra_headers, timeout)
+            except (
+                TransientError,
+                requests.exceptions.Timeout,
+                requests.exceptions.ConnectionError,
+            ):
+                breaker.record_failure(endpoint)
+                raise
+            except GraphAPIError:
+                # 4xx / 429: the endpoint answered
+                breaker.record_success(endpoint)
+                raise
+            except BaseException:
+                # no verdict on the endpoint (e.g. TooManyRedirects)
+                if probe:
+                    breaker.release_probe(endpoint)
+                raise
+            breaker.record_success(endpoint)
+            return result
 
         except (TransientError, RateLimitError) as e:
             last_exception = e
@@ -226,7 +923,7 @@ def send_request_with_retry(
                     wait_time,
                     str(e),
                 )
-                time.sleep(wait_time)
+                (config.sleep or time.sleep)(wait_time)
             else:
                 logger.error(
                     "Max retry attempts (%d) exceeded. Last error: %s",
@@ -251,7 +948,7 @@ def send_request_with_retry(
                     wait_time,
                     str(e),
                 )
-                time.sleep(wait_time)
+                (config.sleep or time.sleep)(wait_time)
             else:
                 logger.error(
                     "Max retry attempts (%d) exceeded. Last error: %s",
@@ -271,13 +968,28 @@ def send_request_with_retry(
     raise GraphAPIError("Unexpected error in retry loop")
 
 
-def _send_single_request(
+def _hedged(endpoint: str) -> Callable[..., dict[str, Any]]:
+    def send_once(
+        spec: request_builders.RequestSpec,
+        access_token: str,
+        extra_headers: dict[str, str] | None,
+        timeout: int,
+    ) -> dict[str, Any]:
+        return HEDGE_POLICY.call(
+            endpoint,
+            lambda: _send_single_request(
+                spec, access_token, extra_headers, timeout
+            ),
+        )
+
+    return send_once
+
+
+def _build_headers(
     spec: request_builders.RequestSpec,
     access_token: str,
-    extra_headers: dict[str, str] | None = None,
-    timeout: int = 30,
-) -> dict[str, Any]:
-    """Execute a single HTTP request without retry."""
+    extra_headers: dict[str, str] | None,
+) -> dict[str, str]:
     headers = {
         "Authorization": f"Bearer {access_token}",
         "Accept": "application/json",
@@ -286,14 +998,23 @@ def _send_single_request(
         headers["Content-Type"] = "application/json"
     if extra_headers:
         headers.update(extra_headers)
+    return headers
+
 
+def _send_single_request(
+    spec: request_builders.RequestSpec,
+    access_token: str,
+    extra_headers: dict[str, str] | None = None,
+    timeout: int = 30,
+) -> dict[str, Any]:
+    """Execute a single HTTP request without retry."""
     # Let Timeout and ConnectionError propagate for retry handling
     resp = requests.request(
         method=spec.method,
         url=spec.url,
         params=spec.params or None,
         json=spec.json,
-        headers=headers,
+        headers=_build_headers(spec, access_token, extra_headers),
         timeout=timeout,
     )
 
@@ -302,6 +1023,150 @@ def _send_single_request(
         _handle_error_response(resp, access_token)
 
     # Parse successful response
+    return _send_single_request_body(resp)
+
+
+def _send_conditional_request(
+    spec: request_builders.RequestSpec,
+    access_token: str,
+    extra_headers: dict[str, str] | None,
+    timeout: int,
+) -> ConditionalResponse:
+    resp = requests.request(
+        method=spec.method,
+        url=spec.url,
+        params=spec.params or None,
+        json=spec.json,
+        headers=_build_headers(spec, access_token, extra_headers),
+        timeout=timeout,
+    )
+    etag = _etag_header(resp)
+    if resp.status_code == 304:
+        return ConditionalResponse(None, etag)
+    if resp.status_code >= 400:
+        _handle_error_response(resp, access_token)
+    return ConditionalResponse(_send_single_request_body(resp), etag)
+
+
+def _etag_header(resp: Any) -> str | None:
+    headers = getattr(resp, "headers", None)
+    if not isinstance(headers, Mapping):
+        return None
+    etag = headers.get("ETag")
+    return etag if isinstance(etag, str) and etag else None
+
+
+# ============================================================
+# ストリーミング応答（コレクションの逐次デコード）
+# ============================================================
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class StreamedCollection:
+    """
+    Items of a Graph collection response, decoded while iterating.
+
+    ``meta`` holds the other top-level members (``@odata.nextLink`` ...);
+    members that follow the collection array are available once iteration
+    finishes. Iterate once; the connection is released when iteration ends
+    or on close().
+    """
+
+    def __init__(
+        self,
+        items: Iterable[Any],
+        meta: dict[str, Any],
+        resp: Any = None,
+    ) -> None:
+        self._items = items
+        self.meta = meta
+        self._resp = resp
+
+    def __iter__(self) -> Iterator[Any]:
+        try:
+            yield from self._items
+        except requests.exceptions.RequestException as e:
+            raise TransientError(
+                f"Connection lost while reading response: {e}",
+                status_code=None,
+                response_text=None,
+            ) from e
+        except ValueError as e:
+            raise GraphAPIError(
+                f"Malformed Graph API response: {e}",
+                status_code=None,
+                response_text=None,
+            ) from e
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        if self._resp is not None:
+            self._resp.close()
+            self._resp = None
+
+    def __enter__(self) -> StreamedCollection:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _open_collection_stream(
+    spec: request_builders.RequestSpec,
+    access_token: str,
+    extra_headers: dict[str, str] | None,
+    timeout: int,
+    item_key: str,
+) -> StreamedCollection:
+    resp = requests.request(
+        method=spec.method,
+        url=spec.url,
+        params=spec.params or None,
+        json=spec.json,
+        headers=_build_headers(spec, access_token, extra_headers),
+        timeout=timeout,
+        stream=True,
+    )
+    if resp.status_code >= 400:
+        try:
+            _handle_error_response(resp, access_token)
+        finally:
+            resp.close()
+
+    decoder = json_stream.JsonCollectionDecoder(
+        resp.iter_content(chunk_size=STREAM_CHUNK_SIZE), item_key=item_key
+    )
+    return StreamedCollection(decoder, decoder.meta, resp)
+
+
+def _read_collection(
+    spec: request_builders.RequestSpec,
+    access_token: str,
+    extra_headers: dict[str, str] | None,
+    timeout: int,
+    item_key: str,
+    keep: Callable[[Any], bool] | None,
+    limit: int | None,
+) -> CollectionPage:
+    page = CollectionPage()
+    with _open_collection_stream(
+        spec, access_token, extra_headers, timeout, item_key
+    ) as stream:
+        for index, item in enumerate(stream):
+            if limit is not None and index >= limit:
+                page.complete = False
+                break
+            page.count += 1
+            if keep is None or keep(item):
+                page.items.append(item)
+                page.positions.append(index)
+        page.meta = dict(stream.meta)
+    return page
+
+
+def _send_single_request_body(resp: Any) -> Any:
     if resp.text:
         try:
             return resp.json()
@@ -313,7 +1178,8 @@ def _send_single_request(
 def _handle_error_response(resp: requests.Response, access_token: str) -> None:
     """Raise appropriate exception based on status code."""
     status = resp.status_code
-    text = resp.text[:500] if resp.text else ""
+    body = resp.text
+    text = body[:500] if body else ""
     token_len = (
         len(access_token) if isinstance(access_token, str) else "non-str"
     )
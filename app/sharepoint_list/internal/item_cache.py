@@ -0,0 +1,120 @@
+"""ETag-validated cache of single list item reads.
+
+get_item keeps the last body and ETag per (site, list, item, select,
+token identity). A re-read sends ``If-None-Match`` and, on ``304 Not
+Modified``, serves the stored body instead of downloading and decoding the
+item again. Entries are only ever served after the server confirmed them,
+so the cache cannot return stale data; local update_item calls drop the
+item's entries up front anyway.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+ITEM_CACHE_ENV = "SHAREPOINT_LIST_ITEM_CACHE"
+ITEM_CACHE_MAX_ENTRIES_ENV = "SHAREPOINT_LIST_ITEM_CACHE_MAX_ENTRIES"
+DEFAULT_MAX_ENTRIES = 256
+
+ItemKey = tuple[str, str, str, tuple[str, ...] | None, str]
+
+
+@dataclass(frozen=True)
+class CachedItem:
+    etag: str
+    body: dict[str, Any]
+
+
+class ItemCache:
+    """Bounded LRU of item bodies with their ETags."""
+
+    def __init__(
+        self, enabled: bool = True, max_entries: int = DEFAULT_MAX_ENTRIES
+    ) -> None:
+        self.enabled = enabled and max_entries > 0
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[ItemKey, CachedItem] = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "stores": 0}
+
+    @staticmethod
+    def key_for(
+        site_id: str,
+        list_id: str,
+        item_id: str,
+        select_fields: list[str] | None,
+        access_token: str,
+    ) -> ItemKey:
+        # Bodies depend on the caller's permissions; keep only a token hash.
+        token_id = hashlib.sha256(
+            str(access_token).encode("utf-8")
+        ).hexdigest()
+        select = tuple(select_fields) if select_fields else None
+        return (site_id, list_id, str(item_id), select, token_id)
+
+    def lookup(self, key: ItemKey) -> CachedItem | None:
+        """The stored entry (still to be revalidated), if any."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def hit(self, entry: CachedItem) -> dict[str, Any]:
+        """Body of a revalidated entry; a copy the caller may mutate."""
+        with self._lock:
+            self.stats["hits"] += 1
+        return copy.deepcopy(entry.body)
+
+    def store(self, key: ItemKey, etag: str, body: dict[str, Any]) -> None:
+        entry = CachedItem(etag=etag, body=copy.deepcopy(body))
+        with self._lock:
+            self.stats["stores"] += 1
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def miss(self) -> None:
+        with self._lock:
+            self.stats["misses"] += 1
+
+    def invalidate_item(
+        self, site_id: str, list_id: str, item_id: str
+    ) -> None:
+        """Drop every cached select variant of one item."""
+        with self._lock:
+            for key in [
+                k
+                for k in self._entries
+                if k[0] == site_id and k[1] == list_id and k[2] == str(item_id)
+            ]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _env_enabled() -> bool:
+    raw = os.getenv(ITEM_CACHE_ENV, "1")
+    return raw.lower() in {"1", "true", "yes", "on"}
+
+
+def _env_max_entries() -> int:
+    try:
+        return max(
+            0,
+            int(os.getenv(ITEM_CACHE_MAX_ENTRIES_ENV) or DEFAULT_MAX_ENTRIES),
+        )
+    except ValueError:
+        return DEFAULT_MAX_ENTRIES
+
+
+ITEM_CACHE = ItemCache(enabled=_env_enabled(), max_entries=_env_max_entries())
@@ -0,0 +1,161 @@
+"""Incremental decoding of Graph collection responses.
+
+Graph returns collections as ``{"@odata.context": ..., "value": [...],
+"@odata.nextLink": ...}``. ``JsonCollectionDecoder`` reads the body chunk by
+chunk and yields the elements of one top-level array (``value`` by default)
+as soon as each element is complete, so only the current element and about
+one chunk of text are held in memory instead of the raw body, its decoded
+text and the whole parsed document at once. Other top-level members are
+small and are collected into ``meta``.
+
+Each element is decoded with the C-accelerated ``JSONDecoder.raw_decode``
+directly from the text buffer, which keeps decoding close to ``json.loads``
+speed without a second boundary-scanning pass.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+# Compact the buffer once this many consumed characters have accumulated.
+_COMPACT_THRESHOLD = 64 * 1024
+_WHITESPACE = " \t\r\n"
+_DELIMITERS = _WHITESPACE + ",]}"
+
+
+class JsonCollectionDecoder:
+    """Yield the items of one top-level array from an iterable of chunks."""
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        item_key: str = "value",
+        decoder: json.JSONDecoder | None = None,
+    ) -> None:
+        self.item_key = item_key
+        self.meta: dict[str, Any] = {}
+        self._decoder = decoder or json.JSONDecoder()
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8-sig")()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def __iter__(self) -> Iterator[Any]:
+        return self._parse()
+
+    # ---- buffer management -------------------------------------------
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        for chunk in self._chunks:
+            text = self._utf8.decode(chunk)
+            if text:
+                self._buf += text
+                return True
+        self._buf += self._utf8.decode(b"", final=True)
+        self._eof = True
+        return False
+
+    def _compact(self) -> None:
+        if self._pos >= _COMPACT_THRESHOLD:
+            self._buf = self._buf[self._pos :]
+            self._pos = 0
+
+    def _peek(self) -> str | None:
+        """Skip whitespace and return the next character (None at the end)."""
+        while True:
+            buf = self._buf
+            while self._pos < len(buf) and buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(buf):
+                return buf[self._pos]
+            if not self._fill():
+                return None
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise ValueError(f"Malformed JSON collection: expected {char!r}")
+        self._pos += 1
+
+    def _read_value(self) -> Any:
+        if self._peek() is None:
+            raise ValueError("Malformed JSON collection: unexpected end")
+        start = self._pos
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, start)
+            except json.JSONDecodeError:
+                if not self._grow(start):
+                    raise ValueError(
+                        "Malformed JSON collection: truncated or invalid value"
+                    ) from None
+                continue
+            # A number cut by a chunk boundary still decodes as its prefix
+            # ("12" of "123", "2.5" of "2.5e3"); strings and containers are
+            # self-delimiting, so only numbers need a delimiter check.
+            if isinstance(value, (int, float)) and not self._eof:
+                if end == len(self._buf) or self._buf[end] not in _DELIMITERS:
+                    if self._grow(start):
+                        continue
+            self._pos = end
+            return value
+
+    def _grow(self, start: int) -> bool:
+        """
+        Read at least as much text again as the pending value has, so a large
+        value spanning many chunks is re-decoded O(log n) times, not O(n).
+        """
+        target = len(self._buf) + max(1, len(self._buf) - start)
+        grew = False
+        while len(self._buf) < target and self._fill():
+            grew = True
+        return grew
+
+    # ---- document structure ------------------------------------------
+
+    def _parse(self) -> Iterator[Any]:
+        if self._peek() is None:
+            return  # empty body
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            if self._peek() != '"':
+                raise ValueError("Malformed JSON collection: bad member name")
+            key = self._read_value()
+            self._expect(":")
+            if key == self.item_key and self._peek() == "[":
+                self._pos += 1
+                yield from self._parse_items()
+            else:
+                self.meta[key] = self._read_value()
+                self._compact()
+            separator = self._peek()
+            self._pos += 1
+            if separator == ",":
+                continue
+            if separator == "}":
+                return
+            raise ValueError("Malformed JSON collection: expected ',' or '}'")
+
+    def _parse_items(self) -> Iterator[Any]:
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            item = self._read_value()
+            self._compact()
+            yield item
+            separator = self._peek()
+            self._pos += 1
+            if separator == ",":
+                continue
+            if separator == "]":
+                return
+            raise ValueError("Malformed JSON collection: expected ',' or ']'")
@@ -1,11 +1,30 @@
 from __future__ import annotations
 
-import os
+import time
 import urllib.parse
-from datetime import UTC, datetime
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
-from . import debug_logging, filters, http_client, request_builders, validators
+from . import (
+    aggregation,
+    filters,
+    http_client,
+    item_cache,
+    projection,
+    query_planner,
+    request_builders,
+    tracing,
+    validators,
+)
+
+# Concurrent $batch calls per get_items invocation.
+DEFAULT_BATCH_WORKERS = 4
+# aggregate_items scans at most this many items unless told otherwise.
+DEFAULT_AGGREGATE_MAX_ITEMS = 20000
+# Page size and per-call page budget when predicates run client-side.
+CLIENT_FILTER_PAGE_SIZE = 100
+CLIENT_FILTER_MAX_PAGES = 20
 
 
 class GraphError(http_client.GraphAPIError):
@@ -18,6 +37,52 @@ def _send_request(
     extra_headers: dict[str, str] | None = None,
 ) -> dict[str, Any]:
     """Send request with retry logic. Wrapper for http_client."""
+    return _logged_call(
+        "operations.py:_send_request",
+        spec,
+        extra_headers,
+        lambda: http_client.send_request_with_retry(
+            spec=spec,
+            access_token=access_token,
+            extra_headers=extra_headers,
+        ),
+    )
+
+
+def _read_page(
+    spec: request_builders.RequestSpec,
+    access_token: str,
+    extra_headers: dict[str, str] | None = None,
+    item_key: str = "value",
+    keep: Callable[[Any], bool] | None = None,
+    limit: int | None = None,
+) -> http_client.CollectionPage:
+    """
+    Send a collection request, decoding its ``item_key`` items one at a
+    time and keeping those accepted by ``keep`` (a pure predicate; the page
+    is re-sent if the body download fails).
+    """
+    return _logged_call(
+        "operations.py:_read_page",
+        spec,
+        extra_headers,
+        lambda: http_client.read_collection_with_retry(
+            spec=spec,
+            access_token=access_token,
+            extra_headers=extra_headers,
+            item_key=item_key,
+            keep=keep,
+            limit=limit,
+        ),
+    )
+
+
+def _logged_call(
+    location: str,
+    spec: request_builders.RequestSpec,
+    extra_headers: dict[str, str] | None,
+    send: Callable[[], Any],
+) -> Any:
     if _is_debug_log_enabled():
         safe_headers = {
             k: v
@@ -25,7 +90,7 @@ def _send_request(
             if k.lower() != "authorization"
         }
         _log_debug(
-            location="operations.py:_send_request",
+            location=location,
             message="request",
             data={
                 "url": spec.url,
@@ -36,15 +101,11 @@ def _send_request(
         )
 
     try:
-        return http_client.send_request_with_retry(
-            spec=spec,
-            access_token=access_token,
-            extra_headers=extra_headers,
-        )
+        return send()
     except http_client.GraphAPIError as e:
         if _is_debug_log_enabled():
             _log_debug(
-                location="operations.py:_send_request",
+                location=location,
                 message="error",
                 data={
                     "status": e.status_code,
@@ -56,41 +117,28 @@ def _send_request(
 
 
 def _is_debug_log_enabled() -> bool:
-    val = os.getenv("SHAREPOINT_LIST_DEBUG_LOG", "").lower()
-    return val in {"1", "true", "yes", "on"}
+    """
+    Whether to build debug payloads. Inside an operation this is the span's
+    sampling decision, made once when the operation started.
+    """
+    return tracing.is_enabled()
 
 
 def _log_debug(
     location: str,
     message: str,
-    data: dict[str, Any],
+    data: tracing.DataArg,
     extra: dict[str, Any] | None = None,
 ) -> None:
-    if not _is_debug_log_enabled():
-        return
-    try:
-        now = datetime.now(UTC)
-        ts = int(now.timestamp() * 1000)
-        timestamp = now.isoformat(timespec="milliseconds").replace(
-            "+00:00", "Z"
-        )
-        log_payload = {
-            "ts": ts,
-            "timestamp": timestamp,
-            "sessionId": "debug-session",
-            "runId": os.getenv("SHAREPOINT_LIST_DEBUG_RUN_ID", "run1"),
-            "location": location,
-            "message": message,
-            "data": data,
-        }
-        if extra:
-            log_payload.update(extra)
-        debug_logging.emit_debug_payload(log_payload)
-    except Exception:
-        # fail silently to avoid impacting main flow
-        pass
+    """Emit a debug event; ``data`` may be a callable, built only if kept."""
+    span = tracing.current()
+    if span is not None:
+        span.event(location, message, data, extra)
+    elif tracing.settings().enabled:
+        tracing.emit(location, message, data, extra)
 
 
+@tracing.timed("resolve_site")
 def resolve_site_id(access_token: str, site_identifier: str) -> str:
     """
     Accepts site_identifier that may be:
@@ -114,6 +162,7 @@ def resolve_site_id(access_token: str, site_identifier: str) -> str:
     return site_identifier
 
 
+@tracing.timed("resolve_list")
 def resolve_list_id(
     access_token: str, site_id: str, list_identifier: str
 ) -> str:
@@ -153,6 +202,7 @@ def resolve_list_id(
     enum_req = request_builders.build_list_enumerate_request(site_id=site_id)
     # include webUrl for diagnostics/matching
     enum_req.params = {"$select": "id,displayName,webUrl"}
+    # Buffered (not streamed) so concurrent resolutions share one request.
     enum_data = _send_request(enum_req, access_token)
     enum_values = enum_data.get("value", []) or []
     raw_identifier = str(list_identifier).strip()
@@ -165,6 +215,8 @@ def resolve_list_id(
     weburl_match_id: str | None = None
     first_weburl_match: dict[str, Any] | None = None
     for item in enum_values:
+        if not isinstance(item, dict):
+            continue
         if item.get("displayName") == list_identifier:
             found_id = item.get("id")
             if found_id:
@@ -237,6 +289,7 @@ def resolve_list_id(
     raise GraphError(f"List '{list_identifier}' not found in site '{site_id}'")
 
 
+@tracing.traced("create_item")
 def create_item(
     access_token: str, target: validators.TargetSpec, fields: dict[str, Any]
 ) -> dict[str, Any]:
@@ -249,9 +302,11 @@ def create_item(
     spec = request_builders.build_create_item_request(
         site_id=site_id, list_id=list_id, fields=mapped_fields
     )
-    return _send_request(spec, access_token)
+    with tracing.phase("request"):
+        return _send_request(spec, access_token)
 
 
+@tracing.traced("update_item")
 def update_item(
     access_token: str,
     target: validators.TargetSpec,
@@ -267,79 +322,323 @@ def update_item(
     spec = request_builders.build_update_item_request(
         site_id=site_id, list_id=list_id, item_id=item_id, fields=mapped_fields
     )
-    return _send_request(spec, access_token)
+    item_cache.ITEM_CACHE.invalidate_item(site_id, list_id, item_id)
+    with tracing.phase("request"):
+        return _send_request(spec, access_token)
 
 
+@tracing.traced("get_item")
 def get_item(
     access_token: str,
     target: validators.TargetSpec,
     item_id: str,
     select_fields: list[str] | None = None,
+    output_format: str | None = None,
 ) -> dict[str, Any]:
+    output_format = projection.normalize_output_format(output_format)
     site_id = resolve_site_id(access_token, target.site_identifier)
     list_id = resolve_list_id(access_token, site_id, target.list_identifier)
-    mapped_select: list[str] | None = None
-    columns_data: dict[str, Any] | None = None
-    display_to_name: dict[str, str] = {}
-    name_set: set[str] = set()
-    if select_fields:
-        display_to_name, name_set, columns_data = _get_column_maps(
-            access_token, site_id, list_id
-        )
-        _validate_requested_fields(
-            requested_fields=select_fields,
-            display_to_name=display_to_name,
-            name_set=name_set,
-            allow_special={"id"},
+    mapped_select = _resolve_item_select(
+        access_token, site_id, list_id, select_fields
+    )
+
+    spec = request_builders.build_get_item_request(
+        site_id=site_id,
+        list_id=list_id,
+        item_id=item_id,
+        select_fields=mapped_select,
+    )
+    with tracing.phase("request"):
+        data = _send_item_request(
+            spec, access_token, site_id, list_id, item_id, mapped_select
         )
-        mapped_select = resolve_select_fields_for_list(
-            access_token=access_token,
+
+    with tracing.phase("postprocess"):
+        if mapped_select and isinstance(data, dict):
+            fields_obj = data.get("fields")
+            if isinstance(fields_obj, dict):
+                backfill_selected_fields(fields_obj, mapped_select)
+
+        if output_format != projection.OUTPUT_FORMAT_RAW:
+            items = [data] if isinstance(data, dict) and data else []
+            return projection.format_items(items, mapped_select, output_format)
+        return data
+
+
+@tracing.traced("get_items")
+def get_items(
+    access_token: str,
+    target: validators.TargetSpec,
+    item_ids: list[str],
+    select_fields: list[str] | None = None,
+    output_format: str | None = None,
+    max_workers: int = DEFAULT_BATCH_WORKERS,
+) -> dict[str, Any]:
+    """
+    Fetch several items by ID with one site/list/column resolution.
+
+    Items are fetched via Graph JSON batching (20 requests per $batch call),
+    with up to ``max_workers`` batches in flight. Returned items keep the
+    order of ``item_ids``; IDs that do not exist are reported in
+    ``missing_ids``.
+    """
+    output_format = projection.normalize_output_format(output_format)
+    if not item_ids:
+        raise ValueError("item_ids must contain at least one item id")
+    site_id = resolve_site_id(access_token, target.site_identifier)
+    list_id = resolve_list_id(access_token, site_id, target.list_identifier)
+    mapped_select = _resolve_item_select(
+        access_token, site_id, list_id, select_fields
+    )
+
+    item_specs = [
+        request_builders.build_get_item_request(
             site_id=site_id,
             list_id=list_id,
-            select_fields=select_fields,
-            display_to_name=display_to_name,
-            name_set=name_set,
-            columns_data=columns_data,
+            item_id=item_id,
+            select_fields=mapped_select,
         )
-    else:
-        mapped_select = resolve_select_fields_for_list(
-            access_token=access_token,
-            site_id=site_id,
-            list_id=list_id,
-            select_fields=None,
+        for item_id in item_ids
+    ]
+    chunk_size = request_builders.MAX_BATCH_REQUESTS
+    chunks = [
+        item_specs[start : start + chunk_size]
+        for start in range(0, len(item_specs), chunk_size)
+    ]
+    workers = max(1, min(max_workers, len(chunks)))
+    with tracing.phase("request"):
+        if workers == 1:
+            responses = [_send_batch(chunk, access_token) for chunk in chunks]
+        else:
+            send_chunk = tracing.bind(
+                lambda chunk: _send_batch(chunk, access_token)
+            )
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                responses = list(executor.map(send_chunk, chunks))
+
+    items: list[dict[str, Any]] = []
+    missing_ids: list[str] = []
+    results = [result for chunk in responses for result in chunk]
+    for item_id, data in zip(item_ids, results, strict=True):
+        if data is None:
+            missing_ids.append(item_id)
+            continue
+        if mapped_select:
+            fields_obj = data.get("fields")
+            if isinstance(fields_obj, dict):
+                backfill_selected_fields(fields_obj, mapped_select)
+        items.append(data)
+
+    tracing_span = tracing.current()
+    if tracing_span is not None:
+        tracing_span.set(
+            requested_count=len(item_ids), batch_count=len(chunks)
+        )
+    if _is_debug_log_enabled():
+        _log_debug(
+            location="operations.py:get_items",
+            message="return_summary",
+            data={
+                "requested_count": len(item_ids),
+                "batch_count": len(chunks),
+                "workers": workers,
+                "returned_items_count": len(items),
+                "missing_count": len(missing_ids),
+            },
         )
 
-    spec = request_builders.build_get_item_request(
+    if output_format != projection.OUTPUT_FORMAT_RAW:
+        return {
+            **projection.format_items(items, mapped_select, output_format),
+            "missing_ids": missing_ids,
+        }
+    return {"items": items, "missing_ids": missing_ids}
+
+
+def _send_item_request(
+    spec: request_builders.RequestSpec,
+    access_token: str,
+    site_id: str,
+    list_id: str,
+    item_id: str,
+    mapped_select: list[str] | None,
+) -> dict[str, Any]:
+    """
+    GET one item through the ETag cache: a cached copy is revalidated with
+    If-None-Match and reused on 304 Not Modified.
+    """
+    cache = item_cache.ITEM_CACHE
+    if not cache.enabled:
+        return _send_request(spec, access_token)
+
+    key = cache.key_for(site_id, list_id, item_id, mapped_select, access_token)
+    cached = cache.lookup(key)
+    result = _logged_call(
+        "operations.py:_send_item_request",
+        spec,
+        None,
+        lambda: http_client.send_conditional_request_with_retry(
+            spec=spec,
+            access_token=access_token,
+            etag=cached.etag if cached is not None else None,
+        ),
+    )
+    span = tracing.current()
+    if result.not_modified:
+        if cached is not None:
+            if span is not None:
+                span.set(item_cache="revalidated")
+            return cache.hit(cached)
+        # 304 without a local copy (evicted meanwhile): fetch it plainly.
+        return _send_request(spec, access_token)
+
+    cache.miss()
+    data = result.data if isinstance(result.data, dict) else {}
+    etag = result.etag or data.get("@odata.etag")
+    if isinstance(etag, str) and etag:
+        cache.store(key, etag, data)
+    if span is not None:
+        span.set(item_cache="miss")
+    return data
+
+
+def _send_batch(
+    specs: list[request_builders.RequestSpec], access_token: str
+) -> list[dict[str, Any] | None]:
+    """
+    Send one $batch call and return each sub-response body in order.
+
+    404 sub-responses map to None. Other failed sub-responses (throttling,
+    transient errors) are re-sent individually so they go through the normal
+    retry policy and error mapping. When any of them was a 429/5xx, the
+    re-sends wait once first, honouring the largest Retry-After.
+    """
+    batch_spec = request_builders.build_batch_request(specs)
+    by_id: dict[str, dict[str, Any]] = {}
+    responses = _read_page(batch_spec, access_token, item_key="responses")
+    for response in responses.items:
+        if isinstance(response, dict) and "id" in response:
+            by_id[str(response["id"])] = response
+
+    results: list[dict[str, Any] | None] = []
+    retry_waited = False
+    for index, spec in enumerate(specs):
+        response = by_id.get(str(index)) or {}
+        status = response.get("status")
+        body = response.get("body")
+        if status == 404:
+            results.append(None)
+            continue
+        if isinstance(status, int) and 200 <= status < 300:
+            results.append(body if isinstance(body, dict) else {})
+            continue
+        if not retry_waited:
+            retry_waited = True
+            _wait_before_batch_resend(list(by_id.values()))
+        try:
+            results.append(_send_request(spec, access_token))
+        except http_client.GraphAPIError as e:
+            if e.status_code != 404:
+                raise
+            results.append(None)
+    return results
+
+
+def _wait_before_batch_resend(responses: list[dict[str, Any]]) -> None:
+    """Back off once for throttled/5xx sub-responses before re-sending."""
+    retryable = False
+    retry_after: int | None = None
+    for response in responses:
+        status = response.get("status")
+        if not isinstance(status, int) or not (
+            status == 429 or 500 <= status < 600
+        ):
+            continue
+        retryable = True
+        headers = response.get("headers")
+        if not isinstance(headers, dict):
+            continue
+        for name, value in headers.items():
+            if str(name).lower() != "retry-after":
+                continue
+            seconds = http_client.parse_retry_after_value(value)
+            if seconds is not None and (
+                retry_after is None or seconds > retry_after
+            ):
+                retry_after = seconds
+    if not retryable:
+        return
+    config = http_client.DEFAULT_RETRY_CONFIG
+    wait_time = http_client.calculate_backoff_wait(0, config, retry_after)
+    (config.sleep or time.sleep)(wait_time)
+
+
+def _resolve_item_select(
+    access_token: str,
+    site_id: str,
+    list_id: str,
+    select_fields: list[str] | None,
+) -> list[str] | None:
+    """Validate select_fields and map them to internal column names."""
+    if not select_fields:
+        return None
+    display_to_name, name_set, columns_data = _get_column_maps(
+        access_token, site_id, list_id
+    )
+    _validate_requested_fields(
+        requested_fields=select_fields,
+        display_to_name=display_to_name,
+        name_set=name_set,
+        allow_special={"id"},
+    )
+    return resolve_select_fields_for_list(
+        access_token=access_token,
         site_id=site_id,
         list_id=list_id,
-        item_id=item_id,
-        select_fields=mapped_select,
+        select_fields=select_fields,
+        display_to_name=display_to_name,
+        name_set=name_set,
+        columns_data=columns_data,
     )
-    data = _send_request(spec, access_token)
 
-    if mapped_select and isinstance(data, dict):
-        fields_obj = data.get("fields")
-        if isinstance(fields_obj, dict):
-            lower_key_map = {
-                k.lower(): k for k in fields_obj.keys() if isinstance(k, str)
-            }
-            for field_name in mapped_select:
-                if not isinstance(field_name, str) or not field_name:
-                    continue
-                if field_name in fields_obj:
-                    continue
-                existing = lower_key_map.get(field_name.lower())
-                if existing and existing in fields_obj:
-                    fields_obj[field_name] = fields_obj.get(existing)
-                    continue
-                if field_name.startswith("_"):
-                    alt = f"OData__{field_name.lstrip('_')}"
-                    if alt in fields_obj:
-                        fields_obj[field_name] = fields_obj.get(alt)
-                        continue
-                fields_obj[field_name] = None
 
-    return data
+def backfill_selected_fields(
+    fields_obj: dict[str, Any], mapped_select: list[str]
+) -> dict[str, str]:
+    """
+    Ensure every requested select field exists in an item's fields.
+
+    Graph may omit field keys when values are empty, which can be confusing
+    for downstream consumers (including Agents). Missing keys are recovered
+    from common variants (case differences / OData__ prefix) or set to None.
+    Returns {field_name: "alias" | "none"} for each key that was filled.
+    """
+    filled: dict[str, str] = {}
+    lower_key_map = {
+        k.lower(): k for k in fields_obj.keys() if isinstance(k, str)
+    }
+    for field_name in mapped_select:
+        if not isinstance(field_name, str) or not field_name:
+            continue
+        if field_name in fields_obj:
+            continue
+        # 1) case-insensitive match (e.g., ID vs id)
+        existing = lower_key_map.get(field_name.lower())
+        if existing and existing in fields_obj:
+            fields_obj[field_name] = fields_obj.get(existing)
+            filled[field_name] = "alias"
+            continue
+        # 2) SharePoint OData__ prefix variant (e.g., OData__x30... vs _x30...)
+        if field_name.startswith("_"):
+            alt = f"OData__{field_name.lstrip('_')}"
+            if alt in fields_obj:
+                fields_obj[field_name] = fields_obj.get(alt)
+                filled[field_name] = "alias"
+                continue
+        # 3) default: explicitly include missing key
+        fields_obj[field_name] = None
+        filled[field_name] = "none"
+    return filled
 
 
 def parse_select_fields(select_fields: str | None) -> list[str] | None:
@@ -360,6 +659,7 @@ def parse_select_fields(select_fields: str | None) -> list[str] | None:
     return parts or None
 
 
+@tracing.timed("columns")
 def _get_column_maps(
     access_token: str, site_id: str, list_id: str
 ) -> tuple[dict[str, str], set[str], dict[str, Any]]:
@@ -481,6 +781,302 @@ def resolve_select_fields_for_list(
     return resolved or None
 
 
+@tracing.traced("aggregate_items")
+def aggregate_items(
+    access_token: str,
+    target: validators.TargetSpec,
+    group_by: str | None,
+    aggregates: str | None,
+    filters_raw: str | None = None,
+    max_items: int = DEFAULT_AGGREGATE_MAX_ITEMS,
+) -> dict[str, Any]:
+    """
+    Group and aggregate list items in the plugin.
+
+    Pages through every matching item (100 per request, only the referenced
+    fields selected) and folds each page into dict accumulators, so only the
+    small result table is returned. Scanning stops after ``max_items`` items
+    and the result is flagged ``truncated``.
+    """
+    specs = aggregation.parse_aggregates(aggregates)
+    group_fields = parse_select_fields(group_by) or []
+    site_id = resolve_site_id(access_token, target.site_identifier)
+    list_id = resolve_list_id(access_token, site_id, target.list_identifier)
+    display_to_name, name_set, columns_data = _get_column_maps(
+        access_token, site_id, list_id
+    )
+
+    referenced = group_fields + [s.field for s in specs if s.field]
+    _validate_requested_fields(
+        requested_fields=referenced,
+        display_to_name=display_to_name,
+        name_set=name_set,
+        allow_special={"id"},
+    )
+
+    def mapped(name: str) -> str:
+        return _map_field_name(name, display_to_name, name_set)
+
+    mapped_group = [mapped(name) for name in group_fields]
+    mapped_specs = [
+        aggregation.AggregateSpec(s.op, mapped(s.field) if s.field else None)
+        for s in specs
+    ]
+    mapped_select = list(
+        dict.fromkeys(
+            mapped_group + [s.field for s in mapped_specs if s.field]
+        )
+    )
+    plan = _plan_query(filters_raw, display_to_name, name_set, columns_data)
+    request_select = list(dict.fromkeys(mapped_select + plan.client_fields))
+    extra_headers = _planned_headers(plan)
+    if _is_debug_log_enabled():
+        _log_debug(
+            location="operations.py:aggregate_items",
+            message="query_plan",
+            data=plan.explain(),
+        )
+
+    aggregator = aggregation.Aggregator(mapped_group, mapped_specs)
+    page_token: str | None = None
+    pages = 0
+    scanned = 0
+    truncated = False
+
+    def matches(item: Any) -> bool:
+        return isinstance(item, dict) and plan.matches(item)
+
+    # Pages are decoded (keeping only matches) and folded one at a time, so
+    # the whole scan is timed as the request phase.
+    with tracing.phase("request"):
+        while True:
+            req = request_builders.build_list_items_request(
+                site_id=site_id,
+                list_id=list_id,
+                top=100,
+                skiptoken=page_token,
+                filter_expr=plan.filter_expr,
+                select_fields=request_select or ["id"],
+                orderby=plan.orderby,
+            )
+            pages += 1
+            page = _read_page(
+                req,
+                access_token,
+                extra_headers,
+                keep=matches,
+                limit=max_items - scanned,
+            )
+            scanned += page.count
+            for item in page.items:
+                fields_obj = item.get("fields")
+                if not isinstance(fields_obj, dict):
+                    fields_obj = {}
+                if mapped_select:
+                    backfill_selected_fields(fields_obj, mapped_select)
+                aggregator.add(fields_obj)
+            if not page.complete:
+                truncated = True
+                break
+            page_token = _next_page_token(page.meta)
+            if not page_token:
+                break
+            if scanned >= max_items:
+                truncated = True
+                break
+
+    result = {**aggregator.result(), "read_items": scanned}
+    if _is_debug_log_enabled():
+        _log_debug(
+            location="operations.py:aggregate_items",
+            message="return_summary",
+            data={
+                "filter_expr": plan.filter_expr,
+                "group_by": mapped_group,
+                "aggregates": [s.label for s in mapped_specs],
+                "pages": pages,
+                "read_items": scanned,
+                "scanned_items": aggregator.scanned,
+                "group_count": result["group_count"],
+                "truncated": truncated,
+            },
+        )
+    return {**result, "pages": pages, "truncated": truncated}
+
+
+def _plan_query(
+    filters_raw: str | None,
+    display_to_name: dict[str, str],
+    name_set: set[str],
+    columns_data: dict[str, Any] | None,
+) -> query_planner.QueryPlan:
+    """
+    Parse the filters JSON and split it between $filter and client-side
+    evaluation, based on the indexed columns in ``columns_data`` (see
+    query_planner).
+    """
+    conditions: list[query_planner.PlannedCondition] = []
+    if filters_raw:
+        parsed_filters = filters.parse_filters(filters_raw)
+        _validate_requested_fields(
+            requested_fields=[c.field for c in parsed_filters],
+            display_to_name=display_to_name,
+            name_set=name_set,
+            allow_special={"createddatetime"},
+        )
+        for cond in parsed_filters:
+            mapped = _map_field_name(cond.field, display_to_name, name_set)
+            # validate the operator up front, even for client-side predicates
+            filters.build_filter_fragment(cond, mapped)
+            conditions.append(
+                query_planner.PlannedCondition(
+                    condition=cond, field_name=mapped
+                )
+            )
+    indexed = query_planner.indexed_columns(columns_data)
+    return query_planner.plan_query(conditions, indexed)
+
+
+def _planned_headers(
+    plan: query_planner.QueryPlan,
+) -> dict[str, str] | None:
+    # SharePoint lists may reject filtering on non-indexed fields
+    # unless Prefer header is provided (legacy plan only).
+    if plan.prefer_non_indexed:
+        return {"Prefer": "HonorNonIndexedQueriesWarning=true"}
+    return None
+
+
+def _fetch_planned_page(
+    access_token: str,
+    plan: query_planner.QueryPlan,
+    site_id: str,
+    list_id: str,
+    top: int,
+    page_token: str | None,
+    mapped_select: list[str] | None,
+) -> tuple[dict[str, Any], str | None]:
+    """
+    Fetch one page of list items according to the plan.
+
+    Returns ``({"value": [...]}, next_page_token)``. Without client-side
+    predicates this is a single request. Otherwise pages of
+    CLIENT_FILTER_PAGE_SIZE items are scanned until ``top`` matches are
+    collected, the list ends, or CLIENT_FILTER_MAX_PAGES pages were read.
+    At most ``top`` items are returned; when the scan stops inside a Graph
+    page, the returned token (see _scan_token) re-reads that page and skips
+    the items already scanned.
+    """
+    extra_headers = _planned_headers(plan)
+    request_select = mapped_select
+    if mapped_select and plan.client_fields:
+        request_select = list(
+            dict.fromkeys(mapped_select + plan.client_fields)
+        )
+
+    def request_page(
+        skiptoken: str | None,
+        page_top: int,
+        keep: Callable[[Any], bool] | None = None,
+    ) -> http_client.CollectionPage:
+        req = request_builders.build_list_items_request(
+            site_id=site_id,
+            list_id=list_id,
+            top=page_top,
+            skiptoken=skiptoken,
+            filter_expr=plan.filter_expr,
+            select_fields=request_select,
+            orderby=plan.orderby,
+        )
+        return _read_page(req, access_token, extra_headers, keep=keep)
+
+    if not plan.client:
+        page = request_page(page_token, top)
+        data = {**page.meta, "value": page.items}
+        return data, _next_page_token(data)
+
+    def keep_match(item: Any) -> bool:
+        # Non-matching items are dropped as soon as they are decoded.
+        return isinstance(item, dict) and plan.matches(item)
+
+    token, skip = _parse_scan_token(page_token)
+    scanned = 0
+
+    # Fields fetched only to evaluate predicates are dropped from the output.
+    helper_fields = set(request_select or []) - set(mapped_select or [])
+    matched: list[dict[str, Any]] = []
+    next_token: str | None = None
+    for _ in range(CLIENT_FILTER_MAX_PAGES):
+        page = request_page(token, CLIENT_FILTER_PAGE_SIZE, keep_match)
+        # Items before ``skip`` were returned by the previous call.
+        kept = [
+            (position, item)
+            for position, item in zip(page.positions, page.items, strict=True)
+            if position >= skip
+        ]
+        scanned += max(0, page.count - skip)
+        skip = 0
+        room = top - len(matched)
+        if len(kept) > room:
+            kept = kept[:room]
+            next_token = _scan_token(token, kept[-1][0] + 1)
+        else:
+            next_token = _next_page_token(page.meta)
+        items = [item for _, item in kept]
+        for item in items:
+            fields_obj = item.get("fields")
+            if helper_fields and isinstance(fields_obj, dict):
+                for name in helper_fields:
+                    fields_obj.pop(name, None)
+            matched.append(item)
+        token = next_token
+        if not token or len(matched) >= top:
+            break
+
+    if _is_debug_log_enabled():
+        _log_debug(
+            location="operations.py:_fetch_planned_page",
+            message="client_filter_scan",
+            data={
+                "scanned_items": scanned,
+                "matched_items": len(matched),
+                "next_page_token_present": bool(next_token),
+            },
+        )
+    return {"value": matched}, next_token
+
+
+# Client-side scans may stop inside a Graph page; such continuation tokens
+# carry the page's $skiptoken and how many of its items were scanned.
+_SCAN_TOKEN_PREFIX = "scan:"
+
+
+def _scan_token(skiptoken: str | None, offset: int) -> str:
+    return f"{_SCAN_TOKEN_PREFIX}{offset}:{skiptoken or ''}"
+
+
+def _parse_scan_token(page_token: str | None) -> tuple[str | None, int]:
+    """Split a next_page_token into ($skiptoken, items to skip)."""
+    if not page_token or not page_token.startswith(_SCAN_TOKEN_PREFIX):
+        return page_token, 0
+    offset, _, skiptoken = page_token[len(_SCAN_TOKEN_PREFIX) :].partition(":")
+    if not offset.isdigit():
+        raise ValueError("page_token is invalid")
+    return skiptoken or None, int(offset)
+
+
+def _next_page_token(data: Any) -> str | None:
+    """Extract $skiptoken from @odata.nextLink, if any."""
+    next_link = data.get("@odata.nextLink") if isinstance(data, dict) else None
+    if not isinstance(next_link, str):
+        return None
+    parsed = urllib.parse.urlparse(next_link)
+    qs = urllib.parse.parse_qs(parsed.query)
+    tokens = qs.get("$skiptoken") or qs.get("%24skiptoken")
+    return tokens[0] if tokens else None
+
+
+@tracing.traced("get_choice_field_info")
 def get_choice_field_info(
     access_token: str,
     site_identifier: str,
@@ -497,35 +1093,25 @@ def get_choice_field_info(
     columns_spec = request_builders.build_list_columns_request(
         site_id=site_id, list_id=list_id
     )
-    columns_data = _send_request(columns_spec, access_token)
+    with tracing.phase("columns"):
+        columns_data = _send_request(columns_spec, access_token)
 
     if _is_debug_log_enabled():
+        columns = (
+            columns_data.get("value", [])
+            if isinstance(columns_data, dict)
+            else []
+        )
         _log_debug(
             location="operations.py:get_choice_field_info",
             message="columns fetched",
-            data={
+            data=lambda: {
                 "field_identifier": field_identifier,
                 "columns_count": (
-                    len(columns_data.get("value", []))
-                    if isinstance(columns_data, dict)
-                    else None
+                    len(columns) if isinstance(columns_data, dict) else None
                 ),
-                "names": [
-                    c.get("name")
-                    for c in (
-                        columns_data.get("value", [])
-                        if isinstance(columns_data, dict)
-                        else []
-                    )
-                ],
-                "displayNames": [
-                    c.get("displayName")
-                    for c in (
-                        columns_data.get("value", [])
-                        if isinstance(columns_data, dict)
-                        else []
-                    )
-                ],
+                "names": [c.get("name") for c in columns],
+                "displayNames": [c.get("displayName") for c in columns],
             },
             extra={"hypothesisId": "H1"},
         )
@@ -596,6 +1182,7 @@ def get_choice_field_info(
     }
 
 
+@tracing.traced("list_items")
 def list_items(
     access_token: str,
     target: validators.TargetSpec,
@@ -603,7 +1190,9 @@ def list_items(
     page_size: int = 20,
     page_token: str | None = None,
     filters_raw: str | None = None,
+    output_format: str | None = None,
 ) -> dict[str, Any]:
+    output_format = projection.normalize_output_format(output_format)
     site_id = resolve_site_id(access_token, target.site_identifier)
     list_id = resolve_list_id(access_token, site_id, target.list_identifier)
 
@@ -636,27 +1225,16 @@ def list_items(
     )
 
     if _is_debug_log_enabled():
-        mapping: list[dict[str, Any]] = []
-        for raw in parsed_select or []:
-            lower = raw.lower()
-            if lower in (name_set or set()):
-                mapped = raw
-                source = "internal"
-            elif lower in (display_to_name or {}):
-                mapped = (display_to_name or {})[lower]
-                source = "display"
-            else:
-                mapped = raw
-                source = "unknown"
-            mapping.append({"raw": raw, "mapped": mapped, "source": source})
         _log_debug(
             location="operations.py:list_items",
             message="select_fields_mapping",
-            data={
+            data=lambda: {
                 "select_fields_raw": select_fields,
                 "parsed_select": parsed_select,
                 "mapped_select": mapped_select,
-                "mapping": mapping,
+                "mapping": _select_mapping(
+                    parsed_select, display_to_name, name_set
+                ),
                 "columns_count": (
                     len(columns_data.get("value", []))
                     if isinstance(columns_data, dict)
@@ -666,220 +1244,158 @@ def list_items(
             extra={"hypothesisId": "H1"},
         )
 
-    clauses: list[str] = []
-
-    uses_fields_clause = False
-
-    # multiple filters
-    if filters_raw:
-        parsed_filters = filters.parse_filters(filters_raw)
-        _validate_requested_fields(
-            requested_fields=[c.field for c in parsed_filters],
-            display_to_name=display_to_name,
-            name_set=name_set,
-            allow_special={"createddatetime"},
-        )
-        for cond in parsed_filters:
-            mapped = _map_field_name(cond.field, display_to_name, name_set)
-            field_ref = mapped
-            if mapped != "createdDateTime":
-                field_ref = f"fields/{mapped}"
-                uses_fields_clause = True
-            fragment = filters.build_filter_fragment(cond, field_ref)
-            clauses.append(fragment)
-
-    filter_expr = " and ".join(clauses) if clauses else None
+    plan = _plan_query(filters_raw, display_to_name, name_set, columns_data)
 
     top = max(1, min(page_size, 100))
 
-    prefer_added = False
-    req = request_builders.build_list_items_request(
-        site_id=site_id,
-        list_id=list_id,
-        top=top,
-        skiptoken=page_token,
-        filter_expr=filter_expr,
-        select_fields=mapped_select,
-        orderby="createdDateTime desc",
-    )
-    # SharePoint lists may reject filtering on non-indexed fields
-    # unless Prefer header is provided.
-    # Provide Prefer header as a best-effort mitigation.
-    extra_headers = None
-    if filter_expr and (uses_fields_clause or "fields/" in filter_expr):
-        extra_headers = {"Prefer": "HonorNonIndexedQueriesWarning=true"}
-        prefer_added = True
-
     if _is_debug_log_enabled():
         _log_debug(
             location="operations.py:list_items",
             message="request_args",
             data={
                 "filters_raw": filters_raw,
-                "filter_expr": filter_expr,
-                "orderby": "createdDateTime desc",
+                "filter_expr": plan.filter_expr,
+                "orderby": plan.orderby,
                 "page_size": top,
                 "page_token": page_token,
-                "prefer_added": prefer_added,
+                "prefer_added": plan.prefer_non_indexed,
+                "plan": plan.explain(),
             },
         )
 
-    data = _send_request(req, access_token, extra_headers=extra_headers)
-
-    if _is_debug_log_enabled():
-        items = data.get("value", []) if isinstance(data, dict) else []
-        first_item = items[0] if items and isinstance(items[0], dict) else None
-        fields_obj = (
-            first_item.get("fields") if isinstance(first_item, dict) else None
-        )
-        fields_keys = (
-            sorted([k for k in fields_obj.keys() if isinstance(k, str)])
-            if isinstance(fields_obj, dict)
-            else []
+    with tracing.phase("request"):
+        data, next_token = _fetch_planned_page(
+            access_token,
+            plan,
+            site_id,
+            list_id,
+            top,
+            page_token,
+            mapped_select,
         )
-        requested = [s for s in (mapped_select or []) if isinstance(s, str)]
-        requested_presence = {s: (s in set(fields_keys)) for s in requested}
-        missing_requested = [
-            s for s, ok in requested_presence.items() if not ok
-        ]
+
+    debug = _is_debug_log_enabled()
+    items = data.get("value", []) if isinstance(data, dict) else []
+    if debug:
         _log_debug(
             location="operations.py:list_items",
             message="response_fields_presence",
-            data={
+            data=lambda: {
                 "items_count": len(items),
-                "first_item_has_fields": isinstance(fields_obj, dict),
-                "first_item_fields_keys_count": (
-                    len(fields_keys) if isinstance(fields_obj, dict) else None
-                ),
-                "first_item_fields_keys_sample": fields_keys[:50],
-                "requested_presence": requested_presence,
-                "missing_requested": missing_requested,
+                **_first_item_presence(items, mapped_select),
             },
             extra={"hypothesisId": "H2"},
         )
 
-    # Normalize: ensure requested select fields exist in each item's fields.
-    # Graph may omit field keys when values are empty, which can be confusing for
-    # downstream consumers (including Agents). Add missing keys with None, and
-    # try to recover from common key variants (case differences / OData__ prefix).
-    if mapped_select and isinstance(data, dict):
-        items = data.get("value", []) or []
-        filled_none_by_field: dict[str, int] = {}
-        filled_alias_by_field: dict[str, int] = {}
-        for item in items:
-            if not isinstance(item, dict):
-                continue
-            fields_obj = item.get("fields")
-            if not isinstance(fields_obj, dict):
-                continue
-            lower_key_map = {
-                k.lower(): k for k in fields_obj.keys() if isinstance(k, str)
-            }
-            for field_name in mapped_select:
-                if not isinstance(field_name, str) or not field_name:
+    with tracing.phase("postprocess"):
+        # Normalize: ensure requested select fields exist in each item.
+        if mapped_select:
+            filled_none_by_field: dict[str, int] = {}
+            filled_alias_by_field: dict[str, int] = {}
+            for item in items:
+                if not isinstance(item, dict):
                     continue
-                if field_name in fields_obj:
+                fields_obj = item.get("fields")
+                if not isinstance(fields_obj, dict):
                     continue
-                # 1) case-insensitive match (e.g., ID vs id)
-                existing = lower_key_map.get(field_name.lower())
-                if existing and existing in fields_obj:
-                    fields_obj[field_name] = fields_obj.get(existing)
-                    filled_alias_by_field[field_name] = (
-                        filled_alias_by_field.get(field_name, 0) + 1
-                    )
+                filled = backfill_selected_fields(fields_obj, mapped_select)
+                if not debug:
                     continue
-                # 2) SharePoint OData__ prefix variant (e.g., OData__x30... vs _x30...)
-                if field_name.startswith("_"):
-                    alt = f"OData__{field_name.lstrip('_')}"
-                    if alt in fields_obj:
-                        fields_obj[field_name] = fields_obj.get(alt)
-                        filled_alias_by_field[field_name] = (
-                            filled_alias_by_field.get(field_name, 0) + 1
-                        )
-                        continue
-                # 3) default: explicitly include missing key
-                fields_obj[field_name] = None
-                filled_none_by_field[field_name] = (
-                    filled_none_by_field.get(field_name, 0) + 1
+                for field_name, source in filled.items():
+                    counts = (
+                        filled_alias_by_field
+                        if source == "alias"
+                        else filled_none_by_field
+                    )
+                    counts[field_name] = counts.get(field_name, 0) + 1
+
+            if debug:
+                _log_debug(
+                    location="operations.py:list_items",
+                    message="normalized_missing_fields",
+                    data={
+                        "items_count": len(items),
+                        "requested_fields": mapped_select,
+                        "filled_none_by_field": filled_none_by_field,
+                        "filled_alias_by_field": filled_alias_by_field,
+                    },
+                )
+                # Check presence again after normalization.
+                _log_debug(
+                    location="operations.py:list_items",
+                    message="response_fields_presence_normalized",
+                    data=lambda: _first_item_presence(items, mapped_select),
                 )
 
-        if _is_debug_log_enabled():
+        if debug:
             _log_debug(
                 location="operations.py:list_items",
-                message="normalized_missing_fields",
+                message="return_summary",
                 data={
-                    "items_count": (
-                        len(items) if isinstance(items, list) else None
-                    ),
-                    "requested_fields": mapped_select,
-                    "filled_none_by_field": filled_none_by_field,
-                    "filled_alias_by_field": filled_alias_by_field,
+                    "returned_items_count": len(items),
+                    "next_page_token_present": bool(next_token),
                 },
+                extra={"hypothesisId": "H3"},
             )
 
-        if _is_debug_log_enabled():
-            # Check presence again after normalization (sample first item only).
-            first_item = (
-                items[0] if items and isinstance(items[0], dict) else None
-            )
-            fields_obj = (
-                first_item.get("fields")
-                if isinstance(first_item, dict)
-                else None
-            )
-            fields_keys = (
-                sorted([k for k in fields_obj.keys() if isinstance(k, str)])
-                if isinstance(fields_obj, dict)
-                else []
-            )
-            requested = [
-                s for s in (mapped_select or []) if isinstance(s, str)
-            ]
-            requested_presence = {
-                s: (s in set(fields_keys)) for s in requested
+        if output_format != projection.OUTPUT_FORMAT_RAW:
+            return {
+                **projection.format_items(items, mapped_select, output_format),
+                "next_page_token": next_token,
             }
-            missing_requested = [
-                s for s, ok in requested_presence.items() if not ok
-            ]
-            _log_debug(
-                location="operations.py:list_items",
-                message="response_fields_presence_normalized",
-                data={
-                    "first_item_has_fields": isinstance(fields_obj, dict),
-                    "first_item_fields_keys_count": (
-                        len(fields_keys)
-                        if isinstance(fields_obj, dict)
-                        else None
-                    ),
-                    "first_item_fields_keys_sample": fields_keys[:50],
-                    "requested_presence": requested_presence,
-                    "missing_requested": missing_requested,
-                },
-            )
+        return {
+            "items": items,
+            "next_page_token": next_token,
+        }
 
-    next_token = None
-    next_link = data.get("@odata.nextLink") if isinstance(data, dict) else None
-    if isinstance(next_link, str):
-        parsed = urllib.parse.urlparse(next_link)
-        qs = urllib.parse.parse_qs(parsed.query)
-        tokens = qs.get("$skiptoken") or qs.get("%24skiptoken")
-        if tokens:
-            next_token = tokens[0]
 
-    if _is_debug_log_enabled():
-        items = data.get("value", []) if isinstance(data, dict) else []
-        _log_debug(
-            location="operations.py:list_items",
-            message="return_summary",
-            data={
-                "returned_items_count": len(items),
-                "next_page_token_present": bool(next_token),
-            },
-            extra={"hypothesisId": "H3"},
-        )
+def _select_mapping(
+    parsed_select: list[str] | None,
+    display_to_name: dict[str, str],
+    name_set: set[str],
+) -> list[dict[str, Any]]:
+    """How each requested select field was resolved (debug payload)."""
+    mapping: list[dict[str, Any]] = []
+    for raw in parsed_select or []:
+        lower = raw.lower()
+        if lower in name_set:
+            mapped = raw
+            source = "internal"
+        elif lower in display_to_name:
+            mapped = display_to_name[lower]
+            source = "display"
+        else:
+            mapped = raw
+            source = "unknown"
+        mapping.append({"raw": raw, "mapped": mapped, "source": source})
+    return mapping
 
-    items = data.get("value", []) if isinstance(data, dict) else []
+
+def _first_item_presence(
+    items: list[Any], mapped_select: list[str] | None
+) -> dict[str, Any]:
+    """Which requested fields the first item carries (debug payload)."""
+    first_item = items[0] if items and isinstance(items[0], dict) else None
+    fields_obj = (
+        first_item.get("fields") if isinstance(first_item, dict) else None
+    )
+    fields_keys = (
+        sorted(k for k in fields_obj if isinstance(k, str))
+        if isinstance(fields_obj, dict)
+        else []
+    )
+    present = set(fields_keys)
+    requested_presence = {
+        s: s in present for s in mapped_select or [] if isinstance(s, str)
+    }
     return {
-        "items": items,
-        "next_page_token": next_token,
+        "first_item_has_fields": isinstance(fields_obj, dict),
+        "first_item_fields_keys_count": (
+            len(fields_keys) if isinstance(fields_obj, dict) else None
+        ),
+        "first_item_fields_keys_sample": fields_keys[:50],
+        "requested_presence": requested_presence,
+        "missing_requested": [
+            s for s, ok in requested_presence.items() if not ok
+        ],
     }
@@ -0,0 +1,118 @@
+"""Compact tabular projection of Graph list items.
+
+Graph items carry envelope metadata (``@odata.etag``, ``createdBy``,
+``parentReference`` ...) and ``@odata`` annotations inside ``fields`` that
+are useless to an agent. The projection keeps only the item ``id`` and the
+requested (or returned) field values.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from typing import Any
+
+OUTPUT_FORMAT_RAW = "raw"
+OUTPUT_FORMAT_TABLE = "table"
+OUTPUT_FORMAT_CSV = "csv"
+OUTPUT_FORMAT_TSV = "tsv"
+OUTPUT_FORMATS = (
+    OUTPUT_FORMAT_RAW,
+    OUTPUT_FORMAT_TABLE,
+    OUTPUT_FORMAT_CSV,
+    OUTPUT_FORMAT_TSV,
+)
+_DELIMITERS = {OUTPUT_FORMAT_CSV: ",", OUTPUT_FORMAT_TSV: "\t"}
+
+
+def normalize_output_format(value: str | None) -> str:
+    text = (value or "").strip().lower()
+    if not text:
+        return OUTPUT_FORMAT_RAW
+    if text not in OUTPUT_FORMATS:
+        allowed = ", ".join(OUTPUT_FORMATS)
+        raise ValueError(f"output_format must be one of: {allowed}")
+    return text
+
+
+def _is_annotation(key: str) -> bool:
+    return "@odata" in key
+
+
+def table_columns(
+    items: list[dict[str, Any]], mapped_select: list[str] | None
+) -> list[str]:
+    """``id`` followed by the selected fields, or every returned field."""
+    columns = ["id"]
+    seen = {"id"}
+    if mapped_select:
+        candidates: list[Any] = list(mapped_select)
+    else:
+        candidates = []
+        for item in items:
+            fields_obj = item.get("fields") if isinstance(item, dict) else None
+            if isinstance(fields_obj, dict):
+                candidates.extend(fields_obj.keys())
+    for name in candidates:
+        if not isinstance(name, str) or _is_annotation(name):
+            continue
+        if name.lower() in seen:
+            continue
+        seen.add(name.lower())
+        columns.append(name)
+    return columns
+
+
+def project_items(
+    items: list[dict[str, Any]], mapped_select: list[str] | None
+) -> dict[str, Any]:
+    columns = table_columns(items, mapped_select)
+    rows: list[list[Any]] = []
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        fields_obj = item.get("fields")
+        if not isinstance(fields_obj, dict):
+            fields_obj = {}
+        rows.append(
+            [item.get("id")]
+            + [fields_obj.get(column) for column in columns[1:]]
+        )
+    return {"columns": columns, "rows": rows}
+
+
+def _cell_text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+def render_delimited(table: dict[str, Any], delimiter: str) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=delimiter, lineterminator="\n")
+    writer.writerow(table["columns"])
+    for row in table["rows"]:
+        writer.writerow([_cell_text(value) for value in row])
+    return buffer.getvalue()
+
+
+def format_items(
+    items: list[dict[str, Any]],
+    mapped_select: list[str] | None,
+    output_format: str,
+) -> dict[str, Any]:
+    """Render items for a non-raw ``output_format``."""
+    table = project_items(items, mapped_select)
+    delimiter = _DELIMITERS.get(output_format)
+    if delimiter is None:
+        return table
+    return {
+        "format": output_format,
+        "row_count": len(table["rows"]),
+        "text": render_delimited(table, delimiter),
+    }
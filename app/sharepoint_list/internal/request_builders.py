@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import urllib.parse
 from dataclasses import dataclass, field
 from typing import Any
 
 from . import validators
 
 GRAPH_BASE = "https://graph.microsoft.com/v1.0"
+# Graph JSON batching accepts at most 20 requests per $batch call.
+MAX_BATCH_REQUESTS = 20
 
 
 @dataclass
@@ -129,7 +132,8 @@ def build_get_item_request(
 def build_list_columns_request(site_id: str, list_id: str) -> RequestSpec:
     """
     Build request to list columns (name/displayName) for a list.
-    Used to map localized display names to internal names.
+    Used to map localized display names to internal names, and to learn
+    which columns are indexed (for query planning).
     """
     if not site_id:
         raise ValueError("site_id is required")
@@ -138,7 +142,7 @@ def build_list_columns_request(site_id: str, list_id: str) -> RequestSpec:
     url = f"{GRAPH_BASE}/sites/{site_id}/lists/{list_id}/columns"
     # Note: columnType is not supported in $select for columnDefinition.
     # Include only choice payload.
-    params = {"$select": "name,displayName,choice"}
+    params = {"$select": "name,displayName,choice,indexed"}
     return RequestSpec(method="GET", url=url, params=params)
 
 
@@ -178,3 +182,44 @@ def build_list_items_request(
 
     url = f"{GRAPH_BASE}/sites/{site_id}/lists/{list_id}/items"
     return RequestSpec(method="GET", url=url, params=params)
+
+
+def build_batch_request(requests: list[RequestSpec]) -> RequestSpec:
+    """
+    Build a JSON batch request combining up to 20 Graph requests.
+    Endpoint: POST /$batch
+    Sub-request ids are their positions ("0", "1", ...).
+    """
+    if not requests:
+        raise ValueError("requests must not be empty")
+    if len(requests) > MAX_BATCH_REQUESTS:
+        raise ValueError(
+            f"a batch may contain at most {MAX_BATCH_REQUESTS} requests"
+        )
+
+    entries: list[dict[str, Any]] = []
+    for index, spec in enumerate(requests):
+        if not spec.url.startswith(GRAPH_BASE):
+            raise ValueError("batched requests must target the Graph base URL")
+        relative_url = spec.url[len(GRAPH_BASE) :]
+        if spec.params:
+            query = urllib.parse.urlencode(
+                spec.params, safe="$(),=/", quote_via=urllib.parse.quote
+            )
+            relative_url = f"{relative_url}?{query}"
+        entry: dict[str, Any] = {
+            "id": str(index),
+            "method": spec.method,
+            "url": relative_url,
+        }
+        if spec.json is not None:
+            entry["body"] = spec.json
+            entry["headers"] = {"Content-Type": "application/json"}
+        entries.append(entry)
+
+    return RequestSpec(
+        method="POST",
+        url=f"{GRAPH_BASE}/$batch",
+        params={},
+        json={"requests": entries},
+    )
@@ -0,0 +1,343 @@
+"""Low-overhead structured tracing of plugin operations.
+
+Each public operation (list_items, get_item, ...) runs inside a span. The
+trace settings are read when the span starts and the sampling decision is
+made once per operation (head-based), so everything below it checks a plain
+attribute instead of the environment. When tracing is off or the operation
+is sampled out, the span is a shared no-op object: phases, attributes and
+events cost an attribute lookup and their payloads are never built.
+
+Sampled spans emit their events as they happen and one ``span`` summary with
+per-phase timings (resolve_site, resolve_list, columns, request,
+postprocess) and counters recorded with ``metric`` (e.g. hedged requests,
+circuit breaker rejections) when the operation ends, through debug_logging.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import os
+import random
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from . import debug_logging
+
+ENV_ENABLED = "SHAREPOINT_LIST_DEBUG_LOG"
+ENV_SAMPLE_RATE = "SHAREPOINT_LIST_TRACE_SAMPLE_RATE"
+ENV_RUN_ID = "SHAREPOINT_LIST_DEBUG_RUN_ID"
+
+DataArg = dict[str, Any] | Callable[[], dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class TraceSettings:
+    enabled: bool = False
+    sample_rate: float = 1.0
+    run_id: str = "run1"
+
+
+def parse_settings(
+    enabled_raw: str | None,
+    sample_rate_raw: str | None,
+    run_id_raw: str | None,
+) -> TraceSettings:
+    enabled = (enabled_raw or "").lower() in {"1", "true", "yes", "on"}
+    try:
+        sample_rate = float(sample_rate_raw) if sample_rate_raw else 1.0
+    except ValueError:
+        sample_rate = 1.0
+    return TraceSettings(
+        enabled=enabled,
+        sample_rate=min(1.0, max(0.0, sample_rate)),
+        run_id=run_id_raw or "run1",
+    )
+
+
+_SETTINGS_CACHE: tuple[tuple[str | None, ...], TraceSettings] | None = None
+
+
+def settings() -> TraceSettings:
+    """Current settings; re-parsed only when the environment changed."""
+    global _SETTINGS_CACHE
+    raw = (
+        os.environ.get(ENV_ENABLED),
+        os.environ.get(ENV_SAMPLE_RATE),
+        os.environ.get(ENV_RUN_ID),
+    )
+    cached = _SETTINGS_CACHE
+    if cached is not None and cached[0] == raw:
+        return cached[1]
+    parsed = parse_settings(*raw)
+    _SETTINGS_CACHE = (raw, parsed)
+    return parsed
+
+
+class _NoopPhase:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_NOOP_PHASE = _NoopPhase()
+
+
+class _Phase:
+    __slots__ = ("_span", "_name", "_start")
+
+    def __init__(self, span: Span, name: str) -> None:
+        self._span = span
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._span.add_timing(self._name, time.perf_counter() - self._start)
+
+
+class NoopSpan:
+    """Span used when tracing is off or the operation was sampled out."""
+
+    __slots__ = ()
+    enabled = False
+
+    def phase(self, name: str) -> _NoopPhase:
+        return _NOOP_PHASE
+
+    def set(self, **attributes: Any) -> None:
+        return None
+
+    def metric(self, name: str, value: float = 1) -> None:
+        return None
+
+    def event(
+        self,
+        location: str,
+        message: str,
+        data: DataArg,
+        extra: dict[str, Any] | None = None,
+    ) -> None:
+        return None
+
+
+NOOP_SPAN = NoopSpan()
+
+
+class Span:
+    """A sampled operation: collects attributes and phase timings."""
+
+    enabled = True
+
+    def __init__(self, name: str, trace_settings: TraceSettings) -> None:
+        self.name = name
+        self.settings = trace_settings
+        self.trace_id = uuid.uuid4().hex[:16]
+        self.attributes: dict[str, Any] = {}
+        self.timings: dict[str, float] = {}
+        self.metrics: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+
+    def phase(self, name: str) -> _Phase:
+        """Time a block; repeated phases (e.g. several requests) add up."""
+        return _Phase(self, name)
+
+    def add_timing(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.timings[name] = self.timings.get(name, 0.0) + seconds
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def metric(self, name: str, value: float = 1) -> None:
+        """Add ``value`` to the span counter ``name``."""
+        with self._lock:
+            self.metrics[name] = self.metrics.get(name, 0) + value
+
+    def event(
+        self,
+        location: str,
+        message: str,
+        data: DataArg,
+        extra: dict[str, Any] | None = None,
+    ) -> None:
+        emit(location, message, data, extra, self.settings, self.trace_id)
+
+    def end(self, error: BaseException | None = None) -> None:
+        data: dict[str, Any] = {
+            "operation": self.name,
+            "status": "error" if error is not None else "ok",
+            "duration_ms": _ms(time.perf_counter() - self._start),
+            "phases_ms": {
+                name: _ms(seconds) for name, seconds in self.timings.items()
+            },
+            "attributes": self.attributes,
+        }
+        if self.metrics:
+            data["metrics"] = dict(self.metrics)
+        if error is not None:
+            data["error_type"] = type(error).__name__
+        emit(
+            f"tracing:{self.name}",
+            "span",
+            data,
+            None,
+            self.settings,
+            self.trace_id,
+        )
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+_CURRENT: contextvars.ContextVar[Span | NoopSpan | None] = (
+    contextvars.ContextVar("sharepoint_list_span", default=None)
+)
+
+
+def current() -> Span | NoopSpan | None:
+    return _CURRENT.get()
+
+
+def is_enabled() -> bool:
+    """Whether debug events should be built in the current context."""
+    span = _CURRENT.get()
+    if span is not None:
+        return span.enabled
+    return settings().enabled
+
+
+def phase(name: str) -> _Phase | _NoopPhase:
+    span = _CURRENT.get()
+    if span is None:
+        return _NOOP_PHASE
+    return span.phase(name)
+
+
+def metric(name: str, value: float = 1) -> None:
+    """Count ``value`` towards ``name`` on the current span, if sampled."""
+    span = _CURRENT.get()
+    if span is not None:
+        span.metric(name, value)
+
+
+def start_span(name: str) -> Span | NoopSpan:
+    trace_settings = settings()
+    if not trace_settings.enabled:
+        return NOOP_SPAN
+    rate = trace_settings.sample_rate
+    if rate < 1.0 and random.random() >= rate:
+        return NOOP_SPAN
+    return Span(name, trace_settings)
+
+
+def traced[T](name: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    Run the function as a traced operation. Nested traced calls join the
+    outer operation instead of starting their own.
+    """
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            if _CURRENT.get() is not None:
+                return func(*args, **kwargs)
+            span = start_span(name)
+            token = _CURRENT.set(span)
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                if isinstance(span, Span):
+                    span.end(e)
+                raise
+            finally:
+                _CURRENT.reset(token)
+            if isinstance(span, Span):
+                span.end()
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def timed[T](name: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Record the function's duration as phase ``name`` of the span."""
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            span = _CURRENT.get()
+            if span is None or not span.enabled:
+                return func(*args, **kwargs)
+            with span.phase(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def bind[T](func: Callable[..., T]) -> Callable[..., T]:
+    """Carry the current span into worker threads (e.g. executor.map)."""
+    span = _CURRENT.get()
+    if span is None:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        token = _CURRENT.set(span)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _CURRENT.reset(token)
+
+    return wrapper
+
+
+def emit(
+    location: str,
+    message: str,
+    data: DataArg,
+    extra: dict[str, Any] | None = None,
+    trace_settings: TraceSettings | None = None,
+    trace_id: str | None = None,
+) -> None:
+    """Build and write one payload; ``data`` may be a callable (lazy)."""
+    try:
+        trace_settings = trace_settings or settings()
+        now = datetime.now(UTC)
+        ts = int(now.timestamp() * 1000)
+        timestamp = now.isoformat(timespec="milliseconds").replace(
+            "+00:00", "Z"
+        )
+        log_payload = {
+            "ts": ts,
+            "timestamp": timestamp,
+            "sessionId": "debug-session",
+            "runId": trace_settings.run_id,
+            "location": location,
+            "message": message,
+            "data": data() if callable(data) else data,
+        }
+        if trace_id is not None:
+            log_payload["traceId"] = trace_id
+        if extra:
+            log_payload.update(extra)
+        debug_logging.emit_debug_payload(log_payload)
+    except Exception:
+        # fail silently to avoid impacting main flow
+        pass
@@ -100,6 +100,46 @@ def ensure_item_id(operation: str, item_id: str | None) -> None:
         raise ValueError("item_id is required for this operation")
 
 
+MAX_ITEM_IDS = 200
+
+
+def parse_item_ids(item_ids: str | list[Any] | None) -> list[str]:
+    """
+    Parse item IDs given as a JSON array or a comma separated string.
+    - duplicates are dropped (first occurrence wins)
+    - empty input: ValueError
+    - more than MAX_ITEM_IDS ids: ValueError
+    """
+    if isinstance(item_ids, str):
+        text = item_ids.strip()
+        if text.startswith("["):
+            try:
+                raw_ids = json.loads(text)
+            except json.JSONDecodeError as exc:
+                raise ValueError("item_ids is not valid JSON") from exc
+            if not isinstance(raw_ids, list):
+                raise ValueError("item_ids must be a JSON array")
+        else:
+            raw_ids = text.split(",")
+    else:
+        raw_ids = list(item_ids or [])
+
+    parsed: list[str] = []
+    seen: set[str] = set()
+    for raw in raw_ids:
+        if isinstance(raw, bool) or not isinstance(raw, (str, int)):
+            raise ValueError("item_ids must contain strings or integers")
+        cleaned = str(raw).strip().strip('"').strip("'")
+        if cleaned and cleaned not in seen:
+            seen.add(cleaned)
+            parsed.append(cleaned)
+    if not parsed:
+        raise ValueError("item_ids must contain at least one item id")
+    if len(parsed) > MAX_ITEM_IDS:
+        raise ValueError(f"item_ids accepts at most {MAX_ITEM_IDS} ids")
+    return parsed
+
+
 def parse_site_url(site_url: str) -> tuple[str, str]:
     """
     Parse SharePoint site URL into (hostname, site_path).
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Generator
+from typing import Any
+
+from dify_plugin import Tool
+from dify_plugin.entities.tool import ToolInvokeMessage
+from internal import operations, validators
+from internal.http_client import (
+    AuthenticationError,
+    AuthorizationError,
+    RateLimitError,
+)
+
+
+class AggregateItemsTool(Tool):
+    def _invoke(
+        self, tool_parameters: dict[str, Any]
+    ) -> Generator[ToolInvokeMessage]:
+        try:
+            credentials = self.runtime.credentials or {}
+            access_token = credentials.get("access_token")
+            access_token_len: int | None = (
+                len(access_token) if isinstance(access_token, str) else None
+            )
+            if not isinstance(access_token, str) or not access_token.strip():
+                yield self.create_text_message(
+                    "Missing or empty access_token. Please authorize again."
+                )
+                yield self.create_json_message(
+                    {
+                        "error": "missing_access_token",
+                        "debug": {"access_token_len": access_token_len},
+                    }
+                )
+                return
+            access_token = access_token.strip()
+
+            list_url = tool_parameters.get("list_url")
+            site_identifier, list_identifier = validators.parse_list_url(
+                list_url=list_url
+            )
+            target = validators.validate_target(
+                site_identifier=site_identifier,
+                list_identifier=list_identifier,
+            )
+
+            filters_raw = tool_parameters.get("filters")
+            if isinstance(filters_raw, (dict, list)):
+                filters_raw = json.dumps(filters_raw)
+
+            result = operations.aggregate_items(
+                access_token=access_token,
+                target=target,
+                group_by=tool_parameters.get("group_by"),
+                aggregates=tool_parameters.get("aggregates"),
+                filters_raw=filters_raw,
+            )
+
+            yield self.create_json_message(result)
+            text = (
+                f"Aggregated {result['scanned_items']} items into "
+                f"{result['group_count']} groups."
+            )
+            if result.get("truncated"):
+                text += " Scan limit reached; the result is partial."
+            yield self.create_text_message(text)
+        except AuthenticationError as e:
+            yield self.create_json_message(
+                {
+                    "error": "authentication_failed",
+                    "error_type": "AuthenticationError",
+                    "message": str(e),
+                }
+            )
+            yield self.create_text_message(
+                "Authentication failed. Your access token may have expired. "
+                "Please re-authorize the SharePoint List connection."
+            )
+        except AuthorizationError as e:
+            yield self.create_json_message(
+                {
+                    "error": "authorization_failed",
+                    "error_type": "AuthorizationError",
+                    "message": str(e),
+                }
+            )
+            yield self.create_text_message(
+                f"Permission denied: {e}. "
+                "Please check your SharePoint permissions."
+            )
+        except RateLimitError as e:
+            yield self.create_json_message(
+                {
+                    "error": "rate_limit_exceeded",
+                    "error_type": "RateLimitError",
+                    "retry_after": e.retry_after,
+                    "message": str(e),
+                }
+            )
+            yield self.create_text_message(
+                f"Rate limit exceeded. Please try again later. "
+                f"(Retry after: {e.retry_after or 'unknown'} seconds)"
+            )
+        except Exception as e:  # noqa: BLE001
+            yield self.create_json_message({"error": str(e)})
+            yield self.create_text_message(f"Failed to aggregate items: {e}")
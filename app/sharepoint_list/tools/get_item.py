@@ -57,8 +57,14 @@ class GetItemTool(Tool):
                 target=target,
                 item_id=item_id,
                 select_fields=select_fields,
+                output_format=tool_parameters.get("output_format"),
+            )
+            delimited_text = (
+                result.pop("text", None) if result.get("format") else None
             )
             yield self.create_json_message(result or {})
+            if delimited_text is not None:
+                yield self.create_text_message(delimited_text)
             yield self.create_text_message("Item fetched successfully.")
         except AuthenticationError as e:
             yield self.create_json_message(
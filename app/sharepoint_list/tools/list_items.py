@@ -88,9 +88,15 @@ class ListItemsTool(Tool):
                 page_size=page_size,
                 page_token=page_token,
                 filters_raw=filters_raw,
+                output_format=tool_parameters.get("output_format"),
             )
 
+            delimited_text = (
+                result.pop("text", None) if result.get("format") else None
+            )
             yield self.create_json_message(result or {})
+            if delimited_text is not None:
+                yield self.create_text_message(delimited_text)
             text = "Items fetched successfully."
             if result.get("next_page_token"):
                 text += " More pages available."
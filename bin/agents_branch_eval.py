@@ -3,15 +3,26 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import re
 import shutil
 import signal
+import sqlite3
 import subprocess
 import textwrap
+import threading
 import time
 import uuid
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -31,9 +42,17 @@ DEFAULT_WORKTREE_ROOT = (
     Path.home() / "eval-worktrees" / "agents_branch_eval_2026-03-21"
 )
 DEFAULT_TIMEOUT_SECONDS = 900
+DEFAULT_PARENT_WORKERS = 1
+DEFAULT_MAX_LOAD_PER_CPU = 1.5
+DEFAULT_MIN_AVAILABLE_MB = 2048
+ADMISSION_POLL_SECONDS = 5.0
+MATRIX_MANIFEST_NAME = "matrix_manifest.jsonl"
+SCORE_STORE_NAME = "score_store.sqlite3"
 TIMESTAMP = "2026-03-21"
 DEFAULT_PARENT_REPS = (1, 2, 3, 4, 5)
 HARNESS_REVISION = "2026-03-22-review-baseline"
+# Bump when scoring logic changes so stored scorecards are recomputed.
+SCORE_STORE_REVISION = f"{HARNESS_REVISION}/score-v1"
 EVAL_CODEX_CONFIG_OVERRIDES = (
     'mcp_servers.serena.command="false"',
     "mcp_servers.serena.args=[]",
@@ -274,6 +293,9 @@ REVIEW_FILE_HINTS = {
 }
 
 TASKS_BY_ID = {task.task_id: task for task in TASKS}
+# `git worktree add/remove/prune` update shared metadata under .git and are
+# not safe to run concurrently against the same repository.
+WORKTREE_LOCK = threading.Lock()
 
 
 def now_utc() -> str:
@@ -503,21 +525,22 @@ def prepare_worktree(
     create_branch: bool,
 ) -> Path:
     worktree_path = worktree_root / run_id
-    remove_existing_worktree(worktree_path)
-    ensure_dir(worktree_root)
-    add = run(
-        [
-            "git",
-            "-C",
-            str(REPO_ROOT),
-            "worktree",
-            "add",
-            "--detach",
-            str(worktree_path),
-            branch.ref,
-        ],
-        cwd=REPO_ROOT,
-    )
+    with WORKTREE_LOCK:
+        remove_existing_worktree(worktree_path)
+        ensure_dir(worktree_root)
+        add = run(
+            [
+                "git",
+                "-C",
+                str(REPO_ROOT),
+                "worktree",
+                "add",
+                "--detach",
+                str(worktree_path),
+                branch.ref,
+            ],
+            cwd=REPO_ROOT,
+        )
     if add.returncode != 0:
         raise RuntimeError(f"worktree add failed: {add.stderr.strip()}")
     if create_branch:
@@ -531,19 +554,23 @@ def prepare_worktree(
 
 
 def cleanup_worktree(path: Path) -> None:
-    run(
-        [
-            "git",
-            "-C",
-            str(REPO_ROOT),
-            "worktree",
-            "remove",
-            "--force",
-            str(path),
-        ],
-        cwd=REPO_ROOT,
-    )
-    run(["git", "-C", str(REPO_ROOT), "worktree", "prune"], cwd=REPO_ROOT)
+    with WORKTREE_LOCK:
+        run(
+            [
+                "git",
+                "-C",
+                str(REPO_ROOT),
+                "worktree",
+                "remove",
+                "--force",
+                str(path),
+            ],
+            cwd=REPO_ROOT,
+        )
+        run(
+            ["git", "-C", str(REPO_ROOT), "worktree", "prune"],
+            cwd=REPO_ROOT,
+        )
     shutil.rmtree(path, ignore_errors=True)
 
 
@@ -762,6 +789,23 @@ def codex_command(task: TaskDef, run_dir: Path) -> tuple[list[str], str]:
     return cmd, prompt
 
 
+def parent_run_id(task: TaskDef, branch: BranchArm, rep: int) -> str:
+    return f"{task.task_id}__{branch.alias}__r{rep}"
+
+
+def load_completed_manifest(run_dir: Path) -> dict[str, Any] | None:
+    manifest_path = run_dir / "run_manifest.json"
+    if not manifest_path.exists():
+        return None
+    try:
+        existing = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return None
+    if existing.get("harness_revision") != HARNESS_REVISION:
+        return None
+    return existing
+
+
 def run_parent_task(
     task: TaskDef,
     branch: BranchArm,
@@ -771,14 +815,14 @@ def run_parent_task(
     timeout: int,
     dify_bin: str | None,
 ) -> dict[str, Any]:
-    run_id = f"{task.task_id}__{branch.alias}__r{rep}"
+    run_id = parent_run_id(task, branch, rep)
     run_dir = RESULTS_ROOT / "parent_runs" / run_id
-    manifest_path = run_dir / "run_manifest.json"
-    if manifest_path.exists():
-        existing = json.loads(manifest_path.read_text(encoding="utf-8"))
-        if existing.get("harness_revision") == HARNESS_REVISION:
-            return existing
-        shutil.rmtree(run_dir, ignore_errors=True)
+    existing = load_completed_manifest(run_dir)
+    if existing is not None:
+        return existing
+    # A run directory without a current manifest is stale or was
+    # interrupted mid-run; start that cell from scratch.
+    shutil.rmtree(run_dir, ignore_errors=True)
 
     ensure_dir(run_dir)
     worktree = prepare_worktree(
@@ -1103,26 +1147,195 @@ def weighted_score(dimensions: dict[str, float]) -> float:
     )
 
 
-def score_parent_runs() -> dict[str, Any]:
-    parent_root = RESULTS_ROOT / "parent_runs"
-    manifests = sorted(parent_root.glob("*/run_manifest.json"))
-    scored_runs: list[dict[str, Any]] = []
-    for manifest_path in manifests:
-        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+def gate_flags(manifest: dict[str, Any]) -> dict[str, bool]:
+    if manifest.get("kind") != "edit":
+        return {}
+    gates = manifest.get("gates", {})
+    return {
+        "active_gate_pass": gates.get("ruff", {}).get("returncode") == 0
+        and gates.get("pytest_no_cov", {}).get("returncode") == 0,
+        "package_pass": package_gate_passed(gates),
+        "one_pass": one_pass_passed(gates),
+    }
+
+
+class ScoreStore:
+    """SQLite index of scorecards keyed by run id and manifest hash.
+
+    A manifest is only re-read when its size or mtime changed, and only
+    re-scored when its content hash changed. The last summary is kept with
+    a fingerprint of every stored run so an unchanged run set skips
+    re-aggregation entirely.
+    """
+
+    def __init__(self, path: Path) -> None:
+        ensure_dir(path.parent)
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id TEXT PRIMARY KEY,
+                manifest_hash TEXT NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                payload TEXT NOT NULL
+            );
+            """)
+        if self._meta("revision") != SCORE_STORE_REVISION:
+            self.clear()
+
+    def __enter__(self) -> ScoreStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.connection.commit()
+        self.connection.close()
+
+    def _meta(self, key: str) -> str | None:
+        row = self.connection.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            (key, value),
+        )
+
+    def clear(self) -> None:
+        self.connection.execute("DELETE FROM runs")
+        self.connection.execute("DELETE FROM meta")
+        self._set_meta("revision", SCORE_STORE_REVISION)
+
+    def lookup(self, run_id: str) -> tuple[str, int, int] | None:
+        return self.connection.execute(
+            "SELECT manifest_hash, mtime_ns, size FROM runs WHERE run_id = ?",
+            (run_id,),
+        ).fetchone()
+
+    def touch(self, run_id: str, mtime_ns: int, size: int) -> None:
+        self.connection.execute(
+            "UPDATE runs SET mtime_ns = ?, size = ? WHERE run_id = ?",
+            (mtime_ns, size, run_id),
+        )
+
+    def upsert(
+        self,
+        run_id: str,
+        manifest_hash: str,
+        mtime_ns: int,
+        size: int,
+        payload: dict[str, Any],
+    ) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO runs "
+            "(run_id, manifest_hash, mtime_ns, size, payload) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                run_id,
+                manifest_hash,
+                mtime_ns,
+                size,
+                json.dumps(payload, sort_keys=True),
+            ),
+        )
+
+    def prune(self, keep: set[str]) -> int:
+        stale = [
+            run_id
+            for (run_id,) in self.connection.execute("SELECT run_id FROM runs")
+            if run_id not in keep
+        ]
+        self.connection.executemany(
+            "DELETE FROM runs WHERE run_id = ?",
+            [(run_id,) for run_id in stale],
+        )
+        return len(stale)
+
+    def fingerprint(self) -> str:
+        digest = hashlib.sha256()
+        for run_id, manifest_hash in self.connection.execute(
+            "SELECT run_id, manifest_hash FROM runs ORDER BY run_id"
+        ):
+            digest.update(f"{run_id}\0{manifest_hash}\n".encode())
+        return digest.hexdigest()
+
+    def scored_runs(self) -> list[dict[str, Any]]:
+        return [
+            json.loads(payload)
+            for (payload,) in self.connection.execute(
+                "SELECT payload FROM runs ORDER BY run_id"
+            )
+        ]
+
+    def cached_summary(self, fingerprint: str) -> dict[str, Any] | None:
+        if self._meta("summary_fingerprint") != fingerprint:
+            return None
+        raw = self._meta("summary")
+        return json.loads(raw) if raw else None
+
+    def store_summary(self, fingerprint: str, summary: dict[str, Any]) -> None:
+        self._set_meta("summary_fingerprint", fingerprint)
+        self._set_meta("summary", json.dumps(summary, sort_keys=True))
+
+
+def sync_score_store(store: ScoreStore, parent_root: Path) -> int:
+    """Score new or changed manifests into ``store``; return runs scored."""
+    present: set[str] = set()
+    rescored = 0
+    for manifest_path in sorted(parent_root.glob("*/run_manifest.json")):
+        run_id = manifest_path.parent.name
+        stat = manifest_path.stat()
+        cached = store.lookup(run_id)
+        if cached is not None and cached[1:] == (
+            stat.st_mtime_ns,
+            stat.st_size,
+        ):
+            present.add(run_id)
+            continue
+        raw = manifest_path.read_bytes()
+        manifest_hash = hashlib.sha256(raw).hexdigest()
+        if cached is not None and cached[0] == manifest_hash:
+            store.touch(run_id, stat.st_mtime_ns, stat.st_size)
+            present.add(run_id)
+            continue
+        manifest = json.loads(raw)
         if manifest.get("harness_revision") != HARNESS_REVISION:
             continue
-        score = score_manifest(manifest)
         payload = {
             "run_id": manifest["run_id"],
             "task_id": manifest["task_id"],
             "branch_alias": manifest["branch_alias"],
             "rep": manifest["rep"],
-            "score": score,
+            "score": score_manifest(manifest),
         }
         write_json(manifest_path.parent / "scorecard.json", payload)
-        scored_runs.append(payload)
+        payload["gate_flags"] = gate_flags(manifest)
+        store.upsert(
+            run_id, manifest_hash, stat.st_mtime_ns, stat.st_size, payload
+        )
+        present.add(run_id)
+        rescored += 1
+    store.prune(present)
+    return rescored
+
+
+def score_parent_runs(*, full_rescore: bool = False) -> dict[str, Any]:
+    parent_root = RESULTS_ROOT / "parent_runs"
+    with ScoreStore(parent_root / SCORE_STORE_NAME) as store:
+        if full_rescore:
+            store.clear()
+        sync_score_store(store, parent_root)
+        fingerprint = store.fingerprint()
+        summary = store.cached_summary(fingerprint)
+        if summary is None:
+            summary = summarize_scores(store.scored_runs())
+            store.store_summary(fingerprint, summary)
 
-    summary = summarize_scores(scored_runs)
     write_json(RESULTS_ROOT / "parent_score_summary.json", summary)
     (RESULTS_ROOT / "parent_score_summary.md").write_text(
         render_parent_summary(summary),
@@ -1179,23 +1392,26 @@ def summarize_scores(scored_runs: list[dict[str, Any]]) -> dict[str, Any]:
                 run["score"]["dimensions"].get("precision_hint", 0.0)
             )
 
-        manifest_path = (
-            RESULTS_ROOT / "parent_runs" / run["run_id"] / "run_manifest.json"
-        )
-        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
         if get_task(run["task_id"]).kind == "edit":
-            gates = manifest["gates"]
+            flags = run.get("gate_flags")
+            if flags is None:
+                manifest_path = (
+                    RESULTS_ROOT
+                    / "parent_runs"
+                    / run["run_id"]
+                    / "run_manifest.json"
+                )
+                flags = gate_flags(
+                    json.loads(manifest_path.read_text(encoding="utf-8"))
+                )
             edit_run_counts[alias] = edit_run_counts.get(alias, 0) + 1
-            if (
-                gates.get("ruff", {}).get("returncode") == 0
-                and gates.get("pytest_no_cov", {}).get("returncode") == 0
-            ):
+            if flags.get("active_gate_pass"):
                 active_gate_pass[alias] = active_gate_pass.get(alias, 0) + 1
-            if package_gate_passed(gates):
+            if flags.get("package_pass"):
                 package_pass_counts[alias] = (
                     package_pass_counts.get(alias, 0) + 1
                 )
-            if one_pass_passed(gates):
+            if flags.get("one_pass"):
                 one_pass_counts[alias] = one_pass_counts.get(alias, 0) + 1
 
     summary = {
@@ -1405,12 +1621,147 @@ def parse_csv_arg(raw: str | None) -> set[str] | None:
     return values or None
 
 
+@dataclass(frozen=True)
+class MatrixCell:
+    task: TaskDef
+    branch: BranchArm
+    rep: int
+
+    @property
+    def run_id(self) -> str:
+        return parent_run_id(self.task, self.branch, self.rep)
+
+
+def read_system_load() -> tuple[float | None, int | None]:
+    """Return (1-minute load per CPU, MemAvailable in MiB); None if unknown."""
+    load_per_cpu = None
+    try:
+        load_per_cpu = os.getloadavg()[0] / (os.cpu_count() or 1)
+    except OSError:
+        pass
+    available_mb = None
+    try:
+        with open("/proc/meminfo", encoding="utf-8") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    available_mb = int(line.split()[1]) // 1024
+                    break
+    except (OSError, ValueError, IndexError):
+        pass
+    return load_per_cpu, available_mb
+
+
+@dataclass(frozen=True)
+class AdmissionPolicy:
+    """Hold back new cells while the host is CPU- or memory-saturated."""
+
+    max_load_per_cpu: float = DEFAULT_MAX_LOAD_PER_CPU
+    min_available_mb: int = DEFAULT_MIN_AVAILABLE_MB
+    probe: Callable[[], tuple[float | None, int | None]] = read_system_load
+
+    def admits(self) -> bool:
+        load_per_cpu, available_mb = self.probe()
+        if load_per_cpu is not None and load_per_cpu > self.max_load_per_cpu:
+            return False
+        if available_mb is not None and available_mb < self.min_available_mb:
+            return False
+        return True
+
+
+class MatrixManifest:
+    """Append one JSON line per finished cell so progress survives crashes."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def record(
+        self, cell: MatrixCell, manifest: dict[str, Any], status: str
+    ) -> None:
+        entry = {
+            "run_id": cell.run_id,
+            "task_id": cell.task.task_id,
+            "branch_alias": cell.branch.alias,
+            "rep": cell.rep,
+            "status": status,
+            "error": manifest.get("error"),
+            "timestamp_started": manifest.get("timestamp_started"),
+            "timestamp_finished": manifest.get("timestamp_finished"),
+            "harness_revision": HARNESS_REVISION,
+            "recorded_at": now_utc(),
+        }
+        line = json.dumps(entry, ensure_ascii=False, sort_keys=True)
+        with self._lock:
+            ensure_dir(self.path.parent)
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
+                handle.flush()
+                os.fsync(handle.fileno())
+
+
+def build_parent_cells(
+    selected_tasks: Iterable[TaskDef], reps: set[int] | None = None
+) -> list[MatrixCell]:
+    return [
+        MatrixCell(task=task, branch=branch, rep=rep)
+        for rep in DEFAULT_PARENT_REPS
+        if not reps or rep in reps
+        for branch in branch_order_for_rep(rep)
+        for task in selected_tasks
+    ]
+
+
+def schedule_parent_cells(
+    cells: list[MatrixCell],
+    run_cell: Callable[[MatrixCell], dict[str, Any]],
+    *,
+    workers: int = DEFAULT_PARENT_WORKERS,
+    admission: AdmissionPolicy | None = None,
+    on_result: Callable[[MatrixCell, dict[str, Any]], None] | None = None,
+    poll_seconds: float = ADMISSION_POLL_SECONDS,
+) -> list[dict[str, Any]]:
+    """Run cells on up to ``workers`` threads and return manifests in cell order.
+
+    Admission is only checked while other cells are running, so one cell
+    always makes progress even on a loaded host.
+    """
+    results: dict[int, dict[str, Any]] = {}
+    pending = deque(enumerate(cells))
+    running: dict[Future[dict[str, Any]], int] = {}
+    with ThreadPoolExecutor(
+        max_workers=max(1, workers), thread_name_prefix="parent-cell"
+    ) as executor:
+        while pending or running:
+            while (
+                pending
+                and len(running) < max(1, workers)
+                and (not running or admission is None or admission.admits())
+            ):
+                index, cell = pending.popleft()
+                running[executor.submit(run_cell, cell)] = index
+            done, _ = wait(
+                running,
+                timeout=poll_seconds if pending else None,
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                index = running.pop(future)
+                manifest = future.result()
+                results[index] = manifest
+                if on_result is not None:
+                    on_result(cells[index], manifest)
+    return [results[index] for index in range(len(cells))]
+
+
 def run_parent_matrix(
     worktree_root: Path,
     timeout: int,
     *,
     task_filter: set[str] | None = None,
     reps: set[int] | None = None,
+    workers: int = DEFAULT_PARENT_WORKERS,
+    admission: AdmissionPolicy | None = None,
+    run_cell: Callable[[MatrixCell], dict[str, Any]] | None = None,
 ) -> list[dict[str, Any]]:
     pf = preflight()
     selected_tasks = [
@@ -1426,23 +1777,45 @@ def run_parent_matrix(
         raise RuntimeError(
             "package gate requires DIFY_BIN=/absolute/path/to/dify (or a PATH-resolved dify binary)"
         )
-    manifests: list[dict[str, Any]] = []
-    for rep in DEFAULT_PARENT_REPS:
-        if reps and rep not in reps:
-            continue
-        for branch in branch_order_for_rep(rep):
-            for task in selected_tasks:
-                manifests.append(
-                    run_parent_task(
-                        task,
-                        branch,
-                        rep,
-                        worktree_root=worktree_root,
-                        timeout=timeout,
-                        dify_bin=pf["dify_path"],
-                    )
-                )
-    return manifests
+    if run_cell is None:
+
+        def run_cell(cell: MatrixCell) -> dict[str, Any]:
+            return run_parent_task(
+                cell.task,
+                cell.branch,
+                cell.rep,
+                worktree_root=worktree_root,
+                timeout=timeout,
+                dify_bin=pf["dify_path"],
+            )
+
+    parent_root = RESULTS_ROOT / "parent_runs"
+    matrix_manifest = MatrixManifest(parent_root / MATRIX_MANIFEST_NAME)
+    cells = build_parent_cells(selected_tasks, reps)
+    # Resume: cells with a manifest for the current harness revision are
+    # reused as-is and never occupy a worker slot.
+    manifests: dict[str, dict[str, Any]] = {}
+    todo: list[MatrixCell] = []
+    for cell in cells:
+        existing = load_completed_manifest(parent_root / cell.run_id)
+        if existing is None:
+            todo.append(cell)
+        else:
+            manifests[cell.run_id] = existing
+
+    def record(cell: MatrixCell, manifest: dict[str, Any]) -> None:
+        status = "error" if manifest.get("error") else "completed"
+        matrix_manifest.record(cell, manifest, status)
+        manifests[cell.run_id] = manifest
+
+    schedule_parent_cells(
+        todo,
+        run_cell,
+        workers=workers,
+        admission=admission,
+        on_result=record,
+    )
+    return [manifests[cell.run_id] for cell in cells]
 
 
 def subagent_pipeline_command(
@@ -1682,10 +2055,17 @@ def run_all(
     *,
     task_filter: set[str] | None = None,
     reps: set[int] | None = None,
+    workers: int = DEFAULT_PARENT_WORKERS,
+    admission: AdmissionPolicy | None = None,
 ) -> None:
     primary_filter = task_filter or PRIMARY_TASK_IDS
     run_parent_matrix(
-        worktree_root, timeout, task_filter=primary_filter, reps=reps
+        worktree_root,
+        timeout,
+        task_filter=primary_filter,
+        reps=reps,
+        workers=workers,
+        admission=admission,
     )
     parent_summary = score_parent_runs()
     subagent_summary = run_subagent_confirmations(
@@ -1703,6 +2083,8 @@ def run_all(
             timeout,
             task_filter=TIEBREAKER_TASK_IDS,
             reps=reps,
+            workers=workers,
+            admission=admission,
         )
         parent_summary = score_parent_runs()
     report = render_final_report(parent_summary, subagent_summary)
@@ -1738,6 +2120,29 @@ def main() -> int:
         "--reps",
         help="Comma-separated repetition numbers to run for parent tasks",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_PARENT_WORKERS,
+        help="Parent matrix cells to run concurrently in separate worktrees",
+    )
+    parser.add_argument(
+        "--max-load-per-cpu",
+        type=float,
+        default=DEFAULT_MAX_LOAD_PER_CPU,
+        help="Do not start another cell while the 1-minute load per CPU exceeds this",
+    )
+    parser.add_argument(
+        "--min-available-mb",
+        type=int,
+        default=DEFAULT_MIN_AVAILABLE_MB,
+        help="Do not start another cell while MemAvailable is below this",
+    )
+    parser.add_argument(
+        "--full-rescore",
+        action="store_true",
+        help="Ignore the score store and re-score every parent manifest",
+    )
     args = parser.parse_args()
 
     worktree_root = Path(args.worktree_root).expanduser().resolve()
@@ -1745,6 +2150,10 @@ def main() -> int:
     task_filter = parse_csv_arg(args.tasks)
     reps_raw = parse_csv_arg(args.reps)
     reps = {int(value) for value in reps_raw} if reps_raw else None
+    admission = AdmissionPolicy(
+        max_load_per_cpu=args.max_load_per_cpu,
+        min_available_mb=args.min_available_mb,
+    )
 
     if args.command == "parent":
         run_parent_matrix(
@@ -1752,10 +2161,12 @@ def main() -> int:
             args.timeout,
             task_filter=task_filter,
             reps=reps,
+            workers=args.workers,
+            admission=admission,
         )
         return 0
     if args.command == "score":
-        score_parent_runs()
+        score_parent_runs(full_rescore=args.full_rescore)
         return 0
     if args.command == "subagent":
         run_subagent_confirmations(
@@ -1770,6 +2181,8 @@ def main() -> int:
         args.timeout,
         task_filter=task_filter,
         reps=reps,
+        workers=args.workers,
+        admission=admission,
     )
     return 0
 
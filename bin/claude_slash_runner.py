@@ -6,6 +6,8 @@ Features:
 - Lists available commands by filename and discovered usage_command blocks
 - Resolves and "runs" a command string like "/dagrunner foo" by locating the
   corresponding definition file and printing its key sections for human use
+- Keeps a persistent index (invalidated per file by mtime and size) and a
+  name trie for prefix and fuzzy lookup, so short invocations stay fast
 
 Note: This runner does not execute actions inside the command files. It simply
 surfaces intent, usage, and related metadata to aid local workflows.
@@ -14,11 +16,31 @@ surfaces intent, usage, and related metadata to aid local workflows.
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import os
 import re
+import tempfile
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
 COMMANDS_DIR = ROOT / ".claude" / "commands"
+INDEX_CACHE_ENV = "CLAUDE_SLASH_INDEX_PATH"
+INDEX_CACHE_VERSION = 1
+FUZZY_MAX_DISTANCE = 2
+_TRIE_TERMINAL = "\0"
+
+
+def default_index_cache_path() -> Path:
+    configured = os.environ.get(INDEX_CACHE_ENV, "").strip()
+    if configured:
+        return Path(configured).expanduser()
+    cache_home = Path(
+        os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    )
+    # One cache file per checkout so worktrees do not share entries.
+    digest = hashlib.sha256(str(COMMANDS_DIR).encode("utf-8")).hexdigest()
+    return cache_home / "claude_slash_runner" / f"{digest[:16]}.json"
 
 
 def iter_command_files() -> list[Path]:
@@ -155,19 +177,238 @@ def derive_command_names(path: Path, usage_block: str | None) -> list[str]:
     return out
 
 
-def build_index() -> dict[str, dict[str, object]]:
-    index: dict[str, dict[str, object]] = {}
-    for p in iter_command_files():
-        text = p.read_text(encoding="utf-8", errors="ignore")
-        usage = extract_usage_block(text)
-        meta = extract_meta(text)
-        names = derive_command_names(p, usage)
-        record = {"path": p, "usage": usage, "meta": meta}
+def parse_command_file(p: Path) -> dict[str, object]:
+    text = p.read_text(encoding="utf-8", errors="ignore")
+    usage = extract_usage_block(text)
+    return {
+        "usage": usage,
+        "meta": extract_meta(text),
+        "names": derive_command_names(p, usage),
+    }
+
+
+class NameTrie:
+    """Character trie over command names for prefix and fuzzy lookup.
+
+    Nodes are plain dicts so the trie can be stored in the JSON index cache
+    as-is; the terminal key holds the full name.
+    """
+
+    def __init__(self, root: dict[str, object] | None = None) -> None:
+        self.root: dict[str, object] = root if root is not None else {}
+
+    @classmethod
+    def from_names(cls, names: list[str]) -> NameTrie:
+        trie = cls()
         for name in names:
+            trie.insert(name)
+        return trie
+
+    def insert(self, name: str) -> None:
+        node = self.root
+        for ch in name:
+            node = node.setdefault(ch, {})  # type: ignore[assignment]
+        node[_TRIE_TERMINAL] = name
+
+    def _walk(self, node: dict[str, object]) -> list[str]:
+        found: list[str] = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            for key, child in current.items():
+                if key == _TRIE_TERMINAL:
+                    found.append(child)  # type: ignore[arg-type]
+                else:
+                    stack.append(child)  # type: ignore[arg-type]
+        return sorted(found)
+
+    def complete(self, prefix: str) -> list[str]:
+        node = self.root
+        for ch in prefix:
+            child = node.get(ch)
+            if child is None:
+                return []
+            node = child  # type: ignore[assignment]
+        return self._walk(node)
+
+    def fuzzy(
+        self, word: str, max_distance: int = FUZZY_MAX_DISTANCE
+    ) -> list[tuple[int, str]]:
+        """Return (edit distance, name) pairs within ``max_distance``.
+
+        Levenshtein rows are computed once per trie node, so branches whose
+        best distance already exceeds the limit are never expanded.
+        """
+        results: list[tuple[int, str]] = []
+        first_row = list(range(len(word) + 1))
+        stack: list[tuple[dict[str, object], str, list[int]]] = [
+            (child, ch, first_row)  # type: ignore[misc]
+            for ch, child in self.root.items()
+            if ch != _TRIE_TERMINAL
+        ]
+        while stack:
+            node, ch, previous = stack.pop()
+            row = [previous[0] + 1]
+            for column in range(1, len(word) + 1):
+                row.append(
+                    min(
+                        row[column - 1] + 1,
+                        previous[column] + 1,
+                        previous[column - 1] + (word[column - 1] != ch),
+                    )
+                )
+            terminal = node.get(_TRIE_TERMINAL)
+            if terminal is not None and row[-1] <= max_distance:
+                results.append((row[-1], terminal))  # type: ignore[arg-type]
+            if min(row) <= max_distance:
+                stack.extend(
+                    (child, key, row)  # type: ignore[misc]
+                    for key, child in node.items()
+                    if key != _TRIE_TERMINAL
+                )
+        return sorted(results)
+
+
+def _load_index_cache(cache_path: Path) -> dict[str, object]:
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != INDEX_CACHE_VERSION
+        or data.get("commands_dir") != str(COMMANDS_DIR)
+    ):
+        return {}
+    return data
+
+
+def _write_index_cache(cache_path: Path, data: dict[str, object]) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=".index-", dir=cache_path.parent
+        )
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(data, fh)
+        os.replace(tmp_name, cache_path)
+    except OSError:
+        # The cache is an optimisation only; a read-only home is fine.
+        pass
+
+
+def load_catalog(
+    cache_path: Path | None = None, *, use_cache: bool = True
+) -> tuple[dict[str, dict[str, object]], NameTrie]:
+    """Return the command index and name trie, re-parsing changed files only."""
+    cache_path = cache_path or default_index_cache_path()
+    cached = _load_index_cache(cache_path) if use_cache else {}
+    cached_files = cached.get("files", {})
+    if not isinstance(cached_files, dict):
+        cached_files = {}
+
+    files: dict[str, dict[str, object]] = {}
+    changed = False
+    for p in iter_command_files():
+        key = str(p.relative_to(COMMANDS_DIR))
+        try:
+            st = p.stat()
+        except OSError:
+            continue
+        entry = cached_files.get(key)
+        if (
+            isinstance(entry, dict)
+            and entry.get("mtime_ns") == st.st_mtime_ns
+            and entry.get("size") == st.st_size
+        ):
+            files[key] = entry
+            continue
+        files[key] = {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            **parse_command_file(p),
+        }
+        changed = True
+    if set(files) != set(cached_files):
+        changed = True
+
+    index: dict[str, dict[str, object]] = {}
+    for key, entry in files.items():
+        record = {
+            "path": COMMANDS_DIR / key,
+            "usage": entry.get("usage"),
+            "meta": entry.get("meta") or {},
+        }
+        for name in entry.get("names", []):  # type: ignore[union-attr]
             index.setdefault(name, record)
+
+    trie_root = cached.get("trie")
+    if changed or not isinstance(trie_root, dict):
+        trie = NameTrie.from_names(sorted(index))
+        changed = True
+    else:
+        trie = NameTrie(trie_root)
+    if changed and use_cache:
+        _write_index_cache(
+            cache_path,
+            {
+                "version": INDEX_CACHE_VERSION,
+                "commands_dir": str(COMMANDS_DIR),
+                "files": files,
+                "trie": trie.root,
+            },
+        )
+    return index, trie
+
+
+def build_index() -> dict[str, dict[str, object]]:
+    index, _ = load_catalog()
     return index
 
 
+def resolve_command_name(
+    token: str,
+    index: dict[str, dict[str, object]],
+    trie: NameTrie,
+) -> tuple[str | None, list[str]]:
+    """Resolve ``token`` to a command name, or return candidate names.
+
+    Tries an exact match, the dash/underscore-insensitive match, a unique
+    prefix, and finally the closest fuzzy match.
+    """
+    if token in index:
+        return token, []
+    # Try fallback: same token without dashes/underscores
+    norm = token.replace("-", "").replace("_", "")
+    for k in index.keys():
+        knorm = k.replace("-", "").replace("_", "")
+        if knorm == norm:
+            return k, []
+    prefixed = trie.complete(token)
+    if len({id(index[name]) for name in prefixed}) == 1:
+        return prefixed[0], []
+    if prefixed:
+        return None, prefixed
+    fuzzy = trie.fuzzy(token)
+    if fuzzy:
+        best = fuzzy[0][0]
+        closest = [name for distance, name in fuzzy if distance == best]
+        if len({id(index[name]) for name in closest}) == 1:
+            return closest[0], []
+        return None, closest
+    return None, []
+
+
+def lookup_command(
+    token: str,
+    index: dict[str, dict[str, object]],
+    trie: NameTrie,
+) -> tuple[dict[str, object] | None, list[str]]:
+    """Resolve ``token`` to a record, or return candidate names."""
+    name, candidates = resolve_command_name(token, index, trie)
+    return (index[name] if name else None), candidates
+
+
 def cmd_list(args: argparse.Namespace) -> None:
     index = build_index()
     if not index:
@@ -178,7 +419,7 @@ def cmd_list(args: argparse.Namespace) -> None:
     for key, rec in index.items():
         seen_paths.setdefault(rec["path"], []).append(key)
     for path, aliases in sorted(seen_paths.items(), key=lambda kv: str(kv[0])):
-        meta = build_index()[aliases[0]]["meta"]  # reusing index to get meta
+        meta = index[aliases[0]]["meta"]
         name = meta.get("name") if isinstance(meta, dict) else None
         print(f"- {', '.join(sorted(set(aliases)))} -> {path}")
         if name:
@@ -196,27 +437,39 @@ def resolve_command_token(s: str) -> tuple[str, list[str]]:
     return token, parts[1:]
 
 
+def cmd_find(args: argparse.Namespace) -> None:
+    _, trie = load_catalog()
+    query = args.query if args.query.startswith("/") else f"/{args.query}"
+    matches = trie.complete(query)
+    if not matches:
+        matches = [name for _, name in trie.fuzzy(query)]
+    if not matches:
+        print(f"No commands match: {query}")
+        return
+    for name in matches:
+        print(name)
+
+
 def cmd_run(args: argparse.Namespace) -> None:
     token, rest = resolve_command_token(args.command)
-    index = build_index()
-    # Try exact, then relaxed matching: e.g., '/dagrunner' vs '/dag-debug-enhanced'
-    rec = index.get(token)
-    if not rec:
-        # Try fallback: same token without dashes/underscores
-        norm = token.replace("-", "").replace("_", "")
-        for k in index.keys():
-            knorm = k.replace("-", "").replace("_", "")
-            if knorm == norm:
-                rec = index[k]
-                break
-    if not rec:
+    index, trie = load_catalog()
+    # Try exact, then relaxed, prefix and fuzzy matching: e.g., '/dagrunner'
+    # vs '/dag-debug-enhanced'
+    name, candidates = resolve_command_name(token, index, trie)
+    if not name:
         print(f"Command not found: {token}")
+        if candidates:
+            print("Did you mean: " + ", ".join(candidates))
         print("Tip: Use 'list' to see available commands.")
         return
+    rec = index[name]
     path: Path = rec["path"]  # type: ignore[assignment]
     usage: str | None = rec.get("usage")  # type: ignore[assignment]
     meta: dict[str, str] = rec.get("meta", {})  # type: ignore[assignment]
-    print(f"Command: {token}")
+    if name == token:
+        print(f"Command: {token}")
+    else:
+        print(f"Command: {name} (matched from '{token}')")
     if rest:
         print(f"Args: {' '.join(rest)}")
     print(f"Source: {path}")
@@ -252,6 +505,12 @@ def main() -> None:
     )
     p_run.set_defaults(func=cmd_run)
 
+    p_find = sub.add_parser(
+        "find", help="List commands matching a name prefix (fuzzy fallback)"
+    )
+    p_find.add_argument("query", help="Command name or prefix, e.g. /dag")
+    p_find.set_defaults(func=cmd_find)
+
     # Convenience: if first argument looks like a slash command, treat as run
     import sys
 
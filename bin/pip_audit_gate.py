@@ -2,12 +2,15 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import subprocess
 import sys
 from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import TextIO
 
@@ -25,6 +28,87 @@ WAIVED_VULNERABILITIES: tuple[WaivedVulnerability, ...] = ()
 DEFAULT_AUDIT_PYTHON = (
     os.getenv("PIP_AUDIT_PYTHON") or os.getenv("UV_PYTHON") or "3.12"
 )
+CACHE_FORMAT_VERSION = 1
+
+Runner = Callable[[list[str]], subprocess.CompletedProcess[str]]
+
+
+@dataclass(frozen=True)
+class FileAuditResult:
+    requirements_path: Path
+    payload: dict[str, object] | None = None
+    cached: bool = False
+    returncode: int = 0
+    error: str = ""
+    stdout: str = ""
+    stderr: str = ""
+
+
+@dataclass
+class AuditCache:
+    """pip-audit JSON payloads keyed by requirements hash and DB snapshot.
+
+    Entries live at ``<directory>/<requirements key>/<snapshot>.json``;
+    offline mode reads the most recently written snapshot for a file.
+    """
+
+    directory: Path
+
+    def _path(self, requirements_key: str, snapshot: str) -> Path:
+        safe_snapshot = "".join(
+            char if char.isalnum() or char in "-_." else "_"
+            for char in snapshot
+        )
+        return self.directory / requirements_key / f"{safe_snapshot}.json"
+
+    def load(
+        self, requirements_key: str, snapshot: str
+    ) -> dict[str, object] | None:
+        return _read_payload(self._path(requirements_key, snapshot))
+
+    def load_latest(self, requirements_key: str) -> dict[str, object] | None:
+        entries = sorted(
+            (self.directory / requirements_key).glob("*.json"),
+            key=lambda path: path.stat().st_mtime,
+        )
+        for path in reversed(entries):
+            payload = _read_payload(path)
+            if payload is not None:
+                return payload
+        return None
+
+    def store(
+        self,
+        requirements_key: str,
+        snapshot: str,
+        payload: dict[str, object],
+    ) -> None:
+        path = self._path(requirements_key, snapshot)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(
+            json.dumps(
+                {"version": CACHE_FORMAT_VERSION, "payload": payload},
+                sort_keys=True,
+            ),
+            encoding="utf-8",
+        )
+        os.replace(temporary, path)
+
+
+def _read_payload(path: Path) -> dict[str, object] | None:
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(entry, dict):
+        return None
+    payload = entry.get("payload")
+    if entry.get("version") != CACHE_FORMAT_VERSION or not isinstance(
+        payload, dict
+    ):
+        return None
+    return payload
 
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
@@ -39,6 +123,47 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         nargs="+",
         help="One or more requirements.txt files to audit.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help=(
+            "Audit files concurrently with this many processes, using one "
+            "JSON pip-audit run per file. 0 keeps the serial mode unless "
+            "--cache-dir, --offline or --vuln-snapshot is given, which "
+            "use one process."
+        ),
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Cache JSON results keyed by requirements hash and snapshot.",
+    )
+    parser.add_argument(
+        "--db-snapshot",
+        default="",
+        help=(
+            "Vulnerability DB snapshot label for cache keys "
+            "(default: today's UTC date)."
+        ),
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help=(
+            "Do not run pip-audit; re-evaluate the latest cached results "
+            "(requires --cache-dir)."
+        ),
+    )
+    parser.add_argument(
+        "--vuln-snapshot",
+        type=Path,
+        help=(
+            "Local JSON snapshot of vulnerabilities to apply on top of the "
+            'pip-audit results: {"vulnerabilities": [{"id", "package", '
+            '"versions"}]}.'
+        ),
+    )
     return parser.parse_args(argv)
 
 
@@ -121,6 +246,149 @@ def collect_present_vulnerabilities(
     return present
 
 
+def requirements_cache_key(requirements_path: Path) -> str:
+    digest = hashlib.sha256()
+    digest.update(DEFAULT_AUDIT_PYTHON.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(requirements_path.read_bytes())
+    return digest.hexdigest()
+
+
+def default_db_snapshot() -> str:
+    return datetime.now(UTC).strftime("%Y-%m-%d")
+
+
+def load_vulnerability_snapshot(path: Path) -> list[dict[str, object]]:
+    try:
+        snapshot = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        raise ValueError(f"cannot read vulnerability snapshot {path}") from exc
+    entries = (
+        snapshot.get("vulnerabilities") if isinstance(snapshot, dict) else None
+    )
+    if not isinstance(entries, list):
+        raise ValueError(
+            "vulnerability snapshot must contain a vulnerabilities list"
+        )
+    return [entry for entry in entries if isinstance(entry, dict)]
+
+
+def apply_vulnerability_snapshot(
+    payload: dict[str, object],
+    snapshot: list[dict[str, object]],
+) -> dict[str, object]:
+    """Add snapshot vulnerabilities that match the resolved versions."""
+    affected: dict[tuple[str, str], list[str]] = {}
+    for entry in snapshot:
+        vuln_id = entry.get("id")
+        package_name = entry.get("package")
+        versions = entry.get("versions")
+        if not isinstance(vuln_id, str) or not isinstance(package_name, str):
+            continue
+        if not isinstance(versions, list):
+            continue
+        for version in versions:
+            key = (package_name.lower(), str(version))
+            affected.setdefault(key, []).append(vuln_id)
+
+    dependencies = payload.get("dependencies")
+    if not isinstance(dependencies, list):
+        return payload
+    updated: list[object] = []
+    for dependency in dependencies:
+        if not isinstance(dependency, dict):
+            updated.append(dependency)
+            continue
+        key = (
+            str(dependency.get("name", "")).lower(),
+            str(dependency.get("version", "")),
+        )
+        vulns = dependency.get("vulns")
+        known = list(vulns) if isinstance(vulns, list) else []
+        known_ids = {
+            vuln.get("id") for vuln in known if isinstance(vuln, dict)
+        }
+        known.extend(
+            {"id": vuln_id, "fix_versions": []}
+            for vuln_id in affected.get(key, [])
+            if vuln_id not in known_ids
+        )
+        updated.append({**dependency, "vulns": known})
+    return {**payload, "dependencies": updated}
+
+
+def run_json_audit(
+    requirements_path: Path,
+    *,
+    snapshot: str,
+    cache_dir: Path | None = None,
+    offline: bool = False,
+    runner: Runner = run_command,
+) -> FileAuditResult:
+    """Produce one JSON payload for a file from the cache or pip-audit."""
+    cache = AuditCache(cache_dir) if cache_dir is not None else None
+    try:
+        requirements_key = requirements_cache_key(requirements_path)
+    except OSError as exc:
+        return FileAuditResult(
+            requirements_path, returncode=1, error=f"cannot read file: {exc}"
+        )
+
+    if cache is not None:
+        payload = (
+            cache.load_latest(requirements_key)
+            if offline
+            else cache.load(requirements_key, snapshot)
+        )
+        if payload is not None:
+            return FileAuditResult(requirements_path, payload, cached=True)
+    if offline:
+        return FileAuditResult(
+            requirements_path,
+            returncode=1,
+            error="no cached pip-audit result available offline",
+        )
+
+    completed = runner(
+        build_pip_audit_command(requirements_path, json_output=True)
+    )
+    if completed.returncode not in {0, 1}:
+        return FileAuditResult(
+            requirements_path,
+            returncode=completed.returncode or 1,
+            error="pip-audit JSON run failed",
+            stdout=completed.stdout,
+            stderr=completed.stderr,
+        )
+    try:
+        payload = extract_json_payload(completed.stdout)
+        collect_present_vulnerabilities(payload)
+    except ValueError as exc:
+        return FileAuditResult(
+            requirements_path,
+            returncode=1,
+            error=f"Failed to parse pip-audit JSON: {exc}",
+            stdout=completed.stdout,
+            stderr=completed.stderr,
+        )
+    if cache is not None:
+        cache.store(requirements_key, snapshot, payload)
+    return FileAuditResult(requirements_path, payload, stderr=completed.stderr)
+
+
+def _run_json_audit_job(
+    job: tuple[Path, str, Path | None, bool, Runner],
+) -> FileAuditResult:
+    requirements_path, snapshot, cache_dir, offline, runner = job
+    return run_json_audit(
+        requirements_path,
+        snapshot=snapshot,
+        cache_dir=cache_dir,
+        offline=offline,
+        runner=runner,
+    )
+
+
 def summarize_present_waivers(
     requirements_path: Path,
     present: dict[str, set[str]],
@@ -211,6 +479,90 @@ def audit_requirements(
             requirements_path, current_vulnerabilities, out
         )
 
+    return check_waivers(present_vulnerabilities, out=out, err=err)
+
+
+def audit_requirements_parallel(
+    requirements_paths: list[Path],
+    *,
+    jobs: int,
+    cache_dir: Path | None = None,
+    snapshot: str = "",
+    offline: bool = False,
+    vulnerability_snapshot: list[dict[str, object]] | None = None,
+    runner: Runner = run_command,
+    executor_factory: Callable[[int], Executor] = ProcessPoolExecutor,
+    out: TextIO = sys.stdout,
+    err: TextIO = sys.stderr,
+) -> int:
+    """Audit files concurrently with one JSON pip-audit run per file.
+
+    The waiver verdict is derived from the same payload that reports the
+    present vulnerabilities, so each file is resolved and audited once.
+    """
+    snapshot = snapshot or default_db_snapshot()
+    job_args = [
+        (requirements_path, snapshot, cache_dir, offline, runner)
+        for requirements_path in requirements_paths
+    ]
+    with executor_factory(max(1, min(jobs, len(job_args)))) as executor:
+        results = list(executor.map(_run_json_audit_job, job_args))
+
+    waived_ids = {waiver.id for waiver in WAIVED_VULNERABILITIES}
+    present_vulnerabilities: dict[str, set[str]] = {}
+    for result in results:
+        source = "cached" if result.cached else "pip-audit"
+        print(
+            f"==> pip-audit gate: {result.requirements_path} ({source})",
+            file=out,
+        )
+        if result.payload is None:
+            emit(out, result.stdout)
+            emit(err, result.stderr)
+            print(f"{result.error} for {result.requirements_path}.", file=err)
+            return result.returncode or 1
+
+        payload = result.payload
+        if vulnerability_snapshot:
+            payload = apply_vulnerability_snapshot(
+                payload, vulnerability_snapshot
+            )
+        current_vulnerabilities = collect_present_vulnerabilities(payload)
+        blocking = {
+            vuln_id: packages
+            for vuln_id, packages in current_vulnerabilities.items()
+            if vuln_id not in waived_ids
+        }
+        if blocking:
+            print(
+                f"pip-audit found unwaived vulnerabilities in "
+                f"{result.requirements_path}:",
+                file=err,
+            )
+            for vuln_id in sorted(blocking):
+                print(
+                    f"- {vuln_id} ({', '.join(sorted(blocking[vuln_id]))})",
+                    file=err,
+                )
+            return 1
+
+        print("No known unwaived vulnerabilities found.", file=out)
+        for vuln_id, packages in current_vulnerabilities.items():
+            present_vulnerabilities.setdefault(vuln_id, set()).update(packages)
+        if waived_ids:
+            summarize_present_waivers(
+                result.requirements_path, current_vulnerabilities, out
+            )
+
+    return check_waivers(present_vulnerabilities, out=out, err=err)
+
+
+def check_waivers(
+    present_vulnerabilities: dict[str, set[str]],
+    *,
+    out: TextIO,
+    err: TextIO,
+) -> int:
     if not WAIVED_VULNERABILITIES:
         print("pip-audit gate passed. No waivers configured.", file=out)
         return 0
@@ -244,7 +596,34 @@ def audit_requirements(
 def main(argv: list[str] | None = None) -> int:
     args = parse_args(argv)
     requirements_paths = [Path(path) for path in args.requirements]
-    return audit_requirements(requirements_paths)
+    uses_json_results = (
+        args.offline
+        or args.cache_dir is not None
+        or args.vuln_snapshot is not None
+    )
+    if args.jobs <= 0 and not uses_json_results:
+        return audit_requirements(requirements_paths)
+
+    if args.offline and args.cache_dir is None:
+        print("--offline requires --cache-dir.", file=sys.stderr)
+        return 2
+    vulnerability_snapshot = None
+    if args.vuln_snapshot is not None:
+        try:
+            vulnerability_snapshot = load_vulnerability_snapshot(
+                args.vuln_snapshot
+            )
+        except ValueError as exc:
+            print(str(exc), file=sys.stderr)
+            return 2
+    return audit_requirements_parallel(
+        requirements_paths,
+        jobs=max(1, args.jobs),
+        cache_dir=args.cache_dir,
+        snapshot=args.db_snapshot,
+        offline=args.offline,
+        vulnerability_snapshot=vulnerability_snapshot,
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import statistics
+import subprocess
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_PLUGINS_DIR = REPO_ROOT / "app"
+DEFAULT_RUNS = 5
+DEFAULT_MAX_REGRESSION = 0.25
+# Ignore regressions smaller than this; cold imports are noisy.
+MIN_REGRESSION_SECONDS = 0.02
+# Imported by the plugin host before main.py runs; a warm start cannot save
+# their cost, so they are loaded before the timed import.
+HOST_PRELOADED_MODULES = ("dify_plugin",)
+_IMPORT_SNIPPET = (
+    "import importlib, sys, time\n"
+    "for name in sys.argv[1:-1]:\n"
+    "    try:\n"
+    "        importlib.import_module(name)\n"
+    "    except ImportError:\n"
+    "        pass\n"
+    "started_at = time.perf_counter()\n"
+    "importlib.import_module(sys.argv[-1])\n"
+    "print(time.perf_counter() - started_at)\n"
+)
+
+Runner = Callable[..., subprocess.CompletedProcess[str]]
+
+
+@dataclass(frozen=True)
+class ImportBenchmark:
+    plugin: str
+    module: str
+    samples: tuple[float, ...]
+
+    @property
+    def median_seconds(self) -> float:
+        return statistics.median(self.samples)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "plugin": self.plugin,
+            "module": self.module,
+            "median_seconds": round(self.median_seconds, 6),
+            "min_seconds": round(min(self.samples), 6),
+            "max_seconds": round(max(self.samples), 6),
+            "runs": len(self.samples),
+        }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Measure the import time of each plugin's WARM_START_MODULES "
+            "in fresh interpreters, after the modules the plugin host "
+            "already loads, and compare against a baseline."
+        )
+    )
+    parser.add_argument(
+        "plugins",
+        nargs="*",
+        help="Plugin directories (default: every app/* with a main.py).",
+    )
+    parser.add_argument(
+        "--module",
+        action="append",
+        default=[],
+        help="Module to measure instead of WARM_START_MODULES (repeatable).",
+    )
+    parser.add_argument(
+        "--preload",
+        action="append",
+        default=None,
+        help=(
+            "Module imported before timing (repeatable, default: "
+            f"{', '.join(HOST_PRELOADED_MODULES)}); pass '' for none."
+        ),
+    )
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--python", default=sys.executable)
+    parser.add_argument("--output", type=Path, help="Write results JSON.")
+    parser.add_argument(
+        "--baseline", type=Path, help="Results JSON to compare against."
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=DEFAULT_MAX_REGRESSION,
+        help="Allowed median slowdown ratio versus the baseline.",
+    )
+    return parser.parse_args(argv)
+
+
+def discover_plugins(plugins_dir: Path = DEFAULT_PLUGINS_DIR) -> list[Path]:
+    return sorted(path.parent for path in plugins_dir.glob("*/main.py"))
+
+
+def read_warm_start_modules(plugin_dir: Path) -> tuple[str, ...]:
+    """Read the ``WARM_START_MODULES`` literal without importing main.py."""
+    tree = ast.parse((plugin_dir / "main.py").read_text(encoding="utf-8"))
+    for node in tree.body:
+        if not isinstance(node, ast.Assign):
+            continue
+        if any(
+            isinstance(target, ast.Name) and target.id == "WARM_START_MODULES"
+            for target in node.targets
+        ):
+            return tuple(str(item) for item in ast.literal_eval(node.value))
+    return ()
+
+
+def measure_import(
+    module: str,
+    *,
+    cwd: Path,
+    python: str = sys.executable,
+    preload: tuple[str, ...] = HOST_PRELOADED_MODULES,
+    runner: Runner = subprocess.run,
+) -> float:
+    completed = runner(
+        [python, "-c", _IMPORT_SNIPPET, *preload, module],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if completed.returncode != 0:
+        detail = (completed.stderr or "").strip().splitlines()
+        raise RuntimeError(
+            f"import {module} failed: {detail[-1] if detail else 'unknown'}"
+        )
+    return float(completed.stdout.strip().splitlines()[-1])
+
+
+def benchmark_plugins(
+    plugin_dirs: list[Path],
+    *,
+    runs: int = DEFAULT_RUNS,
+    modules: tuple[str, ...] = (),
+    python: str = sys.executable,
+    preload: tuple[str, ...] = HOST_PRELOADED_MODULES,
+    runner: Runner = subprocess.run,
+) -> list[ImportBenchmark]:
+    results: list[ImportBenchmark] = []
+    for plugin_dir in plugin_dirs:
+        for module in modules or read_warm_start_modules(plugin_dir):
+            samples = tuple(
+                measure_import(
+                    module,
+                    cwd=plugin_dir,
+                    python=python,
+                    preload=preload,
+                    runner=runner,
+                )
+                for _ in range(max(1, runs))
+            )
+            results.append(
+                ImportBenchmark(
+                    plugin=plugin_dir.name, module=module, samples=samples
+                )
+            )
+    return results
+
+
+def find_regressions(
+    results: list[ImportBenchmark],
+    baseline: dict[str, Any],
+    *,
+    max_regression: float = DEFAULT_MAX_REGRESSION,
+) -> list[str]:
+    previous = {
+        (item["plugin"], item["module"]): float(item["median_seconds"])
+        for item in baseline.get("results", [])
+    }
+    regressions: list[str] = []
+    for result in results:
+        before = previous.get((result.plugin, result.module))
+        if before is None:
+            continue
+        after = result.median_seconds
+        if (
+            after > before * (1 + max_regression)
+            and after - before > MIN_REGRESSION_SECONDS
+        ):
+            regressions.append(
+                f"{result.plugin}: import {result.module} took "
+                f"{after:.3f}s (baseline {before:.3f}s)"
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    plugin_dirs = [Path(path) for path in args.plugins] or discover_plugins()
+    results = benchmark_plugins(
+        plugin_dirs,
+        runs=args.runs,
+        modules=tuple(args.module),
+        python=args.python,
+        preload=(
+            HOST_PRELOADED_MODULES
+            if args.preload is None
+            else tuple(name for name in args.preload if name)
+        ),
+    )
+    report = {
+        "runs": args.runs,
+        "results": [result.to_dict() for result in results],
+    }
+    rendered = json.dumps(report, indent=2, sort_keys=True)
+    print(rendered)
+    if args.output is not None:
+        args.output.write_text(rendered + "\n", encoding="utf-8")
+
+    if args.baseline is None:
+        return 0
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    regressions = find_regressions(
+        results, baseline, max_regression=args.max_regression
+    )
+    for message in regressions:
+        print(f"REGRESSION {message}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,535 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from app.sharepoint_list.internal import (  # noqa: E402
+    http_client,
+    operations,
+    request_builders,
+    validators,
+)
+from tests.sharepoint_list._stub_http_server import (  # noqa: E402
+    StubResponse,
+    StubServer,
+)
+
+SCENARIOS = ("request", "list_items", "get_item", "get_items", "update_item")
+DEFAULT_CALLS = 200
+DEFAULT_CONCURRENCY = 8
+DEFAULT_MAX_REGRESSION = 0.25
+# Ignore latency regressions smaller than this; loopback timings are noisy.
+MIN_REGRESSION_MS = 5.0
+SITE_ID = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+LIST_ID = "b2c3d4e5-f6a7-8901-bcde-f12345678901"
+ITEMS_PER_PAGE = 20
+GET_ITEMS_IDS = 40
+
+
+@dataclass(frozen=True)
+class FaultProfile:
+    """Per-request probabilities of injected faults (applied to retries too)."""
+
+    throttle_rate: float = 0.0
+    retry_after: int = 0
+    server_error_rate: float = 0.0
+    slow_rate: float = 0.0
+    slow_delay: float = 0.2
+    reset_rate: float = 0.0
+    base_delay: float = 0.0
+    seed: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "throttle_rate": self.throttle_rate,
+            "retry_after": self.retry_after,
+            "server_error_rate": self.server_error_rate,
+            "slow_rate": self.slow_rate,
+            "slow_delay": self.slow_delay,
+            "reset_rate": self.reset_rate,
+            "base_delay": self.base_delay,
+        }
+
+
+class FaultInjectingResponder:
+    """Answer Graph-shaped requests, injecting faults per FaultProfile."""
+
+    def __init__(self, profile: FaultProfile) -> None:
+        self.profile = profile
+        self._random = random.Random(profile.seed)
+        self._lock = threading.Lock()
+        self.injected: dict[str, int] = {
+            "throttle": 0,
+            "server_error": 0,
+            "slow": 0,
+            "reset": 0,
+        }
+
+    def _roll(self) -> str | None:
+        profile = self.profile
+        with self._lock:
+            value = self._random.random()
+            slow = self._random.random() < profile.slow_rate
+        fault = None
+        for name, rate in (
+            ("reset", profile.reset_rate),
+            ("throttle", profile.throttle_rate),
+            ("server_error", profile.server_error_rate),
+        ):
+            if value < rate:
+                fault = name
+                break
+            value -= rate
+        with self._lock:
+            if fault is not None:
+                self.injected[fault] += 1
+            if slow:
+                self.injected["slow"] += 1
+        if fault is None and slow:
+            return "slow"
+        return fault
+
+    def __call__(self, request: dict[str, Any]) -> StubResponse:
+        profile = self.profile
+        fault = self._roll()
+        delay = profile.base_delay
+        if fault == "slow":
+            delay += profile.slow_delay
+        if fault == "reset":
+            return StubResponse(reset=True, delay=delay)
+        if fault == "throttle":
+            return StubResponse(
+                status=429,
+                body="Too Many Requests",
+                headers={"Retry-After": str(profile.retry_after)},
+                delay=delay,
+            )
+        if fault == "server_error":
+            return StubResponse(status=503, body="Unavailable", delay=delay)
+        return StubResponse(status=200, body=graph_body(request), delay=delay)
+
+
+def _item(item_id: str) -> dict[str, Any]:
+    return {
+        "id": item_id,
+        "fields": {"id": item_id, "Title": f"Item {item_id}", "Amount": 1},
+    }
+
+
+def graph_body(request: dict[str, Any]) -> dict[str, Any]:
+    """A minimal successful Graph response for the request path."""
+    path = request["path"]
+    if path.endswith("/$batch"):
+        batch = json.loads(request["body"] or b"{}")
+        return {
+            "responses": [
+                {
+                    "id": entry["id"],
+                    "status": 200,
+                    "body": _item(
+                        entry["url"].split("?")[0].rsplit("/", 1)[-1]
+                    ),
+                }
+                for entry in batch.get("requests", [])
+            ]
+        }
+    if path.endswith("/columns"):
+        return {
+            "value": [
+                {"name": "Title", "displayName": "Title", "indexed": True},
+                {"name": "Amount", "displayName": "Amount"},
+            ]
+        }
+    if path.endswith("/items"):
+        return {"value": [_item(str(i)) for i in range(1, ITEMS_PER_PAGE + 1)]}
+    if path.endswith("/fields"):
+        return {"Title": "updated"}
+    return _item(path.rsplit("/", 1)[-1])
+
+
+class SleepRecorder:
+    """RetryConfig.sleep that records backoff waits before sleeping."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_seconds = 0.0
+
+    def __call__(self, seconds: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total_seconds += seconds
+        time.sleep(seconds)
+
+
+@contextmanager
+def routed_to(
+    server: StubServer,
+    retry_config: http_client.RetryConfig,
+    breaker: http_client.CircuitBreaker | None = None,
+    hedge: http_client.HedgePolicy | None = None,
+) -> Iterator[None]:
+    """
+    Point Graph URLs at the stub server and use ``retry_config`` (and the
+    given circuit breaker / hedge policy instead of the process-wide ones).
+    """
+    saved_base = request_builders.GRAPH_BASE
+    saved_config = http_client.DEFAULT_RETRY_CONFIG
+    saved_breaker = http_client.CIRCUIT_BREAKER
+    saved_hedge = http_client.HEDGE_POLICY
+    request_builders.GRAPH_BASE = f"{server.base_url}/v1.0"
+    http_client.DEFAULT_RETRY_CONFIG = retry_config
+    http_client.CIRCUIT_BREAKER = breaker or saved_breaker
+    http_client.HEDGE_POLICY = hedge or saved_hedge
+    http_client.GET_COALESCER.invalidate()
+    try:
+        yield
+    finally:
+        request_builders.GRAPH_BASE = saved_base
+        http_client.DEFAULT_RETRY_CONFIG = saved_config
+        http_client.CIRCUIT_BREAKER = saved_breaker
+        http_client.HEDGE_POLICY = saved_hedge
+        http_client.GET_COALESCER.invalidate()
+
+
+def scenario_call(scenario: str) -> Callable[[int], Any]:
+    target = validators.TargetSpec(
+        site_identifier=SITE_ID, list_identifier=LIST_ID
+    )
+    if scenario == "request":
+
+        def call(index: int) -> Any:
+            spec = request_builders.build_get_item_request(
+                site_id=SITE_ID,
+                list_id=LIST_ID,
+                item_id=str(index),
+                select_fields=None,
+            )
+            return http_client.send_request_with_retry(spec, "bench-token")
+
+        return call
+    if scenario == "list_items":
+        return lambda index: operations.list_items(
+            "bench-token", target, select_fields="Title,Amount"
+        )
+    if scenario == "get_item":
+        return lambda index: operations.get_item(
+            "bench-token", target, str(index), select_fields=["Title"]
+        )
+    if scenario == "get_items":
+        ids = [str(i) for i in range(1, GET_ITEMS_IDS + 1)]
+        return lambda index: operations.get_items(
+            "bench-token", target, ids, select_fields=["Title"]
+        )
+    if scenario == "update_item":
+        return lambda index: operations.update_item(
+            "bench-token", target, str(index), {"Title": "updated"}
+        )
+    raise ValueError(f"unknown scenario: {scenario}")
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Nearest-rank percentile (0 for no samples)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+@dataclass
+class ScenarioResult:
+    scenario: str
+    concurrency: int
+    calls: int
+    wall_seconds: float
+    latencies_ms: list[float] = field(repr=False)
+    errors: dict[str, int]
+    server_requests: int
+    retries: int
+    sleep_seconds: float
+    injected: dict[str, int]
+    circuit_breaker: dict[str, int] = field(default_factory=dict)
+    hedging: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        return self.calls / self.wall_seconds if self.wall_seconds else 0.0
+
+    @property
+    def retry_amplification(self) -> float:
+        """Requests the server saw per request the client meant to send."""
+        first_attempts = self.server_requests - self.retries
+        if first_attempts <= 0:
+            return 0.0
+        return self.server_requests / first_attempts
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "scenario": self.scenario,
+            "concurrency": self.concurrency,
+            "calls": self.calls,
+            "errors": dict(sorted(self.errors.items())),
+            "wall_seconds": round(self.wall_seconds, 6),
+            "throughput_per_second": round(self.throughput, 3),
+            "p50_ms": round(percentile(self.latencies_ms, 0.50), 3),
+            "p95_ms": round(percentile(self.latencies_ms, 0.95), 3),
+            "p99_ms": round(percentile(self.latencies_ms, 0.99), 3),
+            "server_requests": self.server_requests,
+            "retries": self.retries,
+            "retry_amplification": round(self.retry_amplification, 4),
+            "sleep_seconds": round(self.sleep_seconds, 6),
+            "injected_faults": dict(self.injected),
+            "circuit_breaker": dict(self.circuit_breaker),
+            "hedging": dict(self.hedging),
+        }
+
+
+def run_scenario(
+    scenario: str,
+    *,
+    calls: int = DEFAULT_CALLS,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    faults: FaultProfile | None = None,
+    retry_config: http_client.RetryConfig | None = None,
+    circuit_breaker: bool = True,
+    hedge: bool = False,
+) -> ScenarioResult:
+    base_config = retry_config or http_client.RetryConfig()
+    recorder = SleepRecorder()
+    config = http_client.RetryConfig(
+        max_attempts=base_config.max_attempts,
+        min_wait_seconds=base_config.min_wait_seconds,
+        max_wait_seconds=base_config.max_wait_seconds,
+        exponential_base=base_config.exponential_base,
+        jitter=base_config.jitter,
+        sleep=recorder,
+    )
+    responder = FaultInjectingResponder(faults or FaultProfile())
+    server = StubServer()
+    server.responder = responder
+    server.start()
+    breaker = http_client.CircuitBreaker(enabled=circuit_breaker)
+    hedge_policy = http_client.HedgePolicy(enabled=hedge)
+    call = scenario_call(scenario)
+    latencies: list[float] = []
+    errors: dict[str, int] = {}
+    lock = threading.Lock()
+
+    def timed_call(index: int) -> None:
+        started_at = time.perf_counter()
+        error: str | None = None
+        try:
+            call(index)
+        except Exception as e:
+            error = type(e).__name__
+        elapsed_ms = (time.perf_counter() - started_at) * 1000
+        with lock:
+            latencies.append(elapsed_ms)
+            if error is not None:
+                errors[error] = errors.get(error, 0) + 1
+
+    try:
+        with routed_to(server, config, breaker, hedge_policy):
+            started_at = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+                list(pool.map(timed_call, range(1, calls + 1)))
+            wall_seconds = time.perf_counter() - started_at
+    finally:
+        server.stop()
+
+    return ScenarioResult(
+        scenario=scenario,
+        concurrency=concurrency,
+        calls=calls,
+        wall_seconds=wall_seconds,
+        latencies_ms=latencies,
+        errors=errors,
+        server_requests=len(server.requests),
+        retries=recorder.count,
+        sleep_seconds=recorder.total_seconds,
+        injected=dict(responder.injected),
+        circuit_breaker=dict(breaker.stats),
+        hedging=dict(hedge_policy.stats),
+    )
+
+
+def find_regressions(
+    results: list[ScenarioResult],
+    baseline: dict[str, Any],
+    *,
+    max_regression: float = DEFAULT_MAX_REGRESSION,
+) -> list[str]:
+    previous = {
+        (item["scenario"], int(item["concurrency"])): item
+        for item in baseline.get("results", [])
+    }
+    regressions: list[str] = []
+    for result in results:
+        before = previous.get((result.scenario, result.concurrency))
+        if before is None:
+            continue
+        after = result.to_dict()
+        label = f"{result.scenario} (concurrency {result.concurrency})"
+        for key in ("p50_ms", "p95_ms", "p99_ms"):
+            old, new = float(before[key]), float(after[key])
+            if (
+                new > old * (1 + max_regression)
+                and new - old > MIN_REGRESSION_MS
+            ):
+                regressions.append(
+                    f"{label}: {key} {new:.1f}ms (baseline {old:.1f}ms)"
+                )
+        old_tp = float(before["throughput_per_second"])
+        new_tp = float(after["throughput_per_second"])
+        if new_tp < old_tp / (1 + max_regression):
+            regressions.append(
+                f"{label}: throughput {new_tp:.1f}/s "
+                f"(baseline {old_tp:.1f}/s)"
+            )
+        old_amp = float(before["retry_amplification"])
+        new_amp = float(after["retry_amplification"])
+        if new_amp > old_amp * (1 + max_regression):
+            regressions.append(
+                f"{label}: retry amplification {new_amp:.2f} "
+                f"(baseline {old_amp:.2f})"
+            )
+    return regressions
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Drive the SharePoint list HTTP client and operations against a "
+            "local stub Graph server with injected faults, and compare "
+            "latency/throughput/retry figures against a baseline."
+        )
+    )
+    parser.add_argument(
+        "scenarios",
+        nargs="*",
+        help=f"Scenarios to run (default: all of {', '.join(SCENARIOS)}).",
+    )
+    parser.add_argument("--calls", type=int, default=DEFAULT_CALLS)
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        action="append",
+        default=[],
+        help=f"Worker threads (repeatable, default {DEFAULT_CONCURRENCY}).",
+    )
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int, default=0)
+    parser.add_argument("--server-error-rate", type=float, default=0.0)
+    parser.add_argument("--slow-rate", type=float, default=0.0)
+    parser.add_argument("--slow-delay", type=float, default=0.2)
+    parser.add_argument("--reset-rate", type=float, default=0.0)
+    parser.add_argument("--base-delay", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-attempts", type=int, default=3)
+    parser.add_argument("--min-wait", type=float, default=1.0)
+    parser.add_argument("--max-wait", type=float, default=10.0)
+    parser.add_argument("--no-jitter", action="store_true")
+    parser.add_argument(
+        "--no-circuit-breaker",
+        action="store_true",
+        help="Retry failing endpoints instead of failing fast.",
+    )
+    parser.add_argument(
+        "--hedge", action="store_true", help="Hedge slow GET requests."
+    )
+    parser.add_argument("--output", type=Path, help="Write results JSON.")
+    parser.add_argument(
+        "--baseline", type=Path, help="Results JSON to compare against."
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=DEFAULT_MAX_REGRESSION,
+        help="Allowed slowdown ratio versus the baseline.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    unknown = sorted(set(args.scenarios) - set(SCENARIOS))
+    if unknown:
+        print(f"unknown scenario: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    faults = FaultProfile(
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        server_error_rate=args.server_error_rate,
+        slow_rate=args.slow_rate,
+        slow_delay=args.slow_delay,
+        reset_rate=args.reset_rate,
+        base_delay=args.base_delay,
+        seed=args.seed,
+    )
+    retry_config = http_client.RetryConfig(
+        max_attempts=args.max_attempts,
+        min_wait_seconds=args.min_wait,
+        max_wait_seconds=args.max_wait,
+        jitter=not args.no_jitter,
+    )
+    results = [
+        run_scenario(
+            scenario,
+            calls=args.calls,
+            concurrency=concurrency,
+            faults=faults,
+            retry_config=retry_config,
+            circuit_breaker=not args.no_circuit_breaker,
+            hedge=args.hedge,
+        )
+        for scenario in args.scenarios or SCENARIOS
+        for concurrency in args.concurrency or [DEFAULT_CONCURRENCY]
+    ]
+    report = {
+        "calls": args.calls,
+        "faults": faults.to_dict(),
+        "retry": {
+            "max_attempts": retry_config.max_attempts,
+            "min_wait_seconds": retry_config.min_wait_seconds,
+            "max_wait_seconds": retry_config.max_wait_seconds,
+            "jitter": retry_config.jitter,
+        },
+        "circuit_breaker": not args.no_circuit_breaker,
+        "hedge": args.hedge,
+        "results": [result.to_dict() for result in results],
+    }
+    rendered = json.dumps(report, indent=2, sort_keys=True)
+    print(rendered)
+    if args.output is not None:
+        args.output.write_text(rendered + "\n", encoding="utf-8")
+
+    if args.baseline is None:
+        return 0
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    regressions = find_regressions(
+        results, baseline, max_regression=args.max_regression
+    )
+    for message in regressions:
+        print(f"REGRESSION {message}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from app.gpt5_agent_strategies.internal.budget import (
+    BUDGET_CONTINUE,
+    BUDGET_DOWNGRADE,
+    BUDGET_STOP,
+    BudgetController,
+    BudgetLimits,
+    downgrade_reasoning_effort,
+)
+
+
+def _usage(total_tokens: int, total_price: float = 0.0) -> SimpleNamespace:
+    return SimpleNamespace(total_tokens=total_tokens, total_price=total_price)
+
+
+def test_budget_controller_is_inert_without_limits() -> None:
+    budget = BudgetController(BudgetLimits())
+    budget.record_round(seconds=999.0, usage=_usage(10**9, 10**6))
+
+    decision = budget.check(elapsed_seconds=10**6, can_downgrade=False)
+
+    assert decision.action == BUDGET_CONTINUE
+
+
+def test_budget_controller_stops_when_limit_already_exceeded() -> None:
+    budget = BudgetController(BudgetLimits(max_total_tokens=1000))
+    budget.record_round(seconds=1.0, usage=_usage(1200))
+
+    decision = budget.check(elapsed_seconds=1.0, can_downgrade=True)
+
+    assert decision.action == BUDGET_STOP
+    assert decision.reason == "max_total_tokens"
+
+
+def test_budget_controller_projects_next_round_from_recent_rounds() -> None:
+    budget = BudgetController(BudgetLimits(max_run_seconds=60.0))
+    assert (
+        budget.check(elapsed_seconds=0.0, can_downgrade=True).action
+        == BUDGET_CONTINUE
+    )
+    budget.record_round(seconds=25.0, usage=None)
+    budget.record_round(seconds=5.0, usage=None)
+
+    # Next round is projected at 15s (moving average of 25s and 5s).
+    assert (
+        budget.check(elapsed_seconds=40.0, can_downgrade=True).action
+        == BUDGET_CONTINUE
+    )
+    downgrade = budget.check(elapsed_seconds=50.0, can_downgrade=True)
+    assert downgrade.action == BUDGET_DOWNGRADE
+    assert downgrade.reason == "max_run_seconds"
+    stop = budget.check(elapsed_seconds=50.0, can_downgrade=False)
+    assert stop.action == BUDGET_STOP
+
+
+def test_budget_controller_tracks_round_deltas_from_accumulated_usage() -> (
+    None
+):
+    budget = BudgetController(BudgetLimits(max_total_price=1.0))
+    budget.record_round(seconds=1.0, usage=_usage(100, 0.1))
+    budget.record_round(seconds=1.0, usage=_usage(600, 0.5))
+
+    assert budget.total_tokens == 600
+    assert budget.total_price == 0.5
+    # Rounds cost 0.1 and 0.4, so the next round is projected at 0.25.
+    assert (
+        budget.check(elapsed_seconds=2.0, can_downgrade=False).action
+        == BUDGET_CONTINUE
+    )
+    budget.record_round(seconds=1.0, usage=_usage(700, 0.8))
+    assert (
+        budget.check(elapsed_seconds=3.0, can_downgrade=False).reason
+        == "max_total_price"
+    )
+
+
+def test_budget_controller_recovers_after_an_expensive_round() -> None:
+    budget = BudgetController(BudgetLimits(max_total_tokens=8_000))
+    budget.record_round(seconds=1.0, usage=_usage(4_000))
+    budget.record_round(seconds=1.0, usage=_usage(4_200))
+    budget.record_round(seconds=1.0, usage=_usage(4_400))
+
+    # Projecting with the 4000-token first round would reach 8400 tokens;
+    # the recent 200-token rounds bring the projection down to 1150.
+    assert (
+        budget.check(elapsed_seconds=3.0, can_downgrade=True).action
+        == BUDGET_CONTINUE
+    )
+
+
+def test_is_tool_call_cycle_ignores_order_and_ids() -> None:
+    budget = BudgetController(BudgetLimits())
+    first = [("lookup", '{"q": "a"}'), ("search", '{"q": "b"}')]
+
+    assert not budget.is_tool_call_cycle([])
+    assert not budget.is_tool_call_cycle(first)
+    assert budget.is_tool_call_cycle(reversed(first))
+    assert budget.cycle_count == 1
+
+
+def test_is_tool_call_cycle_allows_read_write_read() -> None:
+    budget = BudgetController(BudgetLimits())
+    read = [("get_item", '{"id": "1"}')]
+
+    assert not budget.is_tool_call_cycle(read)
+    assert not budget.is_tool_call_cycle([("update_item", '{"id": "1"}')])
+    assert not budget.is_tool_call_cycle(read)
+    assert budget.cycle_count == 0
+
+
+def test_is_tool_call_cycle_allows_polling_between_other_calls() -> None:
+    budget = BudgetController(BudgetLimits())
+    status = [("job_status", '{"job": "42"}')]
+
+    for seconds in range(1, 5):
+        assert not budget.is_tool_call_cycle(status)
+        assert not budget.is_tool_call_cycle([("wait", f'{{"s": {seconds}}}')])
+    assert budget.cycle_count == 0
+
+
+def test_is_tool_call_cycle_detects_alternation() -> None:
+    budget = BudgetController(BudgetLimits())
+    first = [("lookup", '{"q": "a"}')]
+    second = [("lookup", '{"q": "b"}')]
+
+    assert not budget.is_tool_call_cycle(first)
+    assert not budget.is_tool_call_cycle(second)
+    assert not budget.is_tool_call_cycle(first)
+    assert budget.is_tool_call_cycle(second)
+    assert budget.is_tool_call_cycle(first)
+    assert budget.cycle_count == 2
+
+
+def test_downgrade_reasoning_effort_stops_at_low() -> None:
+    assert downgrade_reasoning_effort("xhigh") == "high"
+    assert downgrade_reasoning_effort("HIGH") == "medium"
+    assert downgrade_reasoning_effort("medium") == "low"
+    assert downgrade_reasoning_effort("low") is None
+    assert downgrade_reasoning_effort(None) is None
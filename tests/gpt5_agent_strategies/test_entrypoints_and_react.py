@@ -52,6 +52,11 @@ def test_agent_main_and_provider_entrypoint() -> None:
 
     assert main_module.plugin.env.kwargs["MAX_REQUEST_TIMEOUT"] == 1800
     assert main_module.plugin.env.kwargs["MAX_INVOCATION_TIMEOUT"] == 1200
+    assert main_module.warm_start.mode == "off"
+    assert "register:plugin" in main_module.warm_start.timings
+    main_module.warm_start.start("blocking")
+    assert "warm:system_instruction" in main_module.warm_start.timings
+    assert main_module.warm_start.errors == {}
     assert (
         provider_module.GPT5AgentProvider.__mro__[1].__name__
         == "AgentProvider"
@@ -3,7 +3,11 @@ from __future__ import annotations
 import json
 
 from app.gpt5_agent_strategies.internal.loop import should_continue
-from app.gpt5_agent_strategies.internal.policy import build_system_instruction
+from app.gpt5_agent_strategies.internal.policy import (
+    _render_system_instruction,
+    build_system_instruction,
+    clear_system_instruction_cache,
+)
 
 
 def test_build_system_instruction_contains_policy_sections() -> None:
@@ -148,3 +152,27 @@ def test_should_continue_stops_without_tool_call() -> None:
     assert not should_continue(
         iteration=1, maximum_iterations=5, has_tool_call=False
     )
+
+
+def test_build_system_instruction_memoizes_rendered_prompt() -> None:
+    clear_system_instruction_cache()
+    override = json.dumps({"extra_policy": "- Stay concise."})
+
+    first = build_system_instruction("You are a coding agent", override)
+    second = build_system_instruction(
+        base_instruction="  You are a coding agent\n",
+        prompt_policy_overrides=f" {override} ",
+    )
+
+    assert second is first
+    info = _render_system_instruction.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_build_system_instruction_treats_missing_overrides_as_empty() -> None:
+    clear_system_instruction_cache()
+
+    assert build_system_instruction("agent", None) is build_system_instruction(
+        "agent", "   "
+    )
+    assert _render_system_instruction.cache_info().currsize == 1
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from app.gpt5_agent_strategies.internal.profiling import (
+    PHASE_MODEL_FIRST_CHUNK,
+    PHASE_PROMPT_ORGANIZATION,
+    RunProfiler,
+    StackSampler,
+)
+
+
+def test_run_profiler_records_phases_and_tools_per_round() -> None:
+    profiler = RunProfiler()
+    profiler.start_round(1)
+    with profiler.phase(PHASE_PROMPT_ORGANIZATION):
+        pass
+    profiler.record_phase(PHASE_MODEL_FIRST_CHUNK, 0.25)
+    tool_timing = profiler.start_tool("call_1", "lookup")
+    tool_timing.mark_response()
+    first_response = tool_timing.first_response_seconds
+    tool_timing.mark_response()
+    tool_timing.finish()
+    profiler.finish_round()
+    profiler.finish()
+
+    report = profiler.to_dict()
+
+    assert tool_timing.first_response_seconds == first_response
+    assert report["rounds"][0]["round"] == 1
+    assert report["rounds"][0]["phases"][PHASE_MODEL_FIRST_CHUNK] == 0.25
+    assert PHASE_PROMPT_ORGANIZATION in report["rounds"][0]["phases"]
+    assert report["rounds"][0]["tools"][0]["name"] == "lookup"
+    assert "tool:lookup" in report["phase_totals"]
+    assert "run;round_1;model_first_chunk 250000" in report["flame"]
+    assert any(
+        line.startswith("run;round_1;tool:lookup;first_response ")
+        for line in report["flame"]
+    )
+    assert "sampled_stacks" not in report
+
+
+def test_run_profiler_ignores_phases_outside_rounds() -> None:
+    profiler = RunProfiler()
+    profiler.record_phase(PHASE_MODEL_FIRST_CHUNK, 1.0)
+    profiler.finish_round()
+
+    assert profiler.to_dict()["rounds"] == []
+
+
+def test_run_profiler_includes_samples_only_for_slow_runs() -> None:
+    sampler = StackSampler(thread_id=threading.get_ident())
+    fast = RunProfiler(sampler=sampler, slow_run_threshold_seconds=60.0)
+    sampler.sample_once()
+    fast.finish()
+    assert "sampled_stacks" not in fast.to_dict()
+
+    slow_sampler = StackSampler(thread_id=threading.get_ident())
+    slow = RunProfiler(sampler=slow_sampler, slow_run_threshold_seconds=0.0)
+    slow_sampler.sample_once()
+    slow.finish()
+
+    stacks = slow.to_dict()["sampled_stacks"]
+    assert stacks
+    assert "test_run_profiler_includes_samples_only_for_slow_runs" in stacks[0]
+
+
+def test_stack_sampler_background_thread_stops_at_sample_cap() -> None:
+    sampler = StackSampler(interval_seconds=0.001, max_samples=3)
+    sampler.start()
+    deadline = time.monotonic() + 2.0
+    while sampler._sample_count < 3 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    sampler.stop()
+
+    assert sampler._sample_count == 3
+    assert (
+        sum(int(line.rsplit(" ", 1)[1]) for line in sampler.collapsed_stacks())
+        == 3
+    )
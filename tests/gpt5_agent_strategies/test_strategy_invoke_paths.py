@@ -2174,3 +2174,499 @@ def test_normalize_tool_invoke_parameters_validates_required_and_types(
         tool_call_args={"count": "abc"},
     )
     assert "requires integer" in str(error)
+
+
+def test_invoke_emits_execution_profile_next_to_metadata(
+    strategy_module: Any,
+) -> None:
+    strategy = strategy_module.GPT5FunctionCallingStrategy()
+    tool_call = strategy_module.AssistantPromptMessage.ToolCall(
+        id="call_1",
+        type="function",
+        function=strategy_module.AssistantPromptMessage.ToolCall.ToolCallFunction(
+            name="lookup",
+            arguments='{"q":"hello"}',
+        ),
+    )
+    llm_result = strategy_module.LLMResult(
+        model="gpt-5.2",
+        prompt_messages=[],
+        message=strategy_module.AssistantPromptMessage(
+            content="need tool",
+            tool_calls=[tool_call],
+        ),
+        usage=None,
+    )
+    llm = _SequenceLLM([llm_result])
+    text_response = types.SimpleNamespace(
+        type=strategy_module.ToolInvokeMessage.MessageType.TEXT,
+        message=strategy_module.ToolInvokeMessage.TextMessage(text="ok"),
+    )
+    strategy.session = types.SimpleNamespace(
+        model=types.SimpleNamespace(llm=llm),
+        tool=types.SimpleNamespace(invoke=lambda **_: [text_response]),
+    )
+
+    messages = list(
+        strategy._invoke(
+            {
+                "query": "hello",
+                "instruction": "",
+                "model": _build_model_config(strategy_module, stream=False),
+                "tools": [_build_tool_entity()],
+                "maximum_iterations": 1,
+            }
+        )
+    )
+
+    payload = [m for m in messages if m.get("kind") == "json"][-1]["payload"]
+    assert "execution_metadata" in payload
+    profile = payload["execution_profile"]
+    assert len(profile["rounds"]) == 1
+    phases = profile["rounds"][0]["phases"]
+    assert {
+        "prompt_organization",
+        "model_config",
+        "model_first_chunk",
+        "argument_normalization",
+    } <= set(phases)
+    tools = profile["rounds"][0]["tools"]
+    assert tools[0]["name"] == "lookup"
+    assert tools[0]["first_response_seconds"] is not None
+    assert "sampled_stacks" not in profile
+
+
+def test_invoke_finishes_tool_timing_and_profiler_on_errors(
+    strategy_module: Any,
+) -> None:
+    strategy = strategy_module.GPT5FunctionCallingStrategy()
+    tool_call = strategy_module.AssistantPromptMessage.ToolCall(
+        id="call_1",
+        type="function",
+        function=strategy_module.AssistantPromptMessage.ToolCall.ToolCallFunction(
+            name="lookup",
+            arguments='{"q":"hello"}',
+        ),
+    )
+    llm_result = strategy_module.LLMResult(
+        model="gpt-5.2",
+        prompt_messages=[],
+        message=strategy_module.AssistantPromptMessage(
+            content="need tool",
+            tool_calls=[tool_call],
+        ),
+        usage=None,
+    )
+    text_response = types.SimpleNamespace(
+        type=strategy_module.ToolInvokeMessage.MessageType.TEXT,
+        message=strategy_module.ToolInvokeMessage.TextMessage(text="ok"),
+    )
+
+    def _failing_tool(**_: Any) -> Any:
+        yield text_response
+        raise RuntimeError("tool stream broke")
+
+    llm = _SequenceLLM([llm_result])
+    strategy.session = types.SimpleNamespace(
+        model=types.SimpleNamespace(llm=llm),
+        tool=types.SimpleNamespace(invoke=_failing_tool),
+    )
+    profilers: list[Any] = []
+    create_profiler = strategy._create_run_profiler
+
+    def _tracked_profiler() -> Any:
+        profilers.append(create_profiler())
+        return profilers[-1]
+
+    strategy._create_run_profiler = _tracked_profiler
+    params = {
+        "query": "hello",
+        "instruction": "",
+        "model": _build_model_config(strategy_module, stream=False),
+        "tools": [_build_tool_entity()],
+        "maximum_iterations": 1,
+    }
+
+    list(strategy._invoke(params))
+
+    (tool_timing,) = profilers[0].rounds[0].tools
+    assert tool_timing.total_seconds > 0
+
+    def _failing_llm(**_: Any) -> Any:
+        raise RuntimeError("model unavailable")
+
+    strategy.session.model.llm = types.SimpleNamespace(invoke=_failing_llm)
+    with pytest.raises(RuntimeError, match="model unavailable"):
+        list(strategy._invoke(params))
+
+    assert profilers[1].finished_at is not None
+
+
+def test_profile_settings_read_environment(
+    strategy_module: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    strategy = strategy_module.GPT5FunctionCallingStrategy()
+
+    monkeypatch.delenv("GPT5_AGENT_PROFILE_SLOW_RUN_SECONDS", raising=False)
+    assert strategy._profile_slow_run_seconds() == 30.0
+    monkeypatch.setenv("GPT5_AGENT_PROFILE_SLOW_RUN_SECONDS", "2.5")
+    assert strategy._profile_slow_run_seconds() == 2.5
+    monkeypatch.setenv("GPT5_AGENT_PROFILE_SLOW_RUN_SECONDS", "abc")
+    assert strategy._profile_slow_run_seconds() == 30.0
+
+    monkeypatch.setenv("GPT5_AGENT_PROFILE_SAMPLING", "true")
+    profiler = strategy._create_run_profiler()
+    profiler.finish()
+    assert profiler._sampler is not None
+
+
+def test_tool_validators_compile_once_and_refresh_on_schema_change(
+    strategy_module: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    strategy = strategy_module.GPT5FunctionCallingStrategy()
+    compile_calls: list[str] = []
+    original_compile = strategy_module.compile_tool_validator
+
+    def _counting_compile(tool_instance: Any) -> Any:
+        compile_calls.append(tool_instance.identity.name)
+        return original_compile(tool_instance)
+
+    monkeypatch.setattr(
+        strategy_module, "compile_tool_validator", _counting_compile
+    )
+    tool = _build_tool_entity()
+    strategy._init_prompt_tools([tool])
+    assert compile_calls == ["lookup"]
+
+    for _ in range(3):
+        _normalized, error = strategy._normalize_tool_invoke_parameters(
+            tool_instance=tool,
+            runtime_parameters={},
+            tool_call_args={"q": "hello"},
+        )
+        assert error is None
+        strategy.update_prompt_message_tool(tool, object())
+    assert compile_calls == ["lookup"]
+
+    tool.parameters = [*tool.parameters, type(tool.parameters[0])(name="n")]
+    strategy.update_prompt_message_tool(tool, object())
+    assert compile_calls == ["lookup", "lookup"]
+    _normalized, error = strategy._normalize_tool_invoke_parameters(
+        tool_instance=tool,
+        runtime_parameters={},
+        tool_call_args={"q": "hello", "n": "x"},
+    )
+    assert error is None
+
+
+def test_bounded_json_chars_matches_json_length_within_limit(
+    strategy_module: Any,
+) -> None:
+    measure = strategy_module.GPT5FunctionCallingStrategy._bounded_json_chars
+
+    for value in ["abc", "\x00" * 5, 12, None, {"k": ["v", 1]}, [True]]:
+        expected = len(strategy_module.json.dumps(value, ensure_ascii=False))
+        assert measure(value, 2048) == expected
+    assert measure("x" * 5000, 2048) > 2048
+    assert measure(["x" * 100] * 1000, 2048) > 2048
+    assert measure(["x" * 100] * 1000, 2048) < 100 * 1000
+
+
+def test_invoke_truncates_large_json_tool_output_for_model(
+    strategy_module: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("GPT5_AGENT_MAX_TOOL_RESULT_CHARS", "2048")
+    strategy = strategy_module.GPT5FunctionCallingStrategy()
+    tool_call = strategy_module.AssistantPromptMessage.ToolCall(
+        id="call_1",
+        type="function",
+        function=strategy_module.AssistantPromptMessage.ToolCall.ToolCallFunction(
+            name="lookup",
+            arguments='{"q":"hello"}',
+        ),
+    )
+    first = strategy_module.LLMResult(
+        model="gpt-5.2",
+        prompt_messages=[],
+        message=strategy_module.AssistantPromptMessage(
+            content="need tool",
+            tool_calls=[tool_call],
+        ),
+        usage=None,
+    )
+    second = strategy_module.LLMResult(
+        model="gpt-5.2",
+        prompt_messages=[],
+        message=strategy_module.AssistantPromptMessage(
+            content="done",
+            tool_calls=[],
+        ),
+        usage=None,
+    )
+
+    class _CaptureLLM:
+        def __init__(self) -> None:
+            self.responses = [first, second]
+            self.prompt_messages: list[Any] = []
+
+        def invoke(self, **kwargs: Any) -> Any:
+            self.prompt_messages = kwargs["prompt_messages"]
+            return self.responses.pop(0)
+
+    llm = _CaptureLLM()
+    json_response = types.SimpleNamespace(
+        type=strategy_module.ToolInvokeMessage.MessageType.JSON,
+        message=strategy_module.ToolInvokeMessage.JsonMessage(
+            json_object={"rows": ["x" * 100] * 1000}
+        ),
+    )
+    strategy.session = types.SimpleNamespace(
+        model=types.SimpleNamespace(llm=llm),
+        tool=types.SimpleNamespace(invoke=lambda **_: [json_response]),
+    )
+
+    _ = list(
+        strategy._invoke(
+            {
+                "query": "hello",
+                "instruction": "",
+                "model": _build_model_config(strategy_module, stream=False),
+                "tools": [_build_tool_entity()],
+                "maximum_iterations": 2,
+            }
+        )
+    )
+
+    tool_messages = [
+        m
+        for m in llm.prompt_messages
+        if isinstance(m, strategy_module.ToolPromptMessage)
+    ]
+    assert len(tool_messages) == 1
+    content = tool_messages[0].content
+    assert content.startswith('tool response: {"rows": ["xxx')
+    assert content.endswith("[tool output truncated]")
+    assert len(content) < 2048 + 64
+
+
+def test_max_tool_result_chars_reads_environment(
+    strategy_module: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    strategy = strategy_module.GPT5FunctionCallingStrategy()
+
+    monkeypatch.delenv("GPT5_AGENT_MAX_TOOL_RESULT_CHARS", raising=False)
+    assert strategy._max_tool_result_chars() == 100_000
+    monkeypatch.setenv("GPT5_AGENT_MAX_TOOL_RESULT_CHARS", "10")
+    assert strategy._max_tool_result_chars() == 1024
+    monkeypatch.setenv("GPT5_AGENT_MAX_TOOL_RESULT_CHARS", "abc")
+    assert strategy._max_tool_result_chars() == 100_000
+
+
+def test_invoke_detects_tool_call_cycle_with_new_ids(
+    strategy_module: Any,
+) -> None:
+    strategy = strategy_module.GPT5FunctionCallingStrategy()
+
+    def _round(call_id: str) -> Any:
+        return strategy_module.LLMResult(
+            model="gpt-5.2",
+            prompt_messages=[],
+            message=strategy_module.AssistantPromptMessage(
+                content="",
+                tool_calls=[
+                    strategy_module.AssistantPromptMessage.ToolCall(
+                        id=call_id,
+                        type="function",
+                        function=strategy_module.AssistantPromptMessage.ToolCall.ToolCallFunction(
+                            name="lookup",
+                            arguments='{"q":"hello"}',
+                        ),
+                    )
+                ],
+            ),
+            usage=None,
+        )
+
+    llm = _SequenceLLM([_round("call_1"), _round("call_2"), _round("call_3")])
+    call_count = 0
+    text_response = types.SimpleNamespace(
+        type=strategy_module.ToolInvokeMessage.MessageType.TEXT,
+        message=strategy_module.ToolInvokeMessage.TextMessage(text="ok"),
+    )
+
+    def _tool_invoke(**_: Any) -> list[Any]:
+        nonlocal call_count
+        call_count += 1
+        return [text_response]
+
+    strategy.session = types.SimpleNamespace(
+        model=types.SimpleNamespace(llm=llm),
+        tool=types.SimpleNamespace(invoke=_tool_invoke),
+    )
+
+    messages = list(
+        strategy._invoke(
+            {
+                "query": "hello",
+                "instruction": "",
+                "model": _build_model_config(strategy_module, stream=False),
+                "tools": [_build_tool_entity()],
+                "maximum_iterations": 10,
+            }
+        )
+    )
+
+    assert call_count == 1
+    assert llm.calls == 3
+    tool_outputs = [
+        m["data"]["output"]["tool_response"]
+        for m in messages
+        if m.get("kind") == "log_finish"
+        and isinstance(m["data"].get("output"), dict)
+    ]
+    assert tool_outputs == [strategy._TOOL_CALL_CYCLE_MESSAGE] * 2
+
+
+def test_invoke_runs_calls_that_return_after_other_work(
+    strategy_module: Any,
+) -> None:
+    strategy = strategy_module.GPT5FunctionCallingStrategy()
+
+    def _round(call_id: str, query: str | None) -> Any:
+        tool_calls = []
+        if query is not None:
+            tool_calls.append(
+                strategy_module.AssistantPromptMessage.ToolCall(
+                    id=call_id,
+                    type="function",
+                    function=strategy_module.AssistantPromptMessage.ToolCall.ToolCallFunction(
+                        name="lookup",
+                        arguments=f'{{"q":"{query}"}}',
+                    ),
+                )
+            )
+        return strategy_module.LLMResult(
+            model="gpt-5.2",
+            prompt_messages=[],
+            message=strategy_module.AssistantPromptMessage(
+                content="" if tool_calls else "done",
+                tool_calls=tool_calls,
+            ),
+            usage=None,
+        )
+
+    # read -> write -> read: the second read must see fresh results.
+    llm = _SequenceLLM(
+        [
+            _round("call_1", "read"),
+            _round("call_2", "write"),
+            _round("call_3", "read"),
+            _round("call_4", None),
+        ]
+    )
+    call_count = 0
+
+    def _tool_invoke(**_: Any) -> list[Any]:
+        nonlocal call_count
+        call_count += 1
+        return [
+            types.SimpleNamespace(
+                type=strategy_module.ToolInvokeMessage.MessageType.TEXT,
+                message=strategy_module.ToolInvokeMessage.TextMessage(
+                    text=f"result {call_count}"
+                ),
+            )
+        ]
+
+    strategy.session = types.SimpleNamespace(
+        model=types.SimpleNamespace(llm=llm),
+        tool=types.SimpleNamespace(invoke=_tool_invoke),
+    )
+
+    messages = list(
+        strategy._invoke(
+            {
+                "query": "hello",
+                "instruction": "",
+                "model": _build_model_config(strategy_module, stream=False),
+                "tools": [_build_tool_entity()],
+                "maximum_iterations": 10,
+            }
+        )
+    )
+
+    assert call_count == 3
+    tool_outputs = [
+        m["data"]["output"]["tool_response"]
+        for m in messages
+        if m.get("kind") == "log_finish"
+        and isinstance(m["data"].get("output"), dict)
+    ]
+    assert strategy._TOOL_CALL_CYCLE_MESSAGE not in tool_outputs
+
+
+def test_invoke_downgrades_reasoning_effort_then_stops_on_budget(
+    strategy_module: Any,
+) -> None:
+    strategy = strategy_module.GPT5FunctionCallingStrategy()
+    usage_cls = strategy_module.LLMUsage
+    calls: list[str | None] = []
+
+    class _BudgetLLM:
+        def __init__(self) -> None:
+            self.total_tokens = 0
+
+        def invoke(self, **kwargs: Any) -> Any:
+            calls.append(
+                kwargs["model_config"]
+                .data["completion_params"]
+                .get("reasoning_effort")
+            )
+            self.total_tokens += 400
+            return strategy_module.LLMResult(
+                model="gpt-5.2",
+                prompt_messages=[],
+                message=strategy_module.AssistantPromptMessage(
+                    content="",
+                    tool_calls=[
+                        strategy_module.AssistantPromptMessage.ToolCall(
+                            id=f"call_{len(calls)}",
+                            type="function",
+                            function=strategy_module.AssistantPromptMessage.ToolCall.ToolCallFunction(
+                                name="lookup",
+                                arguments=f'{{"q":"{len(calls)}"}}',
+                            ),
+                        )
+                    ],
+                ),
+                usage=usage_cls(total_tokens=self.total_tokens),
+            )
+
+    text_response = types.SimpleNamespace(
+        type=strategy_module.ToolInvokeMessage.MessageType.TEXT,
+        message=strategy_module.ToolInvokeMessage.TextMessage(text="ok"),
+    )
+    strategy.session = types.SimpleNamespace(
+        model=types.SimpleNamespace(llm=_BudgetLLM()),
+        tool=types.SimpleNamespace(invoke=lambda **_: [text_response]),
+    )
+    model = _build_model_config(strategy_module, stream=False)
+    model.completion_params = {"reasoning_effort": "medium"}
+
+    messages = list(
+        strategy._invoke(
+            {
+                "query": "hello",
+                "instruction": "",
+                "model": model,
+                "tools": [_build_tool_entity()],
+                "maximum_iterations": 10,
+                "max_total_tokens": 1000,
+            }
+        )
+    )
+
+    # 400 tokens per round: round 3 is projected to cross 1000.
+    assert calls == ["medium", "medium", "low"]
+    text = "".join(m["text"] for m in messages if m.get("kind") == "text")
+    assert "budget limit 'max_total_tokens' would be exceeded" in text
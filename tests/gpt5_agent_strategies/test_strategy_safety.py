@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from types import SimpleNamespace
+
 import pytest
 
 from app.gpt5_agent_strategies.internal.tooling import (
     ToolArgumentsParseResult,
+    compile_tool_validator,
     parse_tool_arguments,
     resolve_tool_instance,
 )
@@ -47,3 +50,40 @@ def test_resolve_tool_instance_returns_none_when_missing() -> None:
     tools = {"known": object()}
     assert resolve_tool_instance(tools, "known") is tools["known"]
     assert resolve_tool_instance(tools, "missing") is None
+
+
+def test_compile_tool_validator_builds_lookup_table() -> None:
+    tool = SimpleNamespace(
+        parameters=[
+            SimpleNamespace(
+                name="mode",
+                type="SELECT",
+                required=True,
+                options=[{"value": "fast"}, SimpleNamespace(value="slow")],
+            ),
+            SimpleNamespace(name="", type="string"),
+            SimpleNamespace(name="q", type=None, options=None),
+        ]
+    )
+
+    validator = compile_tool_validator(tool)
+
+    assert list(validator.parameters) == ["mode", "q"]
+    mode = validator.parameters["mode"]
+    assert mode.type == "select"
+    assert mode.required is True
+    assert mode.options == frozenset({"fast", "slow"})
+    assert mode.option_values == ("fast", "slow")
+    assert validator.parameters["q"].options == frozenset()
+    assert validator.matches(tool)
+
+
+def test_compiled_tool_validator_detects_replaced_schema() -> None:
+    tool = SimpleNamespace(parameters=[SimpleNamespace(name="q")])
+    validator = compile_tool_validator(tool)
+
+    tool.parameters.append(SimpleNamespace(name="limit"))
+    assert not validator.matches(tool)
+
+    tool.parameters = [SimpleNamespace(name="q")]
+    assert not validator.matches(tool)
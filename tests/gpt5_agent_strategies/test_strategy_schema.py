@@ -37,6 +37,9 @@ def test_function_calling_strategy_has_required_parameters() -> None:
         "invocation_timeout_seconds",
         "emit_intermediate_thoughts",
         "allow_schemaless_tool_args",
+        "max_run_seconds",
+        "max_total_tokens",
+        "max_total_price",
     }.issubset(names)
 
 
@@ -52,6 +55,9 @@ def test_react_strategy_has_required_parameters() -> None:
         "invocation_timeout_seconds",
         "emit_intermediate_thoughts",
         "allow_schemaless_tool_args",
+        "max_run_seconds",
+        "max_total_tokens",
+        "max_total_price",
     }.issubset(names)
 
 
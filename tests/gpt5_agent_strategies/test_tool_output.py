@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from app.gpt5_agent_strategies.internal.tool_output import ToolResultBuffer
+
+
+def test_tool_result_buffer_keeps_text_within_budget() -> None:
+    buffer = ToolResultBuffer(max_chars=32)
+    buffer.append("hello ")
+    buffer.append("")
+    buffer.append("world")
+
+    assert buffer.render() == "hello world"
+    assert not buffer.truncated
+    assert buffer.remaining == 21
+
+
+def test_tool_result_buffer_counts_dropped_text() -> None:
+    buffer = ToolResultBuffer(max_chars=5)
+    buffer.append("abcdefgh")
+    buffer.append("ij")
+
+    assert buffer.truncated
+    assert buffer.render() == "abcde\n[tool output truncated: 5 more chars]"
+
+
+def test_tool_result_buffer_encodes_small_json_exactly() -> None:
+    payload = {"items": [1, "二", None], "ok": True}
+    buffer = ToolResultBuffer(max_chars=1024)
+    buffer.append_json(payload)
+
+    assert buffer.render() == json.dumps(payload, ensure_ascii=False)
+
+
+def test_tool_result_buffer_stops_encoding_large_json() -> None:
+    encoded_pieces = 0
+
+    class _CountingList(list):
+        def __iter__(self):  # type: ignore[no-untyped-def]
+            nonlocal encoded_pieces
+            for item in super().__iter__():
+                encoded_pieces += 1
+                yield item
+
+    payload = _CountingList(["x" * 10] * 10_000)
+    buffer = ToolResultBuffer(max_chars=100)
+    buffer.append_json(payload)
+    buffer.append_json({"more": True})
+
+    rendered = buffer.render()
+    assert rendered.endswith("[tool output truncated]")
+    assert rendered.startswith('["xxxxxxxxxx", ')
+    assert encoded_pieces < 20
+
+
+def test_tool_result_buffer_propagates_unserializable_json() -> None:
+    buffer = ToolResultBuffer(max_chars=100)
+    with pytest.raises(TypeError):
+        buffer.append_json({"value": object()})
@@ -118,6 +118,149 @@ def test_make_vertex_adc_client_without_service_account(
     ]
 
 
+def test_credential_fingerprint_ignores_unrelated_keys_and_whitespace(
+    nanobana_imports: None,
+) -> None:
+    auth = importlib.import_module("internal.auth")
+
+    base = auth.credential_fingerprint({"api_key": "developer-key"})
+
+    assert base == auth.credential_fingerprint(
+        {"api_key": " developer-key ", "unrelated": "value"}
+    )
+    assert base != auth.credential_fingerprint({"api_key": "rotated-key"})
+    assert "developer-key" not in base
+
+
+class _ClosableClient:
+    def __init__(self, config: Any) -> None:
+        self.config = config
+        self.close_calls = 0
+
+    def close(self) -> None:
+        self.close_calls += 1
+
+
+def test_client_cache_decodes_service_account_key_once(
+    nanobana_imports: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    auth = importlib.import_module("internal.auth")
+    decode_calls: list[str] = []
+    original_decode = auth.decode_service_account_key
+
+    def counting_decode(key_b64: str) -> dict[str, Any]:
+        decode_calls.append(key_b64)
+        return original_decode(key_b64)
+
+    monkeypatch.setattr(auth, "decode_service_account_key", counting_decode)
+    cache = auth.GenaiClientCache()
+    credentials = {
+        "vertex_project_id": "project-a",
+        "vertex_service_account_key": _service_account_key(),
+    }
+
+    first = cache.get(credentials, _ClosableClient)
+    second = cache.get(dict(credentials), _ClosableClient)
+
+    assert first is second
+    assert len(decode_calls) == 1
+    assert first.config.service_account_info["client_email"] == (
+        "svc@example.iam.gserviceaccount.com"
+    )
+
+
+def test_client_cache_drops_least_recently_used_client_without_closing(
+    nanobana_imports: None,
+) -> None:
+    auth = importlib.import_module("internal.auth")
+    cache = auth.GenaiClientCache(max_entries=2)
+
+    key_a = cache.get({"api_key": "key-a"}, _ClosableClient)
+    key_b = cache.get({"api_key": "key-b"}, _ClosableClient)
+    assert cache.get({"api_key": "key-a"}, _ClosableClient) is key_a
+    cache.get({"api_key": "key-c"}, _ClosableClient)
+
+    assert len(cache) == 2
+    assert cache.get({"api_key": "key-a"}, _ClosableClient) is key_a
+    assert cache.get({"api_key": "key-b"}, _ClosableClient) is not key_b
+    # Invocations that still hold the dropped client can keep using it.
+    assert key_b.close_calls == 0
+
+
+def test_client_cache_evict_and_clear_drop_clients_without_closing(
+    nanobana_imports: None,
+) -> None:
+    auth = importlib.import_module("internal.auth")
+    cache = auth.GenaiClientCache()
+    key_a = cache.get({"api_key": "key-a"}, _ClosableClient)
+    key_b = cache.get({"api_key": "key-b"}, _ClosableClient)
+
+    cache.evict({"api_key": "key-a"})
+    cache.evict({"api_key": "missing"})
+    assert cache.get({"api_key": "key-a"}, _ClosableClient) is not key_a
+
+    cache.clear()
+    assert len(cache) == 0
+    assert key_a.close_calls == 0
+    assert key_b.close_calls == 0
+
+
+def test_client_cache_builds_clients_outside_the_lock(
+    nanobana_imports: None,
+) -> None:
+    auth = importlib.import_module("internal.auth")
+    cache = auth.GenaiClientCache()
+    lock_held: list[bool] = []
+
+    def factory(config: Any) -> _ClosableClient:
+        lock_held.append(cache._lock.locked())
+        return _ClosableClient(config)
+
+    cache.get({"api_key": "key-a"}, factory)
+
+    assert lock_held == [False]
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (ConnectionResetError("reset"), True),
+        (TimeoutError("timed out"), True),
+        (type("RefreshError", (Exception,), {})("expired"), True),
+        (
+            type(
+                "ConnectTimeout",
+                (type("TransportError", (Exception,), {}),),
+                {},
+            )(),
+            True,
+        ),
+        (type("ClientError", (Exception,), {"code": 401})(), True),
+        (type("ClientError", (Exception,), {"code": 400})(), False),
+        (type("ClientError", (Exception,), {"code": 429})(), False),
+        (ValueError("At most 14 input images are supported."), False),
+        (RuntimeError("blocked by safety filters"), False),
+    ],
+)
+def test_is_client_failure_only_matches_auth_and_transport_errors(
+    nanobana_imports: None, error: Exception, expected: bool
+) -> None:
+    auth = importlib.import_module("internal.auth")
+
+    assert auth.is_client_failure(error) is expected
+
+
+def test_client_cache_does_not_store_invalid_credentials(
+    nanobana_imports: None,
+) -> None:
+    auth = importlib.import_module("internal.auth")
+    cache = auth.GenaiClientCache()
+
+    with pytest.raises(ValueError, match="Configure either"):
+        cache.get({}, _ClosableClient)
+    assert len(cache) == 0
+
+
 def test_provider_validation_requires_one_auth_mode(
     nanobana_imports: None,
 ) -> None:
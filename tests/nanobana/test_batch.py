@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import importlib
+import threading
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+
+class RateLimitedError(Exception):
+    code = 429
+
+
+def _jobs(batch: Any, count: int) -> list[Any]:
+    return [
+        batch.BatchJob(
+            index=index, prompt=f"prompt {index}", aspect_ratio="1:1"
+        )
+        for index in range(count)
+    ]
+
+
+def test_run_batch_yields_results_in_completion_order(
+    nanobana_imports: None,
+) -> None:
+    batch = importlib.import_module("internal.batch")
+    release_first = threading.Event()
+
+    def generate(job: Any) -> str:
+        if job.index == 0:
+            assert release_first.wait(timeout=5)
+        return f"image {job.index}"
+
+    results = batch.run_batch(_jobs(batch, 2), generate, max_workers=2)
+    first = next(results)
+    release_first.set()
+    second = next(results)
+
+    assert (first.job.index, first.response) == (1, "image 1")
+    assert (second.job.index, second.response) == (0, "image 0")
+
+
+def test_run_batch_bounds_concurrency(nanobana_imports: None) -> None:
+    batch = importlib.import_module("internal.batch")
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def generate(job: Any) -> int:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        threading.Event().wait(0.01)
+        with lock:
+            active -= 1
+        return job.index
+
+    results = list(batch.run_batch(_jobs(batch, 6), generate, max_workers=2))
+
+    assert sorted(result.response for result in results) == list(range(6))
+    assert peak <= 2
+
+
+def test_run_batch_retries_rate_limited_jobs_behind_shared_gate(
+    nanobana_imports: None,
+) -> None:
+    batch = importlib.import_module("internal.batch")
+    sleeps: list[float] = []
+    gate = batch.RateLimitGate(clock=lambda: 0.0, sleep=sleeps.append)
+    attempts: list[int] = []
+
+    def generate(job: Any) -> str:
+        attempts.append(job.index)
+        if len(attempts) == 1:
+            raise RateLimitedError("quota")
+        return "ok"
+
+    results = list(
+        batch.run_batch(
+            _jobs(batch, 1),
+            generate,
+            backoff_seconds=1.5,
+            gate=gate,
+        )
+    )
+
+    assert results[0].response == "ok"
+    assert attempts == [0, 0]
+    assert sleeps == [1.5]
+
+
+def test_run_batch_reports_errors_without_retrying_other_failures(
+    nanobana_imports: None,
+) -> None:
+    batch = importlib.import_module("internal.batch")
+    calls: list[int] = []
+
+    def generate(job: Any) -> str:
+        calls.append(job.index)
+        raise RuntimeError("bad request")
+
+    results = list(batch.run_batch(_jobs(batch, 1), generate))
+
+    assert calls == [0]
+    assert isinstance(results[0].error, RuntimeError)
+
+
+def test_run_batch_gives_up_after_rate_limit_retries(
+    nanobana_imports: None,
+) -> None:
+    batch = importlib.import_module("internal.batch")
+    gate = batch.RateLimitGate(clock=lambda: 0.0, sleep=lambda _s: None)
+
+    def generate(job: Any) -> str:
+        raise RateLimitedError("quota")
+
+    results = list(
+        batch.run_batch(_jobs(batch, 1), generate, retries=2, gate=gate)
+    )
+
+    assert isinstance(results[0].error, RateLimitedError)
+
+
+def test_run_batch_without_jobs_yields_nothing(nanobana_imports: None) -> None:
+    batch = importlib.import_module("internal.batch")
+
+    assert list(batch.run_batch([], lambda job: job)) == []
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (SimpleNamespace(code=429), True),
+        (SimpleNamespace(status_code=429), True),
+        (SimpleNamespace(status="RESOURCE_EXHAUSTED"), True),
+        (SimpleNamespace(code=400, status="INVALID_ARGUMENT"), False),
+        (RuntimeError("429"), False),
+    ],
+)
+def test_is_rate_limited_error(
+    nanobana_imports: None, error: Any, expected: bool
+) -> None:
+    batch = importlib.import_module("internal.batch")
+
+    assert batch.is_rate_limited_error(error) is expected
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import hashlib
+import importlib
+import io
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from PIL import Image
+
+
+def _encode(
+    size: tuple[int, int],
+    image_format: str,
+    *,
+    mode: str = "RGB",
+    exif: Image.Exif | None = None,
+) -> bytes:
+    image = Image.new(mode, size, color=0)
+    buffer = io.BytesIO()
+    options: dict[str, Any] = {}
+    if exif is not None:
+        options["exif"] = exif
+    image.save(buffer, format=image_format, **options)
+    return buffer.getvalue()
+
+
+def _exif(orientation: int | None = None) -> Image.Exif:
+    exif = Image.Exif()
+    exif[0x010F] = "PhoneMaker"
+    if orientation is not None:
+        exif[0x0112] = orientation
+    return exif
+
+
+def _open(blob: bytes) -> Image.Image:
+    image = Image.open(io.BytesIO(blob))
+    image.load()
+    return image
+
+
+def test_target_edge_follows_output_resolution(nanobana_imports: None) -> None:
+    images = importlib.import_module("internal.images")
+
+    assert images.target_edge("1K") == 1024
+    assert images.target_edge("2K") == 2048
+    assert images.target_edge("4K") == 4096
+    assert images.target_edge("unknown") == 1024
+
+
+def test_prepare_image_downscales_and_strips_metadata(
+    nanobana_imports: None,
+) -> None:
+    images = importlib.import_module("internal.images")
+    # Orientation 6 rotates the stored 300x200 pixels to 200x300.
+    blob = _encode((300, 200), "JPEG", exif=_exif(orientation=6))
+
+    prepared = images.prepare_image(blob, "image/jpeg", "digest", 150)
+
+    result = _open(prepared.blob)
+    assert prepared.mime_type == "image/jpeg"
+    assert prepared.digest == "digest"
+    assert result.size == (100, 150)
+    assert not result.getexif()
+
+
+def test_prepare_image_strips_metadata_without_resizing(
+    nanobana_imports: None,
+) -> None:
+    images = importlib.import_module("internal.images")
+    blob = _encode((64, 32), "JPEG", exif=_exif())
+
+    prepared = images.prepare_image(blob, "image/jpeg", "digest", 1024)
+
+    result = _open(prepared.blob)
+    assert result.size == (64, 32)
+    assert not result.getexif()
+
+
+def test_prepare_image_passes_small_clean_images_through(
+    nanobana_imports: None,
+) -> None:
+    images = importlib.import_module("internal.images")
+    blob = _encode((64, 64), "PNG")
+
+    prepared = images.prepare_image(blob, "image/png", "digest", 1024)
+
+    assert prepared.blob is blob
+    assert prepared.mime_type == "image/png"
+
+
+def test_prepare_image_converts_unsupported_formats(
+    nanobana_imports: None,
+) -> None:
+    images = importlib.import_module("internal.images")
+    transparent = _encode((400, 100), "GIF", mode="RGBA")
+    opaque = _encode((400, 100), "BMP")
+
+    gif = images.prepare_image(transparent, "image/gif", "a", 200)
+    bmp = images.prepare_image(opaque, "image/bmp", "b", 200)
+
+    assert gif.mime_type == "image/png"
+    assert _open(gif.blob).size == (200, 50)
+    assert bmp.mime_type == "image/jpeg"
+    assert _open(bmp.blob).format == "JPEG"
+
+
+def test_prepare_image_keeps_undecodable_bytes(nanobana_imports: None) -> None:
+    images = importlib.import_module("internal.images")
+
+    prepared = images.prepare_image(b"not an image", "image/heic", "d", 1024)
+
+    assert prepared.blob == b"not an image"
+    assert prepared.mime_type == "image/heic"
+
+
+def test_preprocess_images_deduplicates_by_content_and_keeps_order(
+    nanobana_imports: None,
+) -> None:
+    images = importlib.import_module("internal.images")
+    large = _encode((2000, 1000), "PNG")
+    small = _encode((10, 10), "PNG")
+    inputs = [
+        SimpleNamespace(blob=large, mime_type="image/png"),
+        {"blob": small, "mimeType": "image/png"},
+        SimpleNamespace(blob=large, mime_type="image/png"),
+    ]
+
+    prepared = images.preprocess_images(inputs, "1K", max_workers=2)
+
+    assert [item.digest for item in prepared] == [
+        hashlib.sha256(large).hexdigest(),
+        hashlib.sha256(small).hexdigest(),
+    ]
+    assert _open(prepared[0].blob).size == (1024, 512)
+    assert prepared[1].blob is small
+
+
+def test_preprocess_images_rejects_missing_blob_or_mime_type(
+    nanobana_imports: None,
+) -> None:
+    images = importlib.import_module("internal.images")
+
+    with pytest.raises(ValueError, match="blob bytes and mime_type"):
+        images.preprocess_images([{"blob": b"x"}], "1K")
+
+
+class _Files:
+    def __init__(self, error: Exception | None = None) -> None:
+        self.error = error
+        self.uploads: list[dict[str, Any]] = []
+
+    def upload(self, **kwargs: Any) -> SimpleNamespace:
+        self.uploads.append(kwargs)
+        if self.error is not None:
+            raise self.error
+        return SimpleNamespace(uri=f"files/{len(self.uploads)}")
+
+
+def _prepared(images: Any, blob: bytes) -> Any:
+    return images.PreparedImage(
+        blob=blob,
+        mime_type="image/png",
+        digest=hashlib.sha256(blob).hexdigest(),
+    )
+
+
+def test_uploaded_file_cache_reuses_uploads_until_expiry(
+    nanobana_imports: None,
+) -> None:
+    images = importlib.import_module("internal.images")
+    now = [1_000.0]
+    cache = images.UploadedFileCache(
+        min_bytes=4, ttl_seconds=60, clock=lambda: now[0]
+    )
+    client = SimpleNamespace(files=_Files(), vertexai=False)
+    large = _prepared(images, b"large-image")
+    small = _prepared(images, b"abc")
+
+    first = cache.attach(client, "tenant", [large, small])
+    second = cache.attach(client, "tenant", [large])
+    other_tenant = cache.attach(client, "other", [large])
+    now[0] += 61
+    expired = cache.attach(client, "tenant", [large])
+
+    assert [item.file_uri for item in first] == ["files/1", ""]
+    assert first[1] is small
+    assert second[0].file_uri == "files/1"
+    assert other_tenant[0].file_uri == "files/2"
+    assert expired[0].file_uri == "files/3"
+    assert client.files.uploads[0]["config"] == {"mime_type": "image/png"}
+    assert client.files.uploads[0]["file"].read() == b"large-image"
+
+
+def test_uploaded_file_cache_keys_on_the_prepared_resolution(
+    nanobana_imports: None,
+) -> None:
+    images = importlib.import_module("internal.images")
+    cache = images.UploadedFileCache(min_bytes=1)
+    client = SimpleNamespace(files=_Files(), vertexai=False)
+    source = [{"blob": _encode((3000, 1500), "PNG"), "mime_type": "image/png"}]
+
+    low = cache.attach(
+        client, "tenant", images.preprocess_images(source, "1K")
+    )
+    high = cache.attach(
+        client, "tenant", images.preprocess_images(source, "2K")
+    )
+    again = cache.attach(
+        client, "tenant", images.preprocess_images(source, "2K")
+    )
+
+    assert low[0].digest == high[0].digest
+    assert [low[0].file_uri, high[0].file_uri] == ["files/1", "files/2"]
+    assert again[0].file_uri == "files/2"
+    uploaded = client.files.uploads[1]["file"].read()
+    assert _open(uploaded).size == (2048, 1024)
+
+
+def test_uploaded_file_cache_keeps_inline_data_when_upload_is_unavailable(
+    nanobana_imports: None,
+) -> None:
+    images = importlib.import_module("internal.images")
+    cache = images.UploadedFileCache(min_bytes=1)
+    prepared = [_prepared(images, b"image")]
+    vertex_client = SimpleNamespace(files=_Files(), vertexai=True)
+    failing_client = SimpleNamespace(files=_Files(RuntimeError("quota")))
+    no_uri_client = SimpleNamespace(
+        files=SimpleNamespace(upload=lambda **_kwargs: SimpleNamespace())
+    )
+
+    assert cache.attach(vertex_client, "tenant", prepared) is prepared
+    assert cache.attach(failing_client, "tenant", prepared) is prepared
+    assert cache.attach(no_uri_client, "tenant", prepared) is prepared
+    assert vertex_client.files.uploads == []
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import importlib
+import os
+from pathlib import Path
+
+import pytest
+
+
+def _key(result_cache, **overrides) -> str:
+    params = {
+        "namespace": "credential-fingerprint",
+        "model": "gemini-3-pro-image",
+        "prompt": "draw a banana",
+        "aspect_ratio": "1:1",
+        "image_size": "1K",
+        "image_digests": [],
+    }
+    params.update(overrides)
+    return result_cache.make_cache_key(**params)
+
+
+def test_cache_key_depends_on_every_normalized_input(
+    nanobana_imports: None,
+) -> None:
+    result_cache = importlib.import_module("internal.result_cache")
+    base = _key(result_cache)
+    digest = result_cache.image_digest(b"input", "image/png")
+
+    assert base == _key(result_cache)
+    assert digest.startswith("image/png:")
+    variations = [
+        _key(result_cache, namespace="other-credentials"),
+        _key(result_cache, model="gemini-3.1-flash-image"),
+        _key(result_cache, prompt="draw an apple"),
+        _key(result_cache, aspect_ratio="16:9"),
+        _key(result_cache, image_size="4K"),
+        _key(result_cache, image_digests=[digest]),
+        _key(result_cache, sample=1),
+    ]
+    assert base not in variations
+    assert len(set(variations)) == len(variations)
+
+
+def test_cache_round_trips_texts_and_images_with_mime_types(
+    nanobana_imports: None, tmp_path: Path
+) -> None:
+    result_cache = importlib.import_module("internal.result_cache")
+    cache = result_cache.ResultCache(tmp_path / "cache", 1024 * 1024)
+    key = _key(result_cache)
+
+    assert cache.get(key) is None
+    cache.put(key, ["caption"], [("image/webp", b"webp-bytes")])
+
+    assert cache.get(key) == (["caption"], [("image/webp", b"webp-bytes")])
+    assert [path.name for path in (tmp_path / "cache").iterdir()] == [key]
+
+
+def test_cache_skips_results_without_images(
+    nanobana_imports: None, tmp_path: Path
+) -> None:
+    result_cache = importlib.import_module("internal.result_cache")
+    cache = result_cache.ResultCache(tmp_path, 1024)
+
+    cache.put(_key(result_cache), ["text only"], [])
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cache_evicts_least_recently_used_entries(
+    nanobana_imports: None, tmp_path: Path
+) -> None:
+    result_cache = importlib.import_module("internal.result_cache")
+    # Each entry holds a 100 byte blob plus a small meta.json.
+    cache = result_cache.ResultCache(tmp_path, 450)
+    keys = [_key(result_cache, sample=index) for index in range(3)]
+    for offset, key in enumerate(keys[:2]):
+        cache.put(key, [], [("image/png", b"x" * 100)])
+        meta = tmp_path / key / "meta.json"
+        os.utime(meta, (1_000 + offset, 1_000 + offset))
+
+    # Reading the older entry makes the other one least recently used.
+    assert cache.get(keys[0]) is not None
+    cache.put(keys[2], [], [("image/png", b"x" * 100)])
+
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is not None
+
+
+def test_cache_treats_corrupt_entries_as_misses(
+    nanobana_imports: None, tmp_path: Path
+) -> None:
+    result_cache = importlib.import_module("internal.result_cache")
+    cache = result_cache.ResultCache(tmp_path, 1024)
+    key = _key(result_cache)
+    (tmp_path / key).mkdir()
+    (tmp_path / key / "meta.json").write_text("{not json")
+
+    assert cache.get(key) is None
+
+
+@pytest.mark.parametrize(
+    ("max_mb", "expected_bytes"),
+    [("", 1024 * 1024 * 1024), ("8", 8 * 1024 * 1024), ("0", 1024 * 1024)],
+)
+def test_resolve_result_cache_reads_environment(
+    nanobana_imports: None,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    max_mb: str,
+    expected_bytes: int,
+) -> None:
+    result_cache = importlib.import_module("internal.result_cache")
+    monkeypatch.delenv("NANOBANA_RESULT_CACHE_DIR", raising=False)
+    assert result_cache.resolve_result_cache() is None
+
+    monkeypatch.setenv("NANOBANA_RESULT_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("NANOBANA_RESULT_CACHE_MAX_MB", max_mb)
+    cache = result_cache.resolve_result_cache()
+
+    assert cache is not None
+    assert cache.directory == tmp_path
+    assert cache.max_bytes == expected_bytes
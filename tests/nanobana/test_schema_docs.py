@@ -37,6 +37,15 @@ def test_tool_schema_exposes_images_and_resolution() -> None:
     assert "name: image_size" not in schema
 
 
+def test_tool_schema_exposes_batch_parameters() -> None:
+    schema = (PLUGIN_DIR / "tools" / "nanobana.yaml").read_text()
+
+    assert "name: count" in schema
+    assert "max: 8" in schema
+    assert "name: variants" in schema
+    assert "name: stream" in schema
+
+
 def test_provider_schema_supports_developer_and_vertex_modes() -> None:
     schema = (PLUGIN_DIR / "provider" / "nanobana.yaml").read_text()
 
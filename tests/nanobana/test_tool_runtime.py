@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import base64
 import importlib
+import io
+import json
 import sys
+import threading
 import types
+from pathlib import Path
 from types import SimpleNamespace
 from typing import Any
 
@@ -27,6 +32,10 @@ def _install_google_type_stubs(monkeypatch: pytest.MonkeyPatch) -> None:
         def from_bytes(data: bytes, mime_type: str) -> SimpleNamespace:
             return SimpleNamespace(data=data, mime_type=mime_type)
 
+        @staticmethod
+        def from_uri(file_uri: str, mime_type: str) -> SimpleNamespace:
+            return SimpleNamespace(file_uri=file_uri, mime_type=mime_type)
+
     types_mod.ImageConfig = ImageConfig
     types_mod.GenerateContentConfig = GenerateContentConfig
     types_mod.Part = Part
@@ -204,50 +213,593 @@ def test_invoke_skips_thought_parts_before_emitting_outputs(
     assert messages == [{"type": "text", "text": "final caption"}]
 
 
-def test_invoke_closes_client_after_successful_generate_content(
+def test_invoke_reuses_client_across_successful_invocations(
     nanobana_imports: None, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     _install_google_type_stubs(monkeypatch)
     module = importlib.import_module("tools.nanobana")
     response = SimpleNamespace(candidates=[])
-    fake_client = FakeClient(response)
+    created: list[FakeClient] = []
+
+    def make_client(_config: Any) -> FakeClient:
+        created.append(FakeClient(response))
+        return created[-1]
+
+    monkeypatch.setattr(module, "make_genai_client", make_client)
+
+    for _ in range(2):
+        list(
+            _tool(module, {"api_key": "developer-key"})._invoke(
+                {"prompt": "draw a small banana"}
+            )
+        )
+
+    assert len(created) == 1
+    assert created[0].closed is False
+    assert len(created[0].models.calls) == 2
+
+
+def test_invoke_creates_new_client_when_credentials_change(
+    nanobana_imports: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _install_google_type_stubs(monkeypatch)
+    module = importlib.import_module("tools.nanobana")
+    response = SimpleNamespace(candidates=[])
+    created: list[tuple[str, FakeClient]] = []
+
+    def make_client(config: Any) -> FakeClient:
+        created.append((config.api_key, FakeClient(response)))
+        return created[-1][1]
+
+    monkeypatch.setattr(module, "make_genai_client", make_client)
+
+    for api_key in ("developer-key", "rotated-key"):
+        list(
+            _tool(module, {"api_key": api_key})._invoke(
+                {"prompt": "draw a small banana"}
+            )
+        )
+
+    assert [api_key for api_key, _client in created] == [
+        "developer-key",
+        "rotated-key",
+    ]
+
+
+def test_invoke_keeps_client_after_request_error(
+    nanobana_imports: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _install_google_type_stubs(monkeypatch)
+    module = importlib.import_module("tools.nanobana")
+    created: list[FakeClient] = []
+
+    def make_client(_config: Any) -> FakeClient:
+        created.append(
+            FakeClient(
+                SimpleNamespace(candidates=[]),
+                generate_error=RuntimeError("blocked by safety filters"),
+            )
+        )
+        return created[-1]
+
+    monkeypatch.setattr(module, "make_genai_client", make_client)
+
+    for _ in range(2):
+        messages = list(
+            _tool(module, {"api_key": "developer-key"})._invoke(
+                {"prompt": "draw a small banana"}
+            )
+        )
+
+    assert len(created) == 1
+    assert created[0].close_calls == 0
+    assert messages[0]["type"] == "text"
+    assert "Gemini image generation failed" in messages[0]["text"]
+
+
+def test_invoke_drops_client_after_connection_error_without_closing(
+    nanobana_imports: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _install_google_type_stubs(monkeypatch)
+    module = importlib.import_module("tools.nanobana")
+    created: list[FakeClient] = []
+
+    def make_client(_config: Any) -> FakeClient:
+        created.append(
+            FakeClient(
+                SimpleNamespace(candidates=[]),
+                generate_error=ConnectionResetError("connection reset"),
+            )
+        )
+        return created[-1]
+
+    monkeypatch.setattr(module, "make_genai_client", make_client)
+
+    for _ in range(2):
+        list(
+            _tool(module, {"api_key": "developer-key"})._invoke(
+                {"prompt": "draw a small banana"}
+            )
+        )
+
+    assert len(created) == 2
+    assert [client.close_calls for client in created] == [0, 0]
+
+
+def _image_response(data: bytes, text: str = "") -> dict[str, Any]:
+    parts: list[dict[str, Any]] = []
+    if text:
+        parts.append({"text": text})
+    parts.append({"inlineData": {"data": data, "mimeType": "image/png"}})
+    return {"candidates": [{"content": {"parts": parts}}]}
+
+
+class BatchModels:
+    def __init__(self, fail_prompts: tuple[str, ...] = ()) -> None:
+        self.fail_prompts = fail_prompts
+        self.calls: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def generate_content(self, **kwargs: Any) -> Any:
+        with self._lock:
+            self.calls.append(kwargs)
+            index = len(self.calls)
+        prompt = kwargs["contents"][0]
+        if prompt in self.fail_prompts:
+            raise RuntimeError(f"failed for {prompt}")
+        return _image_response(f"{prompt}-{index}".encode())
+
+
+def test_invoke_batch_count_streams_one_blob_per_image(
+    nanobana_imports: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _install_google_type_stubs(monkeypatch)
+    module = importlib.import_module("tools.nanobana")
+    fake_client = FakeClient(None)
+    fake_client.models = BatchModels()
+    monkeypatch.setattr(
+        module, "make_genai_client", lambda _config: fake_client
+    )
+    input_image = SimpleNamespace(blob=b"input-png", mime_type="image/png")
+
+    messages = list(
+        _tool(module, {"api_key": "developer-key"})._invoke(
+            {
+                "prompt": "draw a banana",
+                "images": input_image,
+                "count": 3,
+                "aspect_ratio": "16:9",
+            }
+        )
+    )
+
+    blobs = [message for message in messages if message["type"] == "blob"]
+    assert len(blobs) == 3
+    assert sorted(blob["meta"]["variant_index"] for blob in blobs) == [
+        0,
+        1,
+        2,
+    ]
+    calls = fake_client.models.calls
+    assert len(calls) == 3
+    for call in calls:
+        assert call["contents"][0] == "draw a banana"
+        assert call["contents"][1].data == b"input-png"
+        assert call["config"].image_config.aspect_ratio == "16:9"
+    assert fake_client.closed is False
+
+
+def test_invoke_batch_variants_override_prompt_and_aspect_ratio(
+    nanobana_imports: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _install_google_type_stubs(monkeypatch)
+    module = importlib.import_module("tools.nanobana")
+    fake_client = FakeClient(None)
+    fake_client.models = BatchModels()
     monkeypatch.setattr(
         module, "make_genai_client", lambda _config: fake_client
     )
 
     list(
         _tool(module, {"api_key": "developer-key"})._invoke(
-            {"prompt": "draw a small banana"}
+            {
+                "prompt": "base prompt",
+                "aspect_ratio": "4:3",
+                "variants": json.dumps(
+                    [
+                        "red banana",
+                        {"aspect_ratio": "9:16"},
+                        {"prompt": "blue banana", "aspect_ratio": "bogus"},
+                    ]
+                ),
+            }
         )
     )
 
-    assert fake_client.closed is True
-    assert fake_client.close_calls == 1
+    requested = sorted(
+        (call["contents"][0], call["config"].image_config.aspect_ratio)
+        for call in fake_client.models.calls
+    )
+    assert requested == [
+        ("base prompt", "9:16"),
+        ("blue banana", "1:1"),
+        ("red banana", "4:3"),
+    ]
 
 
-def test_invoke_closes_client_after_generate_content_raises(
+def test_invoke_batch_reports_failed_variant_and_keeps_client(
     nanobana_imports: None, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     _install_google_type_stubs(monkeypatch)
     module = importlib.import_module("tools.nanobana")
-    fake_client = FakeClient(
-        SimpleNamespace(candidates=[]),
-        generate_error=RuntimeError("generation failed"),
+    fake_client = FakeClient(None)
+    fake_client.models = BatchModels(fail_prompts=("broken",))
+    monkeypatch.setattr(
+        module, "make_genai_client", lambda _config: fake_client
+    )
+
+    messages = list(
+        _tool(module, {"api_key": "SECRET-KEY"})._invoke(
+            {"prompt": "base", "variants": ["fine", "broken"]}
+        )
     )
+
+    texts = [m["text"] for m in messages if m["type"] == "text"]
+    blobs = [m for m in messages if m["type"] == "blob"]
+    assert texts == [
+        "Variant 2: Gemini image generation failed: failed for broken"
+    ]
+    assert [blob["meta"]["variant_index"] for blob in blobs] == [0]
+    assert fake_client.close_calls == 0
+    assert len(module._CLIENT_CACHE) == 1
+
+
+@pytest.mark.parametrize(
+    ("parameters", "expected"),
+    [
+        ({"variants": "not json"}, "Variants must be a JSON array."),
+        ({"variants": {"prompt": "x"}}, "Variants must be a JSON array."),
+        ({"variants": [1]}, "Each variant must be a prompt string"),
+        (
+            {"variants": ["a", "b", "c"], "count": 3},
+            "At most 8 images can be generated per call.",
+        ),
+    ],
+)
+def test_invoke_batch_rejects_invalid_requests_without_api_call(
+    nanobana_imports: None,
+    monkeypatch: pytest.MonkeyPatch,
+    parameters: dict[str, Any],
+    expected: str,
+) -> None:
+    _install_google_type_stubs(monkeypatch)
+    module = importlib.import_module("tools.nanobana")
+    fake_client = FakeClient(None)
     monkeypatch.setattr(
         module, "make_genai_client", lambda _config: fake_client
     )
 
     messages = list(
         _tool(module, {"api_key": "developer-key"})._invoke(
-            {"prompt": "draw a small banana"}
+            {"prompt": "base", **parameters}
         )
     )
 
-    assert fake_client.closed is True
-    assert fake_client.close_calls == 1
-    assert messages[0]["type"] == "text"
-    assert "Gemini image generation failed" in messages[0]["text"]
+    assert fake_client.models.calls == []
+    assert messages[0]["text"].startswith("Invalid nanobana batch request")
+    assert expected in messages[0]["text"]
+
+
+def test_invoke_batch_reports_credential_errors(
+    nanobana_imports: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _install_google_type_stubs(monkeypatch)
+    module = importlib.import_module("tools.nanobana")
+
+    messages = list(_tool(module, {})._invoke({"prompt": "base", "count": 2}))
+
+    assert messages == [
+        {
+            "type": "text",
+            "text": "Gemini image generation failed: "
+            "Configure either Vertex AI Project ID or Gemini API key.",
+        }
+    ]
+
+
+def test_invoke_serves_repeated_request_from_result_cache(
+    nanobana_imports: None,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    _install_google_type_stubs(monkeypatch)
+    monkeypatch.setenv("NANOBANA_RESULT_CACHE_DIR", str(tmp_path))
+    module = importlib.import_module("tools.nanobana")
+    fake_client = FakeClient(_image_response(b"webp-image", "caption"))
+    fake_client.models.response["candidates"][0]["content"]["parts"][1][
+        "inlineData"
+    ]["mimeType"] = "image/webp"
+    monkeypatch.setattr(
+        module, "make_genai_client", lambda _config: fake_client
+    )
+    parameters = {
+        "prompt": "draw a banana",
+        "images": SimpleNamespace(blob=b"input", mime_type="image/png"),
+    }
+
+    first = list(
+        _tool(module, {"api_key": "developer-key"})._invoke(parameters)
+    )
+    second = list(
+        _tool(module, {"api_key": "developer-key"})._invoke(parameters)
+    )
+    changed = list(
+        _tool(module, {"api_key": "developer-key"})._invoke(
+            {**parameters, "resolution": "2K"}
+        )
+    )
+
+    assert len(fake_client.models.calls) == 2
+    assert second[0] == {"type": "text", "text": "caption"}
+    assert second[1]["blob"] == b"webp-image"
+    assert second[1]["meta"]["mime_type"] == "image/webp"
+    assert second[1]["meta"]["filename"].endswith(".webp")
+    assert [m["type"] for m in first] == [m["type"] for m in changed]
+
+
+def test_invoke_result_cache_is_private_to_credentials_and_skips_client(
+    nanobana_imports: None,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    _install_google_type_stubs(monkeypatch)
+    monkeypatch.setenv("NANOBANA_RESULT_CACHE_DIR", str(tmp_path))
+    module = importlib.import_module("tools.nanobana")
+    fake_client = FakeClient(_image_response(b"image", "caption"))
+    built: list[str] = []
+
+    def make_client(config: Any) -> FakeClient:
+        built.append(config.api_key)
+        return fake_client
+
+    monkeypatch.setattr(module, "make_genai_client", make_client)
+    parameters = {"prompt": "draw a banana"}
+
+    list(_tool(module, {"api_key": "tenant-a"})._invoke(parameters))
+    module._CLIENT_CACHE.clear()
+    hit = list(_tool(module, {"api_key": "tenant-a"})._invoke(parameters))
+    list(_tool(module, {"api_key": "tenant-b"})._invoke(parameters))
+
+    assert hit[1]["blob"] == b"image"
+    # The cache hit neither rebuilt a client nor called Gemini; tenant-b
+    # did not see tenant-a's result.
+    assert built == ["tenant-a", "tenant-b"]
+    assert len(fake_client.models.calls) == 2
+
+
+def test_invoke_batch_caches_each_sample_separately(
+    nanobana_imports: None,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    _install_google_type_stubs(monkeypatch)
+    monkeypatch.setenv("NANOBANA_RESULT_CACHE_DIR", str(tmp_path))
+    module = importlib.import_module("tools.nanobana")
+    fake_client = FakeClient(None)
+    fake_client.models = BatchModels()
+    monkeypatch.setattr(
+        module, "make_genai_client", lambda _config: fake_client
+    )
+    parameters = {"prompt": "draw a banana", "count": 2}
+
+    first = list(
+        _tool(module, {"api_key": "developer-key"})._invoke(parameters)
+    )
+    second = list(
+        _tool(module, {"api_key": "developer-key"})._invoke(parameters)
+    )
+
+    assert len(fake_client.models.calls) == 2
+    assert len(list(tmp_path.iterdir())) == 2
+
+    def blobs_by_variant(messages: list[dict[str, Any]]) -> dict[int, bytes]:
+        return {
+            m["meta"]["variant_index"]: m["blob"]
+            for m in messages
+            if m["type"] == "blob"
+        }
+
+    assert blobs_by_variant(second) == blobs_by_variant(first)
+    assert len(set(blobs_by_variant(first).values())) == 2
+
+
+class StreamingModels:
+    def __init__(
+        self, chunks: list[Any], error: Exception | None = None
+    ) -> None:
+        self.chunks = chunks
+        self.error = error
+        self.stream_calls: list[dict[str, Any]] = []
+        self.consumed = 0
+
+    def generate_content(self, **kwargs: Any) -> Any:
+        raise AssertionError("stream mode must not call generate_content")
+
+    def generate_content_stream(self, **kwargs: Any) -> Any:
+        self.stream_calls.append(kwargs)
+        for chunk in self.chunks:
+            self.consumed += 1
+            yield chunk
+        if self.error is not None:
+            raise self.error
+
+
+def _chunk(*parts: dict[str, Any]) -> dict[str, Any]:
+    return {"candidates": [{"content": {"parts": list(parts)}}]}
+
+
+def test_invoke_stream_emits_progress_text_and_image_as_they_arrive(
+    nanobana_imports: None,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    _install_google_type_stubs(monkeypatch)
+    monkeypatch.setenv("NANOBANA_RESULT_CACHE_DIR", str(tmp_path))
+    module = importlib.import_module("tools.nanobana")
+    encoded = base64.b64encode(b"streamed-image").decode()
+    fake_client = FakeClient(None)
+    fake_client.models = StreamingModels(
+        [
+            _chunk({"text": "thinking", "thought": True}),
+            _chunk({"text": "Here is "}),
+            _chunk({"text": "your banana"}),
+            _chunk({"inlineData": {"data": encoded, "mimeType": "image/png"}}),
+        ]
+    )
+    monkeypatch.setattr(
+        module, "make_genai_client", lambda _config: fake_client
+    )
+    parameters = {"prompt": "draw", "stream": True, "aspect_ratio": "3:2"}
+
+    stream = _tool(module, {"api_key": "developer-key"})._invoke(parameters)
+    assert next(stream) == {"type": "text", "text": "Generating image..."}
+    assert fake_client.models.consumed == 0
+    assert next(stream) == {"type": "text", "text": "Here is "}
+    assert fake_client.models.consumed == 2
+    rest = list(stream)
+    cached = list(
+        _tool(module, {"api_key": "developer-key"})._invoke(parameters)
+    )
+
+    assert rest[0] == {"type": "text", "text": "your banana"}
+    assert rest[1]["blob"] == b"streamed-image"
+    assert rest[1]["meta"]["mime_type"] == "image/png"
+    assert len(rest) == 2
+    call = fake_client.models.stream_calls[0]
+    assert call["contents"] == ["draw"]
+    assert call["config"].image_config.aspect_ratio == "3:2"
+    assert len(fake_client.models.stream_calls) == 1
+    assert cached[0] == {"type": "text", "text": "Here is your banana"}
+    assert cached[1]["blob"] == b"streamed-image"
+
+
+def test_invoke_stream_returns_the_same_images_as_non_stream_mode(
+    nanobana_imports: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _install_google_type_stubs(monkeypatch)
+    module = importlib.import_module("tools.nanobana")
+    drafts = [
+        {"inlineData": {"data": data, "mimeType": "image/png"}}
+        for data in (b"draft", b"final")
+    ]
+    fake_client = FakeClient({"candidates": [{"content": {"parts": drafts}}]})
+    fake_client.models.generate_content_stream = lambda **_: iter(
+        [_chunk(drafts[0]), _chunk(drafts[1])]
+    )
+    monkeypatch.setattr(
+        module, "make_genai_client", lambda _config: fake_client
+    )
+
+    def blobs(stream: bool) -> list[bytes]:
+        messages = _tool(module, {"api_key": "developer-key"})._invoke(
+            {"prompt": "draw", "stream": stream}
+        )
+        return [m["blob"] for m in messages if m["type"] == "blob"]
+
+    assert blobs(True) == blobs(False) == [b"final"]
+
+
+def test_invoke_stream_reports_failure_after_partial_output(
+    nanobana_imports: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _install_google_type_stubs(monkeypatch)
+    module = importlib.import_module("tools.nanobana")
+    fake_client = FakeClient(None)
+    fake_client.models = StreamingModels(
+        [_chunk({"text": "partial"})],
+        error=RuntimeError("stream dropped for SECRET-KEY"),
+    )
+    monkeypatch.setattr(
+        module, "make_genai_client", lambda _config: fake_client
+    )
+
+    messages = list(
+        _tool(module, {"api_key": "SECRET-KEY"})._invoke(
+            {"prompt": "draw", "stream": "true"}
+        )
+    )
+
+    assert [message["text"] for message in messages] == [
+        "Generating image...",
+        "partial",
+        "Gemini image generation failed: stream dropped for [REDACTED]",
+    ]
+    assert fake_client.close_calls == 0
+
+
+def test_invoke_stream_reports_empty_stream_and_credential_errors(
+    nanobana_imports: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _install_google_type_stubs(monkeypatch)
+    module = importlib.import_module("tools.nanobana")
+    fake_client = FakeClient(None)
+    fake_client.models = StreamingModels([])
+    monkeypatch.setattr(
+        module, "make_genai_client", lambda _config: fake_client
+    )
+
+    empty = list(
+        _tool(module, {"api_key": "developer-key"})._invoke(
+            {"prompt": "draw", "stream": True}
+        )
+    )
+    invalid = list(_tool(module, {})._invoke({"prompt": "draw", "stream": 1}))
+
+    assert [message["text"] for message in empty] == [
+        "Generating image...",
+        "Gemini returned no text or image candidates.",
+    ]
+    assert invalid[0]["text"].startswith("Gemini image generation failed")
+
+
+def test_decode_inline_data_accepts_base64_and_bytes(
+    nanobana_imports: None,
+) -> None:
+    module = importlib.import_module("tools.nanobana")
+    payload = bytes(range(256)) * 3
+    encoded = base64.b64encode(payload).decode()
+
+    assert module._decode_inline_data(encoded) == payload
+    wrapped = "\n".join(
+        encoded[start : start + 7] for start in range(0, len(encoded), 7)
+    )
+    assert module._decode_inline_data(wrapped) == payload
+    assert module._decode_inline_data(payload) is payload
+    assert module._decode_inline_data("") is None
+    assert module._decode_inline_data(None) is None
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(True, True), ("yes", True), ("1", True), (None, False), ("off", False)],
+)
+def test_normalize_flag(
+    nanobana_imports: None, value: Any, expected: bool
+) -> None:
+    module = importlib.import_module("tools.nanobana")
+
+    assert module.normalize_flag(value) is expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"), [(None, 1), ("3", 3), (0, 1), (99, 8), ("x", 1)]
+)
+def test_normalize_count_clamps_to_batch_size(
+    nanobana_imports: None, value: Any, expected: int
+) -> None:
+    module = importlib.import_module("tools.nanobana")
+
+    assert module.normalize_count(value) == expected
 
 
 def test_invoke_adds_single_image_part(
@@ -277,6 +829,116 @@ def test_invoke_adds_single_image_part(
     assert contents[1].mime_type == "image/png"
 
 
+def _png_bytes(size: tuple[int, int]) -> bytes:
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color=(255, 200, 0)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_invoke_downscales_and_deduplicates_input_images(
+    nanobana_imports: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from PIL import Image
+
+    _install_google_type_stubs(monkeypatch)
+    module = importlib.import_module("tools.nanobana")
+    fake_client = FakeClient(SimpleNamespace(candidates=[]))
+    monkeypatch.setattr(
+        module, "make_genai_client", lambda _config: fake_client
+    )
+    photo = SimpleNamespace(
+        blob=_png_bytes((3000, 1500)), mime_type="image/png"
+    )
+
+    list(
+        _tool(module, {"api_key": "developer-key"})._invoke(
+            {"prompt": "edit", "images": [photo, photo], "resolution": "1K"}
+        )
+    )
+
+    contents = fake_client.models.calls[0]["contents"]
+    assert len(contents) == 2
+    assert Image.open(io.BytesIO(contents[1].data)).size == (1024, 512)
+
+
+def test_invoke_reuses_uploaded_files_for_large_inputs(
+    nanobana_imports: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _install_google_type_stubs(monkeypatch)
+    module = importlib.import_module("tools.nanobana")
+    monkeypatch.setattr(
+        module, "_UPLOADED_FILES", module.UploadedFileCache(min_bytes=1)
+    )
+    fake_client = FakeClient(SimpleNamespace(candidates=[]))
+    uploads: list[Any] = []
+
+    def upload(**kwargs: Any) -> SimpleNamespace:
+        uploads.append(kwargs)
+        return SimpleNamespace(uri="https://files.example/abc")
+
+    fake_client.files = SimpleNamespace(upload=upload)
+    monkeypatch.setattr(
+        module, "make_genai_client", lambda _config: fake_client
+    )
+    image = SimpleNamespace(blob=b"reference", mime_type="image/png")
+
+    for parameters in ({}, {"count": 2}):
+        list(
+            _tool(module, {"api_key": "developer-key"})._invoke(
+                {"prompt": "edit", "images": image, **parameters}
+            )
+        )
+
+    assert len(uploads) == 1
+    assert len(fake_client.models.calls) == 3
+    for call in fake_client.models.calls:
+        assert call["contents"][1].file_uri == "https://files.example/abc"
+        assert call["contents"][1].mime_type == "image/png"
+
+
+def test_invoke_skips_uploads_when_results_are_cached(
+    nanobana_imports: None,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    _install_google_type_stubs(monkeypatch)
+    monkeypatch.setenv("NANOBANA_RESULT_CACHE_DIR", str(tmp_path))
+    module = importlib.import_module("tools.nanobana")
+    fake_client = FakeClient(None)
+    fake_client.models = BatchModels()
+    uploads: list[Any] = []
+
+    def upload(**kwargs: Any) -> SimpleNamespace:
+        uploads.append(kwargs)
+        return SimpleNamespace(uri=f"https://files.example/{len(uploads)}")
+
+    fake_client.files = SimpleNamespace(upload=upload)
+    monkeypatch.setattr(
+        module, "make_genai_client", lambda _config: fake_client
+    )
+    image = SimpleNamespace(blob=b"reference", mime_type="image/png")
+
+    for parameters in ({}, {"count": 2}):
+        for _ in range(2):
+            # A fresh upload cache: only result-cache hits avoid uploads.
+            monkeypatch.setattr(
+                module,
+                "_UPLOADED_FILES",
+                module.UploadedFileCache(min_bytes=1),
+            )
+            list(
+                _tool(module, {"api_key": "developer-key"})._invoke(
+                    {"prompt": "edit", "images": image, **parameters}
+                )
+            )
+
+    # The batch's first sample shares the single request's cache entry.
+    assert len(fake_client.models.calls) == 2
+    assert len(uploads) == 2
+
+
 def test_invoke_adds_multiple_image_parts(
     nanobana_imports: None, monkeypatch: pytest.MonkeyPatch
 ) -> None:
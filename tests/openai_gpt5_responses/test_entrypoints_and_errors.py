@@ -38,6 +38,8 @@ def test_openai_main_plugin_entrypoint() -> None:
     module = importlib.import_module("app.openai_gpt5_responses.main")
     assert module.plugin.env.kwargs["MAX_REQUEST_TIMEOUT"] == 1200
     assert module.plugin.env.kwargs["MAX_INVOCATION_TIMEOUT"] == 1200
+    assert module.warm_start.modules == module.WARM_START_MODULES
+    assert "register:plugin" in module.warm_start.timings
 
 
 def test_openai_main_plugin_entrypoint_env_override(
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+from unittest.mock import Mock
+
+
+def json_response_mock() -> Mock:
+    """Return a ``requests.Response`` double whose body can also be streamed.
+
+    Configure ``.json.return_value`` / ``.json.side_effect`` as usual;
+    ``iter_content`` serves the next ``.json()`` payload as raw bytes, so
+    collection reads consume the same sequence as buffered ones.
+    """
+    resp = Mock()
+
+    def iter_content(*_args: Any, **_kwargs: Any) -> Any:
+        return iter([json.dumps(resp.json()).encode("utf-8")])
+
+    resp.iter_content.side_effect = iter_content
+    return resp
@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import json
 import queue
+import socket
+import struct
 import threading
 import time
+from collections.abc import Callable
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any
 from urllib.parse import parse_qs, urlparse
@@ -16,16 +19,27 @@ class StubResponse:
         body: str | bytes | dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
         delay: float = 0.0,
+        reset: bool = False,
     ) -> None:
         self.status = status
         self.body = body
         self.headers = headers or {}
         self.delay = delay
+        # Abort the connection (TCP RST) instead of answering.
+        self.reset = reset
+
+
+class _ThreadingServer(ThreadingHTTPServer):
+    # Room for bursts of concurrent connections (load benchmarks); the
+    # default backlog of 5 adds SYN-retry stalls of about a second.
+    request_queue_size = 128
 
 
 class StubServer:
     def __init__(self) -> None:
         self._responses: queue.Queue[StubResponse] = queue.Queue()
+        # Answers requests once the queue is empty (e.g. generated load).
+        self.responder: Callable[[dict[str, Any]], StubResponse] | None = None
         self.requests: list[dict[str, Any]] = []
         self._server: ThreadingHTTPServer | None = None
         self._thread: threading.Thread | None = None
@@ -52,24 +66,38 @@ class StubServer:
                 parsed = urlparse(self.path)
                 length = int(self.headers.get("Content-Length", "0"))
                 body = self.rfile.read(length) if length else b""
-                self.server.stub.requests.append(
-                    {
-                        "method": self.command,
-                        "path": parsed.path,
-                        "query": parse_qs(parsed.query),
-                        "headers": dict(self.headers),
-                        "body": body,
-                    }
-                )
+                request = {
+                    "method": self.command,
+                    "path": parsed.path,
+                    "query": parse_qs(parsed.query),
+                    "headers": dict(self.headers),
+                    "body": body,
+                }
+                stub = self.server.stub
+                stub.requests.append(request)
 
                 try:
-                    resp = self.server.stub._responses.get_nowait()
+                    resp = stub._responses.get_nowait()
                 except queue.Empty:
-                    resp = StubResponse(status=500, body="No stub response")
+                    if stub.responder is not None:
+                        resp = stub.responder(request)
+                    else:
+                        resp = StubResponse(
+                            status=500, body="No stub response"
+                        )
 
                 if resp.delay:
                     time.sleep(resp.delay)
 
+                if resp.reset:
+                    self.connection.setsockopt(
+                        socket.SOL_SOCKET,
+                        socket.SO_LINGER,
+                        struct.pack("ii", 1, 0),
+                    )
+                    self.close_connection = True
+                    return
+
                 self.send_response(resp.status)
                 for key, value in resp.headers.items():
                     self.send_header(key, value)
@@ -88,7 +116,7 @@ class StubServer:
             def log_message(self, format: str, *args: Any) -> None:
                 return
 
-        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server = _ThreadingServer(("127.0.0.1", 0), Handler)
         self._server.stub = self
         host, port = self._server.server_address
         self.base_url = f"http://{host}:{port}"
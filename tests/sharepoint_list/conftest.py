@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+
+from app.sharepoint_list.internal import http_client
+
+
+@pytest.fixture(autouse=True)
+def _reset_circuit_breaker() -> Iterator[None]:
+    # Failures recorded by one test must not open circuits in the next.
+    http_client.CIRCUIT_BREAKER.reset()
+    yield
+    http_client.CIRCUIT_BREAKER.reset()
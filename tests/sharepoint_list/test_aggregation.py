@@ -0,0 +1,203 @@
+"""Tests for aggregate_items (aggregation.py / operations.aggregate_items)."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.sharepoint_list.internal import aggregation, operations, validators
+from tests.sharepoint_list._mock_response import json_response_mock
+
+SITE_ID = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+LIST_ID = "b2c3d4e5-f6a7-8901-bcde-f12345678901"
+
+
+def _target() -> validators.TargetSpec:
+    return validators.TargetSpec(
+        site_identifier=SITE_ID, list_identifier=LIST_ID
+    )
+
+
+def _columns() -> dict[str, Any]:
+    return {
+        "value": [
+            {"name": "Status", "displayName": "ステータス"},
+            {"name": "Owner", "displayName": "担当者"},
+            {"name": "Hours", "displayName": "工数"},
+        ]
+    }
+
+
+def _page(rows: list[dict[str, Any]], next_token: str | None = None) -> dict:
+    page: dict[str, Any] = {
+        "value": [
+            {"id": str(n), "fields": fields} for n, fields in enumerate(rows)
+        ]
+    }
+    if next_token:
+        page["@odata.nextLink"] = (
+            "https://graph.microsoft.com/v1.0/sites/s/lists/l/items"
+            f"?$skiptoken={next_token}"
+        )
+    return page
+
+
+class TestParseAggregates:
+    def test_defaults_to_count(self) -> None:
+        assert aggregation.parse_aggregates(None) == [
+            aggregation.AggregateSpec("count")
+        ]
+
+    def test_parses_ops_and_fields(self) -> None:
+        specs = aggregation.parse_aggregates("count, SUM:Hours,distinct:Owner")
+        assert [spec.label for spec in specs] == [
+            "count",
+            "sum(Hours)",
+            "distinct(Owner)",
+        ]
+
+    def test_rejects_unknown_op_or_missing_field(self) -> None:
+        with pytest.raises(ValueError, match="Unsupported aggregate"):
+            aggregation.parse_aggregates("avg:Hours")
+        with pytest.raises(ValueError, match="requires a field"):
+            aggregation.parse_aggregates("sum")
+
+
+class TestAggregator:
+    def test_groups_and_accumulates(self) -> None:
+        specs = aggregation.parse_aggregates(
+            "count,count:Hours,sum:Hours,min:Hours,max:Hours,distinct:Tag"
+        )
+        aggregator = aggregation.Aggregator(["Owner"], specs)
+        for fields in [
+            {"Owner": "b", "Hours": 2, "Tag": "x"},
+            {"Owner": "a", "Hours": 1.5, "Tag": "x"},
+            {"Owner": "b", "Hours": None, "Tag": "y"},
+            {"Owner": "b", "Hours": 5, "Tag": "x"},
+            {"Owner": "b", "Hours": "n/a"},
+        ]:
+            aggregator.add(fields)
+
+        result = aggregator.result()
+
+        assert result["columns"] == [
+            "Owner",
+            "count",
+            "count(Hours)",
+            "sum(Hours)",
+            "min(Hours)",
+            "max(Hours)",
+            "distinct(Tag)",
+        ]
+        assert result["rows"] == [
+            ["a", 1, 1, 1.5, 1.5, 1.5, 1],
+            ["b", 4, 3, 7, 2, 5, 2],
+        ]
+        assert result["scanned_items"] == 5
+
+    def test_ungrouped_empty_input_yields_zero_row(self) -> None:
+        aggregator = aggregation.Aggregator(
+            [], aggregation.parse_aggregates("count,sum:Hours")
+        )
+        assert aggregator.result()["rows"] == [[0, None]]
+
+    def test_group_limit(self) -> None:
+        aggregator = aggregation.Aggregator(
+            ["Owner"], aggregation.parse_aggregates(None), max_groups=1
+        )
+        aggregator.add({"Owner": "a"})
+        with pytest.raises(ValueError, match="more than 1 groups"):
+            aggregator.add({"Owner": "b"})
+
+
+class TestAggregateItems:
+    @patch("app.sharepoint_list.internal.http_client.requests.request")
+    def test_streams_all_pages_with_minimal_select(
+        self, mock_request: Mock
+    ) -> None:
+        mock_resp = json_response_mock()
+        mock_resp.status_code = 200
+        mock_resp.text = "{}"
+        mock_resp.json.side_effect = [
+            _columns(),
+            _page(
+                [
+                    {"Owner": "a", "Hours": 1},
+                    {"Owner": "b", "Hours": 2},
+                ],
+                next_token="p2",
+            ),
+            _page([{"Owner": "a", "Hours": 4}, {"Hours": 8}]),
+        ]
+        mock_request.return_value = mock_resp
+
+        result = operations.aggregate_items(
+            access_token="test-token",
+            target=_target(),
+            group_by="担当者",
+            aggregates="count,sum:工数",
+            filters_raw='[{"field": "ステータス", "op": "ne", "value": "完了"}]',
+        )
+
+        assert result == {
+            "columns": ["Owner", "count", "sum(Hours)"],
+            "rows": [["a", 2, 5], ["b", 1, 2], [None, 1, 8]],
+            "group_count": 3,
+            "scanned_items": 4,
+            "read_items": 4,
+            "pages": 2,
+            "truncated": False,
+        }
+        first_page = mock_request.call_args_list[1].kwargs
+        assert first_page["params"]["$expand"] == (
+            "fields($select=Owner,Hours)"
+        )
+        assert first_page["params"]["$top"] == 100
+        assert first_page["params"]["$filter"] == "fields/Status ne '完了'"
+        assert first_page["headers"]["Prefer"] == (
+            "HonorNonIndexedQueriesWarning=true"
+        )
+        second_page = mock_request.call_args_list[2].kwargs
+        assert second_page["params"]["$skiptoken"] == "p2"
+
+    @patch("app.sharepoint_list.internal.http_client.requests.request")
+    def test_stops_at_max_items(self, mock_request: Mock) -> None:
+        mock_resp = json_response_mock()
+        mock_resp.status_code = 200
+        mock_resp.text = "{}"
+        mock_resp.json.side_effect = [
+            _columns(),
+            _page([{"Owner": "a"}] * 3, next_token="p2"),
+        ]
+        mock_request.return_value = mock_resp
+
+        result = operations.aggregate_items(
+            access_token="test-token",
+            target=_target(),
+            group_by=None,
+            aggregates=None,
+            max_items=2,
+        )
+
+        assert result["rows"] == [[2]]
+        assert result["truncated"] is True
+        assert mock_request.call_count == 2
+
+    def test_unknown_field_is_rejected(self) -> None:
+        with patch(
+            "app.sharepoint_list.internal.http_client.requests.request"
+        ) as mock_request:
+            mock_resp = json_response_mock()
+            mock_resp.status_code = 200
+            mock_resp.text = "{}"
+            mock_resp.json.return_value = _columns()
+            mock_request.return_value = mock_resp
+            with pytest.raises(Exception, match="Nope"):
+                operations.aggregate_items(
+                    access_token="test-token",
+                    target=_target(),
+                    group_by="Nope",
+                    aggregates=None,
+                )
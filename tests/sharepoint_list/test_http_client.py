@@ -4,6 +4,10 @@ from __future__ import annotations
 
 import json
 import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
 
 import pytest
 import requests
@@ -295,6 +299,27 @@ class TestSendRequestWithRetry:
         assert result == {"value": []}
         assert len(stub_server.requests) == 2
 
+    def test_retries_on_connection_reset(
+        self, stub_server: StubServer
+    ) -> None:
+        stub_server.enqueue(StubResponse(reset=True))
+        stub_server.enqueue(StubResponse(status=200, body={"value": []}))
+        spec = _make_spec(stub_server.base_url, "/reset")
+        waits: list[float] = []
+        config = http_client.RetryConfig(
+            max_attempts=3,
+            min_wait_seconds=0.5,
+            max_wait_seconds=0.5,
+            jitter=False,
+            sleep=waits.append,
+        )
+        result = http_client.send_request_with_retry(
+            spec, "test_token", config=config
+        )
+        assert result == {"value": []}
+        assert len(stub_server.requests) == 2
+        assert waits == [0.5]
+
     def test_retries_on_rate_limit_error(
         self, stub_server: StubServer
     ) -> None:
@@ -423,3 +448,580 @@ class TestSendRequestWithRetry:
                 spec, "test_token", config=config
             )
         assert "Unexpected error in retry loop" in str(exc_info.value)
+
+
+class TestGetCoalescer:
+    def _wait_for(self, predicate, timeout: float = 5.0) -> None:
+        deadline = time.monotonic() + timeout
+        while not predicate():
+            assert time.monotonic() < deadline, "condition not reached"
+            time.sleep(0.005)
+
+    def test_concurrent_identical_gets_share_one_fetch(self) -> None:
+        coalescer = http_client.GetCoalescer()
+        release = threading.Event()
+        fetches: list[int] = []
+
+        def fetch() -> dict[str, object]:
+            fetches.append(1)
+            release.wait(5)
+            return {"value": [{"id": "1"}]}
+
+        key = ("GET", "https://graph/x", (), (), "token-hash")
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(coalescer.call, key, fetch) for _ in range(4)
+            ]
+            self._wait_for(lambda: coalescer.stats["coalesced"] == 3)
+            release.set()
+            results = [future.result(timeout=5) for future in futures]
+
+        assert len(fetches) == 1
+        assert all(result == {"value": [{"id": "1"}]} for result in results)
+        # Each caller owns its copy.
+        results[0]["value"].append({"id": "2"})
+        assert len(results[1]["value"]) == 1
+
+    def test_waiters_receive_the_leader_error(self) -> None:
+        coalescer = http_client.GetCoalescer()
+        release = threading.Event()
+
+        def fetch() -> dict[str, object]:
+            release.wait(5)
+            raise http_client.AuthenticationError("expired", status_code=401)
+
+        key = ("GET", "https://graph/x", (), (), "token-hash")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(coalescer.call, key, fetch) for _ in range(2)
+            ]
+            self._wait_for(lambda: coalescer.stats["coalesced"] == 1)
+            release.set()
+            for future in futures:
+                with pytest.raises(http_client.AuthenticationError):
+                    future.result(timeout=5)
+
+    def test_key_depends_on_token_params_and_method(self) -> None:
+        coalescer = http_client.GetCoalescer()
+        spec = RequestSpec(
+            method="GET", url="https://graph/x", params={"$top": 5}
+        )
+        key = coalescer.key_for(spec, "token-a")
+
+        assert key == coalescer.key_for(spec, "token-a")
+        assert key != coalescer.key_for(spec, "token-b")
+        assert "token-a" not in repr(key)
+        assert key != coalescer.key_for(
+            spec, "token-a", {"Prefer": "HonorNonIndexedQueriesWarning=true"}
+        )
+        post = RequestSpec(method="POST", url="https://graph/x", json={})
+        assert coalescer.key_for(post, "token-a") is None
+        disabled = http_client.GetCoalescer(enabled=False)
+        assert disabled.key_for(spec, "token-a") is None
+
+    def test_micro_cache_serves_within_ttl(self) -> None:
+        now = [0.0]
+        coalescer = http_client.GetCoalescer(
+            cache_ttl=2.0, clock=lambda: now[0]
+        )
+        calls: list[int] = []
+
+        def fetch() -> dict[str, object]:
+            calls.append(1)
+            return {"n": len(calls)}
+
+        key = ("GET", "https://graph/x", (), (), "token-hash")
+        assert coalescer.call(key, fetch) == {"n": 1}
+        now[0] = 1.9
+        assert coalescer.call(key, fetch) == {"n": 1}
+        now[0] = 2.0
+        assert coalescer.call(key, fetch) == {"n": 2}
+        coalescer.invalidate()
+        assert coalescer.call(key, fetch) == {"n": 3}
+        assert coalescer.stats["cache_hits"] == 1
+
+    def test_gets_started_before_a_write_are_not_cached_or_joined(
+        self,
+    ) -> None:
+        coalescer = http_client.GetCoalescer(cache_ttl=60.0)
+        release = threading.Event()
+        fetches: list[int] = []
+
+        def fetch() -> dict[str, object]:
+            fetches.append(1)
+            if len(fetches) == 1:
+                release.wait(5)
+                return {"v": "before write"}
+            return {"v": "after write"}
+
+        key = ("GET", "https://graph/x", (), (), "token-hash")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            stale = executor.submit(coalescer.call, key, fetch)
+            self._wait_for(lambda: len(fetches) == 1)
+            coalescer.invalidate()
+            # A caller after the write does not join the pre-write fetch.
+            assert coalescer.call(key, fetch) == {"v": "after write"}
+            release.set()
+            assert stale.result(timeout=5) == {"v": "before write"}
+
+        # The late pre-write result did not overwrite the cache.
+        assert coalescer.call(key, fetch) == {"v": "after write"}
+        assert len(fetches) == 2
+
+    def test_send_request_with_retry_coalesces_and_writes_invalidate(
+        self, stub_server: StubServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        coalescer = http_client.GetCoalescer(cache_ttl=60.0)
+        monkeypatch.setattr(http_client, "GET_COALESCER", coalescer)
+        stub_server.enqueue(StubResponse(status=200, body={"v": 1}))
+        stub_server.enqueue(StubResponse(status=200, body={"ok": True}))
+        stub_server.enqueue(StubResponse(status=200, body={"v": 2}))
+        get_spec = _make_spec(stub_server.base_url, "/columns")
+        post_spec = _make_spec(
+            stub_server.base_url, "/items", method="POST", json_body={}
+        )
+
+        first = http_client.send_request_with_retry(get_spec, "tok")
+        cached = http_client.send_request_with_retry(get_spec, "tok")
+        http_client.send_request_with_retry(post_spec, "tok")
+        refreshed = http_client.send_request_with_retry(get_spec, "tok")
+
+        assert (first, cached, refreshed) == ({"v": 1}, {"v": 1}, {"v": 2})
+        assert [r["method"] for r in stub_server.requests] == [
+            "GET",
+            "POST",
+            "GET",
+        ]
+
+
+class TestReadCollection:
+    def test_reads_items_and_collects_meta(
+        self, stub_server: StubServer
+    ) -> None:
+        body = {
+            "@odata.context": "ctx",
+            "value": [{"id": str(i), "n": i} for i in range(500)],
+            "@odata.nextLink": "https://next?$skiptoken=abc",
+        }
+        stub_server.enqueue(StubResponse(status=200, body=body))
+        spec = _make_spec(stub_server.base_url, "/items")
+
+        page = http_client.read_collection_with_retry(spec, "test_token")
+
+        assert page.items == body["value"]
+        assert page.positions == list(range(500))
+        assert page.count == 500
+        assert page.complete
+        assert page.meta == {
+            "@odata.context": "ctx",
+            "@odata.nextLink": "https://next?$skiptoken=abc",
+        }
+
+    def test_retries_before_reading(self, stub_server: StubServer) -> None:
+        stub_server.enqueue(StubResponse(status=503, body="Unavailable"))
+        stub_server.enqueue(
+            StubResponse(status=200, body={"responses": [{"id": "0"}]})
+        )
+        spec = _make_spec(stub_server.base_url, "/batch", method="POST")
+        config = http_client.RetryConfig(
+            max_attempts=3,
+            min_wait_seconds=0,
+            max_wait_seconds=0,
+            jitter=False,
+        )
+
+        page = http_client.read_collection_with_retry(
+            spec, "test_token", config=config, item_key="responses"
+        )
+
+        assert page.items == [{"id": "0"}]
+        assert len(stub_server.requests) == 2
+
+    def test_resends_page_when_body_is_cut_off(
+        self, stub_server: StubServer
+    ) -> None:
+        full = json.dumps({"value": [{"id": str(i)} for i in range(50)]})
+        truncated = full[: len(full) // 2]
+        stub_server.enqueue(
+            StubResponse(
+                status=200,
+                body=truncated,
+                headers={"Content-Length": str(len(full))},
+            )
+        )
+        stub_server.enqueue(StubResponse(status=200, body=full))
+        spec = _make_spec(stub_server.base_url, "/items")
+        config = http_client.RetryConfig(
+            max_attempts=3,
+            min_wait_seconds=0,
+            max_wait_seconds=0,
+            jitter=False,
+        )
+
+        page = http_client.read_collection_with_retry(
+            spec, "test_token", config=config
+        )
+
+        assert [item["id"] for item in page.items] == [
+            str(i) for i in range(50)
+        ]
+        assert page.count == 50
+        assert len(stub_server.requests) == 2
+
+    def test_keep_and_limit_stop_reading_early(
+        self, stub_server: StubServer
+    ) -> None:
+        body = {
+            "value": [{"id": str(i)} for i in range(10)],
+            "@odata.nextLink": "https://next",
+        }
+        stub_server.enqueue(StubResponse(status=200, body=body))
+        spec = _make_spec(stub_server.base_url, "/items")
+
+        page = http_client.read_collection_with_retry(
+            spec,
+            "test_token",
+            keep=lambda item: int(item["id"]) % 2 == 1,
+            limit=6,
+        )
+
+        assert page.items == [{"id": "1"}, {"id": "3"}, {"id": "5"}]
+        assert page.positions == [1, 3, 5]
+        assert page.count == 6
+        assert not page.complete
+
+    def test_error_status_raises_mapped_exception(
+        self, stub_server: StubServer
+    ) -> None:
+        stub_server.enqueue(StubResponse(status=404, body="Not Found"))
+        spec = _make_spec(stub_server.base_url, "/missing")
+
+        with pytest.raises(http_client.GraphAPIError) as exc_info:
+            http_client.read_collection_with_retry(spec, "test_token")
+        assert exc_info.value.status_code == 404
+
+    def test_malformed_body_raises_graph_api_error(
+        self, stub_server: StubServer
+    ) -> None:
+        stub_server.enqueue(
+            StubResponse(status=200, body='{"value": [{"id": "1"}, {"id": ')
+        )
+        spec = _make_spec(stub_server.base_url, "/items")
+
+        with pytest.raises(http_client.GraphAPIError, match="Malformed"):
+            http_client.read_collection_with_retry(spec, "test_token")
+        assert len(stub_server.requests) == 1
+
+    def test_empty_body_yields_nothing(self, stub_server: StubServer) -> None:
+        stub_server.enqueue(StubResponse(status=204))
+        spec = _make_spec(stub_server.base_url, "/empty")
+
+        page = http_client.read_collection_with_retry(spec, "test_token")
+
+        assert page.items == []
+        assert page.count == 0
+        assert page.meta == {}
+
+
+class TestEndpointKey:
+    def test_groups_site_addressing_forms_by_tenant(self) -> None:
+        by_id = http_client.endpoint_key(
+            "https://graph.microsoft.com/v1.0/sites/"
+            "contoso.sharepoint.com,site-guid,web-guid/lists/l/items"
+        )
+        by_path = http_client.endpoint_key(
+            "https://graph.microsoft.com/v1.0/sites/"
+            "contoso.sharepoint.com:/sites/team"
+        )
+
+        assert by_id == by_path
+        assert by_id == "graph.microsoft.com/sites/contoso.sharepoint.com"
+
+    def test_other_urls_use_the_first_resource_segment(self) -> None:
+        assert (
+            http_client.endpoint_key("https://graph.microsoft.com/v1.0/$batch")
+            == "graph.microsoft.com/$batch"
+        )
+
+    def test_batch_requests_bypass_the_circuit_breaker(
+        self, stub_server: StubServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        breaker = http_client.CircuitBreaker(failure_threshold=1)
+        monkeypatch.setattr(http_client, "CIRCUIT_BREAKER", breaker)
+        stub_server.enqueue(StubResponse(status=503, body="down"))
+        stub_server.enqueue(StubResponse(status=200, body={"responses": []}))
+        spec = _make_spec(stub_server.base_url, "/$batch", method="POST")
+        config = http_client.RetryConfig(max_attempts=1)
+
+        with pytest.raises(http_client.TransientError):
+            http_client.send_request_with_retry(spec, "token", config=config)
+        result = http_client.send_request_with_retry(
+            spec, "token", config=config
+        )
+
+        assert result == {"responses": []}
+        assert breaker.stats["opened"] == 0
+
+
+class TestCircuitBreaker:
+    def _breaker(self, now: list[float]) -> http_client.CircuitBreaker:
+        return http_client.CircuitBreaker(
+            failure_threshold=3,
+            window_seconds=10,
+            open_seconds=30,
+            clock=lambda: now[0],
+        )
+
+    def test_opens_after_threshold_and_probes_after_cooldown(self) -> None:
+        now = [0.0]
+        breaker = self._breaker(now)
+        for _ in range(3):
+            breaker.before_request("e")
+            breaker.record_failure("e")
+
+        assert breaker.state("e") == "open"
+        with pytest.raises(http_client.CircuitOpenError) as exc_info:
+            breaker.before_request("e")
+        assert not http_client.is_retryable_exception(exc_info.value)
+        breaker.before_request("other")
+
+        now[0] = 31.0
+        breaker.before_request("e")  # the half-open probe
+        with pytest.raises(http_client.CircuitOpenError):
+            breaker.before_request("e")
+        breaker.record_success("e")
+
+        assert breaker.state("e") == "closed"
+        assert breaker.stats == {
+            "opened": 1,
+            "rejected": 2,
+            "probes": 1,
+            "closed": 1,
+        }
+
+    def test_failed_probe_reopens(self) -> None:
+        now = [0.0]
+        breaker = self._breaker(now)
+        for _ in range(3):
+            breaker.record_failure("e")
+        now[0] = 31.0
+        breaker.before_request("e")
+        breaker.record_failure("e")
+
+        assert breaker.state("e") == "open"
+        now[0] = 61.0
+        assert breaker.state("e") == "half_open"
+
+    def test_lost_probe_is_replaced_after_open_seconds(self) -> None:
+        now = [0.0]
+        breaker = self._breaker(now)
+        for _ in range(3):
+            breaker.record_failure("e")
+        now[0] = 31.0
+        assert breaker.before_request("e") is True  # never reports back
+
+        now[0] = 60.0
+        with pytest.raises(http_client.CircuitOpenError):
+            breaker.before_request("e")
+        now[0] = 61.0
+        assert breaker.before_request("e") is True
+        breaker.record_success("e")
+
+        assert breaker.state("e") == "closed"
+
+    def test_probe_without_verdict_releases_half_open_state(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        now = [0.0]
+        breaker = http_client.CircuitBreaker(
+            failure_threshold=1, open_seconds=30, clock=lambda: now[0]
+        )
+        monkeypatch.setattr(http_client, "CIRCUIT_BREAKER", breaker)
+        healthy = Mock(status_code=200, text='{"ok": true}')
+        healthy.json.return_value = {"ok": True}
+        monkeypatch.setattr(
+            http_client.requests,
+            "request",
+            Mock(
+                side_effect=[
+                    requests.exceptions.ConnectionError("reset"),
+                    requests.exceptions.TooManyRedirects("loop"),
+                    healthy,
+                ]
+            ),
+        )
+        spec = RequestSpec(method="GET", url="https://graph/sites/t/lists")
+        config = http_client.RetryConfig(max_attempts=1)
+
+        with pytest.raises(http_client.TransientError):
+            http_client.send_request_with_retry(spec, "token", config=config)
+        now[0] = 31.0
+        with pytest.raises(requests.exceptions.TooManyRedirects):
+            http_client.send_request_with_retry(spec, "token", config=config)
+
+        assert http_client.send_request_with_retry(
+            spec, "token", config=config
+        ) == {"ok": True}
+        assert breaker.state("t") == "closed"
+        assert breaker.stats["probes"] == 2
+
+    def test_failures_outside_window_or_between_successes_reset(
+        self,
+    ) -> None:
+        now = [0.0]
+        breaker = self._breaker(now)
+        breaker.record_failure("e")
+        breaker.record_failure("e")
+        breaker.record_success("e")
+        breaker.record_failure("e")
+        now[0] = 20.0
+        breaker.record_failure("e")
+        breaker.record_failure("e")
+
+        assert breaker.state("e") == "closed"
+
+    def test_retry_loop_fails_fast_on_open_circuit(
+        self, stub_server: StubServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        breaker = http_client.CircuitBreaker(failure_threshold=2)
+        monkeypatch.setattr(http_client, "CIRCUIT_BREAKER", breaker)
+        for _ in range(2):
+            stub_server.enqueue(StubResponse(status=503, body="down"))
+        spec = _make_spec(stub_server.base_url, "/sites/tenant/lists")
+        config = http_client.RetryConfig(
+            max_attempts=5, min_wait_seconds=0, max_wait_seconds=0
+        )
+
+        with pytest.raises(http_client.CircuitOpenError):
+            http_client.send_request_with_retry(spec, "token", config=config)
+        with pytest.raises(http_client.CircuitOpenError):
+            http_client.send_request_with_retry(spec, "token", config=config)
+
+        assert len(stub_server.requests) == 2
+
+    def test_client_errors_count_as_responses(
+        self, stub_server: StubServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        breaker = http_client.CircuitBreaker(failure_threshold=2)
+        monkeypatch.setattr(http_client, "CIRCUIT_BREAKER", breaker)
+        stub_server.enqueue(StubResponse(status=503, body="down"))
+        stub_server.enqueue(StubResponse(status=404, body="Not Found"))
+        stub_server.enqueue(StubResponse(status=503, body="down"))
+        spec = _make_spec(stub_server.base_url, "/sites/tenant/lists")
+        config = http_client.RetryConfig(max_attempts=1)
+
+        for _ in range(3):
+            with pytest.raises(http_client.GraphAPIError) as exc_info:
+                http_client.send_request_with_retry(
+                    spec, "token", config=config
+                )
+            assert not isinstance(exc_info.value, http_client.CircuitOpenError)
+
+        assert breaker.stats["opened"] == 0
+
+
+class TestHedgePolicy:
+    def test_slow_get_is_hedged_and_fast_copy_wins(
+        self, stub_server: StubServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        policy = http_client.HedgePolicy(
+            enabled=True, min_delay=0.01, default_delay=0.05
+        )
+        monkeypatch.setattr(http_client, "HEDGE_POLICY", policy)
+        stub_server.enqueue(
+            StubResponse(status=200, body={"id": "slow"}, delay=1.0)
+        )
+        stub_server.enqueue(StubResponse(status=200, body={"id": "fast"}))
+        spec = _make_spec(stub_server.base_url, "/sites/tenant/items/1")
+
+        started_at = time.perf_counter()
+        result = http_client.send_request_with_retry(spec, "token")
+
+        assert result == {"id": "fast"}
+        assert time.perf_counter() - started_at < 0.9
+        assert policy.stats == {
+            "requests": 1,
+            "hedged": 1,
+            "hedge_wins": 1,
+            "unhedged": 0,
+        }
+
+    def test_fast_gets_and_writes_are_not_hedged(
+        self, stub_server: StubServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        policy = http_client.HedgePolicy(enabled=True, default_delay=1.0)
+        monkeypatch.setattr(http_client, "HEDGE_POLICY", policy)
+        stub_server.enqueue(StubResponse(status=200, body={"id": "1"}))
+        stub_server.enqueue(StubResponse(status=201, body={"id": "2"}))
+        base = stub_server.base_url
+
+        http_client.send_request_with_retry(
+            _make_spec(base, "/sites/t/items/1"), "token"
+        )
+        http_client.send_request_with_retry(
+            _make_spec(base, "/sites/t/items", "POST", json_body={}), "token"
+        )
+
+        assert len(stub_server.requests) == 2
+        assert policy.stats == {
+            "requests": 1,
+            "hedged": 0,
+            "hedge_wins": 0,
+            "unhedged": 0,
+        }
+
+    def test_delay_follows_observed_p95(self) -> None:
+        policy = http_client.HedgePolicy(min_delay=0.01, default_delay=2.0)
+        assert policy.delay_for("e") == 2.0
+
+        for index in range(100):
+            policy.record_latency("e", (index + 1) / 100)
+
+        assert policy.delay_for("e") == pytest.approx(0.96)
+
+    def test_full_pool_sends_on_the_caller_thread_without_hedging(
+        self,
+    ) -> None:
+        policy = http_client.HedgePolicy(
+            min_delay=0.01, default_delay=0.01, max_workers=2
+        )
+        release = threading.Event()
+        threads: list[threading.Thread] = []
+
+        def slow() -> str:
+            release.wait(5)
+            return "slow"
+
+        def fast() -> str:
+            threads.append(threading.current_thread())
+            time.sleep(0.05)
+            return "fast"
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            busy = executor.submit(policy.call, "e", slow)
+            deadline = time.monotonic() + 5
+            while policy.stats["hedged"] == 0:
+                assert time.monotonic() < deadline
+                time.sleep(0.005)
+
+            assert policy.call("e", fast) == "fast"
+            release.set()
+            assert busy.result(timeout=5) == "slow"
+
+        assert threads == [threading.current_thread()]
+        assert policy.stats["unhedged"] == 1
+        assert policy.stats["hedged"] == 1
+
+    def test_primary_error_is_raised_when_both_copies_fail(self) -> None:
+        policy = http_client.HedgePolicy(min_delay=0.01, default_delay=0.01)
+        calls: list[int] = []
+
+        def send() -> None:
+            calls.append(1)
+            attempt = len(calls)
+            time.sleep(0.05)
+            raise http_client.TransientError(f"attempt {attempt}")
+
+        with pytest.raises(http_client.TransientError, match="attempt 1"):
+            policy.call("e", send)
+        assert len(calls) == 2
@@ -0,0 +1,205 @@
+"""Tests for the ETag item cache (item_cache.py / get_item)."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.sharepoint_list.internal import (
+    http_client,
+    item_cache,
+    operations,
+    validators,
+)
+from app.sharepoint_list.internal.request_builders import RequestSpec
+from tests.sharepoint_list._stub_http_server import StubResponse, StubServer
+
+SITE_ID = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+LIST_ID = "b2c3d4e5-f6a7-8901-bcde-f12345678901"
+TARGET = validators.TargetSpec(
+    site_identifier=SITE_ID, list_identifier=LIST_ID
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_item_cache() -> Iterator[None]:
+    item_cache.ITEM_CACHE.clear()
+    yield
+    item_cache.ITEM_CACHE.clear()
+
+
+def _response(
+    status: int, body: dict | None = None, etag: str | None = None
+) -> Mock:
+    resp = Mock()
+    resp.status_code = status
+    resp.text = "{}" if body is not None else ""
+    resp.json.return_value = body
+    resp.headers = {"ETag": etag} if etag else {}
+    return resp
+
+
+def _item(title: str, etag: str = '"v1"') -> dict:
+    return {
+        "@odata.etag": etag,
+        "id": "7",
+        "fields": {"id": "7", "Title": title},
+    }
+
+
+def _if_none_match(call: object) -> str | None:
+    return call.kwargs["headers"].get("If-None-Match")
+
+
+class TestGetItemCache:
+    """get_item の条件付きリクエスト"""
+
+    @patch("app.sharepoint_list.internal.http_client.requests.request")
+    def test_revalidates_and_serves_304_from_cache(
+        self, mock_request: Mock
+    ) -> None:
+        mock_request.side_effect = [
+            _response(200, _item("A"), etag='"h1"'),
+            _response(304),
+        ]
+
+        first = operations.get_item("test-token", TARGET, "7")
+        first["fields"]["Title"] = "mutated by caller"
+        second = operations.get_item("test-token", TARGET, "7")
+
+        assert second == _item("A")
+        calls = mock_request.call_args_list
+        assert _if_none_match(calls[0]) is None
+        assert _if_none_match(calls[1]) == '"h1"'
+        assert item_cache.ITEM_CACHE.stats["hits"] == 1
+
+    @patch("app.sharepoint_list.internal.http_client.requests.request")
+    def test_changed_item_replaces_entry_using_body_etag(
+        self, mock_request: Mock
+    ) -> None:
+        mock_request.side_effect = [
+            _response(200, _item("A", '"v1"')),
+            _response(200, _item("B", '"v2"')),
+            _response(304),
+        ]
+
+        operations.get_item("test-token", TARGET, "7")
+        changed = operations.get_item("test-token", TARGET, "7")
+        cached = operations.get_item("test-token", TARGET, "7")
+
+        assert changed["fields"]["Title"] == "B"
+        assert cached["fields"]["Title"] == "B"
+        etags = [_if_none_match(c) for c in mock_request.call_args_list]
+        assert etags == [None, '"v1"', '"v2"']
+
+    @patch("app.sharepoint_list.internal.http_client.requests.request")
+    def test_update_item_invalidates_cached_item(
+        self, mock_request: Mock
+    ) -> None:
+        columns = {"value": [{"name": "Title", "displayName": "Title"}]}
+        mock_request.side_effect = [
+            _response(200, _item("A")),
+            _response(200, columns),
+            _response(200, {"Title": "B"}),
+            _response(200, _item("B", '"v2"')),
+        ]
+
+        operations.get_item("test-token", TARGET, "7")
+        operations.update_item("test-token", TARGET, "7", {"Title": "B"})
+        result = operations.get_item("test-token", TARGET, "7")
+
+        assert result["fields"]["Title"] == "B"
+        assert _if_none_match(mock_request.call_args_list[-1]) is None
+
+    @patch("app.sharepoint_list.internal.http_client.requests.request")
+    def test_entries_are_per_token(self, mock_request: Mock) -> None:
+        mock_request.side_effect = [
+            _response(200, _item("A")),
+            _response(200, _item("A")),
+        ]
+
+        operations.get_item("token-a", TARGET, "7")
+        operations.get_item("token-b", TARGET, "7")
+
+        assert _if_none_match(mock_request.call_args_list[1]) is None
+
+    @patch("app.sharepoint_list.internal.http_client.requests.request")
+    def test_disabled_cache_sends_plain_requests(
+        self, mock_request: Mock
+    ) -> None:
+        mock_request.side_effect = [
+            _response(200, _item("A")),
+            _response(200, _item("A")),
+        ]
+
+        with patch.object(item_cache.ITEM_CACHE, "enabled", False):
+            operations.get_item("test-token", TARGET, "7")
+            operations.get_item("test-token", TARGET, "7")
+
+        etags = [_if_none_match(c) for c in mock_request.call_args_list]
+        assert etags == [None, None]
+
+
+class TestItemCache:
+    """ItemCache のユニットテスト"""
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = item_cache.ItemCache(max_entries=2)
+        keys = [
+            cache.key_for(SITE_ID, LIST_ID, str(i), None, "t")
+            for i in range(3)
+        ]
+        cache.store(keys[0], '"0"', {"id": "0"})
+        cache.store(keys[1], '"1"', {"id": "1"})
+        cache.lookup(keys[0])
+        cache.store(keys[2], '"2"', {"id": "2"})
+
+        assert cache.lookup(keys[1]) is None
+        assert cache.lookup(keys[0]).etag == '"0"'
+
+    def test_invalidate_item_drops_all_select_variants(self) -> None:
+        cache = item_cache.ItemCache()
+        plain = cache.key_for(SITE_ID, LIST_ID, "7", None, "t")
+        selected = cache.key_for(SITE_ID, LIST_ID, "7", ["Title"], "t")
+        other = cache.key_for(SITE_ID, LIST_ID, "8", None, "t")
+        for key in (plain, selected, other):
+            cache.store(key, '"v"', {})
+
+        cache.invalidate_item(SITE_ID, LIST_ID, "7")
+
+        assert cache.lookup(plain) is None
+        assert cache.lookup(selected) is None
+        assert cache.lookup(other) is not None
+
+
+class TestConditionalRequest:
+    """send_conditional_request_with_retry のテスト"""
+
+    @pytest.fixture
+    def stub_server(self) -> Iterator[StubServer]:
+        server = StubServer()
+        server.start()
+        yield server
+        server.stop()
+
+    def test_etag_header_and_not_modified(
+        self, stub_server: StubServer
+    ) -> None:
+        stub_server.enqueue(
+            StubResponse(status=200, body={"id": "7"}, headers={"ETag": "e1"})
+        )
+        stub_server.enqueue(StubResponse(status=304, headers={"ETag": "e1"}))
+        spec = RequestSpec(method="GET", url=f"{stub_server.base_url}/item")
+
+        fresh = http_client.send_conditional_request_with_retry(
+            spec, "test_token"
+        )
+        revalidated = http_client.send_conditional_request_with_retry(
+            spec, "test_token", etag="e1"
+        )
+
+        assert fresh == http_client.ConditionalResponse({"id": "7"}, "e1")
+        assert revalidated.not_modified
+        assert stub_server.requests[1]["headers"]["If-None-Match"] == "e1"
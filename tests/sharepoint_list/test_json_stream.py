@@ -0,0 +1,78 @@
+"""Tests for incremental collection decoding (json_stream.py)."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from app.sharepoint_list.internal import json_stream
+
+
+def _chunks(text: str, size: int) -> list[bytes]:
+    data = text.encode("utf-8")
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def _decode(text: str, size: int, item_key: str = "value") -> tuple:
+    decoder = json_stream.JsonCollectionDecoder(
+        _chunks(text, size), item_key=item_key
+    )
+    return list(decoder), decoder.meta
+
+
+class TestJsonCollectionDecoder:
+    """JsonCollectionDecoder のユニットテスト"""
+
+    @pytest.mark.parametrize("size", [1, 2, 7, 64, 100000])
+    def test_matches_json_loads_for_any_chunking(self, size: int) -> None:
+        doc = {
+            "@odata.context": "https://graph/$metadata#items",
+            "value": [
+                {"id": "1", "fields": {"Title": "日本語", "Amount": 1.5e3}},
+                {"id": "2", "fields": {"Tags": ["a", "b"], "Done": True}},
+                {"id": "3", "fields": {"Count": -12345, "Note": None}},
+            ],
+            "@odata.nextLink": "https://graph/next?$skiptoken=x",
+        }
+        text = json.dumps(doc, ensure_ascii=False, indent=1)
+
+        items, meta = _decode(text, size)
+
+        assert items == doc["value"]
+        assert meta == {
+            "@odata.context": doc["@odata.context"],
+            "@odata.nextLink": doc["@odata.nextLink"],
+        }
+
+    def test_numbers_split_at_chunk_boundary(self) -> None:
+        text = '{"value": [12345, -2500.75e-1, 7]}'
+        for size in range(1, len(text)):
+            items, _ = _decode(text, size)
+            assert items == [12345, -250.075, 7]
+
+    def test_custom_item_key_and_bom(self) -> None:
+        text = '\ufeff{"responses": [{"id": "0"}], "value": 1}'
+
+        items, meta = _decode(text, 3, item_key="responses")
+
+        assert items == [{"id": "0"}]
+        assert meta == {"value": 1}
+
+    def test_empty_body_and_empty_object(self) -> None:
+        assert _decode("", 4) == ([], {})
+        assert _decode("{}", 4) == ([], {})
+        assert _decode('{"value": []}', 4) == ([], {})
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            '{"value": [1, 2',
+            '{"value": [{"id": }]}',
+            '{"value": [1] "x": 2}',
+            "[1, 2]",
+        ],
+    )
+    def test_malformed_input_raises_value_error(self, text: str) -> None:
+        with pytest.raises(ValueError):
+            _decode(text, 3)
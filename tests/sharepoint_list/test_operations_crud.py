@@ -6,7 +6,8 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from app.sharepoint_list.internal import operations, validators
+from app.sharepoint_list.internal import http_client, operations, validators
+from tests.sharepoint_list._mock_response import json_response_mock
 
 # Use GUID format to bypass resolve functions
 SITE_ID = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
@@ -44,7 +45,7 @@ class TestCreateItem:
     @patch("app.sharepoint_list.internal.http_client.requests.request")
     def test_create_item_returns_response(self, mock_request: Mock) -> None:
         """アイテム作成でレスポンスが返る"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 201
         mock_resp.text = "{}"
         mock_resp.json.return_value = _mock_item_response("new-item-1")
@@ -68,7 +69,7 @@ class TestCreateItem:
         self, mock_request: Mock
     ) -> None:
         """フィールドがリクエストボディに含まれる"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 201
         mock_resp.text = "{}"
         mock_resp.json.return_value = _mock_item_response()
@@ -98,7 +99,7 @@ class TestUpdateItem:
     @patch("app.sharepoint_list.internal.http_client.requests.request")
     def test_update_item_modifies_fields(self, mock_request: Mock) -> None:
         """フィールド更新が正しく行われる"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.return_value = {
@@ -123,7 +124,7 @@ class TestUpdateItem:
     @patch("app.sharepoint_list.internal.http_client.requests.request")
     def test_update_item_uses_patch_method(self, mock_request: Mock) -> None:
         """PATCHメソッドを使用"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.return_value = _mock_item_response()
@@ -151,7 +152,7 @@ class TestGetItem:
     @patch("app.sharepoint_list.internal.http_client.requests.request")
     def test_get_item_by_id(self, mock_request: Mock) -> None:
         """IDでアイテム取得"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.return_value = _mock_item_response("item-123")
@@ -176,7 +177,7 @@ class TestListItemsPagination:
     @patch("app.sharepoint_list.internal.http_client.requests.request")
     def test_list_items_returns_items(self, mock_request: Mock) -> None:
         """アイテム一覧取得"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.return_value = _mock_items_response_no_pagination()
@@ -201,7 +202,7 @@ class TestListItemsPagination:
         self, mock_request: Mock
     ) -> None:
         """next_page_token が @odata.nextLink から抽出される"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.return_value = _mock_items_response_with_pagination()
@@ -225,7 +226,7 @@ class TestListItemsPagination:
         self, mock_request: Mock
     ) -> None:
         """ページネーションなしの場合 next_page_token は None"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.return_value = _mock_items_response_no_pagination()
@@ -246,7 +247,7 @@ class TestListItemsPagination:
     @patch("app.sharepoint_list.internal.http_client.requests.request")
     def test_list_items_with_page_token(self, mock_request: Mock) -> None:
         """page_token が $skiptoken として使用される"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.return_value = _mock_items_response_no_pagination()
@@ -275,7 +276,7 @@ class TestListItemsPagination:
         self, mock_request: Mock
     ) -> None:
         """page_size は 100 以下に制限される"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.return_value = _mock_items_response_no_pagination()
@@ -323,7 +324,7 @@ class TestResolveSiteId:
     @patch("app.sharepoint_list.internal.http_client.requests.request")
     def test_url_resolved_via_api(self, mock_request: Mock) -> None:
         """URL形式はAPIで解決"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.return_value = {"id": "resolved-site-id"}
@@ -352,7 +353,7 @@ class TestResolveListId:
     @patch("app.sharepoint_list.internal.http_client.requests.request")
     def test_name_resolved_via_filter(self, mock_request: Mock) -> None:
         """リスト名はフィルタで解決"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.return_value = {
@@ -371,7 +372,7 @@ class TestResolveListId:
     @patch("app.sharepoint_list.internal.http_client.requests.request")
     def test_name_not_found_raises_error(self, mock_request: Mock) -> None:
         """リスト名が見つからない場合はエラー"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.side_effect = [
@@ -388,3 +389,33 @@ class TestResolveListId:
             )
 
         assert "not found" in str(exc_info.value)
+
+    @patch("app.sharepoint_list.internal.http_client.requests.request")
+    def test_enumeration_is_buffered_and_coalesced(
+        self, mock_request: Mock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """列挙はバッファ取得で、同一 GET の合流・キャッシュ対象"""
+        monkeypatch.setattr(
+            http_client,
+            "GET_COALESCER",
+            http_client.GetCoalescer(cache_ttl=60.0),
+        )
+        mock_resp = json_response_mock()
+        mock_resp.status_code = 200
+        mock_resp.text = "{}"
+        mock_resp.json.side_effect = [
+            {"value": []},  # filter returns empty
+            {"value": [{"id": "enum-id", "displayName": "Lst"}]},
+        ]
+        mock_request.return_value = mock_resp
+
+        results = [
+            operations.resolve_list_id(
+                access_token="token", site_id=SITE_ID, list_identifier="Lst"
+            )
+            for _ in range(2)
+        ]
+
+        assert results == ["enum-id", "enum-id"]
+        assert mock_request.call_count == 2
+        assert "stream" not in mock_request.call_args.kwargs
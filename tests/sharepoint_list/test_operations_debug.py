@@ -7,6 +7,7 @@ import os
 from unittest.mock import Mock, patch
 
 from app.sharepoint_list.internal import operations
+from tests.sharepoint_list._mock_response import json_response_mock
 
 
 def _logged_payloads(mock_logger: Mock) -> list[dict]:
@@ -130,7 +131,7 @@ class TestSendRequestDebugLogging:
         mock_logger = Mock()
         mock_get_debug_logger.return_value = mock_logger
 
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.return_value = {"id": "test-site"}
@@ -181,7 +182,7 @@ class TestSendRequestDebugLogging:
         mock_logger = Mock()
         mock_get_debug_logger.return_value = mock_logger
 
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.return_value = {"id": "test-site"}
@@ -249,7 +250,7 @@ class TestListItemsDebugLogging:
             "@odata.nextLink": "https://graph.microsoft.com/v1.0/sites/site/lists/list/items?$skiptoken=abc123",
         }
 
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.side_effect = [columns_response, items_response]
@@ -7,6 +7,7 @@ from unittest.mock import Mock, patch
 import pytest
 
 from app.sharepoint_list.internal import operations, validators
+from tests.sharepoint_list._mock_response import json_response_mock
 
 # Use GUID format to bypass resolve functions
 SITE_ID = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
@@ -46,7 +47,7 @@ class TestListItemsFiltersContract:
         # Setup mock responses
         # With GUID identifiers, resolve_site_id and resolve_list_id are skipped
         # So only columns + items requests are made
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.side_effect = [
@@ -79,7 +80,7 @@ class TestListItemsFiltersContract:
     @patch("app.sharepoint_list.internal.http_client.requests.request")
     def test_filters_single_object_accepted(self, mock_request: Mock) -> None:
         """{"field": "Status", "op": "eq", "value": "Active"} が配列に変換される"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.side_effect = [
@@ -114,7 +115,7 @@ class TestListItemsFiltersContract:
         self, mock_request: Mock
     ) -> None:
         """空文字列はフィルタなしとして処理"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         # No filters_raw = no need to fetch columns
@@ -158,7 +159,7 @@ class TestListItemsFilterConstruction:
         self, mock_request: Mock
     ) -> None:
         """createdDateTime はfields/プレフィックスなしで処理"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.side_effect = [
@@ -191,7 +192,7 @@ class TestListItemsFilterConstruction:
     @patch("app.sharepoint_list.internal.http_client.requests.request")
     def test_custom_field_uses_fields_prefix(self, mock_request: Mock) -> None:
         """カスタム列は fields/<internalName> 形式"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.side_effect = [
@@ -224,7 +225,7 @@ class TestListItemsFilterConstruction:
         self, mock_request: Mock
     ) -> None:
         """日本語表示名が内部名に解決される"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.side_effect = [
@@ -260,7 +261,7 @@ class TestListItemsFilterConstruction:
         self, mock_request: Mock
     ) -> None:
         """fields/を含むフィルタにPreferヘッダが付与"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.side_effect = [
@@ -292,7 +293,7 @@ class TestListItemsFilterConstruction:
         self, mock_request: Mock
     ) -> None:
         """createdDateTimeのみのフィルタにはPreferヘッダなし"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.side_effect = [
@@ -323,7 +324,7 @@ class TestListItemsFilterConstruction:
     @patch("app.sharepoint_list.internal.http_client.requests.request")
     def test_created_datetime_ge_in_filters(self, mock_request: Mock) -> None:
         """filters の createdDateTime ge が $filter に反映される"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.side_effect = [
@@ -354,7 +355,7 @@ class TestListItemsFilterConstruction:
     @patch("app.sharepoint_list.internal.http_client.requests.request")
     def test_created_datetime_le_in_filters(self, mock_request: Mock) -> None:
         """filters の createdDateTime le が $filter に反映される"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.side_effect = [
@@ -387,7 +388,7 @@ class TestListItemsFilterConstruction:
         self, mock_request: Mock
     ) -> None:
         """複数フィルタが and で結合される"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.side_effect = [
@@ -0,0 +1,230 @@
+"""Tests for operations.get_items (multi-item fetch via $batch)."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.sharepoint_list.internal import (
+    http_client,
+    operations,
+    request_builders,
+    validators,
+)
+from tests.sharepoint_list._mock_response import json_response_mock
+
+SITE_ID = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+LIST_ID = "b2c3d4e5-f6a7-8901-bcde-f12345678901"
+BATCH_URL = f"{request_builders.GRAPH_BASE}/$batch"
+
+
+def _target() -> validators.TargetSpec:
+    return validators.TargetSpec(
+        site_identifier=SITE_ID, list_identifier=LIST_ID
+    )
+
+
+def _columns() -> dict[str, Any]:
+    return {
+        "value": [
+            {"name": "Title", "displayName": "Title"},
+            {"name": "_x30b9_", "displayName": "ステータス"},
+        ]
+    }
+
+
+def _item(item_id: str, **fields: Any) -> dict[str, Any]:
+    return {"id": item_id, "fields": {"id": item_id, **fields}}
+
+
+def _batch_response(request_json: dict[str, Any]) -> dict[str, Any]:
+    """Answer every sub-request; item id "404" does not exist."""
+    responses = []
+    for sub in request_json["requests"]:
+        item_id = sub["url"].split("/items/")[1].split("?")[0]
+        if item_id == "404":
+            responses.append({"id": sub["id"], "status": 404, "body": {}})
+        else:
+            responses.append(
+                {
+                    "id": sub["id"],
+                    "status": 200,
+                    "body": _item(item_id, Title=f"T{item_id}"),
+                }
+            )
+    # Graph does not guarantee response order.
+    return {"responses": list(reversed(responses))}
+
+
+def _fake_graph(calls: list[dict[str, Any]]) -> Any:
+    def request(method: str, url: str, **kwargs: Any) -> Mock:
+        calls.append({"method": method, "url": url, **kwargs})
+        resp = json_response_mock()
+        resp.status_code = 200
+        resp.text = "{}"
+        if url == BATCH_URL:
+            resp.json.return_value = _batch_response(kwargs["json"])
+        elif url.endswith("/columns"):
+            resp.json.return_value = _columns()
+        else:
+            resp.json.return_value = _item(url.rsplit("/", 1)[1], Title="x")
+        return resp
+
+    return request
+
+
+@patch("app.sharepoint_list.internal.http_client.requests.request")
+def test_get_items_batches_once_and_keeps_input_order(
+    mock_request: Mock,
+) -> None:
+    calls: list[dict[str, Any]] = []
+    mock_request.side_effect = _fake_graph(calls)
+
+    result = operations.get_items(
+        access_token="test-token",
+        target=_target(),
+        item_ids=["3", "404", "1"],
+        select_fields=["Title", "ステータス"],
+    )
+
+    assert [item["id"] for item in result["items"]] == ["3", "1"]
+    assert result["missing_ids"] == ["404"]
+    # Back-fill: missing select fields are added as None.
+    assert result["items"][0]["fields"]["_x30b9_"] is None
+    assert [call["url"].rsplit("/", 1)[1] for call in calls] == [
+        "columns",
+        "$batch",
+    ]
+    sub_urls = [sub["url"] for sub in calls[1]["json"]["requests"]]
+    assert sub_urls[0] == (
+        f"/sites/{SITE_ID}/lists/{LIST_ID}/items/3"
+        "?$expand=fields($select=Title,_x30b9_)"
+    )
+
+
+@patch("app.sharepoint_list.internal.http_client.requests.request")
+def test_get_items_splits_into_concurrent_batches(
+    mock_request: Mock,
+) -> None:
+    calls: list[dict[str, Any]] = []
+    mock_request.side_effect = _fake_graph(calls)
+    item_ids = [str(n) for n in range(1, 46)]
+
+    result = operations.get_items(
+        access_token="test-token",
+        target=_target(),
+        item_ids=item_ids,
+        output_format="table",
+    )
+
+    batch_sizes = sorted(
+        len(call["json"]["requests"])
+        for call in calls
+        if call["url"] == BATCH_URL
+    )
+    assert batch_sizes == [5, 20, 20]
+    assert result["columns"][0] == "id"
+    assert [row[0] for row in result["rows"]] == item_ids
+    assert result["missing_ids"] == []
+
+
+@patch("app.sharepoint_list.internal.http_client.requests.request")
+def test_get_items_resends_throttled_sub_requests_individually(
+    mock_request: Mock,
+) -> None:
+    calls: list[dict[str, Any]] = []
+    graph = _fake_graph(calls)
+
+    def throttled(method: str, url: str, **kwargs: Any) -> Mock:
+        resp = graph(method, url, **kwargs)
+        if url == BATCH_URL:
+            payload = resp.json.return_value
+            payload["responses"][0] = {
+                "id": payload["responses"][0]["id"],
+                "status": 429,
+                "headers": {"Retry-After": "1"},
+                "body": {"error": {"code": "TooManyRequests"}},
+            }
+        return resp
+
+    mock_request.side_effect = throttled
+    sleeps: list[float] = []
+
+    with patch.object(
+        http_client.DEFAULT_RETRY_CONFIG, "sleep", sleeps.append
+    ):
+        result = operations.get_items(
+            access_token="test-token", target=_target(), item_ids=["1", "2"]
+        )
+
+    assert [item["id"] for item in result["items"]] == ["1", "2"]
+    assert calls[-1]["method"] == "GET"
+    assert calls[-1]["url"].endswith("/items/2")
+    assert len(sleeps) == 1
+    assert 1.0 <= sleeps[0] <= 1.25
+
+
+@patch("app.sharepoint_list.internal.http_client.requests.request")
+def test_get_items_waits_for_the_largest_sub_response_retry_after(
+    mock_request: Mock,
+) -> None:
+    calls: list[dict[str, Any]] = []
+    graph = _fake_graph(calls)
+
+    def throttled(method: str, url: str, **kwargs: Any) -> Mock:
+        resp = graph(method, url, **kwargs)
+        if url == BATCH_URL:
+            payload = resp.json.return_value
+            for response, retry_after in zip(
+                payload["responses"], ("2", "7", None), strict=True
+            ):
+                response["status"] = 503 if retry_after is None else 429
+                response["headers"] = (
+                    {} if retry_after is None else {"retry-after": retry_after}
+                )
+        return resp
+
+    mock_request.side_effect = throttled
+    config = http_client.RetryConfig(jitter=False, sleep=Mock())
+
+    with patch.object(http_client, "DEFAULT_RETRY_CONFIG", config):
+        result = operations.get_items(
+            access_token="test-token",
+            target=_target(),
+            item_ids=["1", "2", "3"],
+        )
+
+    assert [item["id"] for item in result["items"]] == ["1", "2", "3"]
+    config.sleep.assert_called_once_with(7.0)
+    assert [call["method"] for call in calls[-3:]] == ["GET"] * 3
+
+
+@patch("app.sharepoint_list.internal.http_client.requests.request")
+def test_get_items_propagates_batch_authentication_errors(
+    mock_request: Mock,
+) -> None:
+    resp = Mock()
+    resp.status_code = 401
+    resp.text = "unauthorized"
+    resp.headers = {}
+    mock_request.return_value = resp
+
+    with pytest.raises(http_client.AuthenticationError):
+        operations.get_items(
+            access_token="test-token", target=_target(), item_ids=["1"]
+        )
+
+
+def test_backfill_selected_fields_reports_filled_keys() -> None:
+    fields_obj = {"ID": "1", "OData__x30b9_": "Open"}
+
+    filled = operations.backfill_selected_fields(
+        fields_obj, ["id", "_x30b9_", "Title"]
+    )
+
+    assert filled == {"id": "alias", "_x30b9_": "alias", "Title": "none"}
+    assert fields_obj["id"] == "1"
+    assert fields_obj["_x30b9_"] == "Open"
+    assert fields_obj["Title"] is None
@@ -7,6 +7,7 @@ from unittest.mock import Mock, patch
 import pytest
 
 from app.sharepoint_list.internal import operations, validators
+from tests.sharepoint_list._mock_response import json_response_mock
 
 # Use GUID format to bypass resolve functions
 SITE_ID = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
@@ -210,7 +211,7 @@ class TestResolveSelectFieldsForList:
     @patch("app.sharepoint_list.internal.http_client.requests.request")
     def test_fetches_columns_if_not_provided(self, mock_request: Mock) -> None:
         """display_to_name/name_setがNoneならAPI呼び出しで取得"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.return_value = _mock_columns_response()
@@ -234,7 +235,7 @@ class TestGetItemSelectFields:
     @patch("app.sharepoint_list.internal.http_client.requests.request")
     def test_select_fields_in_expand_clause(self, mock_request: Mock) -> None:
         """select_fieldsが$expand=fields($select=...)に含まれる"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         # With GUIDs: columns + item requests only
@@ -268,7 +269,7 @@ class TestGetItemSelectFields:
     @patch("app.sharepoint_list.internal.http_client.requests.request")
     def test_display_name_resolved_in_expand(self, mock_request: Mock) -> None:
         """表示名が内部名に解決されて$expandに含まれる"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         # With GUIDs: columns + item requests only
@@ -302,7 +303,7 @@ class TestGetItemSelectFields:
     @patch("app.sharepoint_list.internal.http_client.requests.request")
     def test_no_select_fields_expands_all(self, mock_request: Mock) -> None:
         """select_fieldsなしは全フィールド展開"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         # No select_fields = no columns request needed
@@ -338,7 +339,7 @@ class TestListItemsSelectFields:
     @patch("app.sharepoint_list.internal.http_client.requests.request")
     def test_select_fields_in_expand_clause(self, mock_request: Mock) -> None:
         """select_fieldsが$expand=fields($select=...)に含まれる"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         # With GUIDs: columns + items requests only
@@ -371,7 +372,7 @@ class TestListItemsSelectFields:
     @patch("app.sharepoint_list.internal.http_client.requests.request")
     def test_display_name_resolved_in_expand(self, mock_request: Mock) -> None:
         """表示名が内部名に解決されて$expandに含まれる"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         # With GUIDs: columns + items requests only
@@ -407,7 +408,7 @@ class TestListItemsSelectFields:
         self, mock_request: Mock
     ) -> None:
         """クォートで囲まれたselect_fieldsが正しくパース"""
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         # With GUIDs: columns + items requests only
@@ -478,7 +479,7 @@ class TestListItemsSelectFieldsNormalization:
             "@odata.nextLink": None,
         }
 
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.side_effect = [columns_response, items_response]
@@ -517,7 +518,7 @@ class TestStrictSelectValidation:
                 },
             ]
         }
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.side_effect = [columns_response]
@@ -547,7 +548,7 @@ class TestStrictSelectValidation:
                 },
             ]
         }
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.side_effect = [columns_response]
@@ -578,7 +579,7 @@ class TestStrictSelectValidation:
                 },
             ]
         }
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.side_effect = [columns_response]
@@ -628,7 +629,7 @@ class TestGetItemSelectFieldsNormalization:
             },
         }
 
-        mock_resp = Mock()
+        mock_resp = json_response_mock()
         mock_resp.status_code = 200
         mock_resp.text = "{}"
         mock_resp.json.side_effect = [columns_response, item_response]
@@ -0,0 +1,161 @@
+"""Tests for compact tabular output (projection.py / output_format)."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.sharepoint_list.internal import operations, projection, validators
+from tests.sharepoint_list._mock_response import json_response_mock
+
+SITE_ID = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+LIST_ID = "b2c3d4e5-f6a7-8901-bcde-f12345678901"
+
+
+def _graph_item(item_id: str, **fields: object) -> dict:
+    return {
+        "@odata.etag": f'"etag-{item_id}"',
+        "id": item_id,
+        "createdBy": {"user": {"displayName": "Someone"}},
+        "parentReference": {"siteId": SITE_ID},
+        "fields": {
+            "@odata.etag": f'"etag-{item_id}"',
+            "id": item_id,
+            **fields,
+        },
+    }
+
+
+def _mock_columns_response() -> dict:
+    return {
+        "value": [
+            {"name": "Title", "displayName": "Title"},
+            {"name": "Status", "displayName": "ステータス"},
+        ]
+    }
+
+
+class TestProjectItems:
+    """project_items / render_delimited のユニットテスト"""
+
+    def test_projects_selected_fields_only(self) -> None:
+        items = [
+            _graph_item("1", Title="A", Status="Open", Extra="x"),
+            _graph_item("2", Title="B"),
+        ]
+
+        table = projection.project_items(items, ["Title", "Status"])
+
+        assert table == {
+            "columns": ["id", "Title", "Status"],
+            "rows": [["1", "A", "Open"], ["2", "B", None]],
+        }
+
+    def test_without_select_uses_returned_fields_minus_annotations(
+        self,
+    ) -> None:
+        items = [
+            _graph_item("1", Title="A", **{"Status@odata.type": "x"}),
+            _graph_item("2", Title="B", Status="Done"),
+        ]
+
+        table = projection.project_items(items, None)
+
+        assert table["columns"] == ["id", "Title", "Status"]
+        assert table["rows"][0] == ["1", "A", None]
+
+    def test_render_delimited_quotes_and_serializes_cells(self) -> None:
+        table = {
+            "columns": ["id", "Title", "Tags", "Done"],
+            "rows": [["1", "a,b", ["x", "y"], True], ["2", None, {}, False]],
+        }
+
+        text = projection.render_delimited(table, ",")
+
+        assert text.splitlines() == [
+            "id,Title,Tags,Done",
+            '1,"a,b","[""x"", ""y""]",true',
+            "2,,{},false",
+        ]
+
+    def test_normalize_output_format(self) -> None:
+        assert projection.normalize_output_format(None) == "raw"
+        assert projection.normalize_output_format(" TSV ") == "tsv"
+        with pytest.raises(ValueError, match="output_format"):
+            projection.normalize_output_format("xml")
+
+
+class TestOperationsOutputFormat:
+    """list_items / get_item の output_format 指定"""
+
+    @patch("app.sharepoint_list.internal.http_client.requests.request")
+    def test_list_items_table_output(self, mock_request: Mock) -> None:
+        mock_resp = json_response_mock()
+        mock_resp.status_code = 200
+        mock_resp.text = "{}"
+        mock_resp.json.side_effect = [
+            _mock_columns_response(),
+            {"value": [_graph_item("1", Title="A")]},
+        ]
+        mock_request.return_value = mock_resp
+        target = validators.TargetSpec(
+            site_identifier=SITE_ID, list_identifier=LIST_ID
+        )
+
+        result = operations.list_items(
+            access_token="test-token",
+            target=target,
+            select_fields="Title,ステータス",
+            output_format="table",
+        )
+
+        assert result == {
+            "columns": ["id", "Title", "Status"],
+            "rows": [["1", "A", None]],
+            "next_page_token": None,
+        }
+
+    @patch("app.sharepoint_list.internal.http_client.requests.request")
+    def test_get_item_tsv_output(self, mock_request: Mock) -> None:
+        mock_resp = json_response_mock()
+        mock_resp.status_code = 200
+        mock_resp.text = "{}"
+        mock_resp.json.side_effect = [
+            _mock_columns_response(),
+            _graph_item("7", Title="Tab\tbed", Status="Open"),
+        ]
+        mock_request.return_value = mock_resp
+        target = validators.TargetSpec(
+            site_identifier=SITE_ID, list_identifier=LIST_ID
+        )
+
+        result = operations.get_item(
+            access_token="test-token",
+            target=target,
+            item_id="7",
+            select_fields=["Title", "Status"],
+            output_format="tsv",
+        )
+
+        assert result == {
+            "format": "tsv",
+            "row_count": 1,
+            "text": 'id\tTitle\tStatus\n7\t"Tab\tbed"\tOpen\n',
+        }
+
+    def test_invalid_output_format_fails_before_requests(self) -> None:
+        target = validators.TargetSpec(
+            site_identifier=SITE_ID, list_identifier=LIST_ID
+        )
+        with patch(
+            "app.sharepoint_list.internal.http_client.requests.request"
+        ) as mock_request:
+            with pytest.raises(ValueError, match="output_format"):
+                operations.list_items(
+                    access_token="test-token",
+                    target=target,
+                    select_fields=None,
+                    output_format="xml",
+                )
+        mock_request.assert_not_called()
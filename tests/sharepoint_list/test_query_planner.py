@@ -0,0 +1,343 @@
+"""Tests for the index-aware query planner (query_planner.py)."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.sharepoint_list.internal import (
+    filters,
+    operations,
+    query_planner,
+    validators,
+)
+from tests.sharepoint_list._mock_response import json_response_mock
+
+SITE_ID = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+LIST_ID = "b2c3d4e5-f6a7-8901-bcde-f12345678901"
+
+
+def _target() -> validators.TargetSpec:
+    return validators.TargetSpec(
+        site_identifier=SITE_ID, list_identifier=LIST_ID
+    )
+
+
+def _indexed_columns() -> dict[str, Any]:
+    return {
+        "value": [
+            {"name": "ID", "displayName": "ID", "indexed": True},
+            {"name": "Title", "displayName": "Title", "indexed": False},
+            {"name": "Status", "displayName": "ステータス", "indexed": True},
+            {"name": "Priority", "displayName": "優先度", "indexed": False},
+        ]
+    }
+
+
+def _planned(field: str, op: str, value: Any, value_type: str | None = None):
+    return query_planner.PlannedCondition(
+        condition=filters.FilterCondition(field, op, value, value_type),
+        field_name=field,
+    )
+
+
+class TestPlanQuery:
+    def test_indexed_columns_requires_metadata(self) -> None:
+        assert (
+            query_planner.indexed_columns({"value": [{"name": "A"}]}) is None
+        )
+        assert query_planner.indexed_columns(_indexed_columns()) == {
+            "id",
+            "status",
+        }
+
+    def test_unknown_index_keeps_legacy_plan(self) -> None:
+        plan = query_planner.plan_query(
+            [_planned("Status", "eq", "Open")], None
+        )
+
+        assert plan.filter_expr == "fields/Status eq 'Open'"
+        assert plan.client == []
+        assert plan.orderby == query_planner.LEGACY_ORDERBY
+        assert plan.prefer_non_indexed is True
+
+    def test_splits_predicates_by_index_and_operator(self) -> None:
+        plan = query_planner.plan_query(
+            [
+                _planned("Status", "eq", "Open"),
+                _planned("Status", "ne", "Closed"),
+                _planned("Priority", "ge", 3, "number"),
+            ],
+            {"id", "status"},
+        )
+
+        assert plan.filter_expr == "fields/Status eq 'Open'"
+        assert [p.condition.op for p in plan.client] == ["ne", "ge"]
+        assert plan.client_fields == ["Status", "Priority"]
+        assert plan.prefer_non_indexed is False
+        assert plan.orderby == query_planner.ID_ORDERBY
+        explained = plan.explain()
+        assert explained["client_predicates"] == [
+            "Status ne 'Closed'",
+            "Priority ge 3",
+        ]
+        assert "Priority: not indexed -> client" in explained["notes"]
+
+    def test_indexed_created_keeps_created_order(self) -> None:
+        plan = query_planner.plan_query(
+            [
+                _planned(
+                    "createdDateTime", "ge", "2025-01-01T00:00:00Z", "datetime"
+                )
+            ],
+            {"created"},
+        )
+
+        assert plan.filter_expr == "createdDateTime ge 2025-01-01T00:00:00Z"
+        assert plan.orderby == query_planner.LEGACY_ORDERBY
+
+    def test_created_datetime_stays_server_side_without_index(self) -> None:
+        plan = query_planner.plan_query(
+            [
+                _planned(
+                    "createdDateTime", "ge", "2025-01-01T00:00:00Z", "datetime"
+                ),
+                _planned("Title", "eq", "a"),
+            ],
+            {"id"},
+        )
+
+        assert plan.filter_expr == "createdDateTime ge 2025-01-01T00:00:00Z"
+        assert [p.field_name for p in plan.client] == ["Title"]
+        assert plan.orderby == query_planner.ID_ORDERBY
+
+    def test_no_predicates_keep_legacy_order(self) -> None:
+        for indexed in (None, {"id"}, {"id", "created"}):
+            plan = query_planner.plan_query([], indexed)
+
+            assert plan.orderby == query_planner.LEGACY_ORDERBY
+            assert plan.filter_expr is None
+            assert plan.prefer_non_indexed is False
+
+    def test_evaluate_condition(self) -> None:
+        def check(op: str, value: Any, actual: Any, vt: str | None = None):
+            cond = filters.FilterCondition("F", op, value, vt)
+            return query_planner.evaluate_condition(cond, actual)
+
+        assert check("eq", "open", "Open")
+        assert check("ge", 3, 3.5, "number")
+        assert check("lt", "10", 9)
+        assert not check("gt", 3, "n/a", "number")
+        assert check("contains", "BUG", "minor bug fix")
+        assert check("eq", "b", ["a", "b"])
+        assert check("ne", "c", ["a", "b"])
+        assert check("ne", "x", None)
+        assert not check("eq", "x", None)
+        assert check("eq", True, "true", "bool")
+        assert check("le", "2025-02-01T00:00:00Z", "2025-01-31T23:00:00Z")
+
+    def test_evaluate_condition_compares_datetimes_by_instant(self) -> None:
+        def check(op: str, value: Any, actual: Any, vt: str | None = None):
+            cond = filters.FilterCondition("F", op, value, vt)
+            return query_planner.evaluate_condition(cond, actual)
+
+        # Same instant in different notations / offsets.
+        assert check("eq", "2025-01-31T23:00:00Z", "2025-02-01T08:00:00+09:00")
+        assert check("eq", "2025-01-31T23:00:00.000Z", "2025-01-31T23:00:00Z")
+        # Lexicographic order would get these wrong.
+        assert check("lt", "2025-01-31T23:30:00Z", "2025-02-01T08:00:00+09:00")
+        assert check("ge", "2025-01-31", "2025-01-31T00:00:00Z", "datetime")
+        # Naive values are taken as UTC.
+        assert check("eq", "2025-01-31T23:00:00", "2025-01-31T23:00:00Z")
+        assert not check("gt", "2025-01-01T00:00:00Z", "soon", "datetime")
+        assert check("ne", "2025-01-01T00:00:00Z", "soon", "datetime")
+
+
+def _items_page(
+    rows: list[dict[str, Any]], next_token: str | None = None
+) -> dict[str, Any]:
+    page: dict[str, Any] = {
+        "value": [
+            {"id": fields["id"], "fields": dict(fields)} for fields in rows
+        ]
+    }
+    if next_token:
+        page["@odata.nextLink"] = (
+            "https://graph.microsoft.com/v1.0/sites/s/lists/l/items"
+            f"?$skiptoken={next_token}"
+        )
+    return page
+
+
+class TestPlannedListItems:
+    @patch("app.sharepoint_list.internal.http_client.requests.request")
+    def test_pushes_indexed_predicates_and_filters_rest_client_side(
+        self, mock_request: Mock
+    ) -> None:
+        mock_resp = json_response_mock()
+        mock_resp.status_code = 200
+        mock_resp.text = "{}"
+        mock_resp.json.side_effect = [
+            _indexed_columns(),
+            _items_page(
+                [
+                    {"id": "9", "Title": "a", "Priority": 1},
+                    {"id": "8", "Title": "b", "Priority": 5},
+                ],
+                next_token="p2",
+            ),
+            _items_page(
+                [
+                    {"id": "7", "Title": "c", "Priority": 4},
+                    {"id": "6", "Title": "d", "Priority": 2},
+                ],
+                next_token="p3",
+            ),
+        ]
+        mock_request.return_value = mock_resp
+
+        result = operations.list_items(
+            access_token="test-token",
+            target=_target(),
+            select_fields="Title",
+            page_size=2,
+            filters_raw=(
+                '[{"field": "ステータス", "op": "eq", "value": "Open"},'
+                ' {"field": "優先度", "op": "ge", "value": 3,'
+                ' "type": "number"}]'
+            ),
+        )
+
+        assert [item["id"] for item in result["items"]] == ["8", "7"]
+        # Priority was fetched only to evaluate the predicate.
+        assert result["items"][0]["fields"] == {"id": "8", "Title": "b"}
+        assert result["next_page_token"] == "p3"
+        first_page = mock_request.call_args_list[1].kwargs
+        assert first_page["params"]["$filter"] == "fields/Status eq 'Open'"
+        assert first_page["params"]["$orderby"] == "fields/ID desc"
+        assert first_page["params"]["$top"] == (
+            operations.CLIENT_FILTER_PAGE_SIZE
+        )
+        assert first_page["params"]["$expand"] == (
+            "fields($select=Title,Priority)"
+        )
+        assert "Prefer" not in (first_page["headers"] or {})
+        second_page = mock_request.call_args_list[2].kwargs
+        assert second_page["params"]["$skiptoken"] == "p2"
+
+    @patch("app.sharepoint_list.internal.http_client.requests.request")
+    def test_unfiltered_order_does_not_depend_on_earlier_calls(
+        self, mock_request: Mock
+    ) -> None:
+        mock_resp = json_response_mock()
+        mock_resp.status_code = 200
+        mock_resp.text = "{}"
+        mock_resp.json.side_effect = [
+            _indexed_columns(),
+            {"value": []},
+            {"value": []},
+        ]
+        mock_request.return_value = mock_resp
+
+        # A filtered call sees that Created is not indexed...
+        operations.list_items(
+            access_token="test-token",
+            target=_target(),
+            select_fields=None,
+            filters_raw='{"field": "ステータス", "op": "eq", "value": "a"}',
+        )
+        # ...which must not change the order of an unfiltered listing.
+        operations.list_items(
+            access_token="test-token", target=_target(), select_fields=None
+        )
+
+        assert mock_request.call_count == 3
+        orders = [
+            call.kwargs["params"]["$orderby"]
+            for call in mock_request.call_args_list[1:]
+        ]
+        assert orders == ["fields/ID desc", "createdDateTime desc"]
+
+    @patch("app.sharepoint_list.internal.http_client.requests.request")
+    def test_client_filtering_returns_page_size_and_resumes_mid_page(
+        self, mock_request: Mock
+    ) -> None:
+        rows = [
+            {"id": str(n), "Title": "t", "Priority": n % 2}
+            for n in range(10, 0, -1)
+        ]
+        mock_resp = json_response_mock()
+        mock_resp.status_code = 200
+        mock_resp.text = "{}"
+        mock_resp.json.side_effect = [
+            _indexed_columns(),
+            _items_page(rows, next_token="p2"),
+            _indexed_columns(),
+            _items_page(rows, next_token="p2"),
+            _items_page([]),
+        ]
+        mock_request.return_value = mock_resp
+        kwargs: dict[str, Any] = {
+            "access_token": "test-token",
+            "target": _target(),
+            "select_fields": "Title",
+            "page_size": 3,
+            "filters_raw": (
+                '{"field": "優先度", "op": "eq", "value": 1, "type": "number"}'
+            ),
+        }
+
+        first = operations.list_items(**kwargs)
+        second = operations.list_items(
+            **kwargs, page_token=first["next_page_token"]
+        )
+
+        assert [item["id"] for item in first["items"]] == ["9", "7", "5"]
+        assert [item["id"] for item in second["items"]] == ["3", "1"]
+        assert second["next_page_token"] is None
+        # The resumed call re-reads the same Graph page, then moves on.
+        pages = [call.kwargs["params"] for call in mock_request.call_args_list]
+        assert "$skiptoken" not in pages[3]
+        assert pages[4]["$skiptoken"] == "p2"
+
+    def test_invalid_scan_token_is_rejected(self) -> None:
+        with pytest.raises(ValueError, match="page_token"):
+            operations._parse_scan_token("scan:x:p2")
+        assert operations._parse_scan_token("scan:4:p2") == ("p2", 4)
+        assert operations._parse_scan_token("p2") == ("p2", 0)
+
+    @patch("app.sharepoint_list.internal.http_client.requests.request")
+    def test_aggregate_items_applies_client_predicates(
+        self, mock_request: Mock
+    ) -> None:
+        mock_resp = json_response_mock()
+        mock_resp.status_code = 200
+        mock_resp.text = "{}"
+        mock_resp.json.side_effect = [
+            _indexed_columns(),
+            _items_page(
+                [
+                    {"id": "3", "Status": "Open", "Priority": 1},
+                    {"id": "2", "Status": "Open", "Priority": 4},
+                    {"id": "1", "Status": "Done", "Priority": 5},
+                ]
+            ),
+        ]
+        mock_request.return_value = mock_resp
+
+        result = operations.aggregate_items(
+            access_token="test-token",
+            target=_target(),
+            group_by="Status",
+            aggregates="count",
+            filters_raw='{"field": "Priority", "op": "gt", "value": 2}',
+        )
+
+        assert result["rows"] == [["Done", 1], ["Open", 1]]
+        assert result["scanned_items"] == 2
+        assert result["read_items"] == 3
+        params = mock_request.call_args.kwargs["params"]
+        assert "$filter" not in params
+        assert params["$expand"] == "fields($select=Status,Priority)"
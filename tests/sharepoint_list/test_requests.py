@@ -174,7 +174,7 @@ class TestBuildListColumnsRequest:
             req.url
             == "https://graph.microsoft.com/v1.0/sites/site123/lists/list456/columns"
         )
-        assert req.params == {"$select": "name,displayName,choice"}
+        assert req.params == {"$select": "name,displayName,choice,indexed"}
 
     def test_list_columns_requires_inputs(self) -> None:
         with pytest.raises(ValueError):
@@ -229,3 +229,42 @@ class TestBuildListItemsRequest:
             request_builders.build_list_items_request(
                 site_id="x", list_id="y", top=0
             )
+
+
+class TestBuildBatchRequest:
+    def test_wraps_requests_with_relative_urls(self) -> None:
+        item_req = request_builders.build_get_item_request(
+            site_id="site123",
+            list_id="list456",
+            item_id="7",
+            select_fields=["Title", "Status"],
+        )
+        req = request_builders.build_batch_request([item_req])
+        assert req.method == "POST"
+        assert req.url == "https://graph.microsoft.com/v1.0/$batch"
+        assert req.json == {
+            "requests": [
+                {
+                    "id": "0",
+                    "method": "GET",
+                    "url": (
+                        "/sites/site123/lists/list456/items/7"
+                        "?$expand=fields($select=Title,Status)"
+                    ),
+                }
+            ]
+        }
+
+    def test_rejects_empty_or_oversized_batches(self) -> None:
+        item_req = request_builders.build_get_item_request(
+            site_id="site123",
+            list_id="list456",
+            item_id="1",
+            select_fields=None,
+        )
+        with pytest.raises(ValueError):
+            request_builders.build_batch_request([])
+        with pytest.raises(ValueError):
+            request_builders.build_batch_request(
+                [item_req] * (request_builders.MAX_BATCH_REQUESTS + 1)
+            )
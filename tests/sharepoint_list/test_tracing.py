@@ -0,0 +1,203 @@
+"""Tests for operation tracing (tracing.py)."""
+
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from app.sharepoint_list.internal import operations, tracing, validators
+from tests.sharepoint_list._mock_response import json_response_mock
+
+SITE_ID = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+LIST_ID = "b2c3d4e5-f6a7-8901-bcde-f12345678901"
+
+
+def _logged_payloads(mock_logger: Mock) -> list[dict]:
+    return [
+        json.loads(call.args[0]) for call in mock_logger.info.call_args_list
+    ]
+
+
+def _mock_list_response(mock_request: Mock) -> None:
+    mock_resp = json_response_mock()
+    mock_resp.status_code = 200
+    mock_resp.text = "{}"
+    mock_resp.json.side_effect = [
+        {"value": [{"name": "Title", "displayName": "Title"}]},
+        {"value": [{"id": "1", "fields": {"Title": "A"}}]},
+    ]
+    mock_request.return_value = mock_resp
+
+
+def _list_items() -> dict:
+    target = validators.TargetSpec(
+        site_identifier=SITE_ID, list_identifier=LIST_ID
+    )
+    return operations.list_items(
+        access_token="test-token", target=target, select_fields="Title"
+    )
+
+
+class TestParseSettings:
+    """parse_settings のテスト"""
+
+    def test_defaults(self) -> None:
+        assert tracing.parse_settings(None, None, None) == (
+            tracing.TraceSettings(enabled=False, sample_rate=1.0)
+        )
+
+    def test_sample_rate_is_clamped_and_tolerant(self) -> None:
+        assert tracing.parse_settings("on", "0.25", "r").sample_rate == 0.25
+        assert tracing.parse_settings("on", "7", None).sample_rate == 1.0
+        assert tracing.parse_settings("on", "-1", None).sample_rate == 0.0
+        assert tracing.parse_settings("on", "x", None).sample_rate == 1.0
+
+
+class TestSpans:
+    """span / phase / 遅延ペイロードのテスト"""
+
+    def test_disabled_uses_noop_span_and_skips_lazy_data(self) -> None:
+        builder = Mock(return_value={})
+
+        @tracing.traced("op")
+        def op() -> tracing.Span | tracing.NoopSpan | None:
+            with tracing.phase("request"):
+                operations._log_debug("loc", "msg", builder)
+            return tracing.current()
+
+        with patch.dict(os.environ, {"SHAREPOINT_LIST_DEBUG_LOG": "0"}):
+            assert op() is tracing.NOOP_SPAN
+        builder.assert_not_called()
+        assert tracing.current() is None
+
+    @patch("app.sharepoint_list.internal.debug_logging.get_debug_logger")
+    def test_sampled_out_operation_emits_nothing(
+        self, mock_get_debug_logger: Mock
+    ) -> None:
+        mock_logger = Mock()
+        mock_get_debug_logger.return_value = mock_logger
+
+        @tracing.traced("op")
+        def op() -> bool:
+            operations._log_debug("loc", "msg", {"k": 1})
+            return operations._is_debug_log_enabled()
+
+        with patch.dict(
+            os.environ,
+            {
+                "SHAREPOINT_LIST_DEBUG_LOG": "1",
+                "SHAREPOINT_LIST_TRACE_SAMPLE_RATE": "0",
+            },
+        ):
+            assert op() is False
+        mock_logger.info.assert_not_called()
+
+    @patch("app.sharepoint_list.internal.debug_logging.get_debug_logger")
+    def test_span_summary_reports_error_and_trace_id(
+        self, mock_get_debug_logger: Mock
+    ) -> None:
+        mock_logger = Mock()
+        mock_get_debug_logger.return_value = mock_logger
+
+        @tracing.traced("op")
+        def op() -> None:
+            operations._log_debug("loc", "msg", lambda: {"k": 1})
+            raise ValueError("boom")
+
+        with patch.dict(os.environ, {"SHAREPOINT_LIST_DEBUG_LOG": "1"}):
+            try:
+                op()
+            except ValueError:
+                pass
+
+        event, summary = _logged_payloads(mock_logger)
+        assert event["data"] == {"k": 1}
+        assert summary["message"] == "span"
+        assert summary["data"]["status"] == "error"
+        assert summary["data"]["error_type"] == "ValueError"
+        assert event["traceId"] == summary["traceId"]
+
+    @patch("app.sharepoint_list.internal.debug_logging.get_debug_logger")
+    def test_metrics_are_summed_into_the_span_summary(
+        self, mock_get_debug_logger: Mock
+    ) -> None:
+        mock_logger = Mock()
+        mock_get_debug_logger.return_value = mock_logger
+
+        @tracing.traced("op")
+        def op() -> None:
+            tracing.metric("hedged_requests")
+            tracing.metric("hedged_requests")
+            tracing.metric("circuit_rejected", 3)
+
+        tracing.metric("outside_a_span")
+        with patch.dict(os.environ, {"SHAREPOINT_LIST_DEBUG_LOG": "1"}):
+            op()
+
+        (summary,) = _logged_payloads(mock_logger)
+        assert summary["data"]["metrics"] == {
+            "hedged_requests": 2,
+            "circuit_rejected": 3,
+        }
+
+    def test_bind_carries_span_into_worker_threads(self) -> None:
+        with patch.dict(os.environ, {"SHAREPOINT_LIST_DEBUG_LOG": "1"}):
+
+            @tracing.traced("op")
+            def op() -> list[bool]:
+                span = tracing.current()
+                probe = tracing.bind(lambda _: tracing.current() is span)
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    return list(executor.map(probe, range(4)))
+
+            with patch(
+                "app.sharepoint_list.internal.debug_logging"
+                ".emit_debug_payload"
+            ):
+                assert op() == [True] * 4
+
+
+class TestOperationTracing:
+    """operations のフェーズ計測"""
+
+    @patch("app.sharepoint_list.internal.debug_logging.get_debug_logger")
+    @patch("app.sharepoint_list.internal.http_client.requests.request")
+    def test_list_items_span_records_phases(
+        self, mock_request: Mock, mock_get_debug_logger: Mock
+    ) -> None:
+        mock_logger = Mock()
+        mock_get_debug_logger.return_value = mock_logger
+        _mock_list_response(mock_request)
+
+        with patch.dict(os.environ, {"SHAREPOINT_LIST_DEBUG_LOG": "1"}):
+            result = _list_items()
+
+        assert result["items"][0]["fields"] == {"Title": "A"}
+        payloads = _logged_payloads(mock_logger)
+        summary = payloads[-1]
+        assert summary["location"] == "tracing:list_items"
+        assert summary["data"]["status"] == "ok"
+        assert set(summary["data"]["phases_ms"]) == {
+            "resolve_site",
+            "resolve_list",
+            "columns",
+            "request",
+            "postprocess",
+        }
+        assert {p["traceId"] for p in payloads} == {summary["traceId"]}
+
+    @patch("app.sharepoint_list.internal.debug_logging.get_debug_logger")
+    @patch("app.sharepoint_list.internal.http_client.requests.request")
+    def test_list_items_without_tracing_logs_nothing(
+        self, mock_request: Mock, mock_get_debug_logger: Mock
+    ) -> None:
+        mock_logger = Mock()
+        mock_get_debug_logger.return_value = mock_logger
+        _mock_list_response(mock_request)
+
+        with patch.dict(os.environ, {"SHAREPOINT_LIST_DEBUG_LOG": "0"}):
+            _list_items()
+
+        mock_get_debug_logger.assert_not_called()
@@ -116,3 +116,21 @@ class TestIsGuid:
 
     def test_invalid_guid(self) -> None:
         assert validators.is_guid("not-a-guid") is False
+
+
+class TestParseItemIds:
+    def test_parses_comma_separated_and_dedupes(self) -> None:
+        assert validators.parse_item_ids(" 3, '1',3 ,,2") == ["3", "1", "2"]
+
+    def test_parses_json_array(self) -> None:
+        assert validators.parse_item_ids('[5, "6"]') == ["5", "6"]
+
+    def test_rejects_empty_invalid_or_too_many(self) -> None:
+        with pytest.raises(ValueError):
+            validators.parse_item_ids(" , ")
+        with pytest.raises(ValueError):
+            validators.parse_item_ids("[1,")
+        with pytest.raises(ValueError):
+            validators.parse_item_ids([{"id": 1}])
+        with pytest.raises(ValueError):
+            validators.parse_item_ids(list(range(validators.MAX_ITEM_IDS + 1)))
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+MODULE_PATH = BASE_DIR / "bin" / "agents_branch_eval.py"
+SPEC = importlib.util.spec_from_file_location(
+    "agents_branch_eval", MODULE_PATH
+)
+assert SPEC is not None
+assert SPEC.loader is not None
+branch_eval = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = branch_eval
+SPEC.loader.exec_module(branch_eval)
+
+
+@pytest.fixture
+def results_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    root = tmp_path / "results"
+    monkeypatch.setattr(branch_eval, "RESULTS_ROOT", root)
+    monkeypatch.setattr(
+        branch_eval,
+        "preflight",
+        lambda: {"package_gate_available": True, "dify_path": "/bin/dify"},
+    )
+    return root
+
+
+def _cells(count: int) -> list[Any]:
+    task = branch_eval.get_task("BUG-01")
+    return [
+        branch_eval.MatrixCell(
+            task=task, branch=branch_eval.BRANCH_ARMS[0], rep=rep
+        )
+        for rep in range(1, count + 1)
+    ]
+
+
+def test_schedule_parent_cells_runs_cells_concurrently_in_order() -> None:
+    cells = _cells(3)
+    barrier = threading.Barrier(2, timeout=5)
+    finished: list[str] = []
+
+    def run_cell(cell: Any) -> dict[str, Any]:
+        if cell.rep <= 2:
+            # Both of the first two cells must be in flight at once.
+            barrier.wait()
+        return {"run_id": cell.run_id}
+
+    manifests = branch_eval.schedule_parent_cells(
+        cells,
+        run_cell,
+        workers=2,
+        on_result=lambda cell, _: finished.append(cell.run_id),
+    )
+
+    assert [item["run_id"] for item in manifests] == [
+        cell.run_id for cell in cells
+    ]
+    assert sorted(finished) == sorted(cell.run_id for cell in cells)
+
+
+def test_schedule_parent_cells_defers_cells_when_host_is_saturated() -> None:
+    cells = _cells(3)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def run_cell(cell: Any) -> dict[str, Any]:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return {"run_id": cell.run_id}
+
+    saturated = branch_eval.AdmissionPolicy(
+        max_load_per_cpu=1.0, probe=lambda: (4.0, None)
+    )
+
+    manifests = branch_eval.schedule_parent_cells(
+        cells, run_cell, workers=3, admission=saturated, poll_seconds=0.01
+    )
+
+    assert len(manifests) == 3
+    assert peak == 1
+
+
+def test_admission_policy_checks_load_and_memory() -> None:
+    def policy(load: float | None, memory: int | None) -> Any:
+        return branch_eval.AdmissionPolicy(
+            max_load_per_cpu=1.5,
+            min_available_mb=1024,
+            probe=lambda: (load, memory),
+        )
+
+    assert policy(0.5, 4096).admits()
+    assert policy(None, None).admits()
+    assert not policy(2.0, 4096).admits()
+    assert not policy(0.5, 512).admits()
+
+
+def test_run_parent_matrix_resumes_and_streams_manifest(
+    results_root: Path,
+) -> None:
+    task = branch_eval.get_task("BUG-01")
+    done_cell = branch_eval.MatrixCell(
+        task=task, branch=branch_eval.branch_order_for_rep(1)[0], rep=1
+    )
+    done_dir = results_root / "parent_runs" / done_cell.run_id
+    done_dir.mkdir(parents=True)
+    branch_eval.write_json(
+        done_dir / "run_manifest.json",
+        {
+            "run_id": done_cell.run_id,
+            "harness_revision": branch_eval.HARNESS_REVISION,
+        },
+    )
+    executed: list[str] = []
+
+    def run_cell(cell: Any) -> dict[str, Any]:
+        executed.append(cell.run_id)
+        return {"run_id": cell.run_id, "error": "worktree add failed"}
+
+    manifests = branch_eval.run_parent_matrix(
+        results_root / "worktrees",
+        60,
+        task_filter={"BUG-01"},
+        reps={1},
+        workers=2,
+        run_cell=run_cell,
+    )
+
+    assert [item["run_id"] for item in manifests] == [
+        f"BUG-01__{branch.alias}__r1"
+        for branch in branch_eval.branch_order_for_rep(1)
+    ]
+    assert executed == [manifests[1]["run_id"]]
+    lines = (
+        (results_root / "parent_runs" / branch_eval.MATRIX_MANIFEST_NAME)
+        .read_text(encoding="utf-8")
+        .splitlines()
+    )
+    entries = [json.loads(line) for line in lines]
+    assert [(entry["run_id"], entry["status"]) for entry in entries] == [
+        (executed[0], "error")
+    ]
+
+
+def _write_parent_manifest(
+    results_root: Path, run_id: str, *, alias: str, **extra: Any
+) -> Path:
+    run_dir = results_root / "parent_runs" / run_id
+    run_dir.mkdir(parents=True, exist_ok=True)
+    manifest = {
+        "run_id": run_id,
+        "harness_revision": branch_eval.HARNESS_REVISION,
+        "task_id": "BUG-01",
+        "kind": "edit",
+        "branch_alias": alias,
+        "rep": 1,
+        "gates": {"ruff": {"returncode": 0}},
+        **extra,
+    }
+    branch_eval.write_json(run_dir / "run_manifest.json", manifest)
+    return run_dir / "run_manifest.json"
+
+
+def test_score_parent_runs_rescores_only_new_or_changed_manifests(
+    results_root: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    scored: list[str] = []
+
+    def fake_score(manifest: dict[str, Any]) -> dict[str, Any]:
+        scored.append(manifest["run_id"])
+        return {
+            "hard_fail": False,
+            "hard_fail_reasons": [],
+            "dimensions": {},
+            "overall": float(manifest.get("points", 3.0)),
+        }
+
+    monkeypatch.setattr(branch_eval, "score_manifest", fake_score)
+    alias_a = branch_eval.BRANCH_ARMS[0].alias
+    alias_b = branch_eval.BRANCH_ARMS[1].alias
+    _write_parent_manifest(results_root, "run-a", alias=alias_a)
+    changed = _write_parent_manifest(results_root, "run-b", alias=alias_b)
+
+    first = branch_eval.score_parent_runs()
+    assert sorted(scored) == ["run-a", "run-b"]
+    assert first["run_count"] == 2
+
+    scored.clear()
+    again = branch_eval.score_parent_runs()
+    assert scored == []
+    assert again == first
+
+    _write_parent_manifest(results_root, "run-b", alias=alias_b, points=5.0)
+    changed.touch()
+    updated = branch_eval.score_parent_runs()
+    assert scored == ["run-b"]
+    assert updated["aliases"][alias_b]["mean_overall"] == 5.0
+
+    scored.clear()
+    (results_root / "parent_runs" / "run-a" / "run_manifest.json").unlink()
+    pruned = branch_eval.score_parent_runs()
+    assert scored == []
+    assert pruned["run_count"] == 1
+
+    branch_eval.score_parent_runs(full_rescore=True)
+    assert scored == ["run-b"]
+
+
+def test_summarize_scores_uses_stored_gate_flags(results_root: Path) -> None:
+    alias = branch_eval.BRANCH_ARMS[0].alias
+    run = {
+        "run_id": "missing-manifest",
+        "task_id": "BUG-01",
+        "branch_alias": alias,
+        "rep": 1,
+        "score": {
+            "hard_fail": False,
+            "hard_fail_reasons": [],
+            "dimensions": {},
+            "overall": 4.0,
+        },
+        "gate_flags": {
+            "active_gate_pass": True,
+            "package_pass": True,
+            "one_pass": False,
+        },
+    }
+
+    summary = branch_eval.summarize_scores([run])
+
+    assert summary["active_gate_pass"] == {alias: 1}
+    assert summary["package_pass_rate"] == {alias: 1.0}
+    assert summary["one_pass_pass_rate"] == {alias: 0.0}
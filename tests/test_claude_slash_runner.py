@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+MODULE_PATH = BASE_DIR / "bin" / "claude_slash_runner.py"
+SPEC = importlib.util.spec_from_file_location(
+    "claude_slash_runner", MODULE_PATH
+)
+assert SPEC is not None
+assert SPEC.loader is not None
+runner = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = runner
+SPEC.loader.exec_module(runner)
+
+DAG_COMMAND = """---
+name: dag runner
+version: 1.2
+---
+usage_command: |
+  /dag-debug-enhanced target
+  /dagrunner target
+"""
+
+
+@pytest.fixture
+def commands_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    directory = tmp_path / "commands"
+    directory.mkdir()
+    (directory / "dag-debug-enhanced.md").write_text(
+        DAG_COMMAND, encoding="utf-8"
+    )
+    (directory / "deploy.md").write_text("name: deploy\n", encoding="utf-8")
+    monkeypatch.setattr(runner, "COMMANDS_DIR", directory)
+    monkeypatch.setenv(runner.INDEX_CACHE_ENV, str(tmp_path / "index.json"))
+    return directory
+
+
+def test_load_catalog_reparses_only_changed_files(
+    commands_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    parsed: list[str] = []
+    original = runner.parse_command_file
+
+    def counting_parse(path: Path) -> dict[str, object]:
+        parsed.append(path.name)
+        return original(path)
+
+    monkeypatch.setattr(runner, "parse_command_file", counting_parse)
+
+    index, _ = runner.load_catalog()
+    assert sorted(parsed) == ["dag-debug-enhanced.md", "deploy.md"]
+    assert index["/dagrunner"]["meta"] == {
+        "name": "dag runner",
+        "version": "1.2",
+    }
+
+    parsed.clear()
+    cached_index, _ = runner.load_catalog()
+    assert parsed == []
+    assert cached_index["/dagrunner"]["path"] == index["/dagrunner"]["path"]
+
+    deploy = commands_dir / "deploy.md"
+    deploy.write_text("name: deploy v2\n", encoding="utf-8")
+    stat = deploy.stat()
+    os.utime(deploy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    (commands_dir / "dag-debug-enhanced.md").unlink()
+    updated, trie = runner.load_catalog()
+    assert parsed == ["deploy.md"]
+    assert sorted(updated) == ["/deploy"]
+    assert trie.complete("/d") == ["/deploy"]
+
+
+def test_load_catalog_ignores_cache_from_other_checkout(
+    commands_dir: Path, tmp_path: Path
+) -> None:
+    cache_path = tmp_path / "index.json"
+    cache_path.write_text(
+        json.dumps(
+            {
+                "version": runner.INDEX_CACHE_VERSION,
+                "commands_dir": "/elsewhere",
+                "files": {"stale.md": {"names": ["/stale"]}},
+                "trie": {},
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    index, _ = runner.load_catalog()
+
+    assert "/stale" not in index
+    assert "/deploy" in index
+
+
+def test_name_trie_prefix_and_fuzzy_lookup() -> None:
+    trie = runner.NameTrie.from_names(["/dagrunner", "/deploy", "/docs"])
+
+    assert trie.complete("/d") == ["/dagrunner", "/deploy", "/docs"]
+    assert trie.complete("/de") == ["/deploy"]
+    assert trie.complete("/x") == []
+    assert trie.fuzzy("/deplyo") == [(2, "/deploy")]
+    assert trie.fuzzy("/dosc", max_distance=1) == []
+
+
+def test_lookup_command_resolves_prefix_and_fuzzy_matches(
+    commands_dir: Path,
+) -> None:
+    index, trie = runner.load_catalog()
+
+    rec, _ = runner.lookup_command("/dag", index, trie)
+    assert rec is index["/dag-debug-enhanced"]
+    rec, _ = runner.lookup_command("/dagrunnr", index, trie)
+    assert rec is index["/dagrunner"]
+    rec, candidates = runner.lookup_command("/d", index, trie)
+    assert rec is None
+    assert "/deploy" in candidates
+    assert runner.lookup_command("/zzzzzz", index, trie) == (None, [])
+
+
+def test_cmd_run_reports_the_resolved_command_name(
+    commands_dir: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    runner.cmd_run(argparse.Namespace(command="/dag target"))
+    resolved = capsys.readouterr().out.splitlines()
+    runner.cmd_run(argparse.Namespace(command="/dagrunner target"))
+    exact = capsys.readouterr().out.splitlines()
+
+    assert resolved[:2] == [
+        "Command: /dag-debug-enhanced (matched from '/dag')",
+        "Args: target",
+    ]
+    assert exact[0] == "Command: /dagrunner"
@@ -5,8 +5,11 @@ import io
 import json
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import pytest
+
 MODULE_PATH = Path(__file__).resolve().parents[1] / "bin" / "pip_audit_gate.py"
 SPEC = importlib.util.spec_from_file_location("pip_audit_gate", MODULE_PATH)
 assert SPEC is not None
@@ -154,3 +157,230 @@ def test_audit_requirements_propagates_blocking_failure_without_waivers() -> (
     assert exit_code == 2
     assert "pip-audit failed" in stderr.getvalue()
     assert "applying configured waivers" not in stderr.getvalue()
+
+
+def _write_requirements(tmp_path: Path, name: str, content: str) -> Path:
+    path = tmp_path / name
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def test_audit_requirements_parallel_uses_one_json_run_per_file(
+    tmp_path: Path,
+) -> None:
+    requirements = [
+        _write_requirements(tmp_path, "a.txt", "flask==1.0.0\n"),
+        _write_requirements(tmp_path, "b.txt", "requests==1.0.0\n"),
+    ]
+    recorded_commands: list[list[str]] = []
+
+    def runner(command: list[str]) -> subprocess.CompletedProcess[str]:
+        recorded_commands.append(command)
+        return _completed_process(command, stdout=_build_payload({}))
+
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    exit_code = pip_audit_gate.audit_requirements_parallel(
+        requirements,
+        jobs=2,
+        snapshot="2026-10-19",
+        runner=runner,
+        executor_factory=ThreadPoolExecutor,
+        out=stdout,
+        err=stderr,
+    )
+
+    assert exit_code == 0
+    assert len(recorded_commands) == len(requirements)
+    assert all(command[-2:] == ["-f", "json"] for command in recorded_commands)
+    output = stdout.getvalue()
+    assert output.index("a.txt") < output.index("b.txt")
+    assert "No waivers configured." in output
+    assert stderr.getvalue() == ""
+
+
+def test_audit_requirements_parallel_blocks_unwaived_vulnerabilities(
+    tmp_path: Path,
+) -> None:
+    requirements = [_write_requirements(tmp_path, "a.txt", "flask\n")]
+
+    def runner(command: list[str]) -> subprocess.CompletedProcess[str]:
+        return _completed_process(
+            command,
+            returncode=1,
+            stdout=_build_payload({"flask": ["CVE-2026-27205"]}),
+        )
+
+    stderr = io.StringIO()
+    exit_code = pip_audit_gate.audit_requirements_parallel(
+        requirements,
+        jobs=1,
+        snapshot="s1",
+        runner=runner,
+        executor_factory=ThreadPoolExecutor,
+        out=io.StringIO(),
+        err=stderr,
+    )
+
+    assert exit_code == 1
+    assert "- CVE-2026-27205 (flask)" in stderr.getvalue()
+
+
+def test_audit_requirements_parallel_propagates_tool_failure(
+    tmp_path: Path,
+) -> None:
+    requirements = [_write_requirements(tmp_path, "a.txt", "flask\n")]
+
+    def runner(command: list[str]) -> subprocess.CompletedProcess[str]:
+        return _completed_process(
+            command, returncode=2, stderr="resolution failed\n"
+        )
+
+    stderr = io.StringIO()
+    exit_code = pip_audit_gate.audit_requirements_parallel(
+        requirements,
+        jobs=1,
+        snapshot="s1",
+        runner=runner,
+        executor_factory=ThreadPoolExecutor,
+        out=io.StringIO(),
+        err=stderr,
+    )
+
+    assert exit_code == 2
+    assert "resolution failed" in stderr.getvalue()
+    assert "pip-audit JSON run failed" in stderr.getvalue()
+
+
+def test_audit_requirements_parallel_reuses_cached_payload(
+    tmp_path: Path,
+) -> None:
+    requirements = [_write_requirements(tmp_path, "a.txt", "flask\n")]
+    cache_dir = tmp_path / "cache"
+    calls: list[list[str]] = []
+
+    def runner(command: list[str]) -> subprocess.CompletedProcess[str]:
+        calls.append(command)
+        return _completed_process(command, stdout=_build_payload({}))
+
+    def audit(snapshot: str) -> str:
+        stdout = io.StringIO()
+        exit_code = pip_audit_gate.audit_requirements_parallel(
+            requirements,
+            jobs=1,
+            cache_dir=cache_dir,
+            snapshot=snapshot,
+            runner=runner,
+            executor_factory=ThreadPoolExecutor,
+            out=stdout,
+            err=io.StringIO(),
+        )
+        assert exit_code == 0
+        return stdout.getvalue()
+
+    audit("s1")
+    assert "(cached)" in audit("s1")
+    assert len(calls) == 1
+
+    audit("s2")
+    assert len(calls) == 2
+
+    requirements[0].write_text("flask\nrequests\n", encoding="utf-8")
+    audit("s2")
+    assert len(calls) == 3
+
+
+def test_audit_requirements_parallel_offline_applies_local_snapshot(
+    tmp_path: Path,
+) -> None:
+    requirements = [_write_requirements(tmp_path, "a.txt", "flask\n")]
+    cache = pip_audit_gate.AuditCache(tmp_path / "cache")
+    cache.store(
+        pip_audit_gate.requirements_cache_key(requirements[0]),
+        "s1",
+        json.loads(_build_payload({"flask": []})),
+    )
+
+    def runner(_: list[str]) -> subprocess.CompletedProcess[str]:
+        raise AssertionError("offline mode must not run pip-audit")
+
+    def audit(snapshot: list[dict[str, object]]) -> tuple[int, str]:
+        stderr = io.StringIO()
+        exit_code = pip_audit_gate.audit_requirements_parallel(
+            requirements,
+            jobs=1,
+            cache_dir=cache.directory,
+            snapshot="s2",
+            offline=True,
+            vulnerability_snapshot=snapshot,
+            runner=runner,
+            executor_factory=ThreadPoolExecutor,
+            out=io.StringIO(),
+            err=stderr,
+        )
+        return exit_code, stderr.getvalue()
+
+    assert audit([]) == (0, "")
+    exit_code, errors = audit(
+        [
+            {"id": "GHSA-new", "package": "Flask", "versions": ["1.0.0"]},
+            {"id": "GHSA-old", "package": "flask", "versions": ["0.9"]},
+        ]
+    )
+    assert exit_code == 1
+    assert "- GHSA-new (flask)" in errors
+    assert "GHSA-old" not in errors
+
+
+def test_audit_requirements_parallel_offline_requires_cached_result(
+    tmp_path: Path,
+) -> None:
+    requirements = [_write_requirements(tmp_path, "a.txt", "flask\n")]
+    stderr = io.StringIO()
+
+    exit_code = pip_audit_gate.audit_requirements_parallel(
+        requirements,
+        jobs=1,
+        cache_dir=tmp_path / "cache",
+        snapshot="s1",
+        offline=True,
+        executor_factory=ThreadPoolExecutor,
+        out=io.StringIO(),
+        err=stderr,
+    )
+
+    assert exit_code == 1
+    assert "no cached pip-audit result available offline" in stderr.getvalue()
+
+
+@pytest.mark.parametrize(
+    "option", [["--cache-dir", "cache"], ["--vuln-snapshot", "snapshot.json"]]
+)
+def test_main_routes_serial_mode_options_through_json_results(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, option: list[str]
+) -> None:
+    requirements = _write_requirements(tmp_path, "a.txt", "flask\n")
+    (tmp_path / "snapshot.json").write_text('{"vulnerabilities": []}')
+    calls: list[dict[str, object]] = []
+
+    def fail_serial(_: list[Path]) -> int:
+        raise AssertionError("serial mode ignores cache and snapshot options")
+
+    def parallel(paths: list[Path], **kwargs: object) -> int:
+        calls.append(kwargs)
+        return 0
+
+    monkeypatch.setattr(pip_audit_gate, "audit_requirements", fail_serial)
+    monkeypatch.setattr(
+        pip_audit_gate, "audit_requirements_parallel", parallel
+    )
+    monkeypatch.chdir(tmp_path)
+
+    assert pip_audit_gate.main([str(requirements), *option]) == 0
+    assert calls[0]["jobs"] == 1
+
+
+def test_main_rejects_offline_without_cache_dir(tmp_path: Path) -> None:
+    requirements = _write_requirements(tmp_path, "a.txt", "flask\n")
+
+    assert pip_audit_gate.main([str(requirements), "--offline"]) == 2
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+MODULE_PATH = BASE_DIR / "bin" / "plugin_import_benchmark.py"
+SPEC = importlib.util.spec_from_file_location(
+    "plugin_import_benchmark", MODULE_PATH
+)
+assert SPEC is not None
+assert SPEC.loader is not None
+benchmark = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = benchmark
+SPEC.loader.exec_module(benchmark)
+
+
+class FakeRunner:
+    def __init__(self, timings: dict[str, list[float]]) -> None:
+        self.timings = timings
+        self.calls: list[dict[str, Any]] = []
+
+    def __call__(
+        self, command: list[str], **kwargs: Any
+    ) -> subprocess.CompletedProcess[str]:
+        self.calls.append({"command": command, **kwargs})
+        module = command[-1]
+        if module not in self.timings:
+            return subprocess.CompletedProcess(
+                command, 1, "", f"ModuleNotFoundError: {module}\n"
+            )
+        return subprocess.CompletedProcess(
+            command, 0, f"{self.timings[module].pop(0)}\n", ""
+        )
+
+
+def test_read_warm_start_modules_from_plugin_main() -> None:
+    modules = benchmark.read_warm_start_modules(BASE_DIR / "app" / "nanobana")
+
+    assert "google.genai" in modules
+    assert "PIL.Image" in modules
+    assert (
+        benchmark.read_warm_start_modules(
+            BASE_DIR / "app" / "gpt5_agent_strategies"
+        )
+        == ()
+    )
+
+
+def test_discover_plugins_lists_app_directories_with_main() -> None:
+    names = [path.name for path in benchmark.discover_plugins()]
+
+    assert names == [
+        "gpt5_agent_strategies",
+        "nanobana",
+        "openai_gpt5_responses",
+        "sharepoint_list",
+    ]
+
+
+def test_measure_import_runs_a_fresh_interpreter(tmp_path: Path) -> None:
+    seconds = benchmark.measure_import("json", cwd=tmp_path)
+
+    assert seconds >= 0.0
+
+
+def test_measure_import_reports_failures(tmp_path: Path) -> None:
+    runner = FakeRunner({})
+
+    with pytest.raises(RuntimeError, match="import nope failed"):
+        benchmark.measure_import("nope", cwd=tmp_path, runner=runner)
+
+
+def test_measure_import_preloads_host_modules_before_timing(
+    tmp_path: Path,
+) -> None:
+    runner = FakeRunner({"heavy": [0.1, 0.2]})
+
+    benchmark.measure_import("heavy", cwd=tmp_path, runner=runner)
+    benchmark.measure_import("heavy", cwd=tmp_path, preload=(), runner=runner)
+
+    assert runner.calls[0]["command"][3:] == ["dify_plugin", "heavy"]
+    assert runner.calls[1]["command"][3:] == ["heavy"]
+
+
+def test_measure_import_excludes_preloaded_modules(tmp_path: Path) -> None:
+    seconds = benchmark.measure_import(
+        "json", cwd=tmp_path, preload=("json", "missing_host_module")
+    )
+
+    assert seconds < 0.01
+
+
+def test_benchmark_plugins_aggregates_runs(tmp_path: Path) -> None:
+    runner = FakeRunner({"heavy": [0.3, 0.1, 0.2]})
+
+    results = benchmark.benchmark_plugins(
+        [tmp_path], runs=3, modules=("heavy",), runner=runner
+    )
+
+    assert [result.to_dict() for result in results] == [
+        {
+            "plugin": tmp_path.name,
+            "module": "heavy",
+            "median_seconds": 0.2,
+            "min_seconds": 0.1,
+            "max_seconds": 0.3,
+            "runs": 3,
+        }
+    ]
+    assert all(call["cwd"] == tmp_path for call in runner.calls)
+
+
+def test_find_regressions_ignores_noise_and_new_modules() -> None:
+    results = [
+        benchmark.ImportBenchmark("p", "slow", (0.5,)),
+        benchmark.ImportBenchmark("p", "noisy", (0.015,)),
+        benchmark.ImportBenchmark("p", "new", (9.0,)),
+    ]
+    baseline = {
+        "results": [
+            {"plugin": "p", "module": "slow", "median_seconds": 0.2},
+            {"plugin": "p", "module": "noisy", "median_seconds": 0.005},
+        ]
+    }
+
+    assert benchmark.find_regressions(results, baseline) == [
+        "p: import slow took 0.500s (baseline 0.200s)"
+    ]
+
+
+def test_main_writes_report_and_fails_on_regression(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    plugin_dir = tmp_path / "plugin"
+    plugin_dir.mkdir()
+    (plugin_dir / "main.py").write_text('WARM_START_MODULES = ("json",)\n')
+    output = tmp_path / "report.json"
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(
+        json.dumps(
+            {
+                "results": [
+                    {
+                        "plugin": "plugin",
+                        "module": "json",
+                        "median_seconds": 0.001,
+                    }
+                ]
+            }
+        )
+    )
+    monkeypatch.setattr(
+        benchmark,
+        "measure_import",
+        lambda module, **_kwargs: 0.5,
+    )
+
+    exit_code = benchmark.main(
+        [
+            str(plugin_dir),
+            "--runs",
+            "2",
+            "--output",
+            str(output),
+            "--baseline",
+            str(baseline),
+        ]
+    )
+
+    report = json.loads(output.read_text())
+    assert exit_code == 1
+    assert report["results"][0]["median_seconds"] == 0.5
+    assert "REGRESSION plugin: import json" in capsys.readouterr().err
+    assert benchmark.main([str(plugin_dir), "--output", str(output)]) == 0
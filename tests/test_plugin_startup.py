@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import importlib
+import logging
+from pathlib import Path
+
+import pytest
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+PLUGIN_NAMES = (
+    "gpt5_agent_strategies",
+    "nanobana",
+    "openai_gpt5_responses",
+)
+
+startup = importlib.import_module("app.gpt5_agent_strategies.internal.startup")
+
+
+def test_startup_module_is_identical_across_plugins() -> None:
+    sources = {
+        name: (BASE_DIR / "app" / name / "internal" / "startup.py").read_text()
+        for name in PLUGIN_NAMES
+    }
+
+    assert len(set(sources.values())) == 1
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        (None, "off"),
+        ("", "off"),
+        ("Background", "background"),
+        (" blocking ", "blocking"),
+        ("eager", "off"),
+    ],
+)
+def test_resolve_warm_start_mode(
+    monkeypatch: pytest.MonkeyPatch, raw: str | None, expected: str
+) -> None:
+    if raw is None:
+        monkeypatch.delenv("PLUGIN_WARM_START", raising=False)
+    else:
+        monkeypatch.setenv("PLUGIN_WARM_START", raw)
+
+    assert startup.resolve_warm_start_mode() == expected
+
+
+def test_blocking_warm_start_imports_modules_and_runs_warmers(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    calls: list[str] = []
+
+    def failing_warmer() -> None:
+        raise RuntimeError("no credentials")
+
+    manager = startup.WarmStartManager(
+        ("json", "missing_module_for_warm_start"),
+        warmers=(
+            ("ok", lambda: calls.append("ok")),
+            ("broken", failing_warmer),
+        ),
+    )
+    manager.record_timing("register:plugin", 0.5)
+
+    with caplog.at_level(logging.INFO, logger=startup.__name__):
+        manager.start("blocking")
+
+    report = manager.report()
+    assert manager.wait(0)
+    assert calls == ["ok"]
+    assert report["mode"] == "blocking"
+    assert report["timings"]["import:json"] == 0.0
+    assert report["timings"]["register:plugin"] == 0.5
+    assert "warm:ok" in report["timings"]
+    assert set(report["errors"]) == {
+        "import:missing_module_for_warm_start",
+        "warm:broken",
+    }
+    assert report["errors"]["warm:broken"] == "RuntimeError: no credentials"
+    assert "plugin_warm_start" in caplog.text
+
+
+def test_background_warm_start_runs_on_daemon_thread() -> None:
+    import threading
+
+    thread_names: list[str] = []
+    manager = startup.WarmStartManager(
+        (),
+        warmers=(
+            (
+                "thread",
+                lambda: thread_names.append(threading.current_thread().name),
+            ),
+        ),
+    )
+
+    manager.start("background")
+
+    assert manager.wait(5)
+    assert thread_names == ["plugin-warm-start"]
+
+
+def test_off_mode_only_reports_registration(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    monkeypatch.delenv("PLUGIN_WARM_START", raising=False)
+    warmed: list[str] = []
+    manager = startup.WarmStartManager(
+        ("json",), warmers=(("never", lambda: warmed.append("x")),)
+    )
+    manager.record_timing("register:plugin", 0.25)
+
+    with caplog.at_level(logging.INFO, logger=startup.__name__):
+        manager.start()
+
+    assert manager.wait(0)
+    assert warmed == []
+    assert manager.report()["timings"] == {"register:plugin": 0.25}
+    assert '"mode": "off"' in caplog.text
+
+
+def test_timed_import_skips_loaded_modules() -> None:
+    assert startup.timed_import("json") == 0.0
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.sharepoint_list.internal import http_client, request_builders
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+MODULE_PATH = BASE_DIR / "bin" / "sharepoint_http_benchmark.py"
+SPEC = importlib.util.spec_from_file_location(
+    "sharepoint_http_benchmark", MODULE_PATH
+)
+assert SPEC is not None
+assert SPEC.loader is not None
+benchmark = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = benchmark
+SPEC.loader.exec_module(benchmark)
+
+FAST_RETRY = http_client.RetryConfig(
+    max_attempts=3, min_wait_seconds=0, max_wait_seconds=0, jitter=False
+)
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    samples = [float(value) for value in range(1, 101)]
+
+    assert benchmark.percentile(samples, 0.50) == 50.0
+    assert benchmark.percentile(samples, 0.95) == 95.0
+    assert benchmark.percentile(samples, 0.99) == 99.0
+    assert benchmark.percentile([], 0.99) == 0.0
+
+
+def test_responder_injects_faults_by_rate() -> None:
+    responder = benchmark.FaultInjectingResponder(
+        benchmark.FaultProfile(throttle_rate=1.0, retry_after=3)
+    )
+
+    response = responder({"path": "/v1.0/sites/s/lists/l/items"})
+
+    assert response.status == 429
+    assert response.headers == {"Retry-After": "3"}
+    assert responder.injected["throttle"] == 1
+
+
+def test_graph_body_answers_batches_by_item_id() -> None:
+    body = json.dumps(
+        {"requests": [{"id": "0", "method": "GET", "url": "/x/items/7?a=b"}]}
+    ).encode()
+
+    response = benchmark.graph_body({"path": "/v1.0/$batch", "body": body})
+
+    assert response["responses"][0]["body"]["id"] == "7"
+
+
+@pytest.mark.parametrize("scenario", benchmark.SCENARIOS)
+def test_run_scenario_counts_retries_and_restores_routing(
+    scenario: str,
+) -> None:
+    result = benchmark.run_scenario(
+        scenario,
+        calls=6,
+        concurrency=2,
+        faults=benchmark.FaultProfile(server_error_rate=0.3, reset_rate=0.1),
+        retry_config=FAST_RETRY,
+        circuit_breaker=False,
+    )
+
+    report = result.to_dict()
+    assert report["calls"] == 6
+    assert len(result.latencies_ms) == 6
+    assert report["server_requests"] >= 6
+    # Every injected fault is retried, except the last attempt of a call
+    # that then fails.
+    assert report["retries"] + sum(report["errors"].values()) == sum(
+        result.injected[name] for name in ("server_error", "reset")
+    )
+    assert report["retry_amplification"] >= 1.0
+    assert report["p50_ms"] <= report["p95_ms"] <= report["p99_ms"]
+    assert request_builders.GRAPH_BASE == "https://graph.microsoft.com/v1.0"
+    assert http_client.DEFAULT_RETRY_CONFIG.sleep is None
+    assert report["circuit_breaker"]["opened"] == 0
+
+
+def test_run_scenario_fails_fast_once_the_circuit_opens() -> None:
+    process_breaker = http_client.CIRCUIT_BREAKER
+    result = benchmark.run_scenario(
+        "request",
+        calls=10,
+        concurrency=1,
+        faults=benchmark.FaultProfile(server_error_rate=1.0),
+        retry_config=FAST_RETRY,
+    )
+
+    report = result.to_dict()
+    assert report["circuit_breaker"]["opened"] == 1
+    assert report["errors"]["CircuitOpenError"] >= 8
+    # Two calls reach the server: 3 + 2 attempts open the circuit.
+    assert report["server_requests"] == 5
+    assert http_client.CIRCUIT_BREAKER is process_breaker
+
+
+def _result(**overrides: object) -> object:
+    values = {
+        "scenario": "request",
+        "concurrency": 4,
+        "calls": 100,
+        "wall_seconds": 1.0,
+        "latencies_ms": [10.0] * 100,
+        "errors": {},
+        "server_requests": 100,
+        "retries": 0,
+        "sleep_seconds": 0.0,
+        "injected": {},
+    }
+    values.update(overrides)
+    return benchmark.ScenarioResult(**values)
+
+
+def test_find_regressions_checks_latency_throughput_and_retries() -> None:
+    baseline = {
+        "results": [
+            {
+                **_result().to_dict(),
+                "p99_ms": 8.0,
+                "throughput_per_second": 200.0,
+            },
+            {**_result(concurrency=8).to_dict(), "p50_ms": 10.0},
+        ]
+    }
+    results = [
+        _result(latencies_ms=[10.0] * 98 + [30.0, 30.0]),
+        _result(
+            concurrency=8,
+            latencies_ms=[12.0] * 100,
+            server_requests=150,
+            retries=50,
+        ),
+        _result(scenario="new"),
+    ]
+
+    assert benchmark.find_regressions(results, baseline) == [
+        "request (concurrency 4): p99_ms 30.0ms (baseline 8.0ms)",
+        "request (concurrency 4): throughput 100.0/s (baseline 200.0/s)",
+        "request (concurrency 8): retry amplification 1.50 " "(baseline 1.00)",
+    ]
+
+
+def test_main_writes_report_and_fails_on_regression(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    output = tmp_path / "report.json"
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(
+        json.dumps(
+            {
+                "results": [
+                    {
+                        **_result(concurrency=2).to_dict(),
+                        "throughput_per_second": 1e9,
+                    }
+                ]
+            }
+        )
+    )
+
+    exit_code = benchmark.main(
+        [
+            "request",
+            "--calls",
+            "4",
+            "--concurrency",
+            "2",
+            "--min-wait",
+            "0",
+            "--output",
+            str(output),
+            "--baseline",
+            str(baseline),
+        ]
+    )
+
+    report = json.loads(output.read_text())
+    assert exit_code == 1
+    assert [item["scenario"] for item in report["results"]] == ["request"]
+    assert "REGRESSION request (concurrency 2)" in capsys.readouterr().err
+
+
+def test_main_rejects_unknown_scenarios() -> None:
+    assert benchmark.main(["nope"]) == 2